@@ -0,0 +1,82 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/onnx/checker.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/checker.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/checker.cc.o.d"
+  "/root/package/onnx/common/assertions.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/common/assertions.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/common/assertions.cc.o.d"
+  "/root/package/onnx/common/interned_strings.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/common/interned_strings.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/common/interned_strings.cc.o.d"
+  "/root/package/onnx/common/ir_pb_converter.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/common/ir_pb_converter.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/common/ir_pb_converter.cc.o.d"
+  "/root/package/onnx/common/model_helpers.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/common/model_helpers.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/common/model_helpers.cc.o.d"
+  "/root/package/onnx/common/status.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/common/status.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/common/status.cc.o.d"
+  "/root/package/onnx/cpp2py_export.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/cpp2py_export.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/cpp2py_export.cc.o.d"
+  "/root/package/onnx/defs/attr_proto_util.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/attr_proto_util.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/attr_proto_util.cc.o.d"
+  "/root/package/onnx/defs/controlflow/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/controlflow/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/controlflow/defs.cc.o.d"
+  "/root/package/onnx/defs/controlflow/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/controlflow/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/controlflow/old.cc.o.d"
+  "/root/package/onnx/defs/controlflow/utils.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/controlflow/utils.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/controlflow/utils.cc.o.d"
+  "/root/package/onnx/defs/data_type_utils.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/data_type_utils.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/data_type_utils.cc.o.d"
+  "/root/package/onnx/defs/doc_strings.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/doc_strings.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/doc_strings.cc.o.d"
+  "/root/package/onnx/defs/function.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/function.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/function.cc.o.d"
+  "/root/package/onnx/defs/generator/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/generator/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/generator/defs.cc.o.d"
+  "/root/package/onnx/defs/generator/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/generator/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/generator/old.cc.o.d"
+  "/root/package/onnx/defs/generator/utils.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/generator/utils.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/generator/utils.cc.o.d"
+  "/root/package/onnx/defs/image/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/image/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/image/defs.cc.o.d"
+  "/root/package/onnx/defs/logical/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/logical/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/logical/defs.cc.o.d"
+  "/root/package/onnx/defs/logical/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/logical/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/logical/old.cc.o.d"
+  "/root/package/onnx/defs/math/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/math/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/math/defs.cc.o.d"
+  "/root/package/onnx/defs/math/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/math/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/math/old.cc.o.d"
+  "/root/package/onnx/defs/math/utils.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/math/utils.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/math/utils.cc.o.d"
+  "/root/package/onnx/defs/nn/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/nn/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/nn/defs.cc.o.d"
+  "/root/package/onnx/defs/nn/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/nn/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/nn/old.cc.o.d"
+  "/root/package/onnx/defs/nn/utils.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/nn/utils.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/nn/utils.cc.o.d"
+  "/root/package/onnx/defs/object_detection/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/object_detection/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/object_detection/defs.cc.o.d"
+  "/root/package/onnx/defs/object_detection/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/object_detection/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/object_detection/old.cc.o.d"
+  "/root/package/onnx/defs/optional/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/optional/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/optional/defs.cc.o.d"
+  "/root/package/onnx/defs/optional/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/optional/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/optional/old.cc.o.d"
+  "/root/package/onnx/defs/parser.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/parser.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/parser.cc.o.d"
+  "/root/package/onnx/defs/printer.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/printer.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/printer.cc.o.d"
+  "/root/package/onnx/defs/quantization/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/quantization/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/quantization/defs.cc.o.d"
+  "/root/package/onnx/defs/quantization/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/quantization/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/quantization/old.cc.o.d"
+  "/root/package/onnx/defs/reduction/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/reduction/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/reduction/defs.cc.o.d"
+  "/root/package/onnx/defs/reduction/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/reduction/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/reduction/old.cc.o.d"
+  "/root/package/onnx/defs/reduction/utils.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/reduction/utils.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/reduction/utils.cc.o.d"
+  "/root/package/onnx/defs/rnn/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/rnn/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/rnn/defs.cc.o.d"
+  "/root/package/onnx/defs/rnn/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/rnn/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/rnn/old.cc.o.d"
+  "/root/package/onnx/defs/schema.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/schema.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/schema.cc.o.d"
+  "/root/package/onnx/defs/sequence/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/sequence/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/sequence/defs.cc.o.d"
+  "/root/package/onnx/defs/sequence/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/sequence/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/sequence/old.cc.o.d"
+  "/root/package/onnx/defs/sequence/utils.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/sequence/utils.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/sequence/utils.cc.o.d"
+  "/root/package/onnx/defs/shape_inference.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/shape_inference.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/shape_inference.cc.o.d"
+  "/root/package/onnx/defs/tensor/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/tensor/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/tensor/defs.cc.o.d"
+  "/root/package/onnx/defs/tensor/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/tensor/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/tensor/old.cc.o.d"
+  "/root/package/onnx/defs/tensor/utils.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/tensor/utils.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/tensor/utils.cc.o.d"
+  "/root/package/onnx/defs/tensor_proto_util.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/tensor_proto_util.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/tensor_proto_util.cc.o.d"
+  "/root/package/onnx/defs/tensor_util.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/tensor_util.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/tensor_util.cc.o.d"
+  "/root/package/onnx/defs/text/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/text/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/text/defs.cc.o.d"
+  "/root/package/onnx/defs/traditionalml/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/traditionalml/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/traditionalml/defs.cc.o.d"
+  "/root/package/onnx/defs/traditionalml/old.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/traditionalml/old.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/traditionalml/old.cc.o.d"
+  "/root/package/onnx/defs/training/defs.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/training/defs.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/defs/training/defs.cc.o.d"
+  "/root/package/onnx/inliner/inliner.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/inliner/inliner.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/inliner/inliner.cc.o.d"
+  "/root/package/.setuptools-cmake-build/onnx/onnx-data.pb.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/onnx-data.pb.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/onnx-data.pb.cc.o.d"
+  "/root/package/.setuptools-cmake-build/onnx/onnx-ml.pb.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/onnx-ml.pb.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/onnx-ml.pb.cc.o.d"
+  "/root/package/.setuptools-cmake-build/onnx/onnx-operators-ml.pb.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/onnx-operators-ml.pb.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/onnx-operators-ml.pb.cc.o.d"
+  "/root/package/onnx/shape_inference/implementation.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/shape_inference/implementation.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/shape_inference/implementation.cc.o.d"
+  "/root/package/onnx/version_converter/convert.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/version_converter/convert.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/version_converter/convert.cc.o.d"
+  "/root/package/onnx/version_converter/helper.cc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/version_converter/helper.cc.o" "gcc" "CMakeFiles/onnx_cpp2py_export.dir/onnx/version_converter/helper.cc.o.d"
+  )
+
+# Targets to which this target links which contain Fortran sources.
+set(CMAKE_Fortran_TARGET_LINKED_INFO_FILES
+  )
+
+# Targets to which this target links which contain Fortran sources.
+set(CMAKE_Fortran_TARGET_FORWARD_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,15105 @@
+// Generated by the protocol buffer compiler.  DO NOT EDIT!
+// source: onnx/onnx-ml.proto
+
+#ifndef GOOGLE_PROTOBUF_INCLUDED_onnx_2fonnx_2dml_2eproto
+#define GOOGLE_PROTOBUF_INCLUDED_onnx_2fonnx_2dml_2eproto
+
+#include <limits>
+#include <string>
+
+#include <google/protobuf/port_def.inc>
+#if PROTOBUF_VERSION < 3021000
+#error This file was generated by a newer version of protoc which is
+#error incompatible with your Protocol Buffer headers. Please update
+#error your headers.
+#endif
+#if 3021012 < PROTOBUF_MIN_PROTOC_VERSION
+#error This file was generated by an older version of protoc which is
+#error incompatible with your Protocol Buffer headers. Please
+#error regenerate this file with a newer version of protoc.
+#endif
+
+#include <google/protobuf/port_undef.inc>
+#include <google/protobuf/io/coded_stream.h>
+#include <google/protobuf/arena.h>
+#include <google/protobuf/arenastring.h>
+#include <google/protobuf/generated_message_util.h>
+#include <google/protobuf/metadata_lite.h>
+#include <google/protobuf/generated_message_reflection.h>
+#include <google/protobuf/message.h>
+#include <google/protobuf/repeated_field.h>  // IWYU pragma: export
+#include <google/protobuf/extension_set.h>  // IWYU pragma: export
+#include <google/protobuf/generated_enum_reflection.h>
+#include <google/protobuf/unknown_field_set.h>
+// @@protoc_insertion_point(includes)
+#include <google/protobuf/port_def.inc>
+#define PROTOBUF_INTERNAL_EXPORT_onnx_2fonnx_2dml_2eproto
+PROTOBUF_NAMESPACE_OPEN
+namespace internal {
+class AnyMetadata;
+}  // namespace internal
+PROTOBUF_NAMESPACE_CLOSE
+
+// Internal implementation detail -- do not use these members.
+struct TableStruct_onnx_2fonnx_2dml_2eproto {
+  static const uint32_t offsets[];
+};
+extern const ::PROTOBUF_NAMESPACE_ID::internal::DescriptorTable descriptor_table_onnx_2fonnx_2dml_2eproto;
+namespace onnx {
+class AttributeProto;
+struct AttributeProtoDefaultTypeInternal;
+extern AttributeProtoDefaultTypeInternal _AttributeProto_default_instance_;
+class DeviceConfigurationProto;
+struct DeviceConfigurationProtoDefaultTypeInternal;
+extern DeviceConfigurationProtoDefaultTypeInternal _DeviceConfigurationProto_default_instance_;
+class FunctionProto;
+struct FunctionProtoDefaultTypeInternal;
+extern FunctionProtoDefaultTypeInternal _FunctionProto_default_instance_;
+class GraphProto;
+struct GraphProtoDefaultTypeInternal;
+extern GraphProtoDefaultTypeInternal _GraphProto_default_instance_;
+class IntIntListEntryProto;
+struct IntIntListEntryProtoDefaultTypeInternal;
+extern IntIntListEntryProtoDefaultTypeInternal _IntIntListEntryProto_default_instance_;
+class ModelProto;
+struct ModelProtoDefaultTypeInternal;
+extern ModelProtoDefaultTypeInternal _ModelProto_default_instance_;
+class NodeDeviceConfigurationProto;
+struct NodeDeviceConfigurationProtoDefaultTypeInternal;
+extern NodeDeviceConfigurationProtoDefaultTypeInternal _NodeDeviceConfigurationProto_default_instance_;
+class NodeProto;
+struct NodeProtoDefaultTypeInternal;
+extern NodeProtoDefaultTypeInternal _NodeProto_default_instance_;
+class OperatorSetIdProto;
+struct OperatorSetIdProtoDefaultTypeInternal;
+extern OperatorSetIdProtoDefaultTypeInternal _OperatorSetIdProto_default_instance_;
+class ShardedDimProto;
+struct ShardedDimProtoDefaultTypeInternal;
+extern ShardedDimProtoDefaultTypeInternal _ShardedDimProto_default_instance_;
+class ShardingSpecProto;
+struct ShardingSpecProtoDefaultTypeInternal;
+extern ShardingSpecProtoDefaultTypeInternal _ShardingSpecProto_default_instance_;
+class SimpleShardedDimProto;
+struct SimpleShardedDimProtoDefaultTypeInternal;
+extern SimpleShardedDimProtoDefaultTypeInternal _SimpleShardedDimProto_default_instance_;
+class SparseTensorProto;
+struct SparseTensorProtoDefaultTypeInternal;
+extern SparseTensorProtoDefaultTypeInternal _SparseTensorProto_default_instance_;
+class StringStringEntryProto;
+struct StringStringEntryProtoDefaultTypeInternal;
+extern StringStringEntryProtoDefaultTypeInternal _StringStringEntryProto_default_instance_;
+class TensorAnnotation;
+struct TensorAnnotationDefaultTypeInternal;
+extern TensorAnnotationDefaultTypeInternal _TensorAnnotation_default_instance_;
+class TensorProto;
+struct TensorProtoDefaultTypeInternal;
+extern TensorProtoDefaultTypeInternal _TensorProto_default_instance_;
+class TensorProto_Segment;
+struct TensorProto_SegmentDefaultTypeInternal;
+extern TensorProto_SegmentDefaultTypeInternal _TensorProto_Segment_default_instance_;
+class TensorShapeProto;
+struct TensorShapeProtoDefaultTypeInternal;
+extern TensorShapeProtoDefaultTypeInternal _TensorShapeProto_default_instance_;
+class TensorShapeProto_Dimension;
+struct TensorShapeProto_DimensionDefaultTypeInternal;
+extern TensorShapeProto_DimensionDefaultTypeInternal _TensorShapeProto_Dimension_default_instance_;
+class TrainingInfoProto;
+struct TrainingInfoProtoDefaultTypeInternal;
+extern TrainingInfoProtoDefaultTypeInternal _TrainingInfoProto_default_instance_;
+class TypeProto;
+struct TypeProtoDefaultTypeInternal;
+extern TypeProtoDefaultTypeInternal _TypeProto_default_instance_;
+class TypeProto_Map;
+struct TypeProto_MapDefaultTypeInternal;
+extern TypeProto_MapDefaultTypeInternal _TypeProto_Map_default_instance_;
+class TypeProto_Opaque;
+struct TypeProto_OpaqueDefaultTypeInternal;
+extern TypeProto_OpaqueDefaultTypeInternal _TypeProto_Opaque_default_instance_;
+class TypeProto_Optional;
+struct TypeProto_OptionalDefaultTypeInternal;
+extern TypeProto_OptionalDefaultTypeInternal _TypeProto_Optional_default_instance_;
+class TypeProto_Sequence;
+struct TypeProto_SequenceDefaultTypeInternal;
+extern TypeProto_SequenceDefaultTypeInternal _TypeProto_Sequence_default_instance_;
+class TypeProto_SparseTensor;
+struct TypeProto_SparseTensorDefaultTypeInternal;
+extern TypeProto_SparseTensorDefaultTypeInternal _TypeProto_SparseTensor_default_instance_;
+class TypeProto_Tensor;
+struct TypeProto_TensorDefaultTypeInternal;
+extern TypeProto_TensorDefaultTypeInternal _TypeProto_Tensor_default_instance_;
+class ValueInfoProto;
+struct ValueInfoProtoDefaultTypeInternal;
+extern ValueInfoProtoDefaultTypeInternal _ValueInfoProto_default_instance_;
+}  // namespace onnx
+PROTOBUF_NAMESPACE_OPEN
+template<> ::onnx::AttributeProto* Arena::CreateMaybeMessage<::onnx::AttributeProto>(Arena*);
+template<> ::onnx::DeviceConfigurationProto* Arena::CreateMaybeMessage<::onnx::DeviceConfigurationProto>(Arena*);
+template<> ::onnx::FunctionProto* Arena::CreateMaybeMessage<::onnx::FunctionProto>(Arena*);
+template<> ::onnx::GraphProto* Arena::CreateMaybeMessage<::onnx::GraphProto>(Arena*);
+template<> ::onnx::IntIntListEntryProto* Arena::CreateMaybeMessage<::onnx::IntIntListEntryProto>(Arena*);
+template<> ::onnx::ModelProto* Arena::CreateMaybeMessage<::onnx::ModelProto>(Arena*);
+template<> ::onnx::NodeDeviceConfigurationProto* Arena::CreateMaybeMessage<::onnx::NodeDeviceConfigurationProto>(Arena*);
+template<> ::onnx::NodeProto* Arena::CreateMaybeMessage<::onnx::NodeProto>(Arena*);
+template<> ::onnx::OperatorSetIdProto* Arena::CreateMaybeMessage<::onnx::OperatorSetIdProto>(Arena*);
+template<> ::onnx::ShardedDimProto* Arena::CreateMaybeMessage<::onnx::ShardedDimProto>(Arena*);
+template<> ::onnx::ShardingSpecProto* Arena::CreateMaybeMessage<::onnx::ShardingSpecProto>(Arena*);
+template<> ::onnx::SimpleShardedDimProto* Arena::CreateMaybeMessage<::onnx::SimpleShardedDimProto>(Arena*);
+template<> ::onnx::SparseTensorProto* Arena::CreateMaybeMessage<::onnx::SparseTensorProto>(Arena*);
+template<> ::onnx::StringStringEntryProto* Arena::CreateMaybeMessage<::onnx::StringStringEntryProto>(Arena*);
+template<> ::onnx::TensorAnnotation* Arena::CreateMaybeMessage<::onnx::TensorAnnotation>(Arena*);
+template<> ::onnx::TensorProto* Arena::CreateMaybeMessage<::onnx::TensorProto>(Arena*);
+template<> ::onnx::TensorProto_Segment* Arena::CreateMaybeMessage<::onnx::TensorProto_Segment>(Arena*);
+template<> ::onnx::TensorShapeProto* Arena::CreateMaybeMessage<::onnx::TensorShapeProto>(Arena*);
+template<> ::onnx::TensorShapeProto_Dimension* Arena::CreateMaybeMessage<::onnx::TensorShapeProto_Dimension>(Arena*);
+template<> ::onnx::TrainingInfoProto* Arena::CreateMaybeMessage<::onnx::TrainingInfoProto>(Arena*);
+template<> ::onnx::TypeProto* Arena::CreateMaybeMessage<::onnx::TypeProto>(Arena*);
+template<> ::onnx::TypeProto_Map* Arena::CreateMaybeMessage<::onnx::TypeProto_Map>(Arena*);
+template<> ::onnx::TypeProto_Opaque* Arena::CreateMaybeMessage<::onnx::TypeProto_Opaque>(Arena*);
+template<> ::onnx::TypeProto_Optional* Arena::CreateMaybeMessage<::onnx::TypeProto_Optional>(Arena*);
+template<> ::onnx::TypeProto_Sequence* Arena::CreateMaybeMessage<::onnx::TypeProto_Sequence>(Arena*);
+template<> ::onnx::TypeProto_SparseTensor* Arena::CreateMaybeMessage<::onnx::TypeProto_SparseTensor>(Arena*);
+template<> ::onnx::TypeProto_Tensor* Arena::CreateMaybeMessage<::onnx::TypeProto_Tensor>(Arena*);
+template<> ::onnx::ValueInfoProto* Arena::CreateMaybeMessage<::onnx::ValueInfoProto>(Arena*);
+PROTOBUF_NAMESPACE_CLOSE
+namespace onnx {
+
+enum AttributeProto_AttributeType : int {
+  AttributeProto_AttributeType_UNDEFINED = 0,
+  AttributeProto_AttributeType_FLOAT = 1,
+  AttributeProto_AttributeType_INT = 2,
+  AttributeProto_AttributeType_STRING = 3,
+  AttributeProto_AttributeType_TENSOR = 4,
+  AttributeProto_AttributeType_GRAPH = 5,
+  AttributeProto_AttributeType_SPARSE_TENSOR = 11,
+  AttributeProto_AttributeType_TYPE_PROTO = 13,
+  AttributeProto_AttributeType_FLOATS = 6,
+  AttributeProto_AttributeType_INTS = 7,
+  AttributeProto_AttributeType_STRINGS = 8,
+  AttributeProto_AttributeType_TENSORS = 9,
+  AttributeProto_AttributeType_GRAPHS = 10,
+  AttributeProto_AttributeType_SPARSE_TENSORS = 12,
+  AttributeProto_AttributeType_TYPE_PROTOS = 14
+};
+bool AttributeProto_AttributeType_IsValid(int value);
+constexpr AttributeProto_AttributeType AttributeProto_AttributeType_AttributeType_MIN = AttributeProto_AttributeType_UNDEFINED;
+constexpr AttributeProto_AttributeType AttributeProto_AttributeType_AttributeType_MAX = AttributeProto_AttributeType_TYPE_PROTOS;
+constexpr int AttributeProto_AttributeType_AttributeType_ARRAYSIZE = AttributeProto_AttributeType_AttributeType_MAX + 1;
+
+const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor* AttributeProto_AttributeType_descriptor();
+template<typename T>
+inline const std::string& AttributeProto_AttributeType_Name(T enum_t_value) {
+  static_assert(::std::is_same<T, AttributeProto_AttributeType>::value ||
+    ::std::is_integral<T>::value,
+    "Incorrect type passed to function AttributeProto_AttributeType_Name.");
+  return ::PROTOBUF_NAMESPACE_ID::internal::NameOfEnum(
+    AttributeProto_AttributeType_descriptor(), enum_t_value);
+}
+inline bool AttributeProto_AttributeType_Parse(
+    ::PROTOBUF_NAMESPACE_ID::ConstStringParam name, AttributeProto_AttributeType* value) {
+  return ::PROTOBUF_NAMESPACE_ID::internal::ParseNamedEnum<AttributeProto_AttributeType>(
+    AttributeProto_AttributeType_descriptor(), name, value);
+}
+enum TensorProto_DataType : int {
+  TensorProto_DataType_UNDEFINED = 0,
+  TensorProto_DataType_FLOAT = 1,
+  TensorProto_DataType_UINT8 = 2,
+  TensorProto_DataType_INT8 = 3,
+  TensorProto_DataType_UINT16 = 4,
+  TensorProto_DataType_INT16 = 5,
+  TensorProto_DataType_INT32 = 6,
+  TensorProto_DataType_INT64 = 7,
+  TensorProto_DataType_STRING = 8,
+  TensorProto_DataType_BOOL = 9,
+  TensorProto_DataType_FLOAT16 = 10,
+  TensorProto_DataType_DOUBLE = 11,
+  TensorProto_DataType_UINT32 = 12,
+  TensorProto_DataType_UINT64 = 13,
+  TensorProto_DataType_COMPLEX64 = 14,
+  TensorProto_DataType_COMPLEX128 = 15,
+  TensorProto_DataType_BFLOAT16 = 16,
+  TensorProto_DataType_FLOAT8E4M3FN = 17,
+  TensorProto_DataType_FLOAT8E4M3FNUZ = 18,
+  TensorProto_DataType_FLOAT8E5M2 = 19,
+  TensorProto_DataType_FLOAT8E5M2FNUZ = 20,
+  TensorProto_DataType_UINT4 = 21,
+  TensorProto_DataType_INT4 = 22,
+  TensorProto_DataType_FLOAT4E2M1 = 23,
+  TensorProto_DataType_FLOAT8E8M0 = 24,
+  TensorProto_DataType_UINT2 = 25,
+  TensorProto_DataType_INT2 = 26
+};
+bool TensorProto_DataType_IsValid(int value);
+constexpr TensorProto_DataType TensorProto_DataType_DataType_MIN = TensorProto_DataType_UNDEFINED;
+constexpr TensorProto_DataType TensorProto_DataType_DataType_MAX = TensorProto_DataType_INT2;
+constexpr int TensorProto_DataType_DataType_ARRAYSIZE = TensorProto_DataType_DataType_MAX + 1;
+
+const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor* TensorProto_DataType_descriptor();
+template<typename T>
+inline const std::string& TensorProto_DataType_Name(T enum_t_value) {
+  static_assert(::std::is_same<T, TensorProto_DataType>::value ||
+    ::std::is_integral<T>::value,
+    "Incorrect type passed to function TensorProto_DataType_Name.");
+  return ::PROTOBUF_NAMESPACE_ID::internal::NameOfEnum(
+    TensorProto_DataType_descriptor(), enum_t_value);
+}
+inline bool TensorProto_DataType_Parse(
+    ::PROTOBUF_NAMESPACE_ID::ConstStringParam name, TensorProto_DataType* value) {
+  return ::PROTOBUF_NAMESPACE_ID::internal::ParseNamedEnum<TensorProto_DataType>(
+    TensorProto_DataType_descriptor(), name, value);
+}
+enum TensorProto_DataLocation : int {
+  TensorProto_DataLocation_DEFAULT = 0,
+  TensorProto_DataLocation_EXTERNAL = 1
+};
+bool TensorProto_DataLocation_IsValid(int value);
+constexpr TensorProto_DataLocation TensorProto_DataLocation_DataLocation_MIN = TensorProto_DataLocation_DEFAULT;
+constexpr TensorProto_DataLocation TensorProto_DataLocation_DataLocation_MAX = TensorProto_DataLocation_EXTERNAL;
+constexpr int TensorProto_DataLocation_DataLocation_ARRAYSIZE = TensorProto_DataLocation_DataLocation_MAX + 1;
+
+const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor* TensorProto_DataLocation_descriptor();
+template<typename T>
+inline const std::string& TensorProto_DataLocation_Name(T enum_t_value) {
+  static_assert(::std::is_same<T, TensorProto_DataLocation>::value ||
+    ::std::is_integral<T>::value,
+    "Incorrect type passed to function TensorProto_DataLocation_Name.");
+  return ::PROTOBUF_NAMESPACE_ID::internal::NameOfEnum(
+    TensorProto_DataLocation_descriptor(), enum_t_value);
+}
+inline bool TensorProto_DataLocation_Parse(
+    ::PROTOBUF_NAMESPACE_ID::ConstStringParam name, TensorProto_DataLocation* value) {
+  return ::PROTOBUF_NAMESPACE_ID::internal::ParseNamedEnum<TensorProto_DataLocation>(
+    TensorProto_DataLocation_descriptor(), name, value);
+}
+enum Version : int {
+  _START_VERSION = 0,
+  IR_VERSION_2017_10_10 = 1,
+  IR_VERSION_2017_10_30 = 2,
+  IR_VERSION_2017_11_3 = 3,
+  IR_VERSION_2019_1_22 = 4,
+  IR_VERSION_2019_3_18 = 5,
+  IR_VERSION_2019_9_19 = 6,
+  IR_VERSION_2020_5_8 = 7,
+  IR_VERSION_2021_7_30 = 8,
+  IR_VERSION_2023_5_5 = 9,
+  IR_VERSION_2024_3_25 = 10,
+  IR_VERSION_2025_05_12 = 11,
+  IR_VERSION_2025_08_26 = 12,
+  IR_VERSION = 13
+};
+bool Version_IsValid(int value);
+constexpr Version Version_MIN = _START_VERSION;
+constexpr Version Version_MAX = IR_VERSION;
+constexpr int Version_ARRAYSIZE = Version_MAX + 1;
+
+const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor* Version_descriptor();
+template<typename T>
+inline const std::string& Version_Name(T enum_t_value) {
+  static_assert(::std::is_same<T, Version>::value ||
+    ::std::is_integral<T>::value,
+    "Incorrect type passed to function Version_Name.");
+  return ::PROTOBUF_NAMESPACE_ID::internal::NameOfEnum(
+    Version_descriptor(), enum_t_value);
+}
+inline bool Version_Parse(
+    ::PROTOBUF_NAMESPACE_ID::ConstStringParam name, Version* value) {
+  return ::PROTOBUF_NAMESPACE_ID::internal::ParseNamedEnum<Version>(
+    Version_descriptor(), name, value);
+}
+enum OperatorStatus : int {
+  EXPERIMENTAL = 0,
+  STABLE = 1
+};
+bool OperatorStatus_IsValid(int value);
+constexpr OperatorStatus OperatorStatus_MIN = EXPERIMENTAL;
+constexpr OperatorStatus OperatorStatus_MAX = STABLE;
+constexpr int OperatorStatus_ARRAYSIZE = OperatorStatus_MAX + 1;
+
+const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor* OperatorStatus_descriptor();
+template<typename T>
+inline const std::string& OperatorStatus_Name(T enum_t_value) {
+  static_assert(::std::is_same<T, OperatorStatus>::value ||
+    ::std::is_integral<T>::value,
+    "Incorrect type passed to function OperatorStatus_Name.");
+  return ::PROTOBUF_NAMESPACE_ID::internal::NameOfEnum(
+    OperatorStatus_descriptor(), enum_t_value);
+}
+inline bool OperatorStatus_Parse(
+    ::PROTOBUF_NAMESPACE_ID::ConstStringParam name, OperatorStatus* value) {
+  return ::PROTOBUF_NAMESPACE_ID::internal::ParseNamedEnum<OperatorStatus>(
+    OperatorStatus_descriptor(), name, value);
+}
+// ===================================================================
+
+class AttributeProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.AttributeProto) */ {
+ public:
+  inline AttributeProto() : AttributeProto(nullptr) {}
+  ~AttributeProto() override;
+  explicit PROTOBUF_CONSTEXPR AttributeProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  AttributeProto(const AttributeProto& from);
+  AttributeProto(AttributeProto&& from) noexcept
+    : AttributeProto() {
+    *this = ::std::move(from);
+  }
+
+  inline AttributeProto& operator=(const AttributeProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline AttributeProto& operator=(AttributeProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const AttributeProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const AttributeProto* internal_default_instance() {
+    return reinterpret_cast<const AttributeProto*>(
+               &_AttributeProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    0;
+
+  friend void swap(AttributeProto& a, AttributeProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(AttributeProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(AttributeProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  AttributeProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<AttributeProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const AttributeProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const AttributeProto& from) {
+    AttributeProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(AttributeProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.AttributeProto";
+  }
+  protected:
+  explicit AttributeProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  typedef AttributeProto_AttributeType AttributeType;
+  static constexpr AttributeType UNDEFINED =
+    AttributeProto_AttributeType_UNDEFINED;
+  static constexpr AttributeType FLOAT =
+    AttributeProto_AttributeType_FLOAT;
+  static constexpr AttributeType INT =
+    AttributeProto_AttributeType_INT;
+  static constexpr AttributeType STRING =
+    AttributeProto_AttributeType_STRING;
+  static constexpr AttributeType TENSOR =
+    AttributeProto_AttributeType_TENSOR;
+  static constexpr AttributeType GRAPH =
+    AttributeProto_AttributeType_GRAPH;
+  static constexpr AttributeType SPARSE_TENSOR =
+    AttributeProto_AttributeType_SPARSE_TENSOR;
+  static constexpr AttributeType TYPE_PROTO =
+    AttributeProto_AttributeType_TYPE_PROTO;
+  static constexpr AttributeType FLOATS =
+    AttributeProto_AttributeType_FLOATS;
+  static constexpr AttributeType INTS =
+    AttributeProto_AttributeType_INTS;
+  static constexpr AttributeType STRINGS =
+    AttributeProto_AttributeType_STRINGS;
+  static constexpr AttributeType TENSORS =
+    AttributeProto_AttributeType_TENSORS;
+  static constexpr AttributeType GRAPHS =
+    AttributeProto_AttributeType_GRAPHS;
+  static constexpr AttributeType SPARSE_TENSORS =
+    AttributeProto_AttributeType_SPARSE_TENSORS;
+  static constexpr AttributeType TYPE_PROTOS =
+    AttributeProto_AttributeType_TYPE_PROTOS;
+  static inline bool AttributeType_IsValid(int value) {
+    return AttributeProto_AttributeType_IsValid(value);
+  }
+  static constexpr AttributeType AttributeType_MIN =
+    AttributeProto_AttributeType_AttributeType_MIN;
+  static constexpr AttributeType AttributeType_MAX =
+    AttributeProto_AttributeType_AttributeType_MAX;
+  static constexpr int AttributeType_ARRAYSIZE =
+    AttributeProto_AttributeType_AttributeType_ARRAYSIZE;
+  static inline const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor*
+  AttributeType_descriptor() {
+    return AttributeProto_AttributeType_descriptor();
+  }
+  template<typename T>
+  static inline const std::string& AttributeType_Name(T enum_t_value) {
+    static_assert(::std::is_same<T, AttributeType>::value ||
+      ::std::is_integral<T>::value,
+      "Incorrect type passed to function AttributeType_Name.");
+    return AttributeProto_AttributeType_Name(enum_t_value);
+  }
+  static inline bool AttributeType_Parse(::PROTOBUF_NAMESPACE_ID::ConstStringParam name,
+      AttributeType* value) {
+    return AttributeProto_AttributeType_Parse(name, value);
+  }
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kFloatsFieldNumber = 7,
+    kIntsFieldNumber = 8,
+    kStringsFieldNumber = 9,
+    kTensorsFieldNumber = 10,
+    kGraphsFieldNumber = 11,
+    kTypeProtosFieldNumber = 15,
+    kSparseTensorsFieldNumber = 23,
+    kNameFieldNumber = 1,
+    kSFieldNumber = 4,
+    kDocStringFieldNumber = 13,
+    kRefAttrNameFieldNumber = 21,
+    kTFieldNumber = 5,
+    kGFieldNumber = 6,
+    kTpFieldNumber = 14,
+    kSparseTensorFieldNumber = 22,
+    kIFieldNumber = 3,
+    kFFieldNumber = 2,
+    kTypeFieldNumber = 20,
+  };
+  // repeated float floats = 7;
+  int floats_size() const;
+  private:
+  int _internal_floats_size() const;
+  public:
+  void clear_floats();
+  private:
+  float _internal_floats(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+      _internal_floats() const;
+  void _internal_add_floats(float value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+      _internal_mutable_floats();
+  public:
+  float floats(int index) const;
+  void set_floats(int index, float value);
+  void add_floats(float value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+      floats() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+      mutable_floats();
+
+  // repeated int64 ints = 8;
+  int ints_size() const;
+  private:
+  int _internal_ints_size() const;
+  public:
+  void clear_ints();
+  private:
+  int64_t _internal_ints(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      _internal_ints() const;
+  void _internal_add_ints(int64_t value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      _internal_mutable_ints();
+  public:
+  int64_t ints(int index) const;
+  void set_ints(int index, int64_t value);
+  void add_ints(int64_t value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      ints() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      mutable_ints();
+
+  // repeated bytes strings = 9;
+  int strings_size() const;
+  private:
+  int _internal_strings_size() const;
+  public:
+  void clear_strings();
+  const std::string& strings(int index) const;
+  std::string* mutable_strings(int index);
+  void set_strings(int index, const std::string& value);
+  void set_strings(int index, std::string&& value);
+  void set_strings(int index, const char* value);
+  void set_strings(int index, const void* value, size_t size);
+  std::string* add_strings();
+  void add_strings(const std::string& value);
+  void add_strings(std::string&& value);
+  void add_strings(const char* value);
+  void add_strings(const void* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& strings() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_strings();
+  private:
+  const std::string& _internal_strings(int index) const;
+  std::string* _internal_add_strings();
+  public:
+
+  // repeated .onnx.TensorProto tensors = 10;
+  int tensors_size() const;
+  private:
+  int _internal_tensors_size() const;
+  public:
+  void clear_tensors();
+  ::onnx::TensorProto* mutable_tensors(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorProto >*
+      mutable_tensors();
+  private:
+  const ::onnx::TensorProto& _internal_tensors(int index) const;
+  ::onnx::TensorProto* _internal_add_tensors();
+  public:
+  const ::onnx::TensorProto& tensors(int index) const;
+  ::onnx::TensorProto* add_tensors();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorProto >&
+      tensors() const;
+
+  // repeated .onnx.GraphProto graphs = 11;
+  int graphs_size() const;
+  private:
+  int _internal_graphs_size() const;
+  public:
+  void clear_graphs();
+  ::onnx::GraphProto* mutable_graphs(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::GraphProto >*
+      mutable_graphs();
+  private:
+  const ::onnx::GraphProto& _internal_graphs(int index) const;
+  ::onnx::GraphProto* _internal_add_graphs();
+  public:
+  const ::onnx::GraphProto& graphs(int index) const;
+  ::onnx::GraphProto* add_graphs();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::GraphProto >&
+      graphs() const;
+
+  // repeated .onnx.TypeProto type_protos = 15;
+  int type_protos_size() const;
+  private:
+  int _internal_type_protos_size() const;
+  public:
+  void clear_type_protos();
+  ::onnx::TypeProto* mutable_type_protos(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TypeProto >*
+      mutable_type_protos();
+  private:
+  const ::onnx::TypeProto& _internal_type_protos(int index) const;
+  ::onnx::TypeProto* _internal_add_type_protos();
+  public:
+  const ::onnx::TypeProto& type_protos(int index) const;
+  ::onnx::TypeProto* add_type_protos();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TypeProto >&
+      type_protos() const;
+
+  // repeated .onnx.SparseTensorProto sparse_tensors = 23;
+  int sparse_tensors_size() const;
+  private:
+  int _internal_sparse_tensors_size() const;
+  public:
+  void clear_sparse_tensors();
+  ::onnx::SparseTensorProto* mutable_sparse_tensors(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SparseTensorProto >*
+      mutable_sparse_tensors();
+  private:
+  const ::onnx::SparseTensorProto& _internal_sparse_tensors(int index) const;
+  ::onnx::SparseTensorProto* _internal_add_sparse_tensors();
+  public:
+  const ::onnx::SparseTensorProto& sparse_tensors(int index) const;
+  ::onnx::SparseTensorProto* add_sparse_tensors();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SparseTensorProto >&
+      sparse_tensors() const;
+
+  // optional string name = 1;
+  bool has_name() const;
+  private:
+  bool _internal_has_name() const;
+  public:
+  void clear_name();
+  const std::string& name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* name);
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(const std::string& value);
+  std::string* _internal_mutable_name();
+  public:
+
+  // optional bytes s = 4;
+  bool has_s() const;
+  private:
+  bool _internal_has_s() const;
+  public:
+  void clear_s();
+  const std::string& s() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_s(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_s();
+  PROTOBUF_NODISCARD std::string* release_s();
+  void set_allocated_s(std::string* s);
+  private:
+  const std::string& _internal_s() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_s(const std::string& value);
+  std::string* _internal_mutable_s();
+  public:
+
+  // optional string doc_string = 13;
+  bool has_doc_string() const;
+  private:
+  bool _internal_has_doc_string() const;
+  public:
+  void clear_doc_string();
+  const std::string& doc_string() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_doc_string(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_doc_string();
+  PROTOBUF_NODISCARD std::string* release_doc_string();
+  void set_allocated_doc_string(std::string* doc_string);
+  private:
+  const std::string& _internal_doc_string() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_doc_string(const std::string& value);
+  std::string* _internal_mutable_doc_string();
+  public:
+
+  // optional string ref_attr_name = 21;
+  bool has_ref_attr_name() const;
+  private:
+  bool _internal_has_ref_attr_name() const;
+  public:
+  void clear_ref_attr_name();
+  const std::string& ref_attr_name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_ref_attr_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_ref_attr_name();
+  PROTOBUF_NODISCARD std::string* release_ref_attr_name();
+  void set_allocated_ref_attr_name(std::string* ref_attr_name);
+  private:
+  const std::string& _internal_ref_attr_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_ref_attr_name(const std::string& value);
+  std::string* _internal_mutable_ref_attr_name();
+  public:
+
+  // optional .onnx.TensorProto t = 5;
+  bool has_t() const;
+  private:
+  bool _internal_has_t() const;
+  public:
+  void clear_t();
+  const ::onnx::TensorProto& t() const;
+  PROTOBUF_NODISCARD ::onnx::TensorProto* release_t();
+  ::onnx::TensorProto* mutable_t();
+  void set_allocated_t(::onnx::TensorProto* t);
+  private:
+  const ::onnx::TensorProto& _internal_t() const;
+  ::onnx::TensorProto* _internal_mutable_t();
+  public:
+  void unsafe_arena_set_allocated_t(
+      ::onnx::TensorProto* t);
+  ::onnx::TensorProto* unsafe_arena_release_t();
+
+  // optional .onnx.GraphProto g = 6;
+  bool has_g() const;
+  private:
+  bool _internal_has_g() const;
+  public:
+  void clear_g();
+  const ::onnx::GraphProto& g() const;
+  PROTOBUF_NODISCARD ::onnx::GraphProto* release_g();
+  ::onnx::GraphProto* mutable_g();
+  void set_allocated_g(::onnx::GraphProto* g);
+  private:
+  const ::onnx::GraphProto& _internal_g() const;
+  ::onnx::GraphProto* _internal_mutable_g();
+  public:
+  void unsafe_arena_set_allocated_g(
+      ::onnx::GraphProto* g);
+  ::onnx::GraphProto* unsafe_arena_release_g();
+
+  // optional .onnx.TypeProto tp = 14;
+  bool has_tp() const;
+  private:
+  bool _internal_has_tp() const;
+  public:
+  void clear_tp();
+  const ::onnx::TypeProto& tp() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto* release_tp();
+  ::onnx::TypeProto* mutable_tp();
+  void set_allocated_tp(::onnx::TypeProto* tp);
+  private:
+  const ::onnx::TypeProto& _internal_tp() const;
+  ::onnx::TypeProto* _internal_mutable_tp();
+  public:
+  void unsafe_arena_set_allocated_tp(
+      ::onnx::TypeProto* tp);
+  ::onnx::TypeProto* unsafe_arena_release_tp();
+
+  // optional .onnx.SparseTensorProto sparse_tensor = 22;
+  bool has_sparse_tensor() const;
+  private:
+  bool _internal_has_sparse_tensor() const;
+  public:
+  void clear_sparse_tensor();
+  const ::onnx::SparseTensorProto& sparse_tensor() const;
+  PROTOBUF_NODISCARD ::onnx::SparseTensorProto* release_sparse_tensor();
+  ::onnx::SparseTensorProto* mutable_sparse_tensor();
+  void set_allocated_sparse_tensor(::onnx::SparseTensorProto* sparse_tensor);
+  private:
+  const ::onnx::SparseTensorProto& _internal_sparse_tensor() const;
+  ::onnx::SparseTensorProto* _internal_mutable_sparse_tensor();
+  public:
+  void unsafe_arena_set_allocated_sparse_tensor(
+      ::onnx::SparseTensorProto* sparse_tensor);
+  ::onnx::SparseTensorProto* unsafe_arena_release_sparse_tensor();
+
+  // optional int64 i = 3;
+  bool has_i() const;
+  private:
+  bool _internal_has_i() const;
+  public:
+  void clear_i();
+  int64_t i() const;
+  void set_i(int64_t value);
+  private:
+  int64_t _internal_i() const;
+  void _internal_set_i(int64_t value);
+  public:
+
+  // optional float f = 2;
+  bool has_f() const;
+  private:
+  bool _internal_has_f() const;
+  public:
+  void clear_f();
+  float f() const;
+  void set_f(float value);
+  private:
+  float _internal_f() const;
+  void _internal_set_f(float value);
+  public:
+
+  // optional .onnx.AttributeProto.AttributeType type = 20;
+  bool has_type() const;
+  private:
+  bool _internal_has_type() const;
+  public:
+  void clear_type();
+  ::onnx::AttributeProto_AttributeType type() const;
+  void set_type(::onnx::AttributeProto_AttributeType value);
+  private:
+  ::onnx::AttributeProto_AttributeType _internal_type() const;
+  void _internal_set_type(::onnx::AttributeProto_AttributeType value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.AttributeProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< float > floats_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t > ints_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> strings_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorProto > tensors_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::GraphProto > graphs_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TypeProto > type_protos_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SparseTensorProto > sparse_tensors_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr s_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr doc_string_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr ref_attr_name_;
+    ::onnx::TensorProto* t_;
+    ::onnx::GraphProto* g_;
+    ::onnx::TypeProto* tp_;
+    ::onnx::SparseTensorProto* sparse_tensor_;
+    int64_t i_;
+    float f_;
+    int type_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class ValueInfoProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.ValueInfoProto) */ {
+ public:
+  inline ValueInfoProto() : ValueInfoProto(nullptr) {}
+  ~ValueInfoProto() override;
+  explicit PROTOBUF_CONSTEXPR ValueInfoProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  ValueInfoProto(const ValueInfoProto& from);
+  ValueInfoProto(ValueInfoProto&& from) noexcept
+    : ValueInfoProto() {
+    *this = ::std::move(from);
+  }
+
+  inline ValueInfoProto& operator=(const ValueInfoProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline ValueInfoProto& operator=(ValueInfoProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const ValueInfoProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const ValueInfoProto* internal_default_instance() {
+    return reinterpret_cast<const ValueInfoProto*>(
+               &_ValueInfoProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    1;
+
+  friend void swap(ValueInfoProto& a, ValueInfoProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(ValueInfoProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(ValueInfoProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  ValueInfoProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ValueInfoProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const ValueInfoProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const ValueInfoProto& from) {
+    ValueInfoProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(ValueInfoProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.ValueInfoProto";
+  }
+  protected:
+  explicit ValueInfoProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kMetadataPropsFieldNumber = 4,
+    kNameFieldNumber = 1,
+    kDocStringFieldNumber = 3,
+    kTypeFieldNumber = 2,
+  };
+  // repeated .onnx.StringStringEntryProto metadata_props = 4;
+  int metadata_props_size() const;
+  private:
+  int _internal_metadata_props_size() const;
+  public:
+  void clear_metadata_props();
+  ::onnx::StringStringEntryProto* mutable_metadata_props(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+      mutable_metadata_props();
+  private:
+  const ::onnx::StringStringEntryProto& _internal_metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* _internal_add_metadata_props();
+  public:
+  const ::onnx::StringStringEntryProto& metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* add_metadata_props();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+      metadata_props() const;
+
+  // optional string name = 1;
+  bool has_name() const;
+  private:
+  bool _internal_has_name() const;
+  public:
+  void clear_name();
+  const std::string& name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* name);
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(const std::string& value);
+  std::string* _internal_mutable_name();
+  public:
+
+  // optional string doc_string = 3;
+  bool has_doc_string() const;
+  private:
+  bool _internal_has_doc_string() const;
+  public:
+  void clear_doc_string();
+  const std::string& doc_string() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_doc_string(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_doc_string();
+  PROTOBUF_NODISCARD std::string* release_doc_string();
+  void set_allocated_doc_string(std::string* doc_string);
+  private:
+  const std::string& _internal_doc_string() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_doc_string(const std::string& value);
+  std::string* _internal_mutable_doc_string();
+  public:
+
+  // optional .onnx.TypeProto type = 2;
+  bool has_type() const;
+  private:
+  bool _internal_has_type() const;
+  public:
+  void clear_type();
+  const ::onnx::TypeProto& type() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto* release_type();
+  ::onnx::TypeProto* mutable_type();
+  void set_allocated_type(::onnx::TypeProto* type);
+  private:
+  const ::onnx::TypeProto& _internal_type() const;
+  ::onnx::TypeProto* _internal_mutable_type();
+  public:
+  void unsafe_arena_set_allocated_type(
+      ::onnx::TypeProto* type);
+  ::onnx::TypeProto* unsafe_arena_release_type();
+
+  // @@protoc_insertion_point(class_scope:onnx.ValueInfoProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto > metadata_props_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr doc_string_;
+    ::onnx::TypeProto* type_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class NodeProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.NodeProto) */ {
+ public:
+  inline NodeProto() : NodeProto(nullptr) {}
+  ~NodeProto() override;
+  explicit PROTOBUF_CONSTEXPR NodeProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  NodeProto(const NodeProto& from);
+  NodeProto(NodeProto&& from) noexcept
+    : NodeProto() {
+    *this = ::std::move(from);
+  }
+
+  inline NodeProto& operator=(const NodeProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline NodeProto& operator=(NodeProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const NodeProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const NodeProto* internal_default_instance() {
+    return reinterpret_cast<const NodeProto*>(
+               &_NodeProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    2;
+
+  friend void swap(NodeProto& a, NodeProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(NodeProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(NodeProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  NodeProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<NodeProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const NodeProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const NodeProto& from) {
+    NodeProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(NodeProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.NodeProto";
+  }
+  protected:
+  explicit NodeProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kInputFieldNumber = 1,
+    kOutputFieldNumber = 2,
+    kAttributeFieldNumber = 5,
+    kMetadataPropsFieldNumber = 9,
+    kDeviceConfigurationsFieldNumber = 10,
+    kNameFieldNumber = 3,
+    kOpTypeFieldNumber = 4,
+    kDocStringFieldNumber = 6,
+    kDomainFieldNumber = 7,
+    kOverloadFieldNumber = 8,
+  };
+  // repeated string input = 1;
+  int input_size() const;
+  private:
+  int _internal_input_size() const;
+  public:
+  void clear_input();
+  const std::string& input(int index) const;
+  std::string* mutable_input(int index);
+  void set_input(int index, const std::string& value);
+  void set_input(int index, std::string&& value);
+  void set_input(int index, const char* value);
+  void set_input(int index, const char* value, size_t size);
+  std::string* add_input();
+  void add_input(const std::string& value);
+  void add_input(std::string&& value);
+  void add_input(const char* value);
+  void add_input(const char* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& input() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_input();
+  private:
+  const std::string& _internal_input(int index) const;
+  std::string* _internal_add_input();
+  public:
+
+  // repeated string output = 2;
+  int output_size() const;
+  private:
+  int _internal_output_size() const;
+  public:
+  void clear_output();
+  const std::string& output(int index) const;
+  std::string* mutable_output(int index);
+  void set_output(int index, const std::string& value);
+  void set_output(int index, std::string&& value);
+  void set_output(int index, const char* value);
+  void set_output(int index, const char* value, size_t size);
+  std::string* add_output();
+  void add_output(const std::string& value);
+  void add_output(std::string&& value);
+  void add_output(const char* value);
+  void add_output(const char* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& output() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_output();
+  private:
+  const std::string& _internal_output(int index) const;
+  std::string* _internal_add_output();
+  public:
+
+  // repeated .onnx.AttributeProto attribute = 5;
+  int attribute_size() const;
+  private:
+  int _internal_attribute_size() const;
+  public:
+  void clear_attribute();
+  ::onnx::AttributeProto* mutable_attribute(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::AttributeProto >*
+      mutable_attribute();
+  private:
+  const ::onnx::AttributeProto& _internal_attribute(int index) const;
+  ::onnx::AttributeProto* _internal_add_attribute();
+  public:
+  const ::onnx::AttributeProto& attribute(int index) const;
+  ::onnx::AttributeProto* add_attribute();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::AttributeProto >&
+      attribute() const;
+
+  // repeated .onnx.StringStringEntryProto metadata_props = 9;
+  int metadata_props_size() const;
+  private:
+  int _internal_metadata_props_size() const;
+  public:
+  void clear_metadata_props();
+  ::onnx::StringStringEntryProto* mutable_metadata_props(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+      mutable_metadata_props();
+  private:
+  const ::onnx::StringStringEntryProto& _internal_metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* _internal_add_metadata_props();
+  public:
+  const ::onnx::StringStringEntryProto& metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* add_metadata_props();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+      metadata_props() const;
+
+  // repeated .onnx.NodeDeviceConfigurationProto device_configurations = 10;
+  int device_configurations_size() const;
+  private:
+  int _internal_device_configurations_size() const;
+  public:
+  void clear_device_configurations();
+  ::onnx::NodeDeviceConfigurationProto* mutable_device_configurations(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeDeviceConfigurationProto >*
+      mutable_device_configurations();
+  private:
+  const ::onnx::NodeDeviceConfigurationProto& _internal_device_configurations(int index) const;
+  ::onnx::NodeDeviceConfigurationProto* _internal_add_device_configurations();
+  public:
+  const ::onnx::NodeDeviceConfigurationProto& device_configurations(int index) const;
+  ::onnx::NodeDeviceConfigurationProto* add_device_configurations();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeDeviceConfigurationProto >&
+      device_configurations() const;
+
+  // optional string name = 3;
+  bool has_name() const;
+  private:
+  bool _internal_has_name() const;
+  public:
+  void clear_name();
+  const std::string& name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* name);
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(const std::string& value);
+  std::string* _internal_mutable_name();
+  public:
+
+  // optional string op_type = 4;
+  bool has_op_type() const;
+  private:
+  bool _internal_has_op_type() const;
+  public:
+  void clear_op_type();
+  const std::string& op_type() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_op_type(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_op_type();
+  PROTOBUF_NODISCARD std::string* release_op_type();
+  void set_allocated_op_type(std::string* op_type);
+  private:
+  const std::string& _internal_op_type() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_op_type(const std::string& value);
+  std::string* _internal_mutable_op_type();
+  public:
+
+  // optional string doc_string = 6;
+  bool has_doc_string() const;
+  private:
+  bool _internal_has_doc_string() const;
+  public:
+  void clear_doc_string();
+  const std::string& doc_string() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_doc_string(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_doc_string();
+  PROTOBUF_NODISCARD std::string* release_doc_string();
+  void set_allocated_doc_string(std::string* doc_string);
+  private:
+  const std::string& _internal_doc_string() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_doc_string(const std::string& value);
+  std::string* _internal_mutable_doc_string();
+  public:
+
+  // optional string domain = 7;
+  bool has_domain() const;
+  private:
+  bool _internal_has_domain() const;
+  public:
+  void clear_domain();
+  const std::string& domain() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_domain(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_domain();
+  PROTOBUF_NODISCARD std::string* release_domain();
+  void set_allocated_domain(std::string* domain);
+  private:
+  const std::string& _internal_domain() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_domain(const std::string& value);
+  std::string* _internal_mutable_domain();
+  public:
+
+  // optional string overload = 8;
+  bool has_overload() const;
+  private:
+  bool _internal_has_overload() const;
+  public:
+  void clear_overload();
+  const std::string& overload() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_overload(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_overload();
+  PROTOBUF_NODISCARD std::string* release_overload();
+  void set_allocated_overload(std::string* overload);
+  private:
+  const std::string& _internal_overload() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_overload(const std::string& value);
+  std::string* _internal_mutable_overload();
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.NodeProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> input_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> output_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::AttributeProto > attribute_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto > metadata_props_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeDeviceConfigurationProto > device_configurations_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr op_type_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr doc_string_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr domain_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr overload_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class IntIntListEntryProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.IntIntListEntryProto) */ {
+ public:
+  inline IntIntListEntryProto() : IntIntListEntryProto(nullptr) {}
+  ~IntIntListEntryProto() override;
+  explicit PROTOBUF_CONSTEXPR IntIntListEntryProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  IntIntListEntryProto(const IntIntListEntryProto& from);
+  IntIntListEntryProto(IntIntListEntryProto&& from) noexcept
+    : IntIntListEntryProto() {
+    *this = ::std::move(from);
+  }
+
+  inline IntIntListEntryProto& operator=(const IntIntListEntryProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline IntIntListEntryProto& operator=(IntIntListEntryProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const IntIntListEntryProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const IntIntListEntryProto* internal_default_instance() {
+    return reinterpret_cast<const IntIntListEntryProto*>(
+               &_IntIntListEntryProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    3;
+
+  friend void swap(IntIntListEntryProto& a, IntIntListEntryProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(IntIntListEntryProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(IntIntListEntryProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  IntIntListEntryProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<IntIntListEntryProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const IntIntListEntryProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const IntIntListEntryProto& from) {
+    IntIntListEntryProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(IntIntListEntryProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.IntIntListEntryProto";
+  }
+  protected:
+  explicit IntIntListEntryProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kValueFieldNumber = 2,
+    kKeyFieldNumber = 1,
+  };
+  // repeated int64 value = 2;
+  int value_size() const;
+  private:
+  int _internal_value_size() const;
+  public:
+  void clear_value();
+  private:
+  int64_t _internal_value(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      _internal_value() const;
+  void _internal_add_value(int64_t value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      _internal_mutable_value();
+  public:
+  int64_t value(int index) const;
+  void set_value(int index, int64_t value);
+  void add_value(int64_t value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      value() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      mutable_value();
+
+  // optional int64 key = 1;
+  bool has_key() const;
+  private:
+  bool _internal_has_key() const;
+  public:
+  void clear_key();
+  int64_t key() const;
+  void set_key(int64_t value);
+  private:
+  int64_t _internal_key() const;
+  void _internal_set_key(int64_t value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.IntIntListEntryProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t > value_;
+    int64_t key_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class NodeDeviceConfigurationProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.NodeDeviceConfigurationProto) */ {
+ public:
+  inline NodeDeviceConfigurationProto() : NodeDeviceConfigurationProto(nullptr) {}
+  ~NodeDeviceConfigurationProto() override;
+  explicit PROTOBUF_CONSTEXPR NodeDeviceConfigurationProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  NodeDeviceConfigurationProto(const NodeDeviceConfigurationProto& from);
+  NodeDeviceConfigurationProto(NodeDeviceConfigurationProto&& from) noexcept
+    : NodeDeviceConfigurationProto() {
+    *this = ::std::move(from);
+  }
+
+  inline NodeDeviceConfigurationProto& operator=(const NodeDeviceConfigurationProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline NodeDeviceConfigurationProto& operator=(NodeDeviceConfigurationProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const NodeDeviceConfigurationProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const NodeDeviceConfigurationProto* internal_default_instance() {
+    return reinterpret_cast<const NodeDeviceConfigurationProto*>(
+               &_NodeDeviceConfigurationProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    4;
+
+  friend void swap(NodeDeviceConfigurationProto& a, NodeDeviceConfigurationProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(NodeDeviceConfigurationProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(NodeDeviceConfigurationProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  NodeDeviceConfigurationProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<NodeDeviceConfigurationProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const NodeDeviceConfigurationProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const NodeDeviceConfigurationProto& from) {
+    NodeDeviceConfigurationProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(NodeDeviceConfigurationProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.NodeDeviceConfigurationProto";
+  }
+  protected:
+  explicit NodeDeviceConfigurationProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kShardingSpecFieldNumber = 2,
+    kConfigurationIdFieldNumber = 1,
+    kPipelineStageFieldNumber = 3,
+  };
+  // repeated .onnx.ShardingSpecProto sharding_spec = 2;
+  int sharding_spec_size() const;
+  private:
+  int _internal_sharding_spec_size() const;
+  public:
+  void clear_sharding_spec();
+  ::onnx::ShardingSpecProto* mutable_sharding_spec(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ShardingSpecProto >*
+      mutable_sharding_spec();
+  private:
+  const ::onnx::ShardingSpecProto& _internal_sharding_spec(int index) const;
+  ::onnx::ShardingSpecProto* _internal_add_sharding_spec();
+  public:
+  const ::onnx::ShardingSpecProto& sharding_spec(int index) const;
+  ::onnx::ShardingSpecProto* add_sharding_spec();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ShardingSpecProto >&
+      sharding_spec() const;
+
+  // optional string configuration_id = 1;
+  bool has_configuration_id() const;
+  private:
+  bool _internal_has_configuration_id() const;
+  public:
+  void clear_configuration_id();
+  const std::string& configuration_id() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_configuration_id(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_configuration_id();
+  PROTOBUF_NODISCARD std::string* release_configuration_id();
+  void set_allocated_configuration_id(std::string* configuration_id);
+  private:
+  const std::string& _internal_configuration_id() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_configuration_id(const std::string& value);
+  std::string* _internal_mutable_configuration_id();
+  public:
+
+  // optional int32 pipeline_stage = 3;
+  bool has_pipeline_stage() const;
+  private:
+  bool _internal_has_pipeline_stage() const;
+  public:
+  void clear_pipeline_stage();
+  int32_t pipeline_stage() const;
+  void set_pipeline_stage(int32_t value);
+  private:
+  int32_t _internal_pipeline_stage() const;
+  void _internal_set_pipeline_stage(int32_t value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.NodeDeviceConfigurationProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ShardingSpecProto > sharding_spec_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr configuration_id_;
+    int32_t pipeline_stage_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class ShardingSpecProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.ShardingSpecProto) */ {
+ public:
+  inline ShardingSpecProto() : ShardingSpecProto(nullptr) {}
+  ~ShardingSpecProto() override;
+  explicit PROTOBUF_CONSTEXPR ShardingSpecProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  ShardingSpecProto(const ShardingSpecProto& from);
+  ShardingSpecProto(ShardingSpecProto&& from) noexcept
+    : ShardingSpecProto() {
+    *this = ::std::move(from);
+  }
+
+  inline ShardingSpecProto& operator=(const ShardingSpecProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline ShardingSpecProto& operator=(ShardingSpecProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const ShardingSpecProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const ShardingSpecProto* internal_default_instance() {
+    return reinterpret_cast<const ShardingSpecProto*>(
+               &_ShardingSpecProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    5;
+
+  friend void swap(ShardingSpecProto& a, ShardingSpecProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(ShardingSpecProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(ShardingSpecProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  ShardingSpecProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ShardingSpecProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const ShardingSpecProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const ShardingSpecProto& from) {
+    ShardingSpecProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(ShardingSpecProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.ShardingSpecProto";
+  }
+  protected:
+  explicit ShardingSpecProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kDeviceFieldNumber = 2,
+    kIndexToDeviceGroupMapFieldNumber = 3,
+    kShardedDimFieldNumber = 4,
+    kTensorNameFieldNumber = 1,
+  };
+  // repeated int64 device = 2;
+  int device_size() const;
+  private:
+  int _internal_device_size() const;
+  public:
+  void clear_device();
+  private:
+  int64_t _internal_device(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      _internal_device() const;
+  void _internal_add_device(int64_t value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      _internal_mutable_device();
+  public:
+  int64_t device(int index) const;
+  void set_device(int index, int64_t value);
+  void add_device(int64_t value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      device() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      mutable_device();
+
+  // repeated .onnx.IntIntListEntryProto index_to_device_group_map = 3;
+  int index_to_device_group_map_size() const;
+  private:
+  int _internal_index_to_device_group_map_size() const;
+  public:
+  void clear_index_to_device_group_map();
+  ::onnx::IntIntListEntryProto* mutable_index_to_device_group_map(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::IntIntListEntryProto >*
+      mutable_index_to_device_group_map();
+  private:
+  const ::onnx::IntIntListEntryProto& _internal_index_to_device_group_map(int index) const;
+  ::onnx::IntIntListEntryProto* _internal_add_index_to_device_group_map();
+  public:
+  const ::onnx::IntIntListEntryProto& index_to_device_group_map(int index) const;
+  ::onnx::IntIntListEntryProto* add_index_to_device_group_map();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::IntIntListEntryProto >&
+      index_to_device_group_map() const;
+
+  // repeated .onnx.ShardedDimProto sharded_dim = 4;
+  int sharded_dim_size() const;
+  private:
+  int _internal_sharded_dim_size() const;
+  public:
+  void clear_sharded_dim();
+  ::onnx::ShardedDimProto* mutable_sharded_dim(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ShardedDimProto >*
+      mutable_sharded_dim();
+  private:
+  const ::onnx::ShardedDimProto& _internal_sharded_dim(int index) const;
+  ::onnx::ShardedDimProto* _internal_add_sharded_dim();
+  public:
+  const ::onnx::ShardedDimProto& sharded_dim(int index) const;
+  ::onnx::ShardedDimProto* add_sharded_dim();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ShardedDimProto >&
+      sharded_dim() const;
+
+  // optional string tensor_name = 1;
+  bool has_tensor_name() const;
+  private:
+  bool _internal_has_tensor_name() const;
+  public:
+  void clear_tensor_name();
+  const std::string& tensor_name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_tensor_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_tensor_name();
+  PROTOBUF_NODISCARD std::string* release_tensor_name();
+  void set_allocated_tensor_name(std::string* tensor_name);
+  private:
+  const std::string& _internal_tensor_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_tensor_name(const std::string& value);
+  std::string* _internal_mutable_tensor_name();
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.ShardingSpecProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t > device_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::IntIntListEntryProto > index_to_device_group_map_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ShardedDimProto > sharded_dim_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr tensor_name_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class ShardedDimProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.ShardedDimProto) */ {
+ public:
+  inline ShardedDimProto() : ShardedDimProto(nullptr) {}
+  ~ShardedDimProto() override;
+  explicit PROTOBUF_CONSTEXPR ShardedDimProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  ShardedDimProto(const ShardedDimProto& from);
+  ShardedDimProto(ShardedDimProto&& from) noexcept
+    : ShardedDimProto() {
+    *this = ::std::move(from);
+  }
+
+  inline ShardedDimProto& operator=(const ShardedDimProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline ShardedDimProto& operator=(ShardedDimProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const ShardedDimProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const ShardedDimProto* internal_default_instance() {
+    return reinterpret_cast<const ShardedDimProto*>(
+               &_ShardedDimProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    6;
+
+  friend void swap(ShardedDimProto& a, ShardedDimProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(ShardedDimProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(ShardedDimProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  ShardedDimProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ShardedDimProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const ShardedDimProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const ShardedDimProto& from) {
+    ShardedDimProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(ShardedDimProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.ShardedDimProto";
+  }
+  protected:
+  explicit ShardedDimProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kSimpleShardingFieldNumber = 2,
+    kAxisFieldNumber = 1,
+  };
+  // repeated .onnx.SimpleShardedDimProto simple_sharding = 2;
+  int simple_sharding_size() const;
+  private:
+  int _internal_simple_sharding_size() const;
+  public:
+  void clear_simple_sharding();
+  ::onnx::SimpleShardedDimProto* mutable_simple_sharding(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SimpleShardedDimProto >*
+      mutable_simple_sharding();
+  private:
+  const ::onnx::SimpleShardedDimProto& _internal_simple_sharding(int index) const;
+  ::onnx::SimpleShardedDimProto* _internal_add_simple_sharding();
+  public:
+  const ::onnx::SimpleShardedDimProto& simple_sharding(int index) const;
+  ::onnx::SimpleShardedDimProto* add_simple_sharding();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SimpleShardedDimProto >&
+      simple_sharding() const;
+
+  // optional int64 axis = 1;
+  bool has_axis() const;
+  private:
+  bool _internal_has_axis() const;
+  public:
+  void clear_axis();
+  int64_t axis() const;
+  void set_axis(int64_t value);
+  private:
+  int64_t _internal_axis() const;
+  void _internal_set_axis(int64_t value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.ShardedDimProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SimpleShardedDimProto > simple_sharding_;
+    int64_t axis_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class SimpleShardedDimProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.SimpleShardedDimProto) */ {
+ public:
+  inline SimpleShardedDimProto() : SimpleShardedDimProto(nullptr) {}
+  ~SimpleShardedDimProto() override;
+  explicit PROTOBUF_CONSTEXPR SimpleShardedDimProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  SimpleShardedDimProto(const SimpleShardedDimProto& from);
+  SimpleShardedDimProto(SimpleShardedDimProto&& from) noexcept
+    : SimpleShardedDimProto() {
+    *this = ::std::move(from);
+  }
+
+  inline SimpleShardedDimProto& operator=(const SimpleShardedDimProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline SimpleShardedDimProto& operator=(SimpleShardedDimProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const SimpleShardedDimProto& default_instance() {
+    return *internal_default_instance();
+  }
+  enum DimCase {
+    kDimValue = 1,
+    kDimParam = 2,
+    DIM_NOT_SET = 0,
+  };
+
+  static inline const SimpleShardedDimProto* internal_default_instance() {
+    return reinterpret_cast<const SimpleShardedDimProto*>(
+               &_SimpleShardedDimProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    7;
+
+  friend void swap(SimpleShardedDimProto& a, SimpleShardedDimProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(SimpleShardedDimProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(SimpleShardedDimProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  SimpleShardedDimProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<SimpleShardedDimProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const SimpleShardedDimProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const SimpleShardedDimProto& from) {
+    SimpleShardedDimProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(SimpleShardedDimProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.SimpleShardedDimProto";
+  }
+  protected:
+  explicit SimpleShardedDimProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kNumShardsFieldNumber = 3,
+    kDimValueFieldNumber = 1,
+    kDimParamFieldNumber = 2,
+  };
+  // optional int64 num_shards = 3;
+  bool has_num_shards() const;
+  private:
+  bool _internal_has_num_shards() const;
+  public:
+  void clear_num_shards();
+  int64_t num_shards() const;
+  void set_num_shards(int64_t value);
+  private:
+  int64_t _internal_num_shards() const;
+  void _internal_set_num_shards(int64_t value);
+  public:
+
+  // int64 dim_value = 1;
+  bool has_dim_value() const;
+  private:
+  bool _internal_has_dim_value() const;
+  public:
+  void clear_dim_value();
+  int64_t dim_value() const;
+  void set_dim_value(int64_t value);
+  private:
+  int64_t _internal_dim_value() const;
+  void _internal_set_dim_value(int64_t value);
+  public:
+
+  // string dim_param = 2;
+  bool has_dim_param() const;
+  private:
+  bool _internal_has_dim_param() const;
+  public:
+  void clear_dim_param();
+  const std::string& dim_param() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_dim_param(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_dim_param();
+  PROTOBUF_NODISCARD std::string* release_dim_param();
+  void set_allocated_dim_param(std::string* dim_param);
+  private:
+  const std::string& _internal_dim_param() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_dim_param(const std::string& value);
+  std::string* _internal_mutable_dim_param();
+  public:
+
+  void clear_dim();
+  DimCase dim_case() const;
+  // @@protoc_insertion_point(class_scope:onnx.SimpleShardedDimProto)
+ private:
+  class _Internal;
+  void set_has_dim_value();
+  void set_has_dim_param();
+
+  inline bool has_dim() const;
+  inline void clear_has_dim();
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    int64_t num_shards_;
+    union DimUnion {
+      constexpr DimUnion() : _constinit_{} {}
+        ::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized _constinit_;
+      int64_t dim_value_;
+      ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr dim_param_;
+    } dim_;
+    uint32_t _oneof_case_[1];
+
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TrainingInfoProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TrainingInfoProto) */ {
+ public:
+  inline TrainingInfoProto() : TrainingInfoProto(nullptr) {}
+  ~TrainingInfoProto() override;
+  explicit PROTOBUF_CONSTEXPR TrainingInfoProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TrainingInfoProto(const TrainingInfoProto& from);
+  TrainingInfoProto(TrainingInfoProto&& from) noexcept
+    : TrainingInfoProto() {
+    *this = ::std::move(from);
+  }
+
+  inline TrainingInfoProto& operator=(const TrainingInfoProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TrainingInfoProto& operator=(TrainingInfoProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TrainingInfoProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TrainingInfoProto* internal_default_instance() {
+    return reinterpret_cast<const TrainingInfoProto*>(
+               &_TrainingInfoProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    8;
+
+  friend void swap(TrainingInfoProto& a, TrainingInfoProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TrainingInfoProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TrainingInfoProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TrainingInfoProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TrainingInfoProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TrainingInfoProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TrainingInfoProto& from) {
+    TrainingInfoProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TrainingInfoProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TrainingInfoProto";
+  }
+  protected:
+  explicit TrainingInfoProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kInitializationBindingFieldNumber = 3,
+    kUpdateBindingFieldNumber = 4,
+    kInitializationFieldNumber = 1,
+    kAlgorithmFieldNumber = 2,
+  };
+  // repeated .onnx.StringStringEntryProto initialization_binding = 3;
+  int initialization_binding_size() const;
+  private:
+  int _internal_initialization_binding_size() const;
+  public:
+  void clear_initialization_binding();
+  ::onnx::StringStringEntryProto* mutable_initialization_binding(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+      mutable_initialization_binding();
+  private:
+  const ::onnx::StringStringEntryProto& _internal_initialization_binding(int index) const;
+  ::onnx::StringStringEntryProto* _internal_add_initialization_binding();
+  public:
+  const ::onnx::StringStringEntryProto& initialization_binding(int index) const;
+  ::onnx::StringStringEntryProto* add_initialization_binding();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+      initialization_binding() const;
+
+  // repeated .onnx.StringStringEntryProto update_binding = 4;
+  int update_binding_size() const;
+  private:
+  int _internal_update_binding_size() const;
+  public:
+  void clear_update_binding();
+  ::onnx::StringStringEntryProto* mutable_update_binding(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+      mutable_update_binding();
+  private:
+  const ::onnx::StringStringEntryProto& _internal_update_binding(int index) const;
+  ::onnx::StringStringEntryProto* _internal_add_update_binding();
+  public:
+  const ::onnx::StringStringEntryProto& update_binding(int index) const;
+  ::onnx::StringStringEntryProto* add_update_binding();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+      update_binding() const;
+
+  // optional .onnx.GraphProto initialization = 1;
+  bool has_initialization() const;
+  private:
+  bool _internal_has_initialization() const;
+  public:
+  void clear_initialization();
+  const ::onnx::GraphProto& initialization() const;
+  PROTOBUF_NODISCARD ::onnx::GraphProto* release_initialization();
+  ::onnx::GraphProto* mutable_initialization();
+  void set_allocated_initialization(::onnx::GraphProto* initialization);
+  private:
+  const ::onnx::GraphProto& _internal_initialization() const;
+  ::onnx::GraphProto* _internal_mutable_initialization();
+  public:
+  void unsafe_arena_set_allocated_initialization(
+      ::onnx::GraphProto* initialization);
+  ::onnx::GraphProto* unsafe_arena_release_initialization();
+
+  // optional .onnx.GraphProto algorithm = 2;
+  bool has_algorithm() const;
+  private:
+  bool _internal_has_algorithm() const;
+  public:
+  void clear_algorithm();
+  const ::onnx::GraphProto& algorithm() const;
+  PROTOBUF_NODISCARD ::onnx::GraphProto* release_algorithm();
+  ::onnx::GraphProto* mutable_algorithm();
+  void set_allocated_algorithm(::onnx::GraphProto* algorithm);
+  private:
+  const ::onnx::GraphProto& _internal_algorithm() const;
+  ::onnx::GraphProto* _internal_mutable_algorithm();
+  public:
+  void unsafe_arena_set_allocated_algorithm(
+      ::onnx::GraphProto* algorithm);
+  ::onnx::GraphProto* unsafe_arena_release_algorithm();
+
+  // @@protoc_insertion_point(class_scope:onnx.TrainingInfoProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto > initialization_binding_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto > update_binding_;
+    ::onnx::GraphProto* initialization_;
+    ::onnx::GraphProto* algorithm_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class ModelProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.ModelProto) */ {
+ public:
+  inline ModelProto() : ModelProto(nullptr) {}
+  ~ModelProto() override;
+  explicit PROTOBUF_CONSTEXPR ModelProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  ModelProto(const ModelProto& from);
+  ModelProto(ModelProto&& from) noexcept
+    : ModelProto() {
+    *this = ::std::move(from);
+  }
+
+  inline ModelProto& operator=(const ModelProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline ModelProto& operator=(ModelProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const ModelProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const ModelProto* internal_default_instance() {
+    return reinterpret_cast<const ModelProto*>(
+               &_ModelProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    9;
+
+  friend void swap(ModelProto& a, ModelProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(ModelProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(ModelProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  ModelProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<ModelProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const ModelProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const ModelProto& from) {
+    ModelProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(ModelProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.ModelProto";
+  }
+  protected:
+  explicit ModelProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kOpsetImportFieldNumber = 8,
+    kMetadataPropsFieldNumber = 14,
+    kTrainingInfoFieldNumber = 20,
+    kFunctionsFieldNumber = 25,
+    kConfigurationFieldNumber = 26,
+    kProducerNameFieldNumber = 2,
+    kProducerVersionFieldNumber = 3,
+    kDomainFieldNumber = 4,
+    kDocStringFieldNumber = 6,
+    kGraphFieldNumber = 7,
+    kIrVersionFieldNumber = 1,
+    kModelVersionFieldNumber = 5,
+  };
+  // repeated .onnx.OperatorSetIdProto opset_import = 8;
+  int opset_import_size() const;
+  private:
+  int _internal_opset_import_size() const;
+  public:
+  void clear_opset_import();
+  ::onnx::OperatorSetIdProto* mutable_opset_import(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::OperatorSetIdProto >*
+      mutable_opset_import();
+  private:
+  const ::onnx::OperatorSetIdProto& _internal_opset_import(int index) const;
+  ::onnx::OperatorSetIdProto* _internal_add_opset_import();
+  public:
+  const ::onnx::OperatorSetIdProto& opset_import(int index) const;
+  ::onnx::OperatorSetIdProto* add_opset_import();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::OperatorSetIdProto >&
+      opset_import() const;
+
+  // repeated .onnx.StringStringEntryProto metadata_props = 14;
+  int metadata_props_size() const;
+  private:
+  int _internal_metadata_props_size() const;
+  public:
+  void clear_metadata_props();
+  ::onnx::StringStringEntryProto* mutable_metadata_props(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+      mutable_metadata_props();
+  private:
+  const ::onnx::StringStringEntryProto& _internal_metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* _internal_add_metadata_props();
+  public:
+  const ::onnx::StringStringEntryProto& metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* add_metadata_props();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+      metadata_props() const;
+
+  // repeated .onnx.TrainingInfoProto training_info = 20;
+  int training_info_size() const;
+  private:
+  int _internal_training_info_size() const;
+  public:
+  void clear_training_info();
+  ::onnx::TrainingInfoProto* mutable_training_info(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TrainingInfoProto >*
+      mutable_training_info();
+  private:
+  const ::onnx::TrainingInfoProto& _internal_training_info(int index) const;
+  ::onnx::TrainingInfoProto* _internal_add_training_info();
+  public:
+  const ::onnx::TrainingInfoProto& training_info(int index) const;
+  ::onnx::TrainingInfoProto* add_training_info();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TrainingInfoProto >&
+      training_info() const;
+
+  // repeated .onnx.FunctionProto functions = 25;
+  int functions_size() const;
+  private:
+  int _internal_functions_size() const;
+  public:
+  void clear_functions();
+  ::onnx::FunctionProto* mutable_functions(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::FunctionProto >*
+      mutable_functions();
+  private:
+  const ::onnx::FunctionProto& _internal_functions(int index) const;
+  ::onnx::FunctionProto* _internal_add_functions();
+  public:
+  const ::onnx::FunctionProto& functions(int index) const;
+  ::onnx::FunctionProto* add_functions();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::FunctionProto >&
+      functions() const;
+
+  // repeated .onnx.DeviceConfigurationProto configuration = 26;
+  int configuration_size() const;
+  private:
+  int _internal_configuration_size() const;
+  public:
+  void clear_configuration();
+  ::onnx::DeviceConfigurationProto* mutable_configuration(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::DeviceConfigurationProto >*
+      mutable_configuration();
+  private:
+  const ::onnx::DeviceConfigurationProto& _internal_configuration(int index) const;
+  ::onnx::DeviceConfigurationProto* _internal_add_configuration();
+  public:
+  const ::onnx::DeviceConfigurationProto& configuration(int index) const;
+  ::onnx::DeviceConfigurationProto* add_configuration();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::DeviceConfigurationProto >&
+      configuration() const;
+
+  // optional string producer_name = 2;
+  bool has_producer_name() const;
+  private:
+  bool _internal_has_producer_name() const;
+  public:
+  void clear_producer_name();
+  const std::string& producer_name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_producer_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_producer_name();
+  PROTOBUF_NODISCARD std::string* release_producer_name();
+  void set_allocated_producer_name(std::string* producer_name);
+  private:
+  const std::string& _internal_producer_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_producer_name(const std::string& value);
+  std::string* _internal_mutable_producer_name();
+  public:
+
+  // optional string producer_version = 3;
+  bool has_producer_version() const;
+  private:
+  bool _internal_has_producer_version() const;
+  public:
+  void clear_producer_version();
+  const std::string& producer_version() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_producer_version(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_producer_version();
+  PROTOBUF_NODISCARD std::string* release_producer_version();
+  void set_allocated_producer_version(std::string* producer_version);
+  private:
+  const std::string& _internal_producer_version() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_producer_version(const std::string& value);
+  std::string* _internal_mutable_producer_version();
+  public:
+
+  // optional string domain = 4;
+  bool has_domain() const;
+  private:
+  bool _internal_has_domain() const;
+  public:
+  void clear_domain();
+  const std::string& domain() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_domain(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_domain();
+  PROTOBUF_NODISCARD std::string* release_domain();
+  void set_allocated_domain(std::string* domain);
+  private:
+  const std::string& _internal_domain() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_domain(const std::string& value);
+  std::string* _internal_mutable_domain();
+  public:
+
+  // optional string doc_string = 6;
+  bool has_doc_string() const;
+  private:
+  bool _internal_has_doc_string() const;
+  public:
+  void clear_doc_string();
+  const std::string& doc_string() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_doc_string(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_doc_string();
+  PROTOBUF_NODISCARD std::string* release_doc_string();
+  void set_allocated_doc_string(std::string* doc_string);
+  private:
+  const std::string& _internal_doc_string() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_doc_string(const std::string& value);
+  std::string* _internal_mutable_doc_string();
+  public:
+
+  // optional .onnx.GraphProto graph = 7;
+  bool has_graph() const;
+  private:
+  bool _internal_has_graph() const;
+  public:
+  void clear_graph();
+  const ::onnx::GraphProto& graph() const;
+  PROTOBUF_NODISCARD ::onnx::GraphProto* release_graph();
+  ::onnx::GraphProto* mutable_graph();
+  void set_allocated_graph(::onnx::GraphProto* graph);
+  private:
+  const ::onnx::GraphProto& _internal_graph() const;
+  ::onnx::GraphProto* _internal_mutable_graph();
+  public:
+  void unsafe_arena_set_allocated_graph(
+      ::onnx::GraphProto* graph);
+  ::onnx::GraphProto* unsafe_arena_release_graph();
+
+  // optional int64 ir_version = 1;
+  bool has_ir_version() const;
+  private:
+  bool _internal_has_ir_version() const;
+  public:
+  void clear_ir_version();
+  int64_t ir_version() const;
+  void set_ir_version(int64_t value);
+  private:
+  int64_t _internal_ir_version() const;
+  void _internal_set_ir_version(int64_t value);
+  public:
+
+  // optional int64 model_version = 5;
+  bool has_model_version() const;
+  private:
+  bool _internal_has_model_version() const;
+  public:
+  void clear_model_version();
+  int64_t model_version() const;
+  void set_model_version(int64_t value);
+  private:
+  int64_t _internal_model_version() const;
+  void _internal_set_model_version(int64_t value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.ModelProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::OperatorSetIdProto > opset_import_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto > metadata_props_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TrainingInfoProto > training_info_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::FunctionProto > functions_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::DeviceConfigurationProto > configuration_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr producer_name_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr producer_version_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr domain_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr doc_string_;
+    ::onnx::GraphProto* graph_;
+    int64_t ir_version_;
+    int64_t model_version_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class DeviceConfigurationProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.DeviceConfigurationProto) */ {
+ public:
+  inline DeviceConfigurationProto() : DeviceConfigurationProto(nullptr) {}
+  ~DeviceConfigurationProto() override;
+  explicit PROTOBUF_CONSTEXPR DeviceConfigurationProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  DeviceConfigurationProto(const DeviceConfigurationProto& from);
+  DeviceConfigurationProto(DeviceConfigurationProto&& from) noexcept
+    : DeviceConfigurationProto() {
+    *this = ::std::move(from);
+  }
+
+  inline DeviceConfigurationProto& operator=(const DeviceConfigurationProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline DeviceConfigurationProto& operator=(DeviceConfigurationProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const DeviceConfigurationProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const DeviceConfigurationProto* internal_default_instance() {
+    return reinterpret_cast<const DeviceConfigurationProto*>(
+               &_DeviceConfigurationProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    10;
+
+  friend void swap(DeviceConfigurationProto& a, DeviceConfigurationProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(DeviceConfigurationProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(DeviceConfigurationProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  DeviceConfigurationProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<DeviceConfigurationProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const DeviceConfigurationProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const DeviceConfigurationProto& from) {
+    DeviceConfigurationProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(DeviceConfigurationProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.DeviceConfigurationProto";
+  }
+  protected:
+  explicit DeviceConfigurationProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kDeviceFieldNumber = 3,
+    kNameFieldNumber = 1,
+    kNumDevicesFieldNumber = 2,
+  };
+  // repeated string device = 3;
+  int device_size() const;
+  private:
+  int _internal_device_size() const;
+  public:
+  void clear_device();
+  const std::string& device(int index) const;
+  std::string* mutable_device(int index);
+  void set_device(int index, const std::string& value);
+  void set_device(int index, std::string&& value);
+  void set_device(int index, const char* value);
+  void set_device(int index, const char* value, size_t size);
+  std::string* add_device();
+  void add_device(const std::string& value);
+  void add_device(std::string&& value);
+  void add_device(const char* value);
+  void add_device(const char* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& device() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_device();
+  private:
+  const std::string& _internal_device(int index) const;
+  std::string* _internal_add_device();
+  public:
+
+  // optional string name = 1;
+  bool has_name() const;
+  private:
+  bool _internal_has_name() const;
+  public:
+  void clear_name();
+  const std::string& name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* name);
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(const std::string& value);
+  std::string* _internal_mutable_name();
+  public:
+
+  // optional int32 num_devices = 2;
+  bool has_num_devices() const;
+  private:
+  bool _internal_has_num_devices() const;
+  public:
+  void clear_num_devices();
+  int32_t num_devices() const;
+  void set_num_devices(int32_t value);
+  private:
+  int32_t _internal_num_devices() const;
+  void _internal_set_num_devices(int32_t value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.DeviceConfigurationProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> device_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
+    int32_t num_devices_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class StringStringEntryProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.StringStringEntryProto) */ {
+ public:
+  inline StringStringEntryProto() : StringStringEntryProto(nullptr) {}
+  ~StringStringEntryProto() override;
+  explicit PROTOBUF_CONSTEXPR StringStringEntryProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  StringStringEntryProto(const StringStringEntryProto& from);
+  StringStringEntryProto(StringStringEntryProto&& from) noexcept
+    : StringStringEntryProto() {
+    *this = ::std::move(from);
+  }
+
+  inline StringStringEntryProto& operator=(const StringStringEntryProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline StringStringEntryProto& operator=(StringStringEntryProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const StringStringEntryProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const StringStringEntryProto* internal_default_instance() {
+    return reinterpret_cast<const StringStringEntryProto*>(
+               &_StringStringEntryProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    11;
+
+  friend void swap(StringStringEntryProto& a, StringStringEntryProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(StringStringEntryProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(StringStringEntryProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  StringStringEntryProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<StringStringEntryProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const StringStringEntryProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const StringStringEntryProto& from) {
+    StringStringEntryProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(StringStringEntryProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.StringStringEntryProto";
+  }
+  protected:
+  explicit StringStringEntryProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kKeyFieldNumber = 1,
+    kValueFieldNumber = 2,
+  };
+  // optional string key = 1;
+  bool has_key() const;
+  private:
+  bool _internal_has_key() const;
+  public:
+  void clear_key();
+  const std::string& key() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_key(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_key();
+  PROTOBUF_NODISCARD std::string* release_key();
+  void set_allocated_key(std::string* key);
+  private:
+  const std::string& _internal_key() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_key(const std::string& value);
+  std::string* _internal_mutable_key();
+  public:
+
+  // optional string value = 2;
+  bool has_value() const;
+  private:
+  bool _internal_has_value() const;
+  public:
+  void clear_value();
+  const std::string& value() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_value(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_value();
+  PROTOBUF_NODISCARD std::string* release_value();
+  void set_allocated_value(std::string* value);
+  private:
+  const std::string& _internal_value() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_value(const std::string& value);
+  std::string* _internal_mutable_value();
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.StringStringEntryProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr key_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr value_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TensorAnnotation final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TensorAnnotation) */ {
+ public:
+  inline TensorAnnotation() : TensorAnnotation(nullptr) {}
+  ~TensorAnnotation() override;
+  explicit PROTOBUF_CONSTEXPR TensorAnnotation(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TensorAnnotation(const TensorAnnotation& from);
+  TensorAnnotation(TensorAnnotation&& from) noexcept
+    : TensorAnnotation() {
+    *this = ::std::move(from);
+  }
+
+  inline TensorAnnotation& operator=(const TensorAnnotation& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TensorAnnotation& operator=(TensorAnnotation&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TensorAnnotation& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TensorAnnotation* internal_default_instance() {
+    return reinterpret_cast<const TensorAnnotation*>(
+               &_TensorAnnotation_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    12;
+
+  friend void swap(TensorAnnotation& a, TensorAnnotation& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TensorAnnotation* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TensorAnnotation* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TensorAnnotation* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TensorAnnotation>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TensorAnnotation& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TensorAnnotation& from) {
+    TensorAnnotation::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TensorAnnotation* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TensorAnnotation";
+  }
+  protected:
+  explicit TensorAnnotation(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kQuantParameterTensorNamesFieldNumber = 2,
+    kTensorNameFieldNumber = 1,
+  };
+  // repeated .onnx.StringStringEntryProto quant_parameter_tensor_names = 2;
+  int quant_parameter_tensor_names_size() const;
+  private:
+  int _internal_quant_parameter_tensor_names_size() const;
+  public:
+  void clear_quant_parameter_tensor_names();
+  ::onnx::StringStringEntryProto* mutable_quant_parameter_tensor_names(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+      mutable_quant_parameter_tensor_names();
+  private:
+  const ::onnx::StringStringEntryProto& _internal_quant_parameter_tensor_names(int index) const;
+  ::onnx::StringStringEntryProto* _internal_add_quant_parameter_tensor_names();
+  public:
+  const ::onnx::StringStringEntryProto& quant_parameter_tensor_names(int index) const;
+  ::onnx::StringStringEntryProto* add_quant_parameter_tensor_names();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+      quant_parameter_tensor_names() const;
+
+  // optional string tensor_name = 1;
+  bool has_tensor_name() const;
+  private:
+  bool _internal_has_tensor_name() const;
+  public:
+  void clear_tensor_name();
+  const std::string& tensor_name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_tensor_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_tensor_name();
+  PROTOBUF_NODISCARD std::string* release_tensor_name();
+  void set_allocated_tensor_name(std::string* tensor_name);
+  private:
+  const std::string& _internal_tensor_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_tensor_name(const std::string& value);
+  std::string* _internal_mutable_tensor_name();
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.TensorAnnotation)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto > quant_parameter_tensor_names_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr tensor_name_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class GraphProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.GraphProto) */ {
+ public:
+  inline GraphProto() : GraphProto(nullptr) {}
+  ~GraphProto() override;
+  explicit PROTOBUF_CONSTEXPR GraphProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  GraphProto(const GraphProto& from);
+  GraphProto(GraphProto&& from) noexcept
+    : GraphProto() {
+    *this = ::std::move(from);
+  }
+
+  inline GraphProto& operator=(const GraphProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline GraphProto& operator=(GraphProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const GraphProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const GraphProto* internal_default_instance() {
+    return reinterpret_cast<const GraphProto*>(
+               &_GraphProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    13;
+
+  friend void swap(GraphProto& a, GraphProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(GraphProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(GraphProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  GraphProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<GraphProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const GraphProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const GraphProto& from) {
+    GraphProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(GraphProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.GraphProto";
+  }
+  protected:
+  explicit GraphProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kNodeFieldNumber = 1,
+    kInitializerFieldNumber = 5,
+    kInputFieldNumber = 11,
+    kOutputFieldNumber = 12,
+    kValueInfoFieldNumber = 13,
+    kQuantizationAnnotationFieldNumber = 14,
+    kSparseInitializerFieldNumber = 15,
+    kMetadataPropsFieldNumber = 16,
+    kNameFieldNumber = 2,
+    kDocStringFieldNumber = 10,
+  };
+  // repeated .onnx.NodeProto node = 1;
+  int node_size() const;
+  private:
+  int _internal_node_size() const;
+  public:
+  void clear_node();
+  ::onnx::NodeProto* mutable_node(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeProto >*
+      mutable_node();
+  private:
+  const ::onnx::NodeProto& _internal_node(int index) const;
+  ::onnx::NodeProto* _internal_add_node();
+  public:
+  const ::onnx::NodeProto& node(int index) const;
+  ::onnx::NodeProto* add_node();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeProto >&
+      node() const;
+
+  // repeated .onnx.TensorProto initializer = 5;
+  int initializer_size() const;
+  private:
+  int _internal_initializer_size() const;
+  public:
+  void clear_initializer();
+  ::onnx::TensorProto* mutable_initializer(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorProto >*
+      mutable_initializer();
+  private:
+  const ::onnx::TensorProto& _internal_initializer(int index) const;
+  ::onnx::TensorProto* _internal_add_initializer();
+  public:
+  const ::onnx::TensorProto& initializer(int index) const;
+  ::onnx::TensorProto* add_initializer();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorProto >&
+      initializer() const;
+
+  // repeated .onnx.ValueInfoProto input = 11;
+  int input_size() const;
+  private:
+  int _internal_input_size() const;
+  public:
+  void clear_input();
+  ::onnx::ValueInfoProto* mutable_input(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >*
+      mutable_input();
+  private:
+  const ::onnx::ValueInfoProto& _internal_input(int index) const;
+  ::onnx::ValueInfoProto* _internal_add_input();
+  public:
+  const ::onnx::ValueInfoProto& input(int index) const;
+  ::onnx::ValueInfoProto* add_input();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >&
+      input() const;
+
+  // repeated .onnx.ValueInfoProto output = 12;
+  int output_size() const;
+  private:
+  int _internal_output_size() const;
+  public:
+  void clear_output();
+  ::onnx::ValueInfoProto* mutable_output(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >*
+      mutable_output();
+  private:
+  const ::onnx::ValueInfoProto& _internal_output(int index) const;
+  ::onnx::ValueInfoProto* _internal_add_output();
+  public:
+  const ::onnx::ValueInfoProto& output(int index) const;
+  ::onnx::ValueInfoProto* add_output();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >&
+      output() const;
+
+  // repeated .onnx.ValueInfoProto value_info = 13;
+  int value_info_size() const;
+  private:
+  int _internal_value_info_size() const;
+  public:
+  void clear_value_info();
+  ::onnx::ValueInfoProto* mutable_value_info(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >*
+      mutable_value_info();
+  private:
+  const ::onnx::ValueInfoProto& _internal_value_info(int index) const;
+  ::onnx::ValueInfoProto* _internal_add_value_info();
+  public:
+  const ::onnx::ValueInfoProto& value_info(int index) const;
+  ::onnx::ValueInfoProto* add_value_info();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >&
+      value_info() const;
+
+  // repeated .onnx.TensorAnnotation quantization_annotation = 14;
+  int quantization_annotation_size() const;
+  private:
+  int _internal_quantization_annotation_size() const;
+  public:
+  void clear_quantization_annotation();
+  ::onnx::TensorAnnotation* mutable_quantization_annotation(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorAnnotation >*
+      mutable_quantization_annotation();
+  private:
+  const ::onnx::TensorAnnotation& _internal_quantization_annotation(int index) const;
+  ::onnx::TensorAnnotation* _internal_add_quantization_annotation();
+  public:
+  const ::onnx::TensorAnnotation& quantization_annotation(int index) const;
+  ::onnx::TensorAnnotation* add_quantization_annotation();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorAnnotation >&
+      quantization_annotation() const;
+
+  // repeated .onnx.SparseTensorProto sparse_initializer = 15;
+  int sparse_initializer_size() const;
+  private:
+  int _internal_sparse_initializer_size() const;
+  public:
+  void clear_sparse_initializer();
+  ::onnx::SparseTensorProto* mutable_sparse_initializer(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SparseTensorProto >*
+      mutable_sparse_initializer();
+  private:
+  const ::onnx::SparseTensorProto& _internal_sparse_initializer(int index) const;
+  ::onnx::SparseTensorProto* _internal_add_sparse_initializer();
+  public:
+  const ::onnx::SparseTensorProto& sparse_initializer(int index) const;
+  ::onnx::SparseTensorProto* add_sparse_initializer();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SparseTensorProto >&
+      sparse_initializer() const;
+
+  // repeated .onnx.StringStringEntryProto metadata_props = 16;
+  int metadata_props_size() const;
+  private:
+  int _internal_metadata_props_size() const;
+  public:
+  void clear_metadata_props();
+  ::onnx::StringStringEntryProto* mutable_metadata_props(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+      mutable_metadata_props();
+  private:
+  const ::onnx::StringStringEntryProto& _internal_metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* _internal_add_metadata_props();
+  public:
+  const ::onnx::StringStringEntryProto& metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* add_metadata_props();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+      metadata_props() const;
+
+  // optional string name = 2;
+  bool has_name() const;
+  private:
+  bool _internal_has_name() const;
+  public:
+  void clear_name();
+  const std::string& name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* name);
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(const std::string& value);
+  std::string* _internal_mutable_name();
+  public:
+
+  // optional string doc_string = 10;
+  bool has_doc_string() const;
+  private:
+  bool _internal_has_doc_string() const;
+  public:
+  void clear_doc_string();
+  const std::string& doc_string() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_doc_string(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_doc_string();
+  PROTOBUF_NODISCARD std::string* release_doc_string();
+  void set_allocated_doc_string(std::string* doc_string);
+  private:
+  const std::string& _internal_doc_string() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_doc_string(const std::string& value);
+  std::string* _internal_mutable_doc_string();
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.GraphProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeProto > node_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorProto > initializer_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto > input_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto > output_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto > value_info_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorAnnotation > quantization_annotation_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SparseTensorProto > sparse_initializer_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto > metadata_props_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr doc_string_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TensorProto_Segment final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TensorProto.Segment) */ {
+ public:
+  inline TensorProto_Segment() : TensorProto_Segment(nullptr) {}
+  ~TensorProto_Segment() override;
+  explicit PROTOBUF_CONSTEXPR TensorProto_Segment(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TensorProto_Segment(const TensorProto_Segment& from);
+  TensorProto_Segment(TensorProto_Segment&& from) noexcept
+    : TensorProto_Segment() {
+    *this = ::std::move(from);
+  }
+
+  inline TensorProto_Segment& operator=(const TensorProto_Segment& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TensorProto_Segment& operator=(TensorProto_Segment&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TensorProto_Segment& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TensorProto_Segment* internal_default_instance() {
+    return reinterpret_cast<const TensorProto_Segment*>(
+               &_TensorProto_Segment_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    14;
+
+  friend void swap(TensorProto_Segment& a, TensorProto_Segment& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TensorProto_Segment* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TensorProto_Segment* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TensorProto_Segment* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TensorProto_Segment>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TensorProto_Segment& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TensorProto_Segment& from) {
+    TensorProto_Segment::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TensorProto_Segment* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TensorProto.Segment";
+  }
+  protected:
+  explicit TensorProto_Segment(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kBeginFieldNumber = 1,
+    kEndFieldNumber = 2,
+  };
+  // optional int64 begin = 1;
+  bool has_begin() const;
+  private:
+  bool _internal_has_begin() const;
+  public:
+  void clear_begin();
+  int64_t begin() const;
+  void set_begin(int64_t value);
+  private:
+  int64_t _internal_begin() const;
+  void _internal_set_begin(int64_t value);
+  public:
+
+  // optional int64 end = 2;
+  bool has_end() const;
+  private:
+  bool _internal_has_end() const;
+  public:
+  void clear_end();
+  int64_t end() const;
+  void set_end(int64_t value);
+  private:
+  int64_t _internal_end() const;
+  void _internal_set_end(int64_t value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.TensorProto.Segment)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    int64_t begin_;
+    int64_t end_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TensorProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TensorProto) */ {
+ public:
+  inline TensorProto() : TensorProto(nullptr) {}
+  ~TensorProto() override;
+  explicit PROTOBUF_CONSTEXPR TensorProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TensorProto(const TensorProto& from);
+  TensorProto(TensorProto&& from) noexcept
+    : TensorProto() {
+    *this = ::std::move(from);
+  }
+
+  inline TensorProto& operator=(const TensorProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TensorProto& operator=(TensorProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TensorProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TensorProto* internal_default_instance() {
+    return reinterpret_cast<const TensorProto*>(
+               &_TensorProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    15;
+
+  friend void swap(TensorProto& a, TensorProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TensorProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TensorProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TensorProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TensorProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TensorProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TensorProto& from) {
+    TensorProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TensorProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TensorProto";
+  }
+  protected:
+  explicit TensorProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  typedef TensorProto_Segment Segment;
+
+  typedef TensorProto_DataType DataType;
+  static constexpr DataType UNDEFINED =
+    TensorProto_DataType_UNDEFINED;
+  static constexpr DataType FLOAT =
+    TensorProto_DataType_FLOAT;
+  static constexpr DataType UINT8 =
+    TensorProto_DataType_UINT8;
+  static constexpr DataType INT8 =
+    TensorProto_DataType_INT8;
+  static constexpr DataType UINT16 =
+    TensorProto_DataType_UINT16;
+  static constexpr DataType INT16 =
+    TensorProto_DataType_INT16;
+  static constexpr DataType INT32 =
+    TensorProto_DataType_INT32;
+  static constexpr DataType INT64 =
+    TensorProto_DataType_INT64;
+  static constexpr DataType STRING =
+    TensorProto_DataType_STRING;
+  static constexpr DataType BOOL =
+    TensorProto_DataType_BOOL;
+  static constexpr DataType FLOAT16 =
+    TensorProto_DataType_FLOAT16;
+  static constexpr DataType DOUBLE =
+    TensorProto_DataType_DOUBLE;
+  static constexpr DataType UINT32 =
+    TensorProto_DataType_UINT32;
+  static constexpr DataType UINT64 =
+    TensorProto_DataType_UINT64;
+  static constexpr DataType COMPLEX64 =
+    TensorProto_DataType_COMPLEX64;
+  static constexpr DataType COMPLEX128 =
+    TensorProto_DataType_COMPLEX128;
+  static constexpr DataType BFLOAT16 =
+    TensorProto_DataType_BFLOAT16;
+  static constexpr DataType FLOAT8E4M3FN =
+    TensorProto_DataType_FLOAT8E4M3FN;
+  static constexpr DataType FLOAT8E4M3FNUZ =
+    TensorProto_DataType_FLOAT8E4M3FNUZ;
+  static constexpr DataType FLOAT8E5M2 =
+    TensorProto_DataType_FLOAT8E5M2;
+  static constexpr DataType FLOAT8E5M2FNUZ =
+    TensorProto_DataType_FLOAT8E5M2FNUZ;
+  static constexpr DataType UINT4 =
+    TensorProto_DataType_UINT4;
+  static constexpr DataType INT4 =
+    TensorProto_DataType_INT4;
+  static constexpr DataType FLOAT4E2M1 =
+    TensorProto_DataType_FLOAT4E2M1;
+  static constexpr DataType FLOAT8E8M0 =
+    TensorProto_DataType_FLOAT8E8M0;
+  static constexpr DataType UINT2 =
+    TensorProto_DataType_UINT2;
+  static constexpr DataType INT2 =
+    TensorProto_DataType_INT2;
+  static inline bool DataType_IsValid(int value) {
+    return TensorProto_DataType_IsValid(value);
+  }
+  static constexpr DataType DataType_MIN =
+    TensorProto_DataType_DataType_MIN;
+  static constexpr DataType DataType_MAX =
+    TensorProto_DataType_DataType_MAX;
+  static constexpr int DataType_ARRAYSIZE =
+    TensorProto_DataType_DataType_ARRAYSIZE;
+  static inline const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor*
+  DataType_descriptor() {
+    return TensorProto_DataType_descriptor();
+  }
+  template<typename T>
+  static inline const std::string& DataType_Name(T enum_t_value) {
+    static_assert(::std::is_same<T, DataType>::value ||
+      ::std::is_integral<T>::value,
+      "Incorrect type passed to function DataType_Name.");
+    return TensorProto_DataType_Name(enum_t_value);
+  }
+  static inline bool DataType_Parse(::PROTOBUF_NAMESPACE_ID::ConstStringParam name,
+      DataType* value) {
+    return TensorProto_DataType_Parse(name, value);
+  }
+
+  typedef TensorProto_DataLocation DataLocation;
+  static constexpr DataLocation DEFAULT =
+    TensorProto_DataLocation_DEFAULT;
+  static constexpr DataLocation EXTERNAL =
+    TensorProto_DataLocation_EXTERNAL;
+  static inline bool DataLocation_IsValid(int value) {
+    return TensorProto_DataLocation_IsValid(value);
+  }
+  static constexpr DataLocation DataLocation_MIN =
+    TensorProto_DataLocation_DataLocation_MIN;
+  static constexpr DataLocation DataLocation_MAX =
+    TensorProto_DataLocation_DataLocation_MAX;
+  static constexpr int DataLocation_ARRAYSIZE =
+    TensorProto_DataLocation_DataLocation_ARRAYSIZE;
+  static inline const ::PROTOBUF_NAMESPACE_ID::EnumDescriptor*
+  DataLocation_descriptor() {
+    return TensorProto_DataLocation_descriptor();
+  }
+  template<typename T>
+  static inline const std::string& DataLocation_Name(T enum_t_value) {
+    static_assert(::std::is_same<T, DataLocation>::value ||
+      ::std::is_integral<T>::value,
+      "Incorrect type passed to function DataLocation_Name.");
+    return TensorProto_DataLocation_Name(enum_t_value);
+  }
+  static inline bool DataLocation_Parse(::PROTOBUF_NAMESPACE_ID::ConstStringParam name,
+      DataLocation* value) {
+    return TensorProto_DataLocation_Parse(name, value);
+  }
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kDimsFieldNumber = 1,
+    kFloatDataFieldNumber = 4,
+    kInt32DataFieldNumber = 5,
+    kStringDataFieldNumber = 6,
+    kInt64DataFieldNumber = 7,
+    kDoubleDataFieldNumber = 10,
+    kUint64DataFieldNumber = 11,
+    kExternalDataFieldNumber = 13,
+    kMetadataPropsFieldNumber = 16,
+    kNameFieldNumber = 8,
+    kRawDataFieldNumber = 9,
+    kDocStringFieldNumber = 12,
+    kSegmentFieldNumber = 3,
+    kDataTypeFieldNumber = 2,
+    kDataLocationFieldNumber = 14,
+  };
+  // repeated int64 dims = 1;
+  int dims_size() const;
+  private:
+  int _internal_dims_size() const;
+  public:
+  void clear_dims();
+  private:
+  int64_t _internal_dims(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      _internal_dims() const;
+  void _internal_add_dims(int64_t value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      _internal_mutable_dims();
+  public:
+  int64_t dims(int index) const;
+  void set_dims(int index, int64_t value);
+  void add_dims(int64_t value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      dims() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      mutable_dims();
+
+  // repeated float float_data = 4 [packed = true];
+  int float_data_size() const;
+  private:
+  int _internal_float_data_size() const;
+  public:
+  void clear_float_data();
+  private:
+  float _internal_float_data(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+      _internal_float_data() const;
+  void _internal_add_float_data(float value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+      _internal_mutable_float_data();
+  public:
+  float float_data(int index) const;
+  void set_float_data(int index, float value);
+  void add_float_data(float value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+      float_data() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+      mutable_float_data();
+
+  // repeated int32 int32_data = 5 [packed = true];
+  int int32_data_size() const;
+  private:
+  int _internal_int32_data_size() const;
+  public:
+  void clear_int32_data();
+  private:
+  int32_t _internal_int32_data(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int32_t >&
+      _internal_int32_data() const;
+  void _internal_add_int32_data(int32_t value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int32_t >*
+      _internal_mutable_int32_data();
+  public:
+  int32_t int32_data(int index) const;
+  void set_int32_data(int index, int32_t value);
+  void add_int32_data(int32_t value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int32_t >&
+      int32_data() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int32_t >*
+      mutable_int32_data();
+
+  // repeated bytes string_data = 6;
+  int string_data_size() const;
+  private:
+  int _internal_string_data_size() const;
+  public:
+  void clear_string_data();
+  const std::string& string_data(int index) const;
+  std::string* mutable_string_data(int index);
+  void set_string_data(int index, const std::string& value);
+  void set_string_data(int index, std::string&& value);
+  void set_string_data(int index, const char* value);
+  void set_string_data(int index, const void* value, size_t size);
+  std::string* add_string_data();
+  void add_string_data(const std::string& value);
+  void add_string_data(std::string&& value);
+  void add_string_data(const char* value);
+  void add_string_data(const void* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& string_data() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_string_data();
+  private:
+  const std::string& _internal_string_data(int index) const;
+  std::string* _internal_add_string_data();
+  public:
+
+  // repeated int64 int64_data = 7 [packed = true];
+  int int64_data_size() const;
+  private:
+  int _internal_int64_data_size() const;
+  public:
+  void clear_int64_data();
+  private:
+  int64_t _internal_int64_data(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      _internal_int64_data() const;
+  void _internal_add_int64_data(int64_t value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      _internal_mutable_int64_data();
+  public:
+  int64_t int64_data(int index) const;
+  void set_int64_data(int index, int64_t value);
+  void add_int64_data(int64_t value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      int64_data() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      mutable_int64_data();
+
+  // repeated double double_data = 10 [packed = true];
+  int double_data_size() const;
+  private:
+  int _internal_double_data_size() const;
+  public:
+  void clear_double_data();
+  private:
+  double _internal_double_data(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< double >&
+      _internal_double_data() const;
+  void _internal_add_double_data(double value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< double >*
+      _internal_mutable_double_data();
+  public:
+  double double_data(int index) const;
+  void set_double_data(int index, double value);
+  void add_double_data(double value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< double >&
+      double_data() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< double >*
+      mutable_double_data();
+
+  // repeated uint64 uint64_data = 11 [packed = true];
+  int uint64_data_size() const;
+  private:
+  int _internal_uint64_data_size() const;
+  public:
+  void clear_uint64_data();
+  private:
+  uint64_t _internal_uint64_data(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< uint64_t >&
+      _internal_uint64_data() const;
+  void _internal_add_uint64_data(uint64_t value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< uint64_t >*
+      _internal_mutable_uint64_data();
+  public:
+  uint64_t uint64_data(int index) const;
+  void set_uint64_data(int index, uint64_t value);
+  void add_uint64_data(uint64_t value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< uint64_t >&
+      uint64_data() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< uint64_t >*
+      mutable_uint64_data();
+
+  // repeated .onnx.StringStringEntryProto external_data = 13;
+  int external_data_size() const;
+  private:
+  int _internal_external_data_size() const;
+  public:
+  void clear_external_data();
+  ::onnx::StringStringEntryProto* mutable_external_data(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+      mutable_external_data();
+  private:
+  const ::onnx::StringStringEntryProto& _internal_external_data(int index) const;
+  ::onnx::StringStringEntryProto* _internal_add_external_data();
+  public:
+  const ::onnx::StringStringEntryProto& external_data(int index) const;
+  ::onnx::StringStringEntryProto* add_external_data();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+      external_data() const;
+
+  // repeated .onnx.StringStringEntryProto metadata_props = 16;
+  int metadata_props_size() const;
+  private:
+  int _internal_metadata_props_size() const;
+  public:
+  void clear_metadata_props();
+  ::onnx::StringStringEntryProto* mutable_metadata_props(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+      mutable_metadata_props();
+  private:
+  const ::onnx::StringStringEntryProto& _internal_metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* _internal_add_metadata_props();
+  public:
+  const ::onnx::StringStringEntryProto& metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* add_metadata_props();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+      metadata_props() const;
+
+  // optional string name = 8;
+  bool has_name() const;
+  private:
+  bool _internal_has_name() const;
+  public:
+  void clear_name();
+  const std::string& name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* name);
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(const std::string& value);
+  std::string* _internal_mutable_name();
+  public:
+
+  // optional bytes raw_data = 9;
+  bool has_raw_data() const;
+  private:
+  bool _internal_has_raw_data() const;
+  public:
+  void clear_raw_data();
+  const std::string& raw_data() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_raw_data(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_raw_data();
+  PROTOBUF_NODISCARD std::string* release_raw_data();
+  void set_allocated_raw_data(std::string* raw_data);
+  private:
+  const std::string& _internal_raw_data() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_raw_data(const std::string& value);
+  std::string* _internal_mutable_raw_data();
+  public:
+
+  // optional string doc_string = 12;
+  bool has_doc_string() const;
+  private:
+  bool _internal_has_doc_string() const;
+  public:
+  void clear_doc_string();
+  const std::string& doc_string() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_doc_string(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_doc_string();
+  PROTOBUF_NODISCARD std::string* release_doc_string();
+  void set_allocated_doc_string(std::string* doc_string);
+  private:
+  const std::string& _internal_doc_string() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_doc_string(const std::string& value);
+  std::string* _internal_mutable_doc_string();
+  public:
+
+  // optional .onnx.TensorProto.Segment segment = 3;
+  bool has_segment() const;
+  private:
+  bool _internal_has_segment() const;
+  public:
+  void clear_segment();
+  const ::onnx::TensorProto_Segment& segment() const;
+  PROTOBUF_NODISCARD ::onnx::TensorProto_Segment* release_segment();
+  ::onnx::TensorProto_Segment* mutable_segment();
+  void set_allocated_segment(::onnx::TensorProto_Segment* segment);
+  private:
+  const ::onnx::TensorProto_Segment& _internal_segment() const;
+  ::onnx::TensorProto_Segment* _internal_mutable_segment();
+  public:
+  void unsafe_arena_set_allocated_segment(
+      ::onnx::TensorProto_Segment* segment);
+  ::onnx::TensorProto_Segment* unsafe_arena_release_segment();
+
+  // optional int32 data_type = 2;
+  bool has_data_type() const;
+  private:
+  bool _internal_has_data_type() const;
+  public:
+  void clear_data_type();
+  int32_t data_type() const;
+  void set_data_type(int32_t value);
+  private:
+  int32_t _internal_data_type() const;
+  void _internal_set_data_type(int32_t value);
+  public:
+
+  // optional .onnx.TensorProto.DataLocation data_location = 14;
+  bool has_data_location() const;
+  private:
+  bool _internal_has_data_location() const;
+  public:
+  void clear_data_location();
+  ::onnx::TensorProto_DataLocation data_location() const;
+  void set_data_location(::onnx::TensorProto_DataLocation value);
+  private:
+  ::onnx::TensorProto_DataLocation _internal_data_location() const;
+  void _internal_set_data_location(::onnx::TensorProto_DataLocation value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.TensorProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t > dims_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< float > float_data_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< int32_t > int32_data_;
+    mutable std::atomic<int> _int32_data_cached_byte_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> string_data_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t > int64_data_;
+    mutable std::atomic<int> _int64_data_cached_byte_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< double > double_data_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< uint64_t > uint64_data_;
+    mutable std::atomic<int> _uint64_data_cached_byte_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto > external_data_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto > metadata_props_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr raw_data_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr doc_string_;
+    ::onnx::TensorProto_Segment* segment_;
+    int32_t data_type_;
+    int data_location_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class SparseTensorProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.SparseTensorProto) */ {
+ public:
+  inline SparseTensorProto() : SparseTensorProto(nullptr) {}
+  ~SparseTensorProto() override;
+  explicit PROTOBUF_CONSTEXPR SparseTensorProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  SparseTensorProto(const SparseTensorProto& from);
+  SparseTensorProto(SparseTensorProto&& from) noexcept
+    : SparseTensorProto() {
+    *this = ::std::move(from);
+  }
+
+  inline SparseTensorProto& operator=(const SparseTensorProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline SparseTensorProto& operator=(SparseTensorProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const SparseTensorProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const SparseTensorProto* internal_default_instance() {
+    return reinterpret_cast<const SparseTensorProto*>(
+               &_SparseTensorProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    16;
+
+  friend void swap(SparseTensorProto& a, SparseTensorProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(SparseTensorProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(SparseTensorProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  SparseTensorProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<SparseTensorProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const SparseTensorProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const SparseTensorProto& from) {
+    SparseTensorProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(SparseTensorProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.SparseTensorProto";
+  }
+  protected:
+  explicit SparseTensorProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kDimsFieldNumber = 3,
+    kValuesFieldNumber = 1,
+    kIndicesFieldNumber = 2,
+  };
+  // repeated int64 dims = 3;
+  int dims_size() const;
+  private:
+  int _internal_dims_size() const;
+  public:
+  void clear_dims();
+  private:
+  int64_t _internal_dims(int index) const;
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      _internal_dims() const;
+  void _internal_add_dims(int64_t value);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      _internal_mutable_dims();
+  public:
+  int64_t dims(int index) const;
+  void set_dims(int index, int64_t value);
+  void add_dims(int64_t value);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+      dims() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+      mutable_dims();
+
+  // optional .onnx.TensorProto values = 1;
+  bool has_values() const;
+  private:
+  bool _internal_has_values() const;
+  public:
+  void clear_values();
+  const ::onnx::TensorProto& values() const;
+  PROTOBUF_NODISCARD ::onnx::TensorProto* release_values();
+  ::onnx::TensorProto* mutable_values();
+  void set_allocated_values(::onnx::TensorProto* values);
+  private:
+  const ::onnx::TensorProto& _internal_values() const;
+  ::onnx::TensorProto* _internal_mutable_values();
+  public:
+  void unsafe_arena_set_allocated_values(
+      ::onnx::TensorProto* values);
+  ::onnx::TensorProto* unsafe_arena_release_values();
+
+  // optional .onnx.TensorProto indices = 2;
+  bool has_indices() const;
+  private:
+  bool _internal_has_indices() const;
+  public:
+  void clear_indices();
+  const ::onnx::TensorProto& indices() const;
+  PROTOBUF_NODISCARD ::onnx::TensorProto* release_indices();
+  ::onnx::TensorProto* mutable_indices();
+  void set_allocated_indices(::onnx::TensorProto* indices);
+  private:
+  const ::onnx::TensorProto& _internal_indices() const;
+  ::onnx::TensorProto* _internal_mutable_indices();
+  public:
+  void unsafe_arena_set_allocated_indices(
+      ::onnx::TensorProto* indices);
+  ::onnx::TensorProto* unsafe_arena_release_indices();
+
+  // @@protoc_insertion_point(class_scope:onnx.SparseTensorProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t > dims_;
+    ::onnx::TensorProto* values_;
+    ::onnx::TensorProto* indices_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TensorShapeProto_Dimension final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TensorShapeProto.Dimension) */ {
+ public:
+  inline TensorShapeProto_Dimension() : TensorShapeProto_Dimension(nullptr) {}
+  ~TensorShapeProto_Dimension() override;
+  explicit PROTOBUF_CONSTEXPR TensorShapeProto_Dimension(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TensorShapeProto_Dimension(const TensorShapeProto_Dimension& from);
+  TensorShapeProto_Dimension(TensorShapeProto_Dimension&& from) noexcept
+    : TensorShapeProto_Dimension() {
+    *this = ::std::move(from);
+  }
+
+  inline TensorShapeProto_Dimension& operator=(const TensorShapeProto_Dimension& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TensorShapeProto_Dimension& operator=(TensorShapeProto_Dimension&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TensorShapeProto_Dimension& default_instance() {
+    return *internal_default_instance();
+  }
+  enum ValueCase {
+    kDimValue = 1,
+    kDimParam = 2,
+    VALUE_NOT_SET = 0,
+  };
+
+  static inline const TensorShapeProto_Dimension* internal_default_instance() {
+    return reinterpret_cast<const TensorShapeProto_Dimension*>(
+               &_TensorShapeProto_Dimension_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    17;
+
+  friend void swap(TensorShapeProto_Dimension& a, TensorShapeProto_Dimension& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TensorShapeProto_Dimension* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TensorShapeProto_Dimension* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TensorShapeProto_Dimension* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TensorShapeProto_Dimension>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TensorShapeProto_Dimension& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TensorShapeProto_Dimension& from) {
+    TensorShapeProto_Dimension::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TensorShapeProto_Dimension* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TensorShapeProto.Dimension";
+  }
+  protected:
+  explicit TensorShapeProto_Dimension(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kDenotationFieldNumber = 3,
+    kDimValueFieldNumber = 1,
+    kDimParamFieldNumber = 2,
+  };
+  // optional string denotation = 3;
+  bool has_denotation() const;
+  private:
+  bool _internal_has_denotation() const;
+  public:
+  void clear_denotation();
+  const std::string& denotation() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_denotation(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_denotation();
+  PROTOBUF_NODISCARD std::string* release_denotation();
+  void set_allocated_denotation(std::string* denotation);
+  private:
+  const std::string& _internal_denotation() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_denotation(const std::string& value);
+  std::string* _internal_mutable_denotation();
+  public:
+
+  // int64 dim_value = 1;
+  bool has_dim_value() const;
+  private:
+  bool _internal_has_dim_value() const;
+  public:
+  void clear_dim_value();
+  int64_t dim_value() const;
+  void set_dim_value(int64_t value);
+  private:
+  int64_t _internal_dim_value() const;
+  void _internal_set_dim_value(int64_t value);
+  public:
+
+  // string dim_param = 2;
+  bool has_dim_param() const;
+  private:
+  bool _internal_has_dim_param() const;
+  public:
+  void clear_dim_param();
+  const std::string& dim_param() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_dim_param(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_dim_param();
+  PROTOBUF_NODISCARD std::string* release_dim_param();
+  void set_allocated_dim_param(std::string* dim_param);
+  private:
+  const std::string& _internal_dim_param() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_dim_param(const std::string& value);
+  std::string* _internal_mutable_dim_param();
+  public:
+
+  void clear_value();
+  ValueCase value_case() const;
+  // @@protoc_insertion_point(class_scope:onnx.TensorShapeProto.Dimension)
+ private:
+  class _Internal;
+  void set_has_dim_value();
+  void set_has_dim_param();
+
+  inline bool has_value() const;
+  inline void clear_has_value();
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr denotation_;
+    union ValueUnion {
+      constexpr ValueUnion() : _constinit_{} {}
+        ::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized _constinit_;
+      int64_t dim_value_;
+      ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr dim_param_;
+    } value_;
+    uint32_t _oneof_case_[1];
+
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TensorShapeProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TensorShapeProto) */ {
+ public:
+  inline TensorShapeProto() : TensorShapeProto(nullptr) {}
+  ~TensorShapeProto() override;
+  explicit PROTOBUF_CONSTEXPR TensorShapeProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TensorShapeProto(const TensorShapeProto& from);
+  TensorShapeProto(TensorShapeProto&& from) noexcept
+    : TensorShapeProto() {
+    *this = ::std::move(from);
+  }
+
+  inline TensorShapeProto& operator=(const TensorShapeProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TensorShapeProto& operator=(TensorShapeProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TensorShapeProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TensorShapeProto* internal_default_instance() {
+    return reinterpret_cast<const TensorShapeProto*>(
+               &_TensorShapeProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    18;
+
+  friend void swap(TensorShapeProto& a, TensorShapeProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TensorShapeProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TensorShapeProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TensorShapeProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TensorShapeProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TensorShapeProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TensorShapeProto& from) {
+    TensorShapeProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TensorShapeProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TensorShapeProto";
+  }
+  protected:
+  explicit TensorShapeProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  typedef TensorShapeProto_Dimension Dimension;
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kDimFieldNumber = 1,
+  };
+  // repeated .onnx.TensorShapeProto.Dimension dim = 1;
+  int dim_size() const;
+  private:
+  int _internal_dim_size() const;
+  public:
+  void clear_dim();
+  ::onnx::TensorShapeProto_Dimension* mutable_dim(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorShapeProto_Dimension >*
+      mutable_dim();
+  private:
+  const ::onnx::TensorShapeProto_Dimension& _internal_dim(int index) const;
+  ::onnx::TensorShapeProto_Dimension* _internal_add_dim();
+  public:
+  const ::onnx::TensorShapeProto_Dimension& dim(int index) const;
+  ::onnx::TensorShapeProto_Dimension* add_dim();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorShapeProto_Dimension >&
+      dim() const;
+
+  // @@protoc_insertion_point(class_scope:onnx.TensorShapeProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorShapeProto_Dimension > dim_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TypeProto_Tensor final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TypeProto.Tensor) */ {
+ public:
+  inline TypeProto_Tensor() : TypeProto_Tensor(nullptr) {}
+  ~TypeProto_Tensor() override;
+  explicit PROTOBUF_CONSTEXPR TypeProto_Tensor(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TypeProto_Tensor(const TypeProto_Tensor& from);
+  TypeProto_Tensor(TypeProto_Tensor&& from) noexcept
+    : TypeProto_Tensor() {
+    *this = ::std::move(from);
+  }
+
+  inline TypeProto_Tensor& operator=(const TypeProto_Tensor& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TypeProto_Tensor& operator=(TypeProto_Tensor&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TypeProto_Tensor& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TypeProto_Tensor* internal_default_instance() {
+    return reinterpret_cast<const TypeProto_Tensor*>(
+               &_TypeProto_Tensor_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    19;
+
+  friend void swap(TypeProto_Tensor& a, TypeProto_Tensor& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TypeProto_Tensor* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TypeProto_Tensor* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TypeProto_Tensor* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TypeProto_Tensor>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TypeProto_Tensor& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TypeProto_Tensor& from) {
+    TypeProto_Tensor::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TypeProto_Tensor* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TypeProto.Tensor";
+  }
+  protected:
+  explicit TypeProto_Tensor(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kShapeFieldNumber = 2,
+    kElemTypeFieldNumber = 1,
+  };
+  // optional .onnx.TensorShapeProto shape = 2;
+  bool has_shape() const;
+  private:
+  bool _internal_has_shape() const;
+  public:
+  void clear_shape();
+  const ::onnx::TensorShapeProto& shape() const;
+  PROTOBUF_NODISCARD ::onnx::TensorShapeProto* release_shape();
+  ::onnx::TensorShapeProto* mutable_shape();
+  void set_allocated_shape(::onnx::TensorShapeProto* shape);
+  private:
+  const ::onnx::TensorShapeProto& _internal_shape() const;
+  ::onnx::TensorShapeProto* _internal_mutable_shape();
+  public:
+  void unsafe_arena_set_allocated_shape(
+      ::onnx::TensorShapeProto* shape);
+  ::onnx::TensorShapeProto* unsafe_arena_release_shape();
+
+  // optional int32 elem_type = 1;
+  bool has_elem_type() const;
+  private:
+  bool _internal_has_elem_type() const;
+  public:
+  void clear_elem_type();
+  int32_t elem_type() const;
+  void set_elem_type(int32_t value);
+  private:
+  int32_t _internal_elem_type() const;
+  void _internal_set_elem_type(int32_t value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.TypeProto.Tensor)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::onnx::TensorShapeProto* shape_;
+    int32_t elem_type_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TypeProto_Sequence final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TypeProto.Sequence) */ {
+ public:
+  inline TypeProto_Sequence() : TypeProto_Sequence(nullptr) {}
+  ~TypeProto_Sequence() override;
+  explicit PROTOBUF_CONSTEXPR TypeProto_Sequence(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TypeProto_Sequence(const TypeProto_Sequence& from);
+  TypeProto_Sequence(TypeProto_Sequence&& from) noexcept
+    : TypeProto_Sequence() {
+    *this = ::std::move(from);
+  }
+
+  inline TypeProto_Sequence& operator=(const TypeProto_Sequence& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TypeProto_Sequence& operator=(TypeProto_Sequence&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TypeProto_Sequence& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TypeProto_Sequence* internal_default_instance() {
+    return reinterpret_cast<const TypeProto_Sequence*>(
+               &_TypeProto_Sequence_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    20;
+
+  friend void swap(TypeProto_Sequence& a, TypeProto_Sequence& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TypeProto_Sequence* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TypeProto_Sequence* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TypeProto_Sequence* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TypeProto_Sequence>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TypeProto_Sequence& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TypeProto_Sequence& from) {
+    TypeProto_Sequence::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TypeProto_Sequence* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TypeProto.Sequence";
+  }
+  protected:
+  explicit TypeProto_Sequence(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kElemTypeFieldNumber = 1,
+  };
+  // optional .onnx.TypeProto elem_type = 1;
+  bool has_elem_type() const;
+  private:
+  bool _internal_has_elem_type() const;
+  public:
+  void clear_elem_type();
+  const ::onnx::TypeProto& elem_type() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto* release_elem_type();
+  ::onnx::TypeProto* mutable_elem_type();
+  void set_allocated_elem_type(::onnx::TypeProto* elem_type);
+  private:
+  const ::onnx::TypeProto& _internal_elem_type() const;
+  ::onnx::TypeProto* _internal_mutable_elem_type();
+  public:
+  void unsafe_arena_set_allocated_elem_type(
+      ::onnx::TypeProto* elem_type);
+  ::onnx::TypeProto* unsafe_arena_release_elem_type();
+
+  // @@protoc_insertion_point(class_scope:onnx.TypeProto.Sequence)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::onnx::TypeProto* elem_type_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TypeProto_Map final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TypeProto.Map) */ {
+ public:
+  inline TypeProto_Map() : TypeProto_Map(nullptr) {}
+  ~TypeProto_Map() override;
+  explicit PROTOBUF_CONSTEXPR TypeProto_Map(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TypeProto_Map(const TypeProto_Map& from);
+  TypeProto_Map(TypeProto_Map&& from) noexcept
+    : TypeProto_Map() {
+    *this = ::std::move(from);
+  }
+
+  inline TypeProto_Map& operator=(const TypeProto_Map& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TypeProto_Map& operator=(TypeProto_Map&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TypeProto_Map& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TypeProto_Map* internal_default_instance() {
+    return reinterpret_cast<const TypeProto_Map*>(
+               &_TypeProto_Map_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    21;
+
+  friend void swap(TypeProto_Map& a, TypeProto_Map& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TypeProto_Map* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TypeProto_Map* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TypeProto_Map* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TypeProto_Map>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TypeProto_Map& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TypeProto_Map& from) {
+    TypeProto_Map::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TypeProto_Map* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TypeProto.Map";
+  }
+  protected:
+  explicit TypeProto_Map(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kValueTypeFieldNumber = 2,
+    kKeyTypeFieldNumber = 1,
+  };
+  // optional .onnx.TypeProto value_type = 2;
+  bool has_value_type() const;
+  private:
+  bool _internal_has_value_type() const;
+  public:
+  void clear_value_type();
+  const ::onnx::TypeProto& value_type() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto* release_value_type();
+  ::onnx::TypeProto* mutable_value_type();
+  void set_allocated_value_type(::onnx::TypeProto* value_type);
+  private:
+  const ::onnx::TypeProto& _internal_value_type() const;
+  ::onnx::TypeProto* _internal_mutable_value_type();
+  public:
+  void unsafe_arena_set_allocated_value_type(
+      ::onnx::TypeProto* value_type);
+  ::onnx::TypeProto* unsafe_arena_release_value_type();
+
+  // optional int32 key_type = 1;
+  bool has_key_type() const;
+  private:
+  bool _internal_has_key_type() const;
+  public:
+  void clear_key_type();
+  int32_t key_type() const;
+  void set_key_type(int32_t value);
+  private:
+  int32_t _internal_key_type() const;
+  void _internal_set_key_type(int32_t value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.TypeProto.Map)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::onnx::TypeProto* value_type_;
+    int32_t key_type_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TypeProto_Optional final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TypeProto.Optional) */ {
+ public:
+  inline TypeProto_Optional() : TypeProto_Optional(nullptr) {}
+  ~TypeProto_Optional() override;
+  explicit PROTOBUF_CONSTEXPR TypeProto_Optional(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TypeProto_Optional(const TypeProto_Optional& from);
+  TypeProto_Optional(TypeProto_Optional&& from) noexcept
+    : TypeProto_Optional() {
+    *this = ::std::move(from);
+  }
+
+  inline TypeProto_Optional& operator=(const TypeProto_Optional& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TypeProto_Optional& operator=(TypeProto_Optional&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TypeProto_Optional& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TypeProto_Optional* internal_default_instance() {
+    return reinterpret_cast<const TypeProto_Optional*>(
+               &_TypeProto_Optional_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    22;
+
+  friend void swap(TypeProto_Optional& a, TypeProto_Optional& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TypeProto_Optional* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TypeProto_Optional* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TypeProto_Optional* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TypeProto_Optional>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TypeProto_Optional& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TypeProto_Optional& from) {
+    TypeProto_Optional::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TypeProto_Optional* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TypeProto.Optional";
+  }
+  protected:
+  explicit TypeProto_Optional(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kElemTypeFieldNumber = 1,
+  };
+  // optional .onnx.TypeProto elem_type = 1;
+  bool has_elem_type() const;
+  private:
+  bool _internal_has_elem_type() const;
+  public:
+  void clear_elem_type();
+  const ::onnx::TypeProto& elem_type() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto* release_elem_type();
+  ::onnx::TypeProto* mutable_elem_type();
+  void set_allocated_elem_type(::onnx::TypeProto* elem_type);
+  private:
+  const ::onnx::TypeProto& _internal_elem_type() const;
+  ::onnx::TypeProto* _internal_mutable_elem_type();
+  public:
+  void unsafe_arena_set_allocated_elem_type(
+      ::onnx::TypeProto* elem_type);
+  ::onnx::TypeProto* unsafe_arena_release_elem_type();
+
+  // @@protoc_insertion_point(class_scope:onnx.TypeProto.Optional)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::onnx::TypeProto* elem_type_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TypeProto_SparseTensor final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TypeProto.SparseTensor) */ {
+ public:
+  inline TypeProto_SparseTensor() : TypeProto_SparseTensor(nullptr) {}
+  ~TypeProto_SparseTensor() override;
+  explicit PROTOBUF_CONSTEXPR TypeProto_SparseTensor(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TypeProto_SparseTensor(const TypeProto_SparseTensor& from);
+  TypeProto_SparseTensor(TypeProto_SparseTensor&& from) noexcept
+    : TypeProto_SparseTensor() {
+    *this = ::std::move(from);
+  }
+
+  inline TypeProto_SparseTensor& operator=(const TypeProto_SparseTensor& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TypeProto_SparseTensor& operator=(TypeProto_SparseTensor&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TypeProto_SparseTensor& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TypeProto_SparseTensor* internal_default_instance() {
+    return reinterpret_cast<const TypeProto_SparseTensor*>(
+               &_TypeProto_SparseTensor_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    23;
+
+  friend void swap(TypeProto_SparseTensor& a, TypeProto_SparseTensor& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TypeProto_SparseTensor* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TypeProto_SparseTensor* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TypeProto_SparseTensor* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TypeProto_SparseTensor>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TypeProto_SparseTensor& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TypeProto_SparseTensor& from) {
+    TypeProto_SparseTensor::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TypeProto_SparseTensor* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TypeProto.SparseTensor";
+  }
+  protected:
+  explicit TypeProto_SparseTensor(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kShapeFieldNumber = 2,
+    kElemTypeFieldNumber = 1,
+  };
+  // optional .onnx.TensorShapeProto shape = 2;
+  bool has_shape() const;
+  private:
+  bool _internal_has_shape() const;
+  public:
+  void clear_shape();
+  const ::onnx::TensorShapeProto& shape() const;
+  PROTOBUF_NODISCARD ::onnx::TensorShapeProto* release_shape();
+  ::onnx::TensorShapeProto* mutable_shape();
+  void set_allocated_shape(::onnx::TensorShapeProto* shape);
+  private:
+  const ::onnx::TensorShapeProto& _internal_shape() const;
+  ::onnx::TensorShapeProto* _internal_mutable_shape();
+  public:
+  void unsafe_arena_set_allocated_shape(
+      ::onnx::TensorShapeProto* shape);
+  ::onnx::TensorShapeProto* unsafe_arena_release_shape();
+
+  // optional int32 elem_type = 1;
+  bool has_elem_type() const;
+  private:
+  bool _internal_has_elem_type() const;
+  public:
+  void clear_elem_type();
+  int32_t elem_type() const;
+  void set_elem_type(int32_t value);
+  private:
+  int32_t _internal_elem_type() const;
+  void _internal_set_elem_type(int32_t value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.TypeProto.SparseTensor)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::onnx::TensorShapeProto* shape_;
+    int32_t elem_type_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TypeProto_Opaque final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TypeProto.Opaque) */ {
+ public:
+  inline TypeProto_Opaque() : TypeProto_Opaque(nullptr) {}
+  ~TypeProto_Opaque() override;
+  explicit PROTOBUF_CONSTEXPR TypeProto_Opaque(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TypeProto_Opaque(const TypeProto_Opaque& from);
+  TypeProto_Opaque(TypeProto_Opaque&& from) noexcept
+    : TypeProto_Opaque() {
+    *this = ::std::move(from);
+  }
+
+  inline TypeProto_Opaque& operator=(const TypeProto_Opaque& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TypeProto_Opaque& operator=(TypeProto_Opaque&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TypeProto_Opaque& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const TypeProto_Opaque* internal_default_instance() {
+    return reinterpret_cast<const TypeProto_Opaque*>(
+               &_TypeProto_Opaque_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    24;
+
+  friend void swap(TypeProto_Opaque& a, TypeProto_Opaque& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TypeProto_Opaque* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TypeProto_Opaque* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TypeProto_Opaque* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TypeProto_Opaque>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TypeProto_Opaque& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TypeProto_Opaque& from) {
+    TypeProto_Opaque::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TypeProto_Opaque* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TypeProto.Opaque";
+  }
+  protected:
+  explicit TypeProto_Opaque(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kDomainFieldNumber = 1,
+    kNameFieldNumber = 2,
+  };
+  // optional string domain = 1;
+  bool has_domain() const;
+  private:
+  bool _internal_has_domain() const;
+  public:
+  void clear_domain();
+  const std::string& domain() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_domain(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_domain();
+  PROTOBUF_NODISCARD std::string* release_domain();
+  void set_allocated_domain(std::string* domain);
+  private:
+  const std::string& _internal_domain() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_domain(const std::string& value);
+  std::string* _internal_mutable_domain();
+  public:
+
+  // optional string name = 2;
+  bool has_name() const;
+  private:
+  bool _internal_has_name() const;
+  public:
+  void clear_name();
+  const std::string& name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* name);
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(const std::string& value);
+  std::string* _internal_mutable_name();
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.TypeProto.Opaque)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr domain_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class TypeProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.TypeProto) */ {
+ public:
+  inline TypeProto() : TypeProto(nullptr) {}
+  ~TypeProto() override;
+  explicit PROTOBUF_CONSTEXPR TypeProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  TypeProto(const TypeProto& from);
+  TypeProto(TypeProto&& from) noexcept
+    : TypeProto() {
+    *this = ::std::move(from);
+  }
+
+  inline TypeProto& operator=(const TypeProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline TypeProto& operator=(TypeProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const TypeProto& default_instance() {
+    return *internal_default_instance();
+  }
+  enum ValueCase {
+    kTensorType = 1,
+    kSequenceType = 4,
+    kMapType = 5,
+    kOptionalType = 9,
+    kSparseTensorType = 8,
+    kOpaqueType = 7,
+    VALUE_NOT_SET = 0,
+  };
+
+  static inline const TypeProto* internal_default_instance() {
+    return reinterpret_cast<const TypeProto*>(
+               &_TypeProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    25;
+
+  friend void swap(TypeProto& a, TypeProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(TypeProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(TypeProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  TypeProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<TypeProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const TypeProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const TypeProto& from) {
+    TypeProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(TypeProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.TypeProto";
+  }
+  protected:
+  explicit TypeProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  typedef TypeProto_Tensor Tensor;
+  typedef TypeProto_Sequence Sequence;
+  typedef TypeProto_Map Map;
+  typedef TypeProto_Optional Optional;
+  typedef TypeProto_SparseTensor SparseTensor;
+  typedef TypeProto_Opaque Opaque;
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kDenotationFieldNumber = 6,
+    kTensorTypeFieldNumber = 1,
+    kSequenceTypeFieldNumber = 4,
+    kMapTypeFieldNumber = 5,
+    kOptionalTypeFieldNumber = 9,
+    kSparseTensorTypeFieldNumber = 8,
+    kOpaqueTypeFieldNumber = 7,
+  };
+  // optional string denotation = 6;
+  bool has_denotation() const;
+  private:
+  bool _internal_has_denotation() const;
+  public:
+  void clear_denotation();
+  const std::string& denotation() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_denotation(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_denotation();
+  PROTOBUF_NODISCARD std::string* release_denotation();
+  void set_allocated_denotation(std::string* denotation);
+  private:
+  const std::string& _internal_denotation() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_denotation(const std::string& value);
+  std::string* _internal_mutable_denotation();
+  public:
+
+  // .onnx.TypeProto.Tensor tensor_type = 1;
+  bool has_tensor_type() const;
+  private:
+  bool _internal_has_tensor_type() const;
+  public:
+  void clear_tensor_type();
+  const ::onnx::TypeProto_Tensor& tensor_type() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto_Tensor* release_tensor_type();
+  ::onnx::TypeProto_Tensor* mutable_tensor_type();
+  void set_allocated_tensor_type(::onnx::TypeProto_Tensor* tensor_type);
+  private:
+  const ::onnx::TypeProto_Tensor& _internal_tensor_type() const;
+  ::onnx::TypeProto_Tensor* _internal_mutable_tensor_type();
+  public:
+  void unsafe_arena_set_allocated_tensor_type(
+      ::onnx::TypeProto_Tensor* tensor_type);
+  ::onnx::TypeProto_Tensor* unsafe_arena_release_tensor_type();
+
+  // .onnx.TypeProto.Sequence sequence_type = 4;
+  bool has_sequence_type() const;
+  private:
+  bool _internal_has_sequence_type() const;
+  public:
+  void clear_sequence_type();
+  const ::onnx::TypeProto_Sequence& sequence_type() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto_Sequence* release_sequence_type();
+  ::onnx::TypeProto_Sequence* mutable_sequence_type();
+  void set_allocated_sequence_type(::onnx::TypeProto_Sequence* sequence_type);
+  private:
+  const ::onnx::TypeProto_Sequence& _internal_sequence_type() const;
+  ::onnx::TypeProto_Sequence* _internal_mutable_sequence_type();
+  public:
+  void unsafe_arena_set_allocated_sequence_type(
+      ::onnx::TypeProto_Sequence* sequence_type);
+  ::onnx::TypeProto_Sequence* unsafe_arena_release_sequence_type();
+
+  // .onnx.TypeProto.Map map_type = 5;
+  bool has_map_type() const;
+  private:
+  bool _internal_has_map_type() const;
+  public:
+  void clear_map_type();
+  const ::onnx::TypeProto_Map& map_type() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto_Map* release_map_type();
+  ::onnx::TypeProto_Map* mutable_map_type();
+  void set_allocated_map_type(::onnx::TypeProto_Map* map_type);
+  private:
+  const ::onnx::TypeProto_Map& _internal_map_type() const;
+  ::onnx::TypeProto_Map* _internal_mutable_map_type();
+  public:
+  void unsafe_arena_set_allocated_map_type(
+      ::onnx::TypeProto_Map* map_type);
+  ::onnx::TypeProto_Map* unsafe_arena_release_map_type();
+
+  // .onnx.TypeProto.Optional optional_type = 9;
+  bool has_optional_type() const;
+  private:
+  bool _internal_has_optional_type() const;
+  public:
+  void clear_optional_type();
+  const ::onnx::TypeProto_Optional& optional_type() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto_Optional* release_optional_type();
+  ::onnx::TypeProto_Optional* mutable_optional_type();
+  void set_allocated_optional_type(::onnx::TypeProto_Optional* optional_type);
+  private:
+  const ::onnx::TypeProto_Optional& _internal_optional_type() const;
+  ::onnx::TypeProto_Optional* _internal_mutable_optional_type();
+  public:
+  void unsafe_arena_set_allocated_optional_type(
+      ::onnx::TypeProto_Optional* optional_type);
+  ::onnx::TypeProto_Optional* unsafe_arena_release_optional_type();
+
+  // .onnx.TypeProto.SparseTensor sparse_tensor_type = 8;
+  bool has_sparse_tensor_type() const;
+  private:
+  bool _internal_has_sparse_tensor_type() const;
+  public:
+  void clear_sparse_tensor_type();
+  const ::onnx::TypeProto_SparseTensor& sparse_tensor_type() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto_SparseTensor* release_sparse_tensor_type();
+  ::onnx::TypeProto_SparseTensor* mutable_sparse_tensor_type();
+  void set_allocated_sparse_tensor_type(::onnx::TypeProto_SparseTensor* sparse_tensor_type);
+  private:
+  const ::onnx::TypeProto_SparseTensor& _internal_sparse_tensor_type() const;
+  ::onnx::TypeProto_SparseTensor* _internal_mutable_sparse_tensor_type();
+  public:
+  void unsafe_arena_set_allocated_sparse_tensor_type(
+      ::onnx::TypeProto_SparseTensor* sparse_tensor_type);
+  ::onnx::TypeProto_SparseTensor* unsafe_arena_release_sparse_tensor_type();
+
+  // .onnx.TypeProto.Opaque opaque_type = 7;
+  bool has_opaque_type() const;
+  private:
+  bool _internal_has_opaque_type() const;
+  public:
+  void clear_opaque_type();
+  const ::onnx::TypeProto_Opaque& opaque_type() const;
+  PROTOBUF_NODISCARD ::onnx::TypeProto_Opaque* release_opaque_type();
+  ::onnx::TypeProto_Opaque* mutable_opaque_type();
+  void set_allocated_opaque_type(::onnx::TypeProto_Opaque* opaque_type);
+  private:
+  const ::onnx::TypeProto_Opaque& _internal_opaque_type() const;
+  ::onnx::TypeProto_Opaque* _internal_mutable_opaque_type();
+  public:
+  void unsafe_arena_set_allocated_opaque_type(
+      ::onnx::TypeProto_Opaque* opaque_type);
+  ::onnx::TypeProto_Opaque* unsafe_arena_release_opaque_type();
+
+  void clear_value();
+  ValueCase value_case() const;
+  // @@protoc_insertion_point(class_scope:onnx.TypeProto)
+ private:
+  class _Internal;
+  void set_has_tensor_type();
+  void set_has_sequence_type();
+  void set_has_map_type();
+  void set_has_optional_type();
+  void set_has_sparse_tensor_type();
+  void set_has_opaque_type();
+
+  inline bool has_value() const;
+  inline void clear_has_value();
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr denotation_;
+    union ValueUnion {
+      constexpr ValueUnion() : _constinit_{} {}
+        ::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized _constinit_;
+      ::onnx::TypeProto_Tensor* tensor_type_;
+      ::onnx::TypeProto_Sequence* sequence_type_;
+      ::onnx::TypeProto_Map* map_type_;
+      ::onnx::TypeProto_Optional* optional_type_;
+      ::onnx::TypeProto_SparseTensor* sparse_tensor_type_;
+      ::onnx::TypeProto_Opaque* opaque_type_;
+    } value_;
+    uint32_t _oneof_case_[1];
+
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class OperatorSetIdProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.OperatorSetIdProto) */ {
+ public:
+  inline OperatorSetIdProto() : OperatorSetIdProto(nullptr) {}
+  ~OperatorSetIdProto() override;
+  explicit PROTOBUF_CONSTEXPR OperatorSetIdProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  OperatorSetIdProto(const OperatorSetIdProto& from);
+  OperatorSetIdProto(OperatorSetIdProto&& from) noexcept
+    : OperatorSetIdProto() {
+    *this = ::std::move(from);
+  }
+
+  inline OperatorSetIdProto& operator=(const OperatorSetIdProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline OperatorSetIdProto& operator=(OperatorSetIdProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const OperatorSetIdProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const OperatorSetIdProto* internal_default_instance() {
+    return reinterpret_cast<const OperatorSetIdProto*>(
+               &_OperatorSetIdProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    26;
+
+  friend void swap(OperatorSetIdProto& a, OperatorSetIdProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(OperatorSetIdProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(OperatorSetIdProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  OperatorSetIdProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<OperatorSetIdProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const OperatorSetIdProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const OperatorSetIdProto& from) {
+    OperatorSetIdProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(OperatorSetIdProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.OperatorSetIdProto";
+  }
+  protected:
+  explicit OperatorSetIdProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kDomainFieldNumber = 1,
+    kVersionFieldNumber = 2,
+  };
+  // optional string domain = 1;
+  bool has_domain() const;
+  private:
+  bool _internal_has_domain() const;
+  public:
+  void clear_domain();
+  const std::string& domain() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_domain(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_domain();
+  PROTOBUF_NODISCARD std::string* release_domain();
+  void set_allocated_domain(std::string* domain);
+  private:
+  const std::string& _internal_domain() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_domain(const std::string& value);
+  std::string* _internal_mutable_domain();
+  public:
+
+  // optional int64 version = 2;
+  bool has_version() const;
+  private:
+  bool _internal_has_version() const;
+  public:
+  void clear_version();
+  int64_t version() const;
+  void set_version(int64_t value);
+  private:
+  int64_t _internal_version() const;
+  void _internal_set_version(int64_t value);
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.OperatorSetIdProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr domain_;
+    int64_t version_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// -------------------------------------------------------------------
+
+class FunctionProto final :
+    public ::PROTOBUF_NAMESPACE_ID::Message /* @@protoc_insertion_point(class_definition:onnx.FunctionProto) */ {
+ public:
+  inline FunctionProto() : FunctionProto(nullptr) {}
+  ~FunctionProto() override;
+  explicit PROTOBUF_CONSTEXPR FunctionProto(::PROTOBUF_NAMESPACE_ID::internal::ConstantInitialized);
+
+  FunctionProto(const FunctionProto& from);
+  FunctionProto(FunctionProto&& from) noexcept
+    : FunctionProto() {
+    *this = ::std::move(from);
+  }
+
+  inline FunctionProto& operator=(const FunctionProto& from) {
+    CopyFrom(from);
+    return *this;
+  }
+  inline FunctionProto& operator=(FunctionProto&& from) noexcept {
+    if (this == &from) return *this;
+    if (GetOwningArena() == from.GetOwningArena()
+  #ifdef PROTOBUF_FORCE_COPY_IN_MOVE
+        && GetOwningArena() != nullptr
+  #endif  // !PROTOBUF_FORCE_COPY_IN_MOVE
+    ) {
+      InternalSwap(&from);
+    } else {
+      CopyFrom(from);
+    }
+    return *this;
+  }
+
+  inline const ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet& unknown_fields() const {
+    return _internal_metadata_.unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>(::PROTOBUF_NAMESPACE_ID::UnknownFieldSet::default_instance);
+  }
+  inline ::PROTOBUF_NAMESPACE_ID::UnknownFieldSet* mutable_unknown_fields() {
+    return _internal_metadata_.mutable_unknown_fields<::PROTOBUF_NAMESPACE_ID::UnknownFieldSet>();
+  }
+
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* descriptor() {
+    return GetDescriptor();
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Descriptor* GetDescriptor() {
+    return default_instance().GetMetadata().descriptor;
+  }
+  static const ::PROTOBUF_NAMESPACE_ID::Reflection* GetReflection() {
+    return default_instance().GetMetadata().reflection;
+  }
+  static const FunctionProto& default_instance() {
+    return *internal_default_instance();
+  }
+  static inline const FunctionProto* internal_default_instance() {
+    return reinterpret_cast<const FunctionProto*>(
+               &_FunctionProto_default_instance_);
+  }
+  static constexpr int kIndexInFileMessages =
+    27;
+
+  friend void swap(FunctionProto& a, FunctionProto& b) {
+    a.Swap(&b);
+  }
+  inline void Swap(FunctionProto* other) {
+    if (other == this) return;
+  #ifdef PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() != nullptr &&
+        GetOwningArena() == other->GetOwningArena()) {
+   #else  // PROTOBUF_FORCE_COPY_IN_SWAP
+    if (GetOwningArena() == other->GetOwningArena()) {
+  #endif  // !PROTOBUF_FORCE_COPY_IN_SWAP
+      InternalSwap(other);
+    } else {
+      ::PROTOBUF_NAMESPACE_ID::internal::GenericSwap(this, other);
+    }
+  }
+  void UnsafeArenaSwap(FunctionProto* other) {
+    if (other == this) return;
+    GOOGLE_DCHECK(GetOwningArena() == other->GetOwningArena());
+    InternalSwap(other);
+  }
+
+  // implements Message ----------------------------------------------
+
+  FunctionProto* New(::PROTOBUF_NAMESPACE_ID::Arena* arena = nullptr) const final {
+    return CreateMaybeMessage<FunctionProto>(arena);
+  }
+  using ::PROTOBUF_NAMESPACE_ID::Message::CopyFrom;
+  void CopyFrom(const FunctionProto& from);
+  using ::PROTOBUF_NAMESPACE_ID::Message::MergeFrom;
+  void MergeFrom( const FunctionProto& from) {
+    FunctionProto::MergeImpl(*this, from);
+  }
+  private:
+  static void MergeImpl(::PROTOBUF_NAMESPACE_ID::Message& to_msg, const ::PROTOBUF_NAMESPACE_ID::Message& from_msg);
+  public:
+  PROTOBUF_ATTRIBUTE_REINITIALIZES void Clear() final;
+  bool IsInitialized() const final;
+
+  size_t ByteSizeLong() const final;
+  const char* _InternalParse(const char* ptr, ::PROTOBUF_NAMESPACE_ID::internal::ParseContext* ctx) final;
+  uint8_t* _InternalSerialize(
+      uint8_t* target, ::PROTOBUF_NAMESPACE_ID::io::EpsCopyOutputStream* stream) const final;
+  int GetCachedSize() const final { return _impl_._cached_size_.Get(); }
+
+  private:
+  void SharedCtor(::PROTOBUF_NAMESPACE_ID::Arena* arena, bool is_message_owned);
+  void SharedDtor();
+  void SetCachedSize(int size) const final;
+  void InternalSwap(FunctionProto* other);
+
+  private:
+  friend class ::PROTOBUF_NAMESPACE_ID::internal::AnyMetadata;
+  static ::PROTOBUF_NAMESPACE_ID::StringPiece FullMessageName() {
+    return "onnx.FunctionProto";
+  }
+  protected:
+  explicit FunctionProto(::PROTOBUF_NAMESPACE_ID::Arena* arena,
+                       bool is_message_owned = false);
+  public:
+
+  static const ClassData _class_data_;
+  const ::PROTOBUF_NAMESPACE_ID::Message::ClassData*GetClassData() const final;
+
+  ::PROTOBUF_NAMESPACE_ID::Metadata GetMetadata() const final;
+
+  // nested types ----------------------------------------------------
+
+  // accessors -------------------------------------------------------
+
+  enum : int {
+    kInputFieldNumber = 4,
+    kOutputFieldNumber = 5,
+    kAttributeFieldNumber = 6,
+    kNodeFieldNumber = 7,
+    kOpsetImportFieldNumber = 9,
+    kAttributeProtoFieldNumber = 11,
+    kValueInfoFieldNumber = 12,
+    kMetadataPropsFieldNumber = 14,
+    kNameFieldNumber = 1,
+    kDocStringFieldNumber = 8,
+    kDomainFieldNumber = 10,
+    kOverloadFieldNumber = 13,
+  };
+  // repeated string input = 4;
+  int input_size() const;
+  private:
+  int _internal_input_size() const;
+  public:
+  void clear_input();
+  const std::string& input(int index) const;
+  std::string* mutable_input(int index);
+  void set_input(int index, const std::string& value);
+  void set_input(int index, std::string&& value);
+  void set_input(int index, const char* value);
+  void set_input(int index, const char* value, size_t size);
+  std::string* add_input();
+  void add_input(const std::string& value);
+  void add_input(std::string&& value);
+  void add_input(const char* value);
+  void add_input(const char* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& input() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_input();
+  private:
+  const std::string& _internal_input(int index) const;
+  std::string* _internal_add_input();
+  public:
+
+  // repeated string output = 5;
+  int output_size() const;
+  private:
+  int _internal_output_size() const;
+  public:
+  void clear_output();
+  const std::string& output(int index) const;
+  std::string* mutable_output(int index);
+  void set_output(int index, const std::string& value);
+  void set_output(int index, std::string&& value);
+  void set_output(int index, const char* value);
+  void set_output(int index, const char* value, size_t size);
+  std::string* add_output();
+  void add_output(const std::string& value);
+  void add_output(std::string&& value);
+  void add_output(const char* value);
+  void add_output(const char* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& output() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_output();
+  private:
+  const std::string& _internal_output(int index) const;
+  std::string* _internal_add_output();
+  public:
+
+  // repeated string attribute = 6;
+  int attribute_size() const;
+  private:
+  int _internal_attribute_size() const;
+  public:
+  void clear_attribute();
+  const std::string& attribute(int index) const;
+  std::string* mutable_attribute(int index);
+  void set_attribute(int index, const std::string& value);
+  void set_attribute(int index, std::string&& value);
+  void set_attribute(int index, const char* value);
+  void set_attribute(int index, const char* value, size_t size);
+  std::string* add_attribute();
+  void add_attribute(const std::string& value);
+  void add_attribute(std::string&& value);
+  void add_attribute(const char* value);
+  void add_attribute(const char* value, size_t size);
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>& attribute() const;
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>* mutable_attribute();
+  private:
+  const std::string& _internal_attribute(int index) const;
+  std::string* _internal_add_attribute();
+  public:
+
+  // repeated .onnx.NodeProto node = 7;
+  int node_size() const;
+  private:
+  int _internal_node_size() const;
+  public:
+  void clear_node();
+  ::onnx::NodeProto* mutable_node(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeProto >*
+      mutable_node();
+  private:
+  const ::onnx::NodeProto& _internal_node(int index) const;
+  ::onnx::NodeProto* _internal_add_node();
+  public:
+  const ::onnx::NodeProto& node(int index) const;
+  ::onnx::NodeProto* add_node();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeProto >&
+      node() const;
+
+  // repeated .onnx.OperatorSetIdProto opset_import = 9;
+  int opset_import_size() const;
+  private:
+  int _internal_opset_import_size() const;
+  public:
+  void clear_opset_import();
+  ::onnx::OperatorSetIdProto* mutable_opset_import(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::OperatorSetIdProto >*
+      mutable_opset_import();
+  private:
+  const ::onnx::OperatorSetIdProto& _internal_opset_import(int index) const;
+  ::onnx::OperatorSetIdProto* _internal_add_opset_import();
+  public:
+  const ::onnx::OperatorSetIdProto& opset_import(int index) const;
+  ::onnx::OperatorSetIdProto* add_opset_import();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::OperatorSetIdProto >&
+      opset_import() const;
+
+  // repeated .onnx.AttributeProto attribute_proto = 11;
+  int attribute_proto_size() const;
+  private:
+  int _internal_attribute_proto_size() const;
+  public:
+  void clear_attribute_proto();
+  ::onnx::AttributeProto* mutable_attribute_proto(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::AttributeProto >*
+      mutable_attribute_proto();
+  private:
+  const ::onnx::AttributeProto& _internal_attribute_proto(int index) const;
+  ::onnx::AttributeProto* _internal_add_attribute_proto();
+  public:
+  const ::onnx::AttributeProto& attribute_proto(int index) const;
+  ::onnx::AttributeProto* add_attribute_proto();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::AttributeProto >&
+      attribute_proto() const;
+
+  // repeated .onnx.ValueInfoProto value_info = 12;
+  int value_info_size() const;
+  private:
+  int _internal_value_info_size() const;
+  public:
+  void clear_value_info();
+  ::onnx::ValueInfoProto* mutable_value_info(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >*
+      mutable_value_info();
+  private:
+  const ::onnx::ValueInfoProto& _internal_value_info(int index) const;
+  ::onnx::ValueInfoProto* _internal_add_value_info();
+  public:
+  const ::onnx::ValueInfoProto& value_info(int index) const;
+  ::onnx::ValueInfoProto* add_value_info();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >&
+      value_info() const;
+
+  // repeated .onnx.StringStringEntryProto metadata_props = 14;
+  int metadata_props_size() const;
+  private:
+  int _internal_metadata_props_size() const;
+  public:
+  void clear_metadata_props();
+  ::onnx::StringStringEntryProto* mutable_metadata_props(int index);
+  ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+      mutable_metadata_props();
+  private:
+  const ::onnx::StringStringEntryProto& _internal_metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* _internal_add_metadata_props();
+  public:
+  const ::onnx::StringStringEntryProto& metadata_props(int index) const;
+  ::onnx::StringStringEntryProto* add_metadata_props();
+  const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+      metadata_props() const;
+
+  // optional string name = 1;
+  bool has_name() const;
+  private:
+  bool _internal_has_name() const;
+  public:
+  void clear_name();
+  const std::string& name() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_name(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_name();
+  PROTOBUF_NODISCARD std::string* release_name();
+  void set_allocated_name(std::string* name);
+  private:
+  const std::string& _internal_name() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_name(const std::string& value);
+  std::string* _internal_mutable_name();
+  public:
+
+  // optional string doc_string = 8;
+  bool has_doc_string() const;
+  private:
+  bool _internal_has_doc_string() const;
+  public:
+  void clear_doc_string();
+  const std::string& doc_string() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_doc_string(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_doc_string();
+  PROTOBUF_NODISCARD std::string* release_doc_string();
+  void set_allocated_doc_string(std::string* doc_string);
+  private:
+  const std::string& _internal_doc_string() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_doc_string(const std::string& value);
+  std::string* _internal_mutable_doc_string();
+  public:
+
+  // optional string domain = 10;
+  bool has_domain() const;
+  private:
+  bool _internal_has_domain() const;
+  public:
+  void clear_domain();
+  const std::string& domain() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_domain(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_domain();
+  PROTOBUF_NODISCARD std::string* release_domain();
+  void set_allocated_domain(std::string* domain);
+  private:
+  const std::string& _internal_domain() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_domain(const std::string& value);
+  std::string* _internal_mutable_domain();
+  public:
+
+  // optional string overload = 13;
+  bool has_overload() const;
+  private:
+  bool _internal_has_overload() const;
+  public:
+  void clear_overload();
+  const std::string& overload() const;
+  template <typename ArgT0 = const std::string&, typename... ArgT>
+  void set_overload(ArgT0&& arg0, ArgT... args);
+  std::string* mutable_overload();
+  PROTOBUF_NODISCARD std::string* release_overload();
+  void set_allocated_overload(std::string* overload);
+  private:
+  const std::string& _internal_overload() const;
+  inline PROTOBUF_ALWAYS_INLINE void _internal_set_overload(const std::string& value);
+  std::string* _internal_mutable_overload();
+  public:
+
+  // @@protoc_insertion_point(class_scope:onnx.FunctionProto)
+ private:
+  class _Internal;
+
+  template <typename T> friend class ::PROTOBUF_NAMESPACE_ID::Arena::InternalHelper;
+  typedef void InternalArenaConstructable_;
+  typedef void DestructorSkippable_;
+  struct Impl_ {
+    ::PROTOBUF_NAMESPACE_ID::internal::HasBits<1> _has_bits_;
+    mutable ::PROTOBUF_NAMESPACE_ID::internal::CachedSize _cached_size_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> input_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> output_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string> attribute_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeProto > node_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::OperatorSetIdProto > opset_import_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::AttributeProto > attribute_proto_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto > value_info_;
+    ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto > metadata_props_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr name_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr doc_string_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr domain_;
+    ::PROTOBUF_NAMESPACE_ID::internal::ArenaStringPtr overload_;
+  };
+  union { Impl_ _impl_; };
+  friend struct ::TableStruct_onnx_2fonnx_2dml_2eproto;
+};
+// ===================================================================
+
+
+// ===================================================================
+
+#ifdef __GNUC__
+  #pragma GCC diagnostic push
+  #pragma GCC diagnostic ignored "-Wstrict-aliasing"
+#endif  // __GNUC__
+// AttributeProto
+
+// optional string name = 1;
+inline bool AttributeProto::_internal_has_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool AttributeProto::has_name() const {
+  return _internal_has_name();
+}
+inline void AttributeProto::clear_name() {
+  _impl_.name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& AttributeProto::name() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.name)
+  return _internal_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void AttributeProto::set_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.name)
+}
+inline std::string* AttributeProto::mutable_name() {
+  std::string* _s = _internal_mutable_name();
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.name)
+  return _s;
+}
+inline const std::string& AttributeProto::_internal_name() const {
+  return _impl_.name_.Get();
+}
+inline void AttributeProto::_internal_set_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* AttributeProto::_internal_mutable_name() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* AttributeProto::release_name() {
+  // @@protoc_insertion_point(field_release:onnx.AttributeProto.name)
+  if (!_internal_has_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void AttributeProto::set_allocated_name(std::string* name) {
+  if (name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.name_.SetAllocated(name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.AttributeProto.name)
+}
+
+// optional string ref_attr_name = 21;
+inline bool AttributeProto::_internal_has_ref_attr_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000008u) != 0;
+  return value;
+}
+inline bool AttributeProto::has_ref_attr_name() const {
+  return _internal_has_ref_attr_name();
+}
+inline void AttributeProto::clear_ref_attr_name() {
+  _impl_.ref_attr_name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000008u;
+}
+inline const std::string& AttributeProto::ref_attr_name() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.ref_attr_name)
+  return _internal_ref_attr_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void AttributeProto::set_ref_attr_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000008u;
+ _impl_.ref_attr_name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.ref_attr_name)
+}
+inline std::string* AttributeProto::mutable_ref_attr_name() {
+  std::string* _s = _internal_mutable_ref_attr_name();
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.ref_attr_name)
+  return _s;
+}
+inline const std::string& AttributeProto::_internal_ref_attr_name() const {
+  return _impl_.ref_attr_name_.Get();
+}
+inline void AttributeProto::_internal_set_ref_attr_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000008u;
+  _impl_.ref_attr_name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* AttributeProto::_internal_mutable_ref_attr_name() {
+  _impl_._has_bits_[0] |= 0x00000008u;
+  return _impl_.ref_attr_name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* AttributeProto::release_ref_attr_name() {
+  // @@protoc_insertion_point(field_release:onnx.AttributeProto.ref_attr_name)
+  if (!_internal_has_ref_attr_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000008u;
+  auto* p = _impl_.ref_attr_name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.ref_attr_name_.IsDefault()) {
+    _impl_.ref_attr_name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void AttributeProto::set_allocated_ref_attr_name(std::string* ref_attr_name) {
+  if (ref_attr_name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000008u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000008u;
+  }
+  _impl_.ref_attr_name_.SetAllocated(ref_attr_name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.ref_attr_name_.IsDefault()) {
+    _impl_.ref_attr_name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.AttributeProto.ref_attr_name)
+}
+
+// optional string doc_string = 13;
+inline bool AttributeProto::_internal_has_doc_string() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000004u) != 0;
+  return value;
+}
+inline bool AttributeProto::has_doc_string() const {
+  return _internal_has_doc_string();
+}
+inline void AttributeProto::clear_doc_string() {
+  _impl_.doc_string_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000004u;
+}
+inline const std::string& AttributeProto::doc_string() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.doc_string)
+  return _internal_doc_string();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void AttributeProto::set_doc_string(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000004u;
+ _impl_.doc_string_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.doc_string)
+}
+inline std::string* AttributeProto::mutable_doc_string() {
+  std::string* _s = _internal_mutable_doc_string();
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.doc_string)
+  return _s;
+}
+inline const std::string& AttributeProto::_internal_doc_string() const {
+  return _impl_.doc_string_.Get();
+}
+inline void AttributeProto::_internal_set_doc_string(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  _impl_.doc_string_.Set(value, GetArenaForAllocation());
+}
+inline std::string* AttributeProto::_internal_mutable_doc_string() {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  return _impl_.doc_string_.Mutable(GetArenaForAllocation());
+}
+inline std::string* AttributeProto::release_doc_string() {
+  // @@protoc_insertion_point(field_release:onnx.AttributeProto.doc_string)
+  if (!_internal_has_doc_string()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000004u;
+  auto* p = _impl_.doc_string_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void AttributeProto::set_allocated_doc_string(std::string* doc_string) {
+  if (doc_string != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000004u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000004u;
+  }
+  _impl_.doc_string_.SetAllocated(doc_string, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.AttributeProto.doc_string)
+}
+
+// optional .onnx.AttributeProto.AttributeType type = 20;
+inline bool AttributeProto::_internal_has_type() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000400u) != 0;
+  return value;
+}
+inline bool AttributeProto::has_type() const {
+  return _internal_has_type();
+}
+inline void AttributeProto::clear_type() {
+  _impl_.type_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000400u;
+}
+inline ::onnx::AttributeProto_AttributeType AttributeProto::_internal_type() const {
+  return static_cast< ::onnx::AttributeProto_AttributeType >(_impl_.type_);
+}
+inline ::onnx::AttributeProto_AttributeType AttributeProto::type() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.type)
+  return _internal_type();
+}
+inline void AttributeProto::_internal_set_type(::onnx::AttributeProto_AttributeType value) {
+  assert(::onnx::AttributeProto_AttributeType_IsValid(value));
+  _impl_._has_bits_[0] |= 0x00000400u;
+  _impl_.type_ = value;
+}
+inline void AttributeProto::set_type(::onnx::AttributeProto_AttributeType value) {
+  _internal_set_type(value);
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.type)
+}
+
+// optional float f = 2;
+inline bool AttributeProto::_internal_has_f() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000200u) != 0;
+  return value;
+}
+inline bool AttributeProto::has_f() const {
+  return _internal_has_f();
+}
+inline void AttributeProto::clear_f() {
+  _impl_.f_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000200u;
+}
+inline float AttributeProto::_internal_f() const {
+  return _impl_.f_;
+}
+inline float AttributeProto::f() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.f)
+  return _internal_f();
+}
+inline void AttributeProto::_internal_set_f(float value) {
+  _impl_._has_bits_[0] |= 0x00000200u;
+  _impl_.f_ = value;
+}
+inline void AttributeProto::set_f(float value) {
+  _internal_set_f(value);
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.f)
+}
+
+// optional int64 i = 3;
+inline bool AttributeProto::_internal_has_i() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000100u) != 0;
+  return value;
+}
+inline bool AttributeProto::has_i() const {
+  return _internal_has_i();
+}
+inline void AttributeProto::clear_i() {
+  _impl_.i_ = int64_t{0};
+  _impl_._has_bits_[0] &= ~0x00000100u;
+}
+inline int64_t AttributeProto::_internal_i() const {
+  return _impl_.i_;
+}
+inline int64_t AttributeProto::i() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.i)
+  return _internal_i();
+}
+inline void AttributeProto::_internal_set_i(int64_t value) {
+  _impl_._has_bits_[0] |= 0x00000100u;
+  _impl_.i_ = value;
+}
+inline void AttributeProto::set_i(int64_t value) {
+  _internal_set_i(value);
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.i)
+}
+
+// optional bytes s = 4;
+inline bool AttributeProto::_internal_has_s() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool AttributeProto::has_s() const {
+  return _internal_has_s();
+}
+inline void AttributeProto::clear_s() {
+  _impl_.s_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const std::string& AttributeProto::s() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.s)
+  return _internal_s();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void AttributeProto::set_s(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000002u;
+ _impl_.s_.SetBytes(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.s)
+}
+inline std::string* AttributeProto::mutable_s() {
+  std::string* _s = _internal_mutable_s();
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.s)
+  return _s;
+}
+inline const std::string& AttributeProto::_internal_s() const {
+  return _impl_.s_.Get();
+}
+inline void AttributeProto::_internal_set_s(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.s_.Set(value, GetArenaForAllocation());
+}
+inline std::string* AttributeProto::_internal_mutable_s() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  return _impl_.s_.Mutable(GetArenaForAllocation());
+}
+inline std::string* AttributeProto::release_s() {
+  // @@protoc_insertion_point(field_release:onnx.AttributeProto.s)
+  if (!_internal_has_s()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  auto* p = _impl_.s_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.s_.IsDefault()) {
+    _impl_.s_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void AttributeProto::set_allocated_s(std::string* s) {
+  if (s != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.s_.SetAllocated(s, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.s_.IsDefault()) {
+    _impl_.s_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.AttributeProto.s)
+}
+
+// optional .onnx.TensorProto t = 5;
+inline bool AttributeProto::_internal_has_t() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000010u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.t_ != nullptr);
+  return value;
+}
+inline bool AttributeProto::has_t() const {
+  return _internal_has_t();
+}
+inline void AttributeProto::clear_t() {
+  if (_impl_.t_ != nullptr) _impl_.t_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000010u;
+}
+inline const ::onnx::TensorProto& AttributeProto::_internal_t() const {
+  const ::onnx::TensorProto* p = _impl_.t_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TensorProto&>(
+      ::onnx::_TensorProto_default_instance_);
+}
+inline const ::onnx::TensorProto& AttributeProto::t() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.t)
+  return _internal_t();
+}
+inline void AttributeProto::unsafe_arena_set_allocated_t(
+    ::onnx::TensorProto* t) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.t_);
+  }
+  _impl_.t_ = t;
+  if (t) {
+    _impl_._has_bits_[0] |= 0x00000010u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000010u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.AttributeProto.t)
+}
+inline ::onnx::TensorProto* AttributeProto::release_t() {
+  _impl_._has_bits_[0] &= ~0x00000010u;
+  ::onnx::TensorProto* temp = _impl_.t_;
+  _impl_.t_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TensorProto* AttributeProto::unsafe_arena_release_t() {
+  // @@protoc_insertion_point(field_release:onnx.AttributeProto.t)
+  _impl_._has_bits_[0] &= ~0x00000010u;
+  ::onnx::TensorProto* temp = _impl_.t_;
+  _impl_.t_ = nullptr;
+  return temp;
+}
+inline ::onnx::TensorProto* AttributeProto::_internal_mutable_t() {
+  _impl_._has_bits_[0] |= 0x00000010u;
+  if (_impl_.t_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TensorProto>(GetArenaForAllocation());
+    _impl_.t_ = p;
+  }
+  return _impl_.t_;
+}
+inline ::onnx::TensorProto* AttributeProto::mutable_t() {
+  ::onnx::TensorProto* _msg = _internal_mutable_t();
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.t)
+  return _msg;
+}
+inline void AttributeProto::set_allocated_t(::onnx::TensorProto* t) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.t_;
+  }
+  if (t) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(t);
+    if (message_arena != submessage_arena) {
+      t = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, t, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000010u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000010u;
+  }
+  _impl_.t_ = t;
+  // @@protoc_insertion_point(field_set_allocated:onnx.AttributeProto.t)
+}
+
+// optional .onnx.GraphProto g = 6;
+inline bool AttributeProto::_internal_has_g() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000020u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.g_ != nullptr);
+  return value;
+}
+inline bool AttributeProto::has_g() const {
+  return _internal_has_g();
+}
+inline void AttributeProto::clear_g() {
+  if (_impl_.g_ != nullptr) _impl_.g_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000020u;
+}
+inline const ::onnx::GraphProto& AttributeProto::_internal_g() const {
+  const ::onnx::GraphProto* p = _impl_.g_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::GraphProto&>(
+      ::onnx::_GraphProto_default_instance_);
+}
+inline const ::onnx::GraphProto& AttributeProto::g() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.g)
+  return _internal_g();
+}
+inline void AttributeProto::unsafe_arena_set_allocated_g(
+    ::onnx::GraphProto* g) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.g_);
+  }
+  _impl_.g_ = g;
+  if (g) {
+    _impl_._has_bits_[0] |= 0x00000020u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000020u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.AttributeProto.g)
+}
+inline ::onnx::GraphProto* AttributeProto::release_g() {
+  _impl_._has_bits_[0] &= ~0x00000020u;
+  ::onnx::GraphProto* temp = _impl_.g_;
+  _impl_.g_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::GraphProto* AttributeProto::unsafe_arena_release_g() {
+  // @@protoc_insertion_point(field_release:onnx.AttributeProto.g)
+  _impl_._has_bits_[0] &= ~0x00000020u;
+  ::onnx::GraphProto* temp = _impl_.g_;
+  _impl_.g_ = nullptr;
+  return temp;
+}
+inline ::onnx::GraphProto* AttributeProto::_internal_mutable_g() {
+  _impl_._has_bits_[0] |= 0x00000020u;
+  if (_impl_.g_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::GraphProto>(GetArenaForAllocation());
+    _impl_.g_ = p;
+  }
+  return _impl_.g_;
+}
+inline ::onnx::GraphProto* AttributeProto::mutable_g() {
+  ::onnx::GraphProto* _msg = _internal_mutable_g();
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.g)
+  return _msg;
+}
+inline void AttributeProto::set_allocated_g(::onnx::GraphProto* g) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.g_;
+  }
+  if (g) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(g);
+    if (message_arena != submessage_arena) {
+      g = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, g, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000020u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000020u;
+  }
+  _impl_.g_ = g;
+  // @@protoc_insertion_point(field_set_allocated:onnx.AttributeProto.g)
+}
+
+// optional .onnx.SparseTensorProto sparse_tensor = 22;
+inline bool AttributeProto::_internal_has_sparse_tensor() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000080u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.sparse_tensor_ != nullptr);
+  return value;
+}
+inline bool AttributeProto::has_sparse_tensor() const {
+  return _internal_has_sparse_tensor();
+}
+inline void AttributeProto::clear_sparse_tensor() {
+  if (_impl_.sparse_tensor_ != nullptr) _impl_.sparse_tensor_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000080u;
+}
+inline const ::onnx::SparseTensorProto& AttributeProto::_internal_sparse_tensor() const {
+  const ::onnx::SparseTensorProto* p = _impl_.sparse_tensor_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::SparseTensorProto&>(
+      ::onnx::_SparseTensorProto_default_instance_);
+}
+inline const ::onnx::SparseTensorProto& AttributeProto::sparse_tensor() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.sparse_tensor)
+  return _internal_sparse_tensor();
+}
+inline void AttributeProto::unsafe_arena_set_allocated_sparse_tensor(
+    ::onnx::SparseTensorProto* sparse_tensor) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.sparse_tensor_);
+  }
+  _impl_.sparse_tensor_ = sparse_tensor;
+  if (sparse_tensor) {
+    _impl_._has_bits_[0] |= 0x00000080u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000080u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.AttributeProto.sparse_tensor)
+}
+inline ::onnx::SparseTensorProto* AttributeProto::release_sparse_tensor() {
+  _impl_._has_bits_[0] &= ~0x00000080u;
+  ::onnx::SparseTensorProto* temp = _impl_.sparse_tensor_;
+  _impl_.sparse_tensor_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::SparseTensorProto* AttributeProto::unsafe_arena_release_sparse_tensor() {
+  // @@protoc_insertion_point(field_release:onnx.AttributeProto.sparse_tensor)
+  _impl_._has_bits_[0] &= ~0x00000080u;
+  ::onnx::SparseTensorProto* temp = _impl_.sparse_tensor_;
+  _impl_.sparse_tensor_ = nullptr;
+  return temp;
+}
+inline ::onnx::SparseTensorProto* AttributeProto::_internal_mutable_sparse_tensor() {
+  _impl_._has_bits_[0] |= 0x00000080u;
+  if (_impl_.sparse_tensor_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::SparseTensorProto>(GetArenaForAllocation());
+    _impl_.sparse_tensor_ = p;
+  }
+  return _impl_.sparse_tensor_;
+}
+inline ::onnx::SparseTensorProto* AttributeProto::mutable_sparse_tensor() {
+  ::onnx::SparseTensorProto* _msg = _internal_mutable_sparse_tensor();
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.sparse_tensor)
+  return _msg;
+}
+inline void AttributeProto::set_allocated_sparse_tensor(::onnx::SparseTensorProto* sparse_tensor) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.sparse_tensor_;
+  }
+  if (sparse_tensor) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(sparse_tensor);
+    if (message_arena != submessage_arena) {
+      sparse_tensor = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, sparse_tensor, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000080u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000080u;
+  }
+  _impl_.sparse_tensor_ = sparse_tensor;
+  // @@protoc_insertion_point(field_set_allocated:onnx.AttributeProto.sparse_tensor)
+}
+
+// optional .onnx.TypeProto tp = 14;
+inline bool AttributeProto::_internal_has_tp() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000040u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.tp_ != nullptr);
+  return value;
+}
+inline bool AttributeProto::has_tp() const {
+  return _internal_has_tp();
+}
+inline void AttributeProto::clear_tp() {
+  if (_impl_.tp_ != nullptr) _impl_.tp_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000040u;
+}
+inline const ::onnx::TypeProto& AttributeProto::_internal_tp() const {
+  const ::onnx::TypeProto* p = _impl_.tp_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TypeProto&>(
+      ::onnx::_TypeProto_default_instance_);
+}
+inline const ::onnx::TypeProto& AttributeProto::tp() const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.tp)
+  return _internal_tp();
+}
+inline void AttributeProto::unsafe_arena_set_allocated_tp(
+    ::onnx::TypeProto* tp) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.tp_);
+  }
+  _impl_.tp_ = tp;
+  if (tp) {
+    _impl_._has_bits_[0] |= 0x00000040u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000040u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.AttributeProto.tp)
+}
+inline ::onnx::TypeProto* AttributeProto::release_tp() {
+  _impl_._has_bits_[0] &= ~0x00000040u;
+  ::onnx::TypeProto* temp = _impl_.tp_;
+  _impl_.tp_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TypeProto* AttributeProto::unsafe_arena_release_tp() {
+  // @@protoc_insertion_point(field_release:onnx.AttributeProto.tp)
+  _impl_._has_bits_[0] &= ~0x00000040u;
+  ::onnx::TypeProto* temp = _impl_.tp_;
+  _impl_.tp_ = nullptr;
+  return temp;
+}
+inline ::onnx::TypeProto* AttributeProto::_internal_mutable_tp() {
+  _impl_._has_bits_[0] |= 0x00000040u;
+  if (_impl_.tp_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TypeProto>(GetArenaForAllocation());
+    _impl_.tp_ = p;
+  }
+  return _impl_.tp_;
+}
+inline ::onnx::TypeProto* AttributeProto::mutable_tp() {
+  ::onnx::TypeProto* _msg = _internal_mutable_tp();
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.tp)
+  return _msg;
+}
+inline void AttributeProto::set_allocated_tp(::onnx::TypeProto* tp) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.tp_;
+  }
+  if (tp) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(tp);
+    if (message_arena != submessage_arena) {
+      tp = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, tp, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000040u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000040u;
+  }
+  _impl_.tp_ = tp;
+  // @@protoc_insertion_point(field_set_allocated:onnx.AttributeProto.tp)
+}
+
+// repeated float floats = 7;
+inline int AttributeProto::_internal_floats_size() const {
+  return _impl_.floats_.size();
+}
+inline int AttributeProto::floats_size() const {
+  return _internal_floats_size();
+}
+inline void AttributeProto::clear_floats() {
+  _impl_.floats_.Clear();
+}
+inline float AttributeProto::_internal_floats(int index) const {
+  return _impl_.floats_.Get(index);
+}
+inline float AttributeProto::floats(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.floats)
+  return _internal_floats(index);
+}
+inline void AttributeProto::set_floats(int index, float value) {
+  _impl_.floats_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.floats)
+}
+inline void AttributeProto::_internal_add_floats(float value) {
+  _impl_.floats_.Add(value);
+}
+inline void AttributeProto::add_floats(float value) {
+  _internal_add_floats(value);
+  // @@protoc_insertion_point(field_add:onnx.AttributeProto.floats)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+AttributeProto::_internal_floats() const {
+  return _impl_.floats_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+AttributeProto::floats() const {
+  // @@protoc_insertion_point(field_list:onnx.AttributeProto.floats)
+  return _internal_floats();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+AttributeProto::_internal_mutable_floats() {
+  return &_impl_.floats_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+AttributeProto::mutable_floats() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.AttributeProto.floats)
+  return _internal_mutable_floats();
+}
+
+// repeated int64 ints = 8;
+inline int AttributeProto::_internal_ints_size() const {
+  return _impl_.ints_.size();
+}
+inline int AttributeProto::ints_size() const {
+  return _internal_ints_size();
+}
+inline void AttributeProto::clear_ints() {
+  _impl_.ints_.Clear();
+}
+inline int64_t AttributeProto::_internal_ints(int index) const {
+  return _impl_.ints_.Get(index);
+}
+inline int64_t AttributeProto::ints(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.ints)
+  return _internal_ints(index);
+}
+inline void AttributeProto::set_ints(int index, int64_t value) {
+  _impl_.ints_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.ints)
+}
+inline void AttributeProto::_internal_add_ints(int64_t value) {
+  _impl_.ints_.Add(value);
+}
+inline void AttributeProto::add_ints(int64_t value) {
+  _internal_add_ints(value);
+  // @@protoc_insertion_point(field_add:onnx.AttributeProto.ints)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+AttributeProto::_internal_ints() const {
+  return _impl_.ints_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+AttributeProto::ints() const {
+  // @@protoc_insertion_point(field_list:onnx.AttributeProto.ints)
+  return _internal_ints();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+AttributeProto::_internal_mutable_ints() {
+  return &_impl_.ints_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+AttributeProto::mutable_ints() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.AttributeProto.ints)
+  return _internal_mutable_ints();
+}
+
+// repeated bytes strings = 9;
+inline int AttributeProto::_internal_strings_size() const {
+  return _impl_.strings_.size();
+}
+inline int AttributeProto::strings_size() const {
+  return _internal_strings_size();
+}
+inline void AttributeProto::clear_strings() {
+  _impl_.strings_.Clear();
+}
+inline std::string* AttributeProto::add_strings() {
+  std::string* _s = _internal_add_strings();
+  // @@protoc_insertion_point(field_add_mutable:onnx.AttributeProto.strings)
+  return _s;
+}
+inline const std::string& AttributeProto::_internal_strings(int index) const {
+  return _impl_.strings_.Get(index);
+}
+inline const std::string& AttributeProto::strings(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.strings)
+  return _internal_strings(index);
+}
+inline std::string* AttributeProto::mutable_strings(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.strings)
+  return _impl_.strings_.Mutable(index);
+}
+inline void AttributeProto::set_strings(int index, const std::string& value) {
+  _impl_.strings_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.strings)
+}
+inline void AttributeProto::set_strings(int index, std::string&& value) {
+  _impl_.strings_.Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:onnx.AttributeProto.strings)
+}
+inline void AttributeProto::set_strings(int index, const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.strings_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:onnx.AttributeProto.strings)
+}
+inline void AttributeProto::set_strings(int index, const void* value, size_t size) {
+  _impl_.strings_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:onnx.AttributeProto.strings)
+}
+inline std::string* AttributeProto::_internal_add_strings() {
+  return _impl_.strings_.Add();
+}
+inline void AttributeProto::add_strings(const std::string& value) {
+  _impl_.strings_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:onnx.AttributeProto.strings)
+}
+inline void AttributeProto::add_strings(std::string&& value) {
+  _impl_.strings_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:onnx.AttributeProto.strings)
+}
+inline void AttributeProto::add_strings(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.strings_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:onnx.AttributeProto.strings)
+}
+inline void AttributeProto::add_strings(const void* value, size_t size) {
+  _impl_.strings_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:onnx.AttributeProto.strings)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+AttributeProto::strings() const {
+  // @@protoc_insertion_point(field_list:onnx.AttributeProto.strings)
+  return _impl_.strings_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+AttributeProto::mutable_strings() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.AttributeProto.strings)
+  return &_impl_.strings_;
+}
+
+// repeated .onnx.TensorProto tensors = 10;
+inline int AttributeProto::_internal_tensors_size() const {
+  return _impl_.tensors_.size();
+}
+inline int AttributeProto::tensors_size() const {
+  return _internal_tensors_size();
+}
+inline void AttributeProto::clear_tensors() {
+  _impl_.tensors_.Clear();
+}
+inline ::onnx::TensorProto* AttributeProto::mutable_tensors(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.tensors)
+  return _impl_.tensors_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorProto >*
+AttributeProto::mutable_tensors() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.AttributeProto.tensors)
+  return &_impl_.tensors_;
+}
+inline const ::onnx::TensorProto& AttributeProto::_internal_tensors(int index) const {
+  return _impl_.tensors_.Get(index);
+}
+inline const ::onnx::TensorProto& AttributeProto::tensors(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.tensors)
+  return _internal_tensors(index);
+}
+inline ::onnx::TensorProto* AttributeProto::_internal_add_tensors() {
+  return _impl_.tensors_.Add();
+}
+inline ::onnx::TensorProto* AttributeProto::add_tensors() {
+  ::onnx::TensorProto* _add = _internal_add_tensors();
+  // @@protoc_insertion_point(field_add:onnx.AttributeProto.tensors)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorProto >&
+AttributeProto::tensors() const {
+  // @@protoc_insertion_point(field_list:onnx.AttributeProto.tensors)
+  return _impl_.tensors_;
+}
+
+// repeated .onnx.GraphProto graphs = 11;
+inline int AttributeProto::_internal_graphs_size() const {
+  return _impl_.graphs_.size();
+}
+inline int AttributeProto::graphs_size() const {
+  return _internal_graphs_size();
+}
+inline void AttributeProto::clear_graphs() {
+  _impl_.graphs_.Clear();
+}
+inline ::onnx::GraphProto* AttributeProto::mutable_graphs(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.graphs)
+  return _impl_.graphs_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::GraphProto >*
+AttributeProto::mutable_graphs() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.AttributeProto.graphs)
+  return &_impl_.graphs_;
+}
+inline const ::onnx::GraphProto& AttributeProto::_internal_graphs(int index) const {
+  return _impl_.graphs_.Get(index);
+}
+inline const ::onnx::GraphProto& AttributeProto::graphs(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.graphs)
+  return _internal_graphs(index);
+}
+inline ::onnx::GraphProto* AttributeProto::_internal_add_graphs() {
+  return _impl_.graphs_.Add();
+}
+inline ::onnx::GraphProto* AttributeProto::add_graphs() {
+  ::onnx::GraphProto* _add = _internal_add_graphs();
+  // @@protoc_insertion_point(field_add:onnx.AttributeProto.graphs)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::GraphProto >&
+AttributeProto::graphs() const {
+  // @@protoc_insertion_point(field_list:onnx.AttributeProto.graphs)
+  return _impl_.graphs_;
+}
+
+// repeated .onnx.SparseTensorProto sparse_tensors = 23;
+inline int AttributeProto::_internal_sparse_tensors_size() const {
+  return _impl_.sparse_tensors_.size();
+}
+inline int AttributeProto::sparse_tensors_size() const {
+  return _internal_sparse_tensors_size();
+}
+inline void AttributeProto::clear_sparse_tensors() {
+  _impl_.sparse_tensors_.Clear();
+}
+inline ::onnx::SparseTensorProto* AttributeProto::mutable_sparse_tensors(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.sparse_tensors)
+  return _impl_.sparse_tensors_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SparseTensorProto >*
+AttributeProto::mutable_sparse_tensors() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.AttributeProto.sparse_tensors)
+  return &_impl_.sparse_tensors_;
+}
+inline const ::onnx::SparseTensorProto& AttributeProto::_internal_sparse_tensors(int index) const {
+  return _impl_.sparse_tensors_.Get(index);
+}
+inline const ::onnx::SparseTensorProto& AttributeProto::sparse_tensors(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.sparse_tensors)
+  return _internal_sparse_tensors(index);
+}
+inline ::onnx::SparseTensorProto* AttributeProto::_internal_add_sparse_tensors() {
+  return _impl_.sparse_tensors_.Add();
+}
+inline ::onnx::SparseTensorProto* AttributeProto::add_sparse_tensors() {
+  ::onnx::SparseTensorProto* _add = _internal_add_sparse_tensors();
+  // @@protoc_insertion_point(field_add:onnx.AttributeProto.sparse_tensors)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SparseTensorProto >&
+AttributeProto::sparse_tensors() const {
+  // @@protoc_insertion_point(field_list:onnx.AttributeProto.sparse_tensors)
+  return _impl_.sparse_tensors_;
+}
+
+// repeated .onnx.TypeProto type_protos = 15;
+inline int AttributeProto::_internal_type_protos_size() const {
+  return _impl_.type_protos_.size();
+}
+inline int AttributeProto::type_protos_size() const {
+  return _internal_type_protos_size();
+}
+inline void AttributeProto::clear_type_protos() {
+  _impl_.type_protos_.Clear();
+}
+inline ::onnx::TypeProto* AttributeProto::mutable_type_protos(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.AttributeProto.type_protos)
+  return _impl_.type_protos_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TypeProto >*
+AttributeProto::mutable_type_protos() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.AttributeProto.type_protos)
+  return &_impl_.type_protos_;
+}
+inline const ::onnx::TypeProto& AttributeProto::_internal_type_protos(int index) const {
+  return _impl_.type_protos_.Get(index);
+}
+inline const ::onnx::TypeProto& AttributeProto::type_protos(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.AttributeProto.type_protos)
+  return _internal_type_protos(index);
+}
+inline ::onnx::TypeProto* AttributeProto::_internal_add_type_protos() {
+  return _impl_.type_protos_.Add();
+}
+inline ::onnx::TypeProto* AttributeProto::add_type_protos() {
+  ::onnx::TypeProto* _add = _internal_add_type_protos();
+  // @@protoc_insertion_point(field_add:onnx.AttributeProto.type_protos)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TypeProto >&
+AttributeProto::type_protos() const {
+  // @@protoc_insertion_point(field_list:onnx.AttributeProto.type_protos)
+  return _impl_.type_protos_;
+}
+
+// -------------------------------------------------------------------
+
+// ValueInfoProto
+
+// optional string name = 1;
+inline bool ValueInfoProto::_internal_has_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool ValueInfoProto::has_name() const {
+  return _internal_has_name();
+}
+inline void ValueInfoProto::clear_name() {
+  _impl_.name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& ValueInfoProto::name() const {
+  // @@protoc_insertion_point(field_get:onnx.ValueInfoProto.name)
+  return _internal_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void ValueInfoProto::set_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.ValueInfoProto.name)
+}
+inline std::string* ValueInfoProto::mutable_name() {
+  std::string* _s = _internal_mutable_name();
+  // @@protoc_insertion_point(field_mutable:onnx.ValueInfoProto.name)
+  return _s;
+}
+inline const std::string& ValueInfoProto::_internal_name() const {
+  return _impl_.name_.Get();
+}
+inline void ValueInfoProto::_internal_set_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* ValueInfoProto::_internal_mutable_name() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* ValueInfoProto::release_name() {
+  // @@protoc_insertion_point(field_release:onnx.ValueInfoProto.name)
+  if (!_internal_has_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void ValueInfoProto::set_allocated_name(std::string* name) {
+  if (name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.name_.SetAllocated(name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.ValueInfoProto.name)
+}
+
+// optional .onnx.TypeProto type = 2;
+inline bool ValueInfoProto::_internal_has_type() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000004u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.type_ != nullptr);
+  return value;
+}
+inline bool ValueInfoProto::has_type() const {
+  return _internal_has_type();
+}
+inline void ValueInfoProto::clear_type() {
+  if (_impl_.type_ != nullptr) _impl_.type_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000004u;
+}
+inline const ::onnx::TypeProto& ValueInfoProto::_internal_type() const {
+  const ::onnx::TypeProto* p = _impl_.type_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TypeProto&>(
+      ::onnx::_TypeProto_default_instance_);
+}
+inline const ::onnx::TypeProto& ValueInfoProto::type() const {
+  // @@protoc_insertion_point(field_get:onnx.ValueInfoProto.type)
+  return _internal_type();
+}
+inline void ValueInfoProto::unsafe_arena_set_allocated_type(
+    ::onnx::TypeProto* type) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.type_);
+  }
+  _impl_.type_ = type;
+  if (type) {
+    _impl_._has_bits_[0] |= 0x00000004u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000004u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.ValueInfoProto.type)
+}
+inline ::onnx::TypeProto* ValueInfoProto::release_type() {
+  _impl_._has_bits_[0] &= ~0x00000004u;
+  ::onnx::TypeProto* temp = _impl_.type_;
+  _impl_.type_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TypeProto* ValueInfoProto::unsafe_arena_release_type() {
+  // @@protoc_insertion_point(field_release:onnx.ValueInfoProto.type)
+  _impl_._has_bits_[0] &= ~0x00000004u;
+  ::onnx::TypeProto* temp = _impl_.type_;
+  _impl_.type_ = nullptr;
+  return temp;
+}
+inline ::onnx::TypeProto* ValueInfoProto::_internal_mutable_type() {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  if (_impl_.type_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TypeProto>(GetArenaForAllocation());
+    _impl_.type_ = p;
+  }
+  return _impl_.type_;
+}
+inline ::onnx::TypeProto* ValueInfoProto::mutable_type() {
+  ::onnx::TypeProto* _msg = _internal_mutable_type();
+  // @@protoc_insertion_point(field_mutable:onnx.ValueInfoProto.type)
+  return _msg;
+}
+inline void ValueInfoProto::set_allocated_type(::onnx::TypeProto* type) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.type_;
+  }
+  if (type) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(type);
+    if (message_arena != submessage_arena) {
+      type = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, type, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000004u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000004u;
+  }
+  _impl_.type_ = type;
+  // @@protoc_insertion_point(field_set_allocated:onnx.ValueInfoProto.type)
+}
+
+// optional string doc_string = 3;
+inline bool ValueInfoProto::_internal_has_doc_string() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool ValueInfoProto::has_doc_string() const {
+  return _internal_has_doc_string();
+}
+inline void ValueInfoProto::clear_doc_string() {
+  _impl_.doc_string_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const std::string& ValueInfoProto::doc_string() const {
+  // @@protoc_insertion_point(field_get:onnx.ValueInfoProto.doc_string)
+  return _internal_doc_string();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void ValueInfoProto::set_doc_string(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000002u;
+ _impl_.doc_string_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.ValueInfoProto.doc_string)
+}
+inline std::string* ValueInfoProto::mutable_doc_string() {
+  std::string* _s = _internal_mutable_doc_string();
+  // @@protoc_insertion_point(field_mutable:onnx.ValueInfoProto.doc_string)
+  return _s;
+}
+inline const std::string& ValueInfoProto::_internal_doc_string() const {
+  return _impl_.doc_string_.Get();
+}
+inline void ValueInfoProto::_internal_set_doc_string(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.doc_string_.Set(value, GetArenaForAllocation());
+}
+inline std::string* ValueInfoProto::_internal_mutable_doc_string() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  return _impl_.doc_string_.Mutable(GetArenaForAllocation());
+}
+inline std::string* ValueInfoProto::release_doc_string() {
+  // @@protoc_insertion_point(field_release:onnx.ValueInfoProto.doc_string)
+  if (!_internal_has_doc_string()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  auto* p = _impl_.doc_string_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void ValueInfoProto::set_allocated_doc_string(std::string* doc_string) {
+  if (doc_string != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.doc_string_.SetAllocated(doc_string, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.ValueInfoProto.doc_string)
+}
+
+// repeated .onnx.StringStringEntryProto metadata_props = 4;
+inline int ValueInfoProto::_internal_metadata_props_size() const {
+  return _impl_.metadata_props_.size();
+}
+inline int ValueInfoProto::metadata_props_size() const {
+  return _internal_metadata_props_size();
+}
+inline void ValueInfoProto::clear_metadata_props() {
+  _impl_.metadata_props_.Clear();
+}
+inline ::onnx::StringStringEntryProto* ValueInfoProto::mutable_metadata_props(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.ValueInfoProto.metadata_props)
+  return _impl_.metadata_props_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+ValueInfoProto::mutable_metadata_props() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.ValueInfoProto.metadata_props)
+  return &_impl_.metadata_props_;
+}
+inline const ::onnx::StringStringEntryProto& ValueInfoProto::_internal_metadata_props(int index) const {
+  return _impl_.metadata_props_.Get(index);
+}
+inline const ::onnx::StringStringEntryProto& ValueInfoProto::metadata_props(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.ValueInfoProto.metadata_props)
+  return _internal_metadata_props(index);
+}
+inline ::onnx::StringStringEntryProto* ValueInfoProto::_internal_add_metadata_props() {
+  return _impl_.metadata_props_.Add();
+}
+inline ::onnx::StringStringEntryProto* ValueInfoProto::add_metadata_props() {
+  ::onnx::StringStringEntryProto* _add = _internal_add_metadata_props();
+  // @@protoc_insertion_point(field_add:onnx.ValueInfoProto.metadata_props)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+ValueInfoProto::metadata_props() const {
+  // @@protoc_insertion_point(field_list:onnx.ValueInfoProto.metadata_props)
+  return _impl_.metadata_props_;
+}
+
+// -------------------------------------------------------------------
+
+// NodeProto
+
+// repeated string input = 1;
+inline int NodeProto::_internal_input_size() const {
+  return _impl_.input_.size();
+}
+inline int NodeProto::input_size() const {
+  return _internal_input_size();
+}
+inline void NodeProto::clear_input() {
+  _impl_.input_.Clear();
+}
+inline std::string* NodeProto::add_input() {
+  std::string* _s = _internal_add_input();
+  // @@protoc_insertion_point(field_add_mutable:onnx.NodeProto.input)
+  return _s;
+}
+inline const std::string& NodeProto::_internal_input(int index) const {
+  return _impl_.input_.Get(index);
+}
+inline const std::string& NodeProto::input(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.NodeProto.input)
+  return _internal_input(index);
+}
+inline std::string* NodeProto::mutable_input(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.NodeProto.input)
+  return _impl_.input_.Mutable(index);
+}
+inline void NodeProto::set_input(int index, const std::string& value) {
+  _impl_.input_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:onnx.NodeProto.input)
+}
+inline void NodeProto::set_input(int index, std::string&& value) {
+  _impl_.input_.Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:onnx.NodeProto.input)
+}
+inline void NodeProto::set_input(int index, const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.input_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:onnx.NodeProto.input)
+}
+inline void NodeProto::set_input(int index, const char* value, size_t size) {
+  _impl_.input_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:onnx.NodeProto.input)
+}
+inline std::string* NodeProto::_internal_add_input() {
+  return _impl_.input_.Add();
+}
+inline void NodeProto::add_input(const std::string& value) {
+  _impl_.input_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:onnx.NodeProto.input)
+}
+inline void NodeProto::add_input(std::string&& value) {
+  _impl_.input_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:onnx.NodeProto.input)
+}
+inline void NodeProto::add_input(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.input_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:onnx.NodeProto.input)
+}
+inline void NodeProto::add_input(const char* value, size_t size) {
+  _impl_.input_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:onnx.NodeProto.input)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+NodeProto::input() const {
+  // @@protoc_insertion_point(field_list:onnx.NodeProto.input)
+  return _impl_.input_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+NodeProto::mutable_input() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.NodeProto.input)
+  return &_impl_.input_;
+}
+
+// repeated string output = 2;
+inline int NodeProto::_internal_output_size() const {
+  return _impl_.output_.size();
+}
+inline int NodeProto::output_size() const {
+  return _internal_output_size();
+}
+inline void NodeProto::clear_output() {
+  _impl_.output_.Clear();
+}
+inline std::string* NodeProto::add_output() {
+  std::string* _s = _internal_add_output();
+  // @@protoc_insertion_point(field_add_mutable:onnx.NodeProto.output)
+  return _s;
+}
+inline const std::string& NodeProto::_internal_output(int index) const {
+  return _impl_.output_.Get(index);
+}
+inline const std::string& NodeProto::output(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.NodeProto.output)
+  return _internal_output(index);
+}
+inline std::string* NodeProto::mutable_output(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.NodeProto.output)
+  return _impl_.output_.Mutable(index);
+}
+inline void NodeProto::set_output(int index, const std::string& value) {
+  _impl_.output_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:onnx.NodeProto.output)
+}
+inline void NodeProto::set_output(int index, std::string&& value) {
+  _impl_.output_.Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:onnx.NodeProto.output)
+}
+inline void NodeProto::set_output(int index, const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.output_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:onnx.NodeProto.output)
+}
+inline void NodeProto::set_output(int index, const char* value, size_t size) {
+  _impl_.output_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:onnx.NodeProto.output)
+}
+inline std::string* NodeProto::_internal_add_output() {
+  return _impl_.output_.Add();
+}
+inline void NodeProto::add_output(const std::string& value) {
+  _impl_.output_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:onnx.NodeProto.output)
+}
+inline void NodeProto::add_output(std::string&& value) {
+  _impl_.output_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:onnx.NodeProto.output)
+}
+inline void NodeProto::add_output(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.output_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:onnx.NodeProto.output)
+}
+inline void NodeProto::add_output(const char* value, size_t size) {
+  _impl_.output_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:onnx.NodeProto.output)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+NodeProto::output() const {
+  // @@protoc_insertion_point(field_list:onnx.NodeProto.output)
+  return _impl_.output_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+NodeProto::mutable_output() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.NodeProto.output)
+  return &_impl_.output_;
+}
+
+// optional string name = 3;
+inline bool NodeProto::_internal_has_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool NodeProto::has_name() const {
+  return _internal_has_name();
+}
+inline void NodeProto::clear_name() {
+  _impl_.name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& NodeProto::name() const {
+  // @@protoc_insertion_point(field_get:onnx.NodeProto.name)
+  return _internal_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void NodeProto::set_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.NodeProto.name)
+}
+inline std::string* NodeProto::mutable_name() {
+  std::string* _s = _internal_mutable_name();
+  // @@protoc_insertion_point(field_mutable:onnx.NodeProto.name)
+  return _s;
+}
+inline const std::string& NodeProto::_internal_name() const {
+  return _impl_.name_.Get();
+}
+inline void NodeProto::_internal_set_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* NodeProto::_internal_mutable_name() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* NodeProto::release_name() {
+  // @@protoc_insertion_point(field_release:onnx.NodeProto.name)
+  if (!_internal_has_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void NodeProto::set_allocated_name(std::string* name) {
+  if (name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.name_.SetAllocated(name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.NodeProto.name)
+}
+
+// optional string op_type = 4;
+inline bool NodeProto::_internal_has_op_type() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool NodeProto::has_op_type() const {
+  return _internal_has_op_type();
+}
+inline void NodeProto::clear_op_type() {
+  _impl_.op_type_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const std::string& NodeProto::op_type() const {
+  // @@protoc_insertion_point(field_get:onnx.NodeProto.op_type)
+  return _internal_op_type();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void NodeProto::set_op_type(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000002u;
+ _impl_.op_type_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.NodeProto.op_type)
+}
+inline std::string* NodeProto::mutable_op_type() {
+  std::string* _s = _internal_mutable_op_type();
+  // @@protoc_insertion_point(field_mutable:onnx.NodeProto.op_type)
+  return _s;
+}
+inline const std::string& NodeProto::_internal_op_type() const {
+  return _impl_.op_type_.Get();
+}
+inline void NodeProto::_internal_set_op_type(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.op_type_.Set(value, GetArenaForAllocation());
+}
+inline std::string* NodeProto::_internal_mutable_op_type() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  return _impl_.op_type_.Mutable(GetArenaForAllocation());
+}
+inline std::string* NodeProto::release_op_type() {
+  // @@protoc_insertion_point(field_release:onnx.NodeProto.op_type)
+  if (!_internal_has_op_type()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  auto* p = _impl_.op_type_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.op_type_.IsDefault()) {
+    _impl_.op_type_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void NodeProto::set_allocated_op_type(std::string* op_type) {
+  if (op_type != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.op_type_.SetAllocated(op_type, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.op_type_.IsDefault()) {
+    _impl_.op_type_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.NodeProto.op_type)
+}
+
+// optional string domain = 7;
+inline bool NodeProto::_internal_has_domain() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000008u) != 0;
+  return value;
+}
+inline bool NodeProto::has_domain() const {
+  return _internal_has_domain();
+}
+inline void NodeProto::clear_domain() {
+  _impl_.domain_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000008u;
+}
+inline const std::string& NodeProto::domain() const {
+  // @@protoc_insertion_point(field_get:onnx.NodeProto.domain)
+  return _internal_domain();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void NodeProto::set_domain(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000008u;
+ _impl_.domain_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.NodeProto.domain)
+}
+inline std::string* NodeProto::mutable_domain() {
+  std::string* _s = _internal_mutable_domain();
+  // @@protoc_insertion_point(field_mutable:onnx.NodeProto.domain)
+  return _s;
+}
+inline const std::string& NodeProto::_internal_domain() const {
+  return _impl_.domain_.Get();
+}
+inline void NodeProto::_internal_set_domain(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000008u;
+  _impl_.domain_.Set(value, GetArenaForAllocation());
+}
+inline std::string* NodeProto::_internal_mutable_domain() {
+  _impl_._has_bits_[0] |= 0x00000008u;
+  return _impl_.domain_.Mutable(GetArenaForAllocation());
+}
+inline std::string* NodeProto::release_domain() {
+  // @@protoc_insertion_point(field_release:onnx.NodeProto.domain)
+  if (!_internal_has_domain()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000008u;
+  auto* p = _impl_.domain_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.domain_.IsDefault()) {
+    _impl_.domain_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void NodeProto::set_allocated_domain(std::string* domain) {
+  if (domain != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000008u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000008u;
+  }
+  _impl_.domain_.SetAllocated(domain, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.domain_.IsDefault()) {
+    _impl_.domain_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.NodeProto.domain)
+}
+
+// optional string overload = 8;
+inline bool NodeProto::_internal_has_overload() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000010u) != 0;
+  return value;
+}
+inline bool NodeProto::has_overload() const {
+  return _internal_has_overload();
+}
+inline void NodeProto::clear_overload() {
+  _impl_.overload_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000010u;
+}
+inline const std::string& NodeProto::overload() const {
+  // @@protoc_insertion_point(field_get:onnx.NodeProto.overload)
+  return _internal_overload();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void NodeProto::set_overload(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000010u;
+ _impl_.overload_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.NodeProto.overload)
+}
+inline std::string* NodeProto::mutable_overload() {
+  std::string* _s = _internal_mutable_overload();
+  // @@protoc_insertion_point(field_mutable:onnx.NodeProto.overload)
+  return _s;
+}
+inline const std::string& NodeProto::_internal_overload() const {
+  return _impl_.overload_.Get();
+}
+inline void NodeProto::_internal_set_overload(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000010u;
+  _impl_.overload_.Set(value, GetArenaForAllocation());
+}
+inline std::string* NodeProto::_internal_mutable_overload() {
+  _impl_._has_bits_[0] |= 0x00000010u;
+  return _impl_.overload_.Mutable(GetArenaForAllocation());
+}
+inline std::string* NodeProto::release_overload() {
+  // @@protoc_insertion_point(field_release:onnx.NodeProto.overload)
+  if (!_internal_has_overload()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000010u;
+  auto* p = _impl_.overload_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.overload_.IsDefault()) {
+    _impl_.overload_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void NodeProto::set_allocated_overload(std::string* overload) {
+  if (overload != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000010u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000010u;
+  }
+  _impl_.overload_.SetAllocated(overload, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.overload_.IsDefault()) {
+    _impl_.overload_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.NodeProto.overload)
+}
+
+// repeated .onnx.AttributeProto attribute = 5;
+inline int NodeProto::_internal_attribute_size() const {
+  return _impl_.attribute_.size();
+}
+inline int NodeProto::attribute_size() const {
+  return _internal_attribute_size();
+}
+inline void NodeProto::clear_attribute() {
+  _impl_.attribute_.Clear();
+}
+inline ::onnx::AttributeProto* NodeProto::mutable_attribute(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.NodeProto.attribute)
+  return _impl_.attribute_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::AttributeProto >*
+NodeProto::mutable_attribute() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.NodeProto.attribute)
+  return &_impl_.attribute_;
+}
+inline const ::onnx::AttributeProto& NodeProto::_internal_attribute(int index) const {
+  return _impl_.attribute_.Get(index);
+}
+inline const ::onnx::AttributeProto& NodeProto::attribute(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.NodeProto.attribute)
+  return _internal_attribute(index);
+}
+inline ::onnx::AttributeProto* NodeProto::_internal_add_attribute() {
+  return _impl_.attribute_.Add();
+}
+inline ::onnx::AttributeProto* NodeProto::add_attribute() {
+  ::onnx::AttributeProto* _add = _internal_add_attribute();
+  // @@protoc_insertion_point(field_add:onnx.NodeProto.attribute)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::AttributeProto >&
+NodeProto::attribute() const {
+  // @@protoc_insertion_point(field_list:onnx.NodeProto.attribute)
+  return _impl_.attribute_;
+}
+
+// optional string doc_string = 6;
+inline bool NodeProto::_internal_has_doc_string() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000004u) != 0;
+  return value;
+}
+inline bool NodeProto::has_doc_string() const {
+  return _internal_has_doc_string();
+}
+inline void NodeProto::clear_doc_string() {
+  _impl_.doc_string_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000004u;
+}
+inline const std::string& NodeProto::doc_string() const {
+  // @@protoc_insertion_point(field_get:onnx.NodeProto.doc_string)
+  return _internal_doc_string();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void NodeProto::set_doc_string(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000004u;
+ _impl_.doc_string_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.NodeProto.doc_string)
+}
+inline std::string* NodeProto::mutable_doc_string() {
+  std::string* _s = _internal_mutable_doc_string();
+  // @@protoc_insertion_point(field_mutable:onnx.NodeProto.doc_string)
+  return _s;
+}
+inline const std::string& NodeProto::_internal_doc_string() const {
+  return _impl_.doc_string_.Get();
+}
+inline void NodeProto::_internal_set_doc_string(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  _impl_.doc_string_.Set(value, GetArenaForAllocation());
+}
+inline std::string* NodeProto::_internal_mutable_doc_string() {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  return _impl_.doc_string_.Mutable(GetArenaForAllocation());
+}
+inline std::string* NodeProto::release_doc_string() {
+  // @@protoc_insertion_point(field_release:onnx.NodeProto.doc_string)
+  if (!_internal_has_doc_string()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000004u;
+  auto* p = _impl_.doc_string_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void NodeProto::set_allocated_doc_string(std::string* doc_string) {
+  if (doc_string != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000004u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000004u;
+  }
+  _impl_.doc_string_.SetAllocated(doc_string, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.NodeProto.doc_string)
+}
+
+// repeated .onnx.StringStringEntryProto metadata_props = 9;
+inline int NodeProto::_internal_metadata_props_size() const {
+  return _impl_.metadata_props_.size();
+}
+inline int NodeProto::metadata_props_size() const {
+  return _internal_metadata_props_size();
+}
+inline void NodeProto::clear_metadata_props() {
+  _impl_.metadata_props_.Clear();
+}
+inline ::onnx::StringStringEntryProto* NodeProto::mutable_metadata_props(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.NodeProto.metadata_props)
+  return _impl_.metadata_props_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+NodeProto::mutable_metadata_props() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.NodeProto.metadata_props)
+  return &_impl_.metadata_props_;
+}
+inline const ::onnx::StringStringEntryProto& NodeProto::_internal_metadata_props(int index) const {
+  return _impl_.metadata_props_.Get(index);
+}
+inline const ::onnx::StringStringEntryProto& NodeProto::metadata_props(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.NodeProto.metadata_props)
+  return _internal_metadata_props(index);
+}
+inline ::onnx::StringStringEntryProto* NodeProto::_internal_add_metadata_props() {
+  return _impl_.metadata_props_.Add();
+}
+inline ::onnx::StringStringEntryProto* NodeProto::add_metadata_props() {
+  ::onnx::StringStringEntryProto* _add = _internal_add_metadata_props();
+  // @@protoc_insertion_point(field_add:onnx.NodeProto.metadata_props)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+NodeProto::metadata_props() const {
+  // @@protoc_insertion_point(field_list:onnx.NodeProto.metadata_props)
+  return _impl_.metadata_props_;
+}
+
+// repeated .onnx.NodeDeviceConfigurationProto device_configurations = 10;
+inline int NodeProto::_internal_device_configurations_size() const {
+  return _impl_.device_configurations_.size();
+}
+inline int NodeProto::device_configurations_size() const {
+  return _internal_device_configurations_size();
+}
+inline void NodeProto::clear_device_configurations() {
+  _impl_.device_configurations_.Clear();
+}
+inline ::onnx::NodeDeviceConfigurationProto* NodeProto::mutable_device_configurations(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.NodeProto.device_configurations)
+  return _impl_.device_configurations_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeDeviceConfigurationProto >*
+NodeProto::mutable_device_configurations() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.NodeProto.device_configurations)
+  return &_impl_.device_configurations_;
+}
+inline const ::onnx::NodeDeviceConfigurationProto& NodeProto::_internal_device_configurations(int index) const {
+  return _impl_.device_configurations_.Get(index);
+}
+inline const ::onnx::NodeDeviceConfigurationProto& NodeProto::device_configurations(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.NodeProto.device_configurations)
+  return _internal_device_configurations(index);
+}
+inline ::onnx::NodeDeviceConfigurationProto* NodeProto::_internal_add_device_configurations() {
+  return _impl_.device_configurations_.Add();
+}
+inline ::onnx::NodeDeviceConfigurationProto* NodeProto::add_device_configurations() {
+  ::onnx::NodeDeviceConfigurationProto* _add = _internal_add_device_configurations();
+  // @@protoc_insertion_point(field_add:onnx.NodeProto.device_configurations)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeDeviceConfigurationProto >&
+NodeProto::device_configurations() const {
+  // @@protoc_insertion_point(field_list:onnx.NodeProto.device_configurations)
+  return _impl_.device_configurations_;
+}
+
+// -------------------------------------------------------------------
+
+// IntIntListEntryProto
+
+// optional int64 key = 1;
+inline bool IntIntListEntryProto::_internal_has_key() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool IntIntListEntryProto::has_key() const {
+  return _internal_has_key();
+}
+inline void IntIntListEntryProto::clear_key() {
+  _impl_.key_ = int64_t{0};
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline int64_t IntIntListEntryProto::_internal_key() const {
+  return _impl_.key_;
+}
+inline int64_t IntIntListEntryProto::key() const {
+  // @@protoc_insertion_point(field_get:onnx.IntIntListEntryProto.key)
+  return _internal_key();
+}
+inline void IntIntListEntryProto::_internal_set_key(int64_t value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.key_ = value;
+}
+inline void IntIntListEntryProto::set_key(int64_t value) {
+  _internal_set_key(value);
+  // @@protoc_insertion_point(field_set:onnx.IntIntListEntryProto.key)
+}
+
+// repeated int64 value = 2;
+inline int IntIntListEntryProto::_internal_value_size() const {
+  return _impl_.value_.size();
+}
+inline int IntIntListEntryProto::value_size() const {
+  return _internal_value_size();
+}
+inline void IntIntListEntryProto::clear_value() {
+  _impl_.value_.Clear();
+}
+inline int64_t IntIntListEntryProto::_internal_value(int index) const {
+  return _impl_.value_.Get(index);
+}
+inline int64_t IntIntListEntryProto::value(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.IntIntListEntryProto.value)
+  return _internal_value(index);
+}
+inline void IntIntListEntryProto::set_value(int index, int64_t value) {
+  _impl_.value_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.IntIntListEntryProto.value)
+}
+inline void IntIntListEntryProto::_internal_add_value(int64_t value) {
+  _impl_.value_.Add(value);
+}
+inline void IntIntListEntryProto::add_value(int64_t value) {
+  _internal_add_value(value);
+  // @@protoc_insertion_point(field_add:onnx.IntIntListEntryProto.value)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+IntIntListEntryProto::_internal_value() const {
+  return _impl_.value_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+IntIntListEntryProto::value() const {
+  // @@protoc_insertion_point(field_list:onnx.IntIntListEntryProto.value)
+  return _internal_value();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+IntIntListEntryProto::_internal_mutable_value() {
+  return &_impl_.value_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+IntIntListEntryProto::mutable_value() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.IntIntListEntryProto.value)
+  return _internal_mutable_value();
+}
+
+// -------------------------------------------------------------------
+
+// NodeDeviceConfigurationProto
+
+// optional string configuration_id = 1;
+inline bool NodeDeviceConfigurationProto::_internal_has_configuration_id() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool NodeDeviceConfigurationProto::has_configuration_id() const {
+  return _internal_has_configuration_id();
+}
+inline void NodeDeviceConfigurationProto::clear_configuration_id() {
+  _impl_.configuration_id_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& NodeDeviceConfigurationProto::configuration_id() const {
+  // @@protoc_insertion_point(field_get:onnx.NodeDeviceConfigurationProto.configuration_id)
+  return _internal_configuration_id();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void NodeDeviceConfigurationProto::set_configuration_id(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.configuration_id_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.NodeDeviceConfigurationProto.configuration_id)
+}
+inline std::string* NodeDeviceConfigurationProto::mutable_configuration_id() {
+  std::string* _s = _internal_mutable_configuration_id();
+  // @@protoc_insertion_point(field_mutable:onnx.NodeDeviceConfigurationProto.configuration_id)
+  return _s;
+}
+inline const std::string& NodeDeviceConfigurationProto::_internal_configuration_id() const {
+  return _impl_.configuration_id_.Get();
+}
+inline void NodeDeviceConfigurationProto::_internal_set_configuration_id(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.configuration_id_.Set(value, GetArenaForAllocation());
+}
+inline std::string* NodeDeviceConfigurationProto::_internal_mutable_configuration_id() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.configuration_id_.Mutable(GetArenaForAllocation());
+}
+inline std::string* NodeDeviceConfigurationProto::release_configuration_id() {
+  // @@protoc_insertion_point(field_release:onnx.NodeDeviceConfigurationProto.configuration_id)
+  if (!_internal_has_configuration_id()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.configuration_id_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.configuration_id_.IsDefault()) {
+    _impl_.configuration_id_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void NodeDeviceConfigurationProto::set_allocated_configuration_id(std::string* configuration_id) {
+  if (configuration_id != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.configuration_id_.SetAllocated(configuration_id, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.configuration_id_.IsDefault()) {
+    _impl_.configuration_id_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.NodeDeviceConfigurationProto.configuration_id)
+}
+
+// repeated .onnx.ShardingSpecProto sharding_spec = 2;
+inline int NodeDeviceConfigurationProto::_internal_sharding_spec_size() const {
+  return _impl_.sharding_spec_.size();
+}
+inline int NodeDeviceConfigurationProto::sharding_spec_size() const {
+  return _internal_sharding_spec_size();
+}
+inline void NodeDeviceConfigurationProto::clear_sharding_spec() {
+  _impl_.sharding_spec_.Clear();
+}
+inline ::onnx::ShardingSpecProto* NodeDeviceConfigurationProto::mutable_sharding_spec(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.NodeDeviceConfigurationProto.sharding_spec)
+  return _impl_.sharding_spec_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ShardingSpecProto >*
+NodeDeviceConfigurationProto::mutable_sharding_spec() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.NodeDeviceConfigurationProto.sharding_spec)
+  return &_impl_.sharding_spec_;
+}
+inline const ::onnx::ShardingSpecProto& NodeDeviceConfigurationProto::_internal_sharding_spec(int index) const {
+  return _impl_.sharding_spec_.Get(index);
+}
+inline const ::onnx::ShardingSpecProto& NodeDeviceConfigurationProto::sharding_spec(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.NodeDeviceConfigurationProto.sharding_spec)
+  return _internal_sharding_spec(index);
+}
+inline ::onnx::ShardingSpecProto* NodeDeviceConfigurationProto::_internal_add_sharding_spec() {
+  return _impl_.sharding_spec_.Add();
+}
+inline ::onnx::ShardingSpecProto* NodeDeviceConfigurationProto::add_sharding_spec() {
+  ::onnx::ShardingSpecProto* _add = _internal_add_sharding_spec();
+  // @@protoc_insertion_point(field_add:onnx.NodeDeviceConfigurationProto.sharding_spec)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ShardingSpecProto >&
+NodeDeviceConfigurationProto::sharding_spec() const {
+  // @@protoc_insertion_point(field_list:onnx.NodeDeviceConfigurationProto.sharding_spec)
+  return _impl_.sharding_spec_;
+}
+
+// optional int32 pipeline_stage = 3;
+inline bool NodeDeviceConfigurationProto::_internal_has_pipeline_stage() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool NodeDeviceConfigurationProto::has_pipeline_stage() const {
+  return _internal_has_pipeline_stage();
+}
+inline void NodeDeviceConfigurationProto::clear_pipeline_stage() {
+  _impl_.pipeline_stage_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline int32_t NodeDeviceConfigurationProto::_internal_pipeline_stage() const {
+  return _impl_.pipeline_stage_;
+}
+inline int32_t NodeDeviceConfigurationProto::pipeline_stage() const {
+  // @@protoc_insertion_point(field_get:onnx.NodeDeviceConfigurationProto.pipeline_stage)
+  return _internal_pipeline_stage();
+}
+inline void NodeDeviceConfigurationProto::_internal_set_pipeline_stage(int32_t value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.pipeline_stage_ = value;
+}
+inline void NodeDeviceConfigurationProto::set_pipeline_stage(int32_t value) {
+  _internal_set_pipeline_stage(value);
+  // @@protoc_insertion_point(field_set:onnx.NodeDeviceConfigurationProto.pipeline_stage)
+}
+
+// -------------------------------------------------------------------
+
+// ShardingSpecProto
+
+// optional string tensor_name = 1;
+inline bool ShardingSpecProto::_internal_has_tensor_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool ShardingSpecProto::has_tensor_name() const {
+  return _internal_has_tensor_name();
+}
+inline void ShardingSpecProto::clear_tensor_name() {
+  _impl_.tensor_name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& ShardingSpecProto::tensor_name() const {
+  // @@protoc_insertion_point(field_get:onnx.ShardingSpecProto.tensor_name)
+  return _internal_tensor_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void ShardingSpecProto::set_tensor_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.tensor_name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.ShardingSpecProto.tensor_name)
+}
+inline std::string* ShardingSpecProto::mutable_tensor_name() {
+  std::string* _s = _internal_mutable_tensor_name();
+  // @@protoc_insertion_point(field_mutable:onnx.ShardingSpecProto.tensor_name)
+  return _s;
+}
+inline const std::string& ShardingSpecProto::_internal_tensor_name() const {
+  return _impl_.tensor_name_.Get();
+}
+inline void ShardingSpecProto::_internal_set_tensor_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.tensor_name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* ShardingSpecProto::_internal_mutable_tensor_name() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.tensor_name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* ShardingSpecProto::release_tensor_name() {
+  // @@protoc_insertion_point(field_release:onnx.ShardingSpecProto.tensor_name)
+  if (!_internal_has_tensor_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.tensor_name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.tensor_name_.IsDefault()) {
+    _impl_.tensor_name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void ShardingSpecProto::set_allocated_tensor_name(std::string* tensor_name) {
+  if (tensor_name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.tensor_name_.SetAllocated(tensor_name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.tensor_name_.IsDefault()) {
+    _impl_.tensor_name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.ShardingSpecProto.tensor_name)
+}
+
+// repeated int64 device = 2;
+inline int ShardingSpecProto::_internal_device_size() const {
+  return _impl_.device_.size();
+}
+inline int ShardingSpecProto::device_size() const {
+  return _internal_device_size();
+}
+inline void ShardingSpecProto::clear_device() {
+  _impl_.device_.Clear();
+}
+inline int64_t ShardingSpecProto::_internal_device(int index) const {
+  return _impl_.device_.Get(index);
+}
+inline int64_t ShardingSpecProto::device(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.ShardingSpecProto.device)
+  return _internal_device(index);
+}
+inline void ShardingSpecProto::set_device(int index, int64_t value) {
+  _impl_.device_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.ShardingSpecProto.device)
+}
+inline void ShardingSpecProto::_internal_add_device(int64_t value) {
+  _impl_.device_.Add(value);
+}
+inline void ShardingSpecProto::add_device(int64_t value) {
+  _internal_add_device(value);
+  // @@protoc_insertion_point(field_add:onnx.ShardingSpecProto.device)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+ShardingSpecProto::_internal_device() const {
+  return _impl_.device_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+ShardingSpecProto::device() const {
+  // @@protoc_insertion_point(field_list:onnx.ShardingSpecProto.device)
+  return _internal_device();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+ShardingSpecProto::_internal_mutable_device() {
+  return &_impl_.device_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+ShardingSpecProto::mutable_device() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.ShardingSpecProto.device)
+  return _internal_mutable_device();
+}
+
+// repeated .onnx.IntIntListEntryProto index_to_device_group_map = 3;
+inline int ShardingSpecProto::_internal_index_to_device_group_map_size() const {
+  return _impl_.index_to_device_group_map_.size();
+}
+inline int ShardingSpecProto::index_to_device_group_map_size() const {
+  return _internal_index_to_device_group_map_size();
+}
+inline void ShardingSpecProto::clear_index_to_device_group_map() {
+  _impl_.index_to_device_group_map_.Clear();
+}
+inline ::onnx::IntIntListEntryProto* ShardingSpecProto::mutable_index_to_device_group_map(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.ShardingSpecProto.index_to_device_group_map)
+  return _impl_.index_to_device_group_map_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::IntIntListEntryProto >*
+ShardingSpecProto::mutable_index_to_device_group_map() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.ShardingSpecProto.index_to_device_group_map)
+  return &_impl_.index_to_device_group_map_;
+}
+inline const ::onnx::IntIntListEntryProto& ShardingSpecProto::_internal_index_to_device_group_map(int index) const {
+  return _impl_.index_to_device_group_map_.Get(index);
+}
+inline const ::onnx::IntIntListEntryProto& ShardingSpecProto::index_to_device_group_map(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.ShardingSpecProto.index_to_device_group_map)
+  return _internal_index_to_device_group_map(index);
+}
+inline ::onnx::IntIntListEntryProto* ShardingSpecProto::_internal_add_index_to_device_group_map() {
+  return _impl_.index_to_device_group_map_.Add();
+}
+inline ::onnx::IntIntListEntryProto* ShardingSpecProto::add_index_to_device_group_map() {
+  ::onnx::IntIntListEntryProto* _add = _internal_add_index_to_device_group_map();
+  // @@protoc_insertion_point(field_add:onnx.ShardingSpecProto.index_to_device_group_map)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::IntIntListEntryProto >&
+ShardingSpecProto::index_to_device_group_map() const {
+  // @@protoc_insertion_point(field_list:onnx.ShardingSpecProto.index_to_device_group_map)
+  return _impl_.index_to_device_group_map_;
+}
+
+// repeated .onnx.ShardedDimProto sharded_dim = 4;
+inline int ShardingSpecProto::_internal_sharded_dim_size() const {
+  return _impl_.sharded_dim_.size();
+}
+inline int ShardingSpecProto::sharded_dim_size() const {
+  return _internal_sharded_dim_size();
+}
+inline void ShardingSpecProto::clear_sharded_dim() {
+  _impl_.sharded_dim_.Clear();
+}
+inline ::onnx::ShardedDimProto* ShardingSpecProto::mutable_sharded_dim(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.ShardingSpecProto.sharded_dim)
+  return _impl_.sharded_dim_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ShardedDimProto >*
+ShardingSpecProto::mutable_sharded_dim() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.ShardingSpecProto.sharded_dim)
+  return &_impl_.sharded_dim_;
+}
+inline const ::onnx::ShardedDimProto& ShardingSpecProto::_internal_sharded_dim(int index) const {
+  return _impl_.sharded_dim_.Get(index);
+}
+inline const ::onnx::ShardedDimProto& ShardingSpecProto::sharded_dim(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.ShardingSpecProto.sharded_dim)
+  return _internal_sharded_dim(index);
+}
+inline ::onnx::ShardedDimProto* ShardingSpecProto::_internal_add_sharded_dim() {
+  return _impl_.sharded_dim_.Add();
+}
+inline ::onnx::ShardedDimProto* ShardingSpecProto::add_sharded_dim() {
+  ::onnx::ShardedDimProto* _add = _internal_add_sharded_dim();
+  // @@protoc_insertion_point(field_add:onnx.ShardingSpecProto.sharded_dim)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ShardedDimProto >&
+ShardingSpecProto::sharded_dim() const {
+  // @@protoc_insertion_point(field_list:onnx.ShardingSpecProto.sharded_dim)
+  return _impl_.sharded_dim_;
+}
+
+// -------------------------------------------------------------------
+
+// ShardedDimProto
+
+// optional int64 axis = 1;
+inline bool ShardedDimProto::_internal_has_axis() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool ShardedDimProto::has_axis() const {
+  return _internal_has_axis();
+}
+inline void ShardedDimProto::clear_axis() {
+  _impl_.axis_ = int64_t{0};
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline int64_t ShardedDimProto::_internal_axis() const {
+  return _impl_.axis_;
+}
+inline int64_t ShardedDimProto::axis() const {
+  // @@protoc_insertion_point(field_get:onnx.ShardedDimProto.axis)
+  return _internal_axis();
+}
+inline void ShardedDimProto::_internal_set_axis(int64_t value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.axis_ = value;
+}
+inline void ShardedDimProto::set_axis(int64_t value) {
+  _internal_set_axis(value);
+  // @@protoc_insertion_point(field_set:onnx.ShardedDimProto.axis)
+}
+
+// repeated .onnx.SimpleShardedDimProto simple_sharding = 2;
+inline int ShardedDimProto::_internal_simple_sharding_size() const {
+  return _impl_.simple_sharding_.size();
+}
+inline int ShardedDimProto::simple_sharding_size() const {
+  return _internal_simple_sharding_size();
+}
+inline void ShardedDimProto::clear_simple_sharding() {
+  _impl_.simple_sharding_.Clear();
+}
+inline ::onnx::SimpleShardedDimProto* ShardedDimProto::mutable_simple_sharding(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.ShardedDimProto.simple_sharding)
+  return _impl_.simple_sharding_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SimpleShardedDimProto >*
+ShardedDimProto::mutable_simple_sharding() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.ShardedDimProto.simple_sharding)
+  return &_impl_.simple_sharding_;
+}
+inline const ::onnx::SimpleShardedDimProto& ShardedDimProto::_internal_simple_sharding(int index) const {
+  return _impl_.simple_sharding_.Get(index);
+}
+inline const ::onnx::SimpleShardedDimProto& ShardedDimProto::simple_sharding(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.ShardedDimProto.simple_sharding)
+  return _internal_simple_sharding(index);
+}
+inline ::onnx::SimpleShardedDimProto* ShardedDimProto::_internal_add_simple_sharding() {
+  return _impl_.simple_sharding_.Add();
+}
+inline ::onnx::SimpleShardedDimProto* ShardedDimProto::add_simple_sharding() {
+  ::onnx::SimpleShardedDimProto* _add = _internal_add_simple_sharding();
+  // @@protoc_insertion_point(field_add:onnx.ShardedDimProto.simple_sharding)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SimpleShardedDimProto >&
+ShardedDimProto::simple_sharding() const {
+  // @@protoc_insertion_point(field_list:onnx.ShardedDimProto.simple_sharding)
+  return _impl_.simple_sharding_;
+}
+
+// -------------------------------------------------------------------
+
+// SimpleShardedDimProto
+
+// int64 dim_value = 1;
+inline bool SimpleShardedDimProto::_internal_has_dim_value() const {
+  return dim_case() == kDimValue;
+}
+inline bool SimpleShardedDimProto::has_dim_value() const {
+  return _internal_has_dim_value();
+}
+inline void SimpleShardedDimProto::set_has_dim_value() {
+  _impl_._oneof_case_[0] = kDimValue;
+}
+inline void SimpleShardedDimProto::clear_dim_value() {
+  if (_internal_has_dim_value()) {
+    _impl_.dim_.dim_value_ = int64_t{0};
+    clear_has_dim();
+  }
+}
+inline int64_t SimpleShardedDimProto::_internal_dim_value() const {
+  if (_internal_has_dim_value()) {
+    return _impl_.dim_.dim_value_;
+  }
+  return int64_t{0};
+}
+inline void SimpleShardedDimProto::_internal_set_dim_value(int64_t value) {
+  if (!_internal_has_dim_value()) {
+    clear_dim();
+    set_has_dim_value();
+  }
+  _impl_.dim_.dim_value_ = value;
+}
+inline int64_t SimpleShardedDimProto::dim_value() const {
+  // @@protoc_insertion_point(field_get:onnx.SimpleShardedDimProto.dim_value)
+  return _internal_dim_value();
+}
+inline void SimpleShardedDimProto::set_dim_value(int64_t value) {
+  _internal_set_dim_value(value);
+  // @@protoc_insertion_point(field_set:onnx.SimpleShardedDimProto.dim_value)
+}
+
+// string dim_param = 2;
+inline bool SimpleShardedDimProto::_internal_has_dim_param() const {
+  return dim_case() == kDimParam;
+}
+inline bool SimpleShardedDimProto::has_dim_param() const {
+  return _internal_has_dim_param();
+}
+inline void SimpleShardedDimProto::set_has_dim_param() {
+  _impl_._oneof_case_[0] = kDimParam;
+}
+inline void SimpleShardedDimProto::clear_dim_param() {
+  if (_internal_has_dim_param()) {
+    _impl_.dim_.dim_param_.Destroy();
+    clear_has_dim();
+  }
+}
+inline const std::string& SimpleShardedDimProto::dim_param() const {
+  // @@protoc_insertion_point(field_get:onnx.SimpleShardedDimProto.dim_param)
+  return _internal_dim_param();
+}
+template <typename ArgT0, typename... ArgT>
+inline void SimpleShardedDimProto::set_dim_param(ArgT0&& arg0, ArgT... args) {
+  if (!_internal_has_dim_param()) {
+    clear_dim();
+    set_has_dim_param();
+    _impl_.dim_.dim_param_.InitDefault();
+  }
+  _impl_.dim_.dim_param_.Set( static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.SimpleShardedDimProto.dim_param)
+}
+inline std::string* SimpleShardedDimProto::mutable_dim_param() {
+  std::string* _s = _internal_mutable_dim_param();
+  // @@protoc_insertion_point(field_mutable:onnx.SimpleShardedDimProto.dim_param)
+  return _s;
+}
+inline const std::string& SimpleShardedDimProto::_internal_dim_param() const {
+  if (_internal_has_dim_param()) {
+    return _impl_.dim_.dim_param_.Get();
+  }
+  return ::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited();
+}
+inline void SimpleShardedDimProto::_internal_set_dim_param(const std::string& value) {
+  if (!_internal_has_dim_param()) {
+    clear_dim();
+    set_has_dim_param();
+    _impl_.dim_.dim_param_.InitDefault();
+  }
+  _impl_.dim_.dim_param_.Set(value, GetArenaForAllocation());
+}
+inline std::string* SimpleShardedDimProto::_internal_mutable_dim_param() {
+  if (!_internal_has_dim_param()) {
+    clear_dim();
+    set_has_dim_param();
+    _impl_.dim_.dim_param_.InitDefault();
+  }
+  return _impl_.dim_.dim_param_.Mutable(      GetArenaForAllocation());
+}
+inline std::string* SimpleShardedDimProto::release_dim_param() {
+  // @@protoc_insertion_point(field_release:onnx.SimpleShardedDimProto.dim_param)
+  if (_internal_has_dim_param()) {
+    clear_has_dim();
+    return _impl_.dim_.dim_param_.Release();
+  } else {
+    return nullptr;
+  }
+}
+inline void SimpleShardedDimProto::set_allocated_dim_param(std::string* dim_param) {
+  if (has_dim()) {
+    clear_dim();
+  }
+  if (dim_param != nullptr) {
+    set_has_dim_param();
+    _impl_.dim_.dim_param_.InitAllocated(dim_param, GetArenaForAllocation());
+  }
+  // @@protoc_insertion_point(field_set_allocated:onnx.SimpleShardedDimProto.dim_param)
+}
+
+// optional int64 num_shards = 3;
+inline bool SimpleShardedDimProto::_internal_has_num_shards() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool SimpleShardedDimProto::has_num_shards() const {
+  return _internal_has_num_shards();
+}
+inline void SimpleShardedDimProto::clear_num_shards() {
+  _impl_.num_shards_ = int64_t{0};
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline int64_t SimpleShardedDimProto::_internal_num_shards() const {
+  return _impl_.num_shards_;
+}
+inline int64_t SimpleShardedDimProto::num_shards() const {
+  // @@protoc_insertion_point(field_get:onnx.SimpleShardedDimProto.num_shards)
+  return _internal_num_shards();
+}
+inline void SimpleShardedDimProto::_internal_set_num_shards(int64_t value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.num_shards_ = value;
+}
+inline void SimpleShardedDimProto::set_num_shards(int64_t value) {
+  _internal_set_num_shards(value);
+  // @@protoc_insertion_point(field_set:onnx.SimpleShardedDimProto.num_shards)
+}
+
+inline bool SimpleShardedDimProto::has_dim() const {
+  return dim_case() != DIM_NOT_SET;
+}
+inline void SimpleShardedDimProto::clear_has_dim() {
+  _impl_._oneof_case_[0] = DIM_NOT_SET;
+}
+inline SimpleShardedDimProto::DimCase SimpleShardedDimProto::dim_case() const {
+  return SimpleShardedDimProto::DimCase(_impl_._oneof_case_[0]);
+}
+// -------------------------------------------------------------------
+
+// TrainingInfoProto
+
+// optional .onnx.GraphProto initialization = 1;
+inline bool TrainingInfoProto::_internal_has_initialization() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.initialization_ != nullptr);
+  return value;
+}
+inline bool TrainingInfoProto::has_initialization() const {
+  return _internal_has_initialization();
+}
+inline void TrainingInfoProto::clear_initialization() {
+  if (_impl_.initialization_ != nullptr) _impl_.initialization_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::onnx::GraphProto& TrainingInfoProto::_internal_initialization() const {
+  const ::onnx::GraphProto* p = _impl_.initialization_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::GraphProto&>(
+      ::onnx::_GraphProto_default_instance_);
+}
+inline const ::onnx::GraphProto& TrainingInfoProto::initialization() const {
+  // @@protoc_insertion_point(field_get:onnx.TrainingInfoProto.initialization)
+  return _internal_initialization();
+}
+inline void TrainingInfoProto::unsafe_arena_set_allocated_initialization(
+    ::onnx::GraphProto* initialization) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.initialization_);
+  }
+  _impl_.initialization_ = initialization;
+  if (initialization) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TrainingInfoProto.initialization)
+}
+inline ::onnx::GraphProto* TrainingInfoProto::release_initialization() {
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::GraphProto* temp = _impl_.initialization_;
+  _impl_.initialization_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::GraphProto* TrainingInfoProto::unsafe_arena_release_initialization() {
+  // @@protoc_insertion_point(field_release:onnx.TrainingInfoProto.initialization)
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::GraphProto* temp = _impl_.initialization_;
+  _impl_.initialization_ = nullptr;
+  return temp;
+}
+inline ::onnx::GraphProto* TrainingInfoProto::_internal_mutable_initialization() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  if (_impl_.initialization_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::GraphProto>(GetArenaForAllocation());
+    _impl_.initialization_ = p;
+  }
+  return _impl_.initialization_;
+}
+inline ::onnx::GraphProto* TrainingInfoProto::mutable_initialization() {
+  ::onnx::GraphProto* _msg = _internal_mutable_initialization();
+  // @@protoc_insertion_point(field_mutable:onnx.TrainingInfoProto.initialization)
+  return _msg;
+}
+inline void TrainingInfoProto::set_allocated_initialization(::onnx::GraphProto* initialization) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.initialization_;
+  }
+  if (initialization) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(initialization);
+    if (message_arena != submessage_arena) {
+      initialization = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, initialization, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.initialization_ = initialization;
+  // @@protoc_insertion_point(field_set_allocated:onnx.TrainingInfoProto.initialization)
+}
+
+// optional .onnx.GraphProto algorithm = 2;
+inline bool TrainingInfoProto::_internal_has_algorithm() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.algorithm_ != nullptr);
+  return value;
+}
+inline bool TrainingInfoProto::has_algorithm() const {
+  return _internal_has_algorithm();
+}
+inline void TrainingInfoProto::clear_algorithm() {
+  if (_impl_.algorithm_ != nullptr) _impl_.algorithm_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const ::onnx::GraphProto& TrainingInfoProto::_internal_algorithm() const {
+  const ::onnx::GraphProto* p = _impl_.algorithm_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::GraphProto&>(
+      ::onnx::_GraphProto_default_instance_);
+}
+inline const ::onnx::GraphProto& TrainingInfoProto::algorithm() const {
+  // @@protoc_insertion_point(field_get:onnx.TrainingInfoProto.algorithm)
+  return _internal_algorithm();
+}
+inline void TrainingInfoProto::unsafe_arena_set_allocated_algorithm(
+    ::onnx::GraphProto* algorithm) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.algorithm_);
+  }
+  _impl_.algorithm_ = algorithm;
+  if (algorithm) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TrainingInfoProto.algorithm)
+}
+inline ::onnx::GraphProto* TrainingInfoProto::release_algorithm() {
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  ::onnx::GraphProto* temp = _impl_.algorithm_;
+  _impl_.algorithm_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::GraphProto* TrainingInfoProto::unsafe_arena_release_algorithm() {
+  // @@protoc_insertion_point(field_release:onnx.TrainingInfoProto.algorithm)
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  ::onnx::GraphProto* temp = _impl_.algorithm_;
+  _impl_.algorithm_ = nullptr;
+  return temp;
+}
+inline ::onnx::GraphProto* TrainingInfoProto::_internal_mutable_algorithm() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  if (_impl_.algorithm_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::GraphProto>(GetArenaForAllocation());
+    _impl_.algorithm_ = p;
+  }
+  return _impl_.algorithm_;
+}
+inline ::onnx::GraphProto* TrainingInfoProto::mutable_algorithm() {
+  ::onnx::GraphProto* _msg = _internal_mutable_algorithm();
+  // @@protoc_insertion_point(field_mutable:onnx.TrainingInfoProto.algorithm)
+  return _msg;
+}
+inline void TrainingInfoProto::set_allocated_algorithm(::onnx::GraphProto* algorithm) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.algorithm_;
+  }
+  if (algorithm) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(algorithm);
+    if (message_arena != submessage_arena) {
+      algorithm = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, algorithm, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.algorithm_ = algorithm;
+  // @@protoc_insertion_point(field_set_allocated:onnx.TrainingInfoProto.algorithm)
+}
+
+// repeated .onnx.StringStringEntryProto initialization_binding = 3;
+inline int TrainingInfoProto::_internal_initialization_binding_size() const {
+  return _impl_.initialization_binding_.size();
+}
+inline int TrainingInfoProto::initialization_binding_size() const {
+  return _internal_initialization_binding_size();
+}
+inline void TrainingInfoProto::clear_initialization_binding() {
+  _impl_.initialization_binding_.Clear();
+}
+inline ::onnx::StringStringEntryProto* TrainingInfoProto::mutable_initialization_binding(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.TrainingInfoProto.initialization_binding)
+  return _impl_.initialization_binding_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+TrainingInfoProto::mutable_initialization_binding() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TrainingInfoProto.initialization_binding)
+  return &_impl_.initialization_binding_;
+}
+inline const ::onnx::StringStringEntryProto& TrainingInfoProto::_internal_initialization_binding(int index) const {
+  return _impl_.initialization_binding_.Get(index);
+}
+inline const ::onnx::StringStringEntryProto& TrainingInfoProto::initialization_binding(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TrainingInfoProto.initialization_binding)
+  return _internal_initialization_binding(index);
+}
+inline ::onnx::StringStringEntryProto* TrainingInfoProto::_internal_add_initialization_binding() {
+  return _impl_.initialization_binding_.Add();
+}
+inline ::onnx::StringStringEntryProto* TrainingInfoProto::add_initialization_binding() {
+  ::onnx::StringStringEntryProto* _add = _internal_add_initialization_binding();
+  // @@protoc_insertion_point(field_add:onnx.TrainingInfoProto.initialization_binding)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+TrainingInfoProto::initialization_binding() const {
+  // @@protoc_insertion_point(field_list:onnx.TrainingInfoProto.initialization_binding)
+  return _impl_.initialization_binding_;
+}
+
+// repeated .onnx.StringStringEntryProto update_binding = 4;
+inline int TrainingInfoProto::_internal_update_binding_size() const {
+  return _impl_.update_binding_.size();
+}
+inline int TrainingInfoProto::update_binding_size() const {
+  return _internal_update_binding_size();
+}
+inline void TrainingInfoProto::clear_update_binding() {
+  _impl_.update_binding_.Clear();
+}
+inline ::onnx::StringStringEntryProto* TrainingInfoProto::mutable_update_binding(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.TrainingInfoProto.update_binding)
+  return _impl_.update_binding_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+TrainingInfoProto::mutable_update_binding() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TrainingInfoProto.update_binding)
+  return &_impl_.update_binding_;
+}
+inline const ::onnx::StringStringEntryProto& TrainingInfoProto::_internal_update_binding(int index) const {
+  return _impl_.update_binding_.Get(index);
+}
+inline const ::onnx::StringStringEntryProto& TrainingInfoProto::update_binding(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TrainingInfoProto.update_binding)
+  return _internal_update_binding(index);
+}
+inline ::onnx::StringStringEntryProto* TrainingInfoProto::_internal_add_update_binding() {
+  return _impl_.update_binding_.Add();
+}
+inline ::onnx::StringStringEntryProto* TrainingInfoProto::add_update_binding() {
+  ::onnx::StringStringEntryProto* _add = _internal_add_update_binding();
+  // @@protoc_insertion_point(field_add:onnx.TrainingInfoProto.update_binding)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+TrainingInfoProto::update_binding() const {
+  // @@protoc_insertion_point(field_list:onnx.TrainingInfoProto.update_binding)
+  return _impl_.update_binding_;
+}
+
+// -------------------------------------------------------------------
+
+// ModelProto
+
+// optional int64 ir_version = 1;
+inline bool ModelProto::_internal_has_ir_version() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000020u) != 0;
+  return value;
+}
+inline bool ModelProto::has_ir_version() const {
+  return _internal_has_ir_version();
+}
+inline void ModelProto::clear_ir_version() {
+  _impl_.ir_version_ = int64_t{0};
+  _impl_._has_bits_[0] &= ~0x00000020u;
+}
+inline int64_t ModelProto::_internal_ir_version() const {
+  return _impl_.ir_version_;
+}
+inline int64_t ModelProto::ir_version() const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.ir_version)
+  return _internal_ir_version();
+}
+inline void ModelProto::_internal_set_ir_version(int64_t value) {
+  _impl_._has_bits_[0] |= 0x00000020u;
+  _impl_.ir_version_ = value;
+}
+inline void ModelProto::set_ir_version(int64_t value) {
+  _internal_set_ir_version(value);
+  // @@protoc_insertion_point(field_set:onnx.ModelProto.ir_version)
+}
+
+// repeated .onnx.OperatorSetIdProto opset_import = 8;
+inline int ModelProto::_internal_opset_import_size() const {
+  return _impl_.opset_import_.size();
+}
+inline int ModelProto::opset_import_size() const {
+  return _internal_opset_import_size();
+}
+inline void ModelProto::clear_opset_import() {
+  _impl_.opset_import_.Clear();
+}
+inline ::onnx::OperatorSetIdProto* ModelProto::mutable_opset_import(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.ModelProto.opset_import)
+  return _impl_.opset_import_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::OperatorSetIdProto >*
+ModelProto::mutable_opset_import() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.ModelProto.opset_import)
+  return &_impl_.opset_import_;
+}
+inline const ::onnx::OperatorSetIdProto& ModelProto::_internal_opset_import(int index) const {
+  return _impl_.opset_import_.Get(index);
+}
+inline const ::onnx::OperatorSetIdProto& ModelProto::opset_import(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.opset_import)
+  return _internal_opset_import(index);
+}
+inline ::onnx::OperatorSetIdProto* ModelProto::_internal_add_opset_import() {
+  return _impl_.opset_import_.Add();
+}
+inline ::onnx::OperatorSetIdProto* ModelProto::add_opset_import() {
+  ::onnx::OperatorSetIdProto* _add = _internal_add_opset_import();
+  // @@protoc_insertion_point(field_add:onnx.ModelProto.opset_import)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::OperatorSetIdProto >&
+ModelProto::opset_import() const {
+  // @@protoc_insertion_point(field_list:onnx.ModelProto.opset_import)
+  return _impl_.opset_import_;
+}
+
+// optional string producer_name = 2;
+inline bool ModelProto::_internal_has_producer_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool ModelProto::has_producer_name() const {
+  return _internal_has_producer_name();
+}
+inline void ModelProto::clear_producer_name() {
+  _impl_.producer_name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& ModelProto::producer_name() const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.producer_name)
+  return _internal_producer_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void ModelProto::set_producer_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.producer_name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.ModelProto.producer_name)
+}
+inline std::string* ModelProto::mutable_producer_name() {
+  std::string* _s = _internal_mutable_producer_name();
+  // @@protoc_insertion_point(field_mutable:onnx.ModelProto.producer_name)
+  return _s;
+}
+inline const std::string& ModelProto::_internal_producer_name() const {
+  return _impl_.producer_name_.Get();
+}
+inline void ModelProto::_internal_set_producer_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.producer_name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* ModelProto::_internal_mutable_producer_name() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.producer_name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* ModelProto::release_producer_name() {
+  // @@protoc_insertion_point(field_release:onnx.ModelProto.producer_name)
+  if (!_internal_has_producer_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.producer_name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.producer_name_.IsDefault()) {
+    _impl_.producer_name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void ModelProto::set_allocated_producer_name(std::string* producer_name) {
+  if (producer_name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.producer_name_.SetAllocated(producer_name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.producer_name_.IsDefault()) {
+    _impl_.producer_name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.ModelProto.producer_name)
+}
+
+// optional string producer_version = 3;
+inline bool ModelProto::_internal_has_producer_version() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool ModelProto::has_producer_version() const {
+  return _internal_has_producer_version();
+}
+inline void ModelProto::clear_producer_version() {
+  _impl_.producer_version_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const std::string& ModelProto::producer_version() const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.producer_version)
+  return _internal_producer_version();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void ModelProto::set_producer_version(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000002u;
+ _impl_.producer_version_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.ModelProto.producer_version)
+}
+inline std::string* ModelProto::mutable_producer_version() {
+  std::string* _s = _internal_mutable_producer_version();
+  // @@protoc_insertion_point(field_mutable:onnx.ModelProto.producer_version)
+  return _s;
+}
+inline const std::string& ModelProto::_internal_producer_version() const {
+  return _impl_.producer_version_.Get();
+}
+inline void ModelProto::_internal_set_producer_version(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.producer_version_.Set(value, GetArenaForAllocation());
+}
+inline std::string* ModelProto::_internal_mutable_producer_version() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  return _impl_.producer_version_.Mutable(GetArenaForAllocation());
+}
+inline std::string* ModelProto::release_producer_version() {
+  // @@protoc_insertion_point(field_release:onnx.ModelProto.producer_version)
+  if (!_internal_has_producer_version()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  auto* p = _impl_.producer_version_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.producer_version_.IsDefault()) {
+    _impl_.producer_version_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void ModelProto::set_allocated_producer_version(std::string* producer_version) {
+  if (producer_version != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.producer_version_.SetAllocated(producer_version, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.producer_version_.IsDefault()) {
+    _impl_.producer_version_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.ModelProto.producer_version)
+}
+
+// optional string domain = 4;
+inline bool ModelProto::_internal_has_domain() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000004u) != 0;
+  return value;
+}
+inline bool ModelProto::has_domain() const {
+  return _internal_has_domain();
+}
+inline void ModelProto::clear_domain() {
+  _impl_.domain_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000004u;
+}
+inline const std::string& ModelProto::domain() const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.domain)
+  return _internal_domain();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void ModelProto::set_domain(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000004u;
+ _impl_.domain_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.ModelProto.domain)
+}
+inline std::string* ModelProto::mutable_domain() {
+  std::string* _s = _internal_mutable_domain();
+  // @@protoc_insertion_point(field_mutable:onnx.ModelProto.domain)
+  return _s;
+}
+inline const std::string& ModelProto::_internal_domain() const {
+  return _impl_.domain_.Get();
+}
+inline void ModelProto::_internal_set_domain(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  _impl_.domain_.Set(value, GetArenaForAllocation());
+}
+inline std::string* ModelProto::_internal_mutable_domain() {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  return _impl_.domain_.Mutable(GetArenaForAllocation());
+}
+inline std::string* ModelProto::release_domain() {
+  // @@protoc_insertion_point(field_release:onnx.ModelProto.domain)
+  if (!_internal_has_domain()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000004u;
+  auto* p = _impl_.domain_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.domain_.IsDefault()) {
+    _impl_.domain_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void ModelProto::set_allocated_domain(std::string* domain) {
+  if (domain != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000004u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000004u;
+  }
+  _impl_.domain_.SetAllocated(domain, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.domain_.IsDefault()) {
+    _impl_.domain_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.ModelProto.domain)
+}
+
+// optional int64 model_version = 5;
+inline bool ModelProto::_internal_has_model_version() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000040u) != 0;
+  return value;
+}
+inline bool ModelProto::has_model_version() const {
+  return _internal_has_model_version();
+}
+inline void ModelProto::clear_model_version() {
+  _impl_.model_version_ = int64_t{0};
+  _impl_._has_bits_[0] &= ~0x00000040u;
+}
+inline int64_t ModelProto::_internal_model_version() const {
+  return _impl_.model_version_;
+}
+inline int64_t ModelProto::model_version() const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.model_version)
+  return _internal_model_version();
+}
+inline void ModelProto::_internal_set_model_version(int64_t value) {
+  _impl_._has_bits_[0] |= 0x00000040u;
+  _impl_.model_version_ = value;
+}
+inline void ModelProto::set_model_version(int64_t value) {
+  _internal_set_model_version(value);
+  // @@protoc_insertion_point(field_set:onnx.ModelProto.model_version)
+}
+
+// optional string doc_string = 6;
+inline bool ModelProto::_internal_has_doc_string() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000008u) != 0;
+  return value;
+}
+inline bool ModelProto::has_doc_string() const {
+  return _internal_has_doc_string();
+}
+inline void ModelProto::clear_doc_string() {
+  _impl_.doc_string_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000008u;
+}
+inline const std::string& ModelProto::doc_string() const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.doc_string)
+  return _internal_doc_string();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void ModelProto::set_doc_string(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000008u;
+ _impl_.doc_string_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.ModelProto.doc_string)
+}
+inline std::string* ModelProto::mutable_doc_string() {
+  std::string* _s = _internal_mutable_doc_string();
+  // @@protoc_insertion_point(field_mutable:onnx.ModelProto.doc_string)
+  return _s;
+}
+inline const std::string& ModelProto::_internal_doc_string() const {
+  return _impl_.doc_string_.Get();
+}
+inline void ModelProto::_internal_set_doc_string(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000008u;
+  _impl_.doc_string_.Set(value, GetArenaForAllocation());
+}
+inline std::string* ModelProto::_internal_mutable_doc_string() {
+  _impl_._has_bits_[0] |= 0x00000008u;
+  return _impl_.doc_string_.Mutable(GetArenaForAllocation());
+}
+inline std::string* ModelProto::release_doc_string() {
+  // @@protoc_insertion_point(field_release:onnx.ModelProto.doc_string)
+  if (!_internal_has_doc_string()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000008u;
+  auto* p = _impl_.doc_string_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void ModelProto::set_allocated_doc_string(std::string* doc_string) {
+  if (doc_string != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000008u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000008u;
+  }
+  _impl_.doc_string_.SetAllocated(doc_string, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.ModelProto.doc_string)
+}
+
+// optional .onnx.GraphProto graph = 7;
+inline bool ModelProto::_internal_has_graph() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000010u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.graph_ != nullptr);
+  return value;
+}
+inline bool ModelProto::has_graph() const {
+  return _internal_has_graph();
+}
+inline void ModelProto::clear_graph() {
+  if (_impl_.graph_ != nullptr) _impl_.graph_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000010u;
+}
+inline const ::onnx::GraphProto& ModelProto::_internal_graph() const {
+  const ::onnx::GraphProto* p = _impl_.graph_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::GraphProto&>(
+      ::onnx::_GraphProto_default_instance_);
+}
+inline const ::onnx::GraphProto& ModelProto::graph() const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.graph)
+  return _internal_graph();
+}
+inline void ModelProto::unsafe_arena_set_allocated_graph(
+    ::onnx::GraphProto* graph) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.graph_);
+  }
+  _impl_.graph_ = graph;
+  if (graph) {
+    _impl_._has_bits_[0] |= 0x00000010u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000010u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.ModelProto.graph)
+}
+inline ::onnx::GraphProto* ModelProto::release_graph() {
+  _impl_._has_bits_[0] &= ~0x00000010u;
+  ::onnx::GraphProto* temp = _impl_.graph_;
+  _impl_.graph_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::GraphProto* ModelProto::unsafe_arena_release_graph() {
+  // @@protoc_insertion_point(field_release:onnx.ModelProto.graph)
+  _impl_._has_bits_[0] &= ~0x00000010u;
+  ::onnx::GraphProto* temp = _impl_.graph_;
+  _impl_.graph_ = nullptr;
+  return temp;
+}
+inline ::onnx::GraphProto* ModelProto::_internal_mutable_graph() {
+  _impl_._has_bits_[0] |= 0x00000010u;
+  if (_impl_.graph_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::GraphProto>(GetArenaForAllocation());
+    _impl_.graph_ = p;
+  }
+  return _impl_.graph_;
+}
+inline ::onnx::GraphProto* ModelProto::mutable_graph() {
+  ::onnx::GraphProto* _msg = _internal_mutable_graph();
+  // @@protoc_insertion_point(field_mutable:onnx.ModelProto.graph)
+  return _msg;
+}
+inline void ModelProto::set_allocated_graph(::onnx::GraphProto* graph) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.graph_;
+  }
+  if (graph) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(graph);
+    if (message_arena != submessage_arena) {
+      graph = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, graph, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000010u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000010u;
+  }
+  _impl_.graph_ = graph;
+  // @@protoc_insertion_point(field_set_allocated:onnx.ModelProto.graph)
+}
+
+// repeated .onnx.StringStringEntryProto metadata_props = 14;
+inline int ModelProto::_internal_metadata_props_size() const {
+  return _impl_.metadata_props_.size();
+}
+inline int ModelProto::metadata_props_size() const {
+  return _internal_metadata_props_size();
+}
+inline void ModelProto::clear_metadata_props() {
+  _impl_.metadata_props_.Clear();
+}
+inline ::onnx::StringStringEntryProto* ModelProto::mutable_metadata_props(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.ModelProto.metadata_props)
+  return _impl_.metadata_props_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+ModelProto::mutable_metadata_props() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.ModelProto.metadata_props)
+  return &_impl_.metadata_props_;
+}
+inline const ::onnx::StringStringEntryProto& ModelProto::_internal_metadata_props(int index) const {
+  return _impl_.metadata_props_.Get(index);
+}
+inline const ::onnx::StringStringEntryProto& ModelProto::metadata_props(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.metadata_props)
+  return _internal_metadata_props(index);
+}
+inline ::onnx::StringStringEntryProto* ModelProto::_internal_add_metadata_props() {
+  return _impl_.metadata_props_.Add();
+}
+inline ::onnx::StringStringEntryProto* ModelProto::add_metadata_props() {
+  ::onnx::StringStringEntryProto* _add = _internal_add_metadata_props();
+  // @@protoc_insertion_point(field_add:onnx.ModelProto.metadata_props)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+ModelProto::metadata_props() const {
+  // @@protoc_insertion_point(field_list:onnx.ModelProto.metadata_props)
+  return _impl_.metadata_props_;
+}
+
+// repeated .onnx.TrainingInfoProto training_info = 20;
+inline int ModelProto::_internal_training_info_size() const {
+  return _impl_.training_info_.size();
+}
+inline int ModelProto::training_info_size() const {
+  return _internal_training_info_size();
+}
+inline void ModelProto::clear_training_info() {
+  _impl_.training_info_.Clear();
+}
+inline ::onnx::TrainingInfoProto* ModelProto::mutable_training_info(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.ModelProto.training_info)
+  return _impl_.training_info_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TrainingInfoProto >*
+ModelProto::mutable_training_info() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.ModelProto.training_info)
+  return &_impl_.training_info_;
+}
+inline const ::onnx::TrainingInfoProto& ModelProto::_internal_training_info(int index) const {
+  return _impl_.training_info_.Get(index);
+}
+inline const ::onnx::TrainingInfoProto& ModelProto::training_info(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.training_info)
+  return _internal_training_info(index);
+}
+inline ::onnx::TrainingInfoProto* ModelProto::_internal_add_training_info() {
+  return _impl_.training_info_.Add();
+}
+inline ::onnx::TrainingInfoProto* ModelProto::add_training_info() {
+  ::onnx::TrainingInfoProto* _add = _internal_add_training_info();
+  // @@protoc_insertion_point(field_add:onnx.ModelProto.training_info)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TrainingInfoProto >&
+ModelProto::training_info() const {
+  // @@protoc_insertion_point(field_list:onnx.ModelProto.training_info)
+  return _impl_.training_info_;
+}
+
+// repeated .onnx.FunctionProto functions = 25;
+inline int ModelProto::_internal_functions_size() const {
+  return _impl_.functions_.size();
+}
+inline int ModelProto::functions_size() const {
+  return _internal_functions_size();
+}
+inline void ModelProto::clear_functions() {
+  _impl_.functions_.Clear();
+}
+inline ::onnx::FunctionProto* ModelProto::mutable_functions(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.ModelProto.functions)
+  return _impl_.functions_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::FunctionProto >*
+ModelProto::mutable_functions() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.ModelProto.functions)
+  return &_impl_.functions_;
+}
+inline const ::onnx::FunctionProto& ModelProto::_internal_functions(int index) const {
+  return _impl_.functions_.Get(index);
+}
+inline const ::onnx::FunctionProto& ModelProto::functions(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.functions)
+  return _internal_functions(index);
+}
+inline ::onnx::FunctionProto* ModelProto::_internal_add_functions() {
+  return _impl_.functions_.Add();
+}
+inline ::onnx::FunctionProto* ModelProto::add_functions() {
+  ::onnx::FunctionProto* _add = _internal_add_functions();
+  // @@protoc_insertion_point(field_add:onnx.ModelProto.functions)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::FunctionProto >&
+ModelProto::functions() const {
+  // @@protoc_insertion_point(field_list:onnx.ModelProto.functions)
+  return _impl_.functions_;
+}
+
+// repeated .onnx.DeviceConfigurationProto configuration = 26;
+inline int ModelProto::_internal_configuration_size() const {
+  return _impl_.configuration_.size();
+}
+inline int ModelProto::configuration_size() const {
+  return _internal_configuration_size();
+}
+inline void ModelProto::clear_configuration() {
+  _impl_.configuration_.Clear();
+}
+inline ::onnx::DeviceConfigurationProto* ModelProto::mutable_configuration(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.ModelProto.configuration)
+  return _impl_.configuration_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::DeviceConfigurationProto >*
+ModelProto::mutable_configuration() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.ModelProto.configuration)
+  return &_impl_.configuration_;
+}
+inline const ::onnx::DeviceConfigurationProto& ModelProto::_internal_configuration(int index) const {
+  return _impl_.configuration_.Get(index);
+}
+inline const ::onnx::DeviceConfigurationProto& ModelProto::configuration(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.ModelProto.configuration)
+  return _internal_configuration(index);
+}
+inline ::onnx::DeviceConfigurationProto* ModelProto::_internal_add_configuration() {
+  return _impl_.configuration_.Add();
+}
+inline ::onnx::DeviceConfigurationProto* ModelProto::add_configuration() {
+  ::onnx::DeviceConfigurationProto* _add = _internal_add_configuration();
+  // @@protoc_insertion_point(field_add:onnx.ModelProto.configuration)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::DeviceConfigurationProto >&
+ModelProto::configuration() const {
+  // @@protoc_insertion_point(field_list:onnx.ModelProto.configuration)
+  return _impl_.configuration_;
+}
+
+// -------------------------------------------------------------------
+
+// DeviceConfigurationProto
+
+// optional string name = 1;
+inline bool DeviceConfigurationProto::_internal_has_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool DeviceConfigurationProto::has_name() const {
+  return _internal_has_name();
+}
+inline void DeviceConfigurationProto::clear_name() {
+  _impl_.name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& DeviceConfigurationProto::name() const {
+  // @@protoc_insertion_point(field_get:onnx.DeviceConfigurationProto.name)
+  return _internal_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void DeviceConfigurationProto::set_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.DeviceConfigurationProto.name)
+}
+inline std::string* DeviceConfigurationProto::mutable_name() {
+  std::string* _s = _internal_mutable_name();
+  // @@protoc_insertion_point(field_mutable:onnx.DeviceConfigurationProto.name)
+  return _s;
+}
+inline const std::string& DeviceConfigurationProto::_internal_name() const {
+  return _impl_.name_.Get();
+}
+inline void DeviceConfigurationProto::_internal_set_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* DeviceConfigurationProto::_internal_mutable_name() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* DeviceConfigurationProto::release_name() {
+  // @@protoc_insertion_point(field_release:onnx.DeviceConfigurationProto.name)
+  if (!_internal_has_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void DeviceConfigurationProto::set_allocated_name(std::string* name) {
+  if (name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.name_.SetAllocated(name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.DeviceConfigurationProto.name)
+}
+
+// optional int32 num_devices = 2;
+inline bool DeviceConfigurationProto::_internal_has_num_devices() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool DeviceConfigurationProto::has_num_devices() const {
+  return _internal_has_num_devices();
+}
+inline void DeviceConfigurationProto::clear_num_devices() {
+  _impl_.num_devices_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline int32_t DeviceConfigurationProto::_internal_num_devices() const {
+  return _impl_.num_devices_;
+}
+inline int32_t DeviceConfigurationProto::num_devices() const {
+  // @@protoc_insertion_point(field_get:onnx.DeviceConfigurationProto.num_devices)
+  return _internal_num_devices();
+}
+inline void DeviceConfigurationProto::_internal_set_num_devices(int32_t value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.num_devices_ = value;
+}
+inline void DeviceConfigurationProto::set_num_devices(int32_t value) {
+  _internal_set_num_devices(value);
+  // @@protoc_insertion_point(field_set:onnx.DeviceConfigurationProto.num_devices)
+}
+
+// repeated string device = 3;
+inline int DeviceConfigurationProto::_internal_device_size() const {
+  return _impl_.device_.size();
+}
+inline int DeviceConfigurationProto::device_size() const {
+  return _internal_device_size();
+}
+inline void DeviceConfigurationProto::clear_device() {
+  _impl_.device_.Clear();
+}
+inline std::string* DeviceConfigurationProto::add_device() {
+  std::string* _s = _internal_add_device();
+  // @@protoc_insertion_point(field_add_mutable:onnx.DeviceConfigurationProto.device)
+  return _s;
+}
+inline const std::string& DeviceConfigurationProto::_internal_device(int index) const {
+  return _impl_.device_.Get(index);
+}
+inline const std::string& DeviceConfigurationProto::device(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.DeviceConfigurationProto.device)
+  return _internal_device(index);
+}
+inline std::string* DeviceConfigurationProto::mutable_device(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.DeviceConfigurationProto.device)
+  return _impl_.device_.Mutable(index);
+}
+inline void DeviceConfigurationProto::set_device(int index, const std::string& value) {
+  _impl_.device_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:onnx.DeviceConfigurationProto.device)
+}
+inline void DeviceConfigurationProto::set_device(int index, std::string&& value) {
+  _impl_.device_.Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:onnx.DeviceConfigurationProto.device)
+}
+inline void DeviceConfigurationProto::set_device(int index, const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.device_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:onnx.DeviceConfigurationProto.device)
+}
+inline void DeviceConfigurationProto::set_device(int index, const char* value, size_t size) {
+  _impl_.device_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:onnx.DeviceConfigurationProto.device)
+}
+inline std::string* DeviceConfigurationProto::_internal_add_device() {
+  return _impl_.device_.Add();
+}
+inline void DeviceConfigurationProto::add_device(const std::string& value) {
+  _impl_.device_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:onnx.DeviceConfigurationProto.device)
+}
+inline void DeviceConfigurationProto::add_device(std::string&& value) {
+  _impl_.device_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:onnx.DeviceConfigurationProto.device)
+}
+inline void DeviceConfigurationProto::add_device(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.device_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:onnx.DeviceConfigurationProto.device)
+}
+inline void DeviceConfigurationProto::add_device(const char* value, size_t size) {
+  _impl_.device_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:onnx.DeviceConfigurationProto.device)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+DeviceConfigurationProto::device() const {
+  // @@protoc_insertion_point(field_list:onnx.DeviceConfigurationProto.device)
+  return _impl_.device_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+DeviceConfigurationProto::mutable_device() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.DeviceConfigurationProto.device)
+  return &_impl_.device_;
+}
+
+// -------------------------------------------------------------------
+
+// StringStringEntryProto
+
+// optional string key = 1;
+inline bool StringStringEntryProto::_internal_has_key() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool StringStringEntryProto::has_key() const {
+  return _internal_has_key();
+}
+inline void StringStringEntryProto::clear_key() {
+  _impl_.key_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& StringStringEntryProto::key() const {
+  // @@protoc_insertion_point(field_get:onnx.StringStringEntryProto.key)
+  return _internal_key();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void StringStringEntryProto::set_key(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.key_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.StringStringEntryProto.key)
+}
+inline std::string* StringStringEntryProto::mutable_key() {
+  std::string* _s = _internal_mutable_key();
+  // @@protoc_insertion_point(field_mutable:onnx.StringStringEntryProto.key)
+  return _s;
+}
+inline const std::string& StringStringEntryProto::_internal_key() const {
+  return _impl_.key_.Get();
+}
+inline void StringStringEntryProto::_internal_set_key(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.key_.Set(value, GetArenaForAllocation());
+}
+inline std::string* StringStringEntryProto::_internal_mutable_key() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.key_.Mutable(GetArenaForAllocation());
+}
+inline std::string* StringStringEntryProto::release_key() {
+  // @@protoc_insertion_point(field_release:onnx.StringStringEntryProto.key)
+  if (!_internal_has_key()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.key_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.key_.IsDefault()) {
+    _impl_.key_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void StringStringEntryProto::set_allocated_key(std::string* key) {
+  if (key != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.key_.SetAllocated(key, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.key_.IsDefault()) {
+    _impl_.key_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.StringStringEntryProto.key)
+}
+
+// optional string value = 2;
+inline bool StringStringEntryProto::_internal_has_value() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool StringStringEntryProto::has_value() const {
+  return _internal_has_value();
+}
+inline void StringStringEntryProto::clear_value() {
+  _impl_.value_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const std::string& StringStringEntryProto::value() const {
+  // @@protoc_insertion_point(field_get:onnx.StringStringEntryProto.value)
+  return _internal_value();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void StringStringEntryProto::set_value(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000002u;
+ _impl_.value_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.StringStringEntryProto.value)
+}
+inline std::string* StringStringEntryProto::mutable_value() {
+  std::string* _s = _internal_mutable_value();
+  // @@protoc_insertion_point(field_mutable:onnx.StringStringEntryProto.value)
+  return _s;
+}
+inline const std::string& StringStringEntryProto::_internal_value() const {
+  return _impl_.value_.Get();
+}
+inline void StringStringEntryProto::_internal_set_value(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.value_.Set(value, GetArenaForAllocation());
+}
+inline std::string* StringStringEntryProto::_internal_mutable_value() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  return _impl_.value_.Mutable(GetArenaForAllocation());
+}
+inline std::string* StringStringEntryProto::release_value() {
+  // @@protoc_insertion_point(field_release:onnx.StringStringEntryProto.value)
+  if (!_internal_has_value()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  auto* p = _impl_.value_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.value_.IsDefault()) {
+    _impl_.value_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void StringStringEntryProto::set_allocated_value(std::string* value) {
+  if (value != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.value_.SetAllocated(value, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.value_.IsDefault()) {
+    _impl_.value_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.StringStringEntryProto.value)
+}
+
+// -------------------------------------------------------------------
+
+// TensorAnnotation
+
+// optional string tensor_name = 1;
+inline bool TensorAnnotation::_internal_has_tensor_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool TensorAnnotation::has_tensor_name() const {
+  return _internal_has_tensor_name();
+}
+inline void TensorAnnotation::clear_tensor_name() {
+  _impl_.tensor_name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& TensorAnnotation::tensor_name() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorAnnotation.tensor_name)
+  return _internal_tensor_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void TensorAnnotation::set_tensor_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.tensor_name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.TensorAnnotation.tensor_name)
+}
+inline std::string* TensorAnnotation::mutable_tensor_name() {
+  std::string* _s = _internal_mutable_tensor_name();
+  // @@protoc_insertion_point(field_mutable:onnx.TensorAnnotation.tensor_name)
+  return _s;
+}
+inline const std::string& TensorAnnotation::_internal_tensor_name() const {
+  return _impl_.tensor_name_.Get();
+}
+inline void TensorAnnotation::_internal_set_tensor_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.tensor_name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* TensorAnnotation::_internal_mutable_tensor_name() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.tensor_name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* TensorAnnotation::release_tensor_name() {
+  // @@protoc_insertion_point(field_release:onnx.TensorAnnotation.tensor_name)
+  if (!_internal_has_tensor_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.tensor_name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.tensor_name_.IsDefault()) {
+    _impl_.tensor_name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void TensorAnnotation::set_allocated_tensor_name(std::string* tensor_name) {
+  if (tensor_name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.tensor_name_.SetAllocated(tensor_name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.tensor_name_.IsDefault()) {
+    _impl_.tensor_name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.TensorAnnotation.tensor_name)
+}
+
+// repeated .onnx.StringStringEntryProto quant_parameter_tensor_names = 2;
+inline int TensorAnnotation::_internal_quant_parameter_tensor_names_size() const {
+  return _impl_.quant_parameter_tensor_names_.size();
+}
+inline int TensorAnnotation::quant_parameter_tensor_names_size() const {
+  return _internal_quant_parameter_tensor_names_size();
+}
+inline void TensorAnnotation::clear_quant_parameter_tensor_names() {
+  _impl_.quant_parameter_tensor_names_.Clear();
+}
+inline ::onnx::StringStringEntryProto* TensorAnnotation::mutable_quant_parameter_tensor_names(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.TensorAnnotation.quant_parameter_tensor_names)
+  return _impl_.quant_parameter_tensor_names_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+TensorAnnotation::mutable_quant_parameter_tensor_names() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorAnnotation.quant_parameter_tensor_names)
+  return &_impl_.quant_parameter_tensor_names_;
+}
+inline const ::onnx::StringStringEntryProto& TensorAnnotation::_internal_quant_parameter_tensor_names(int index) const {
+  return _impl_.quant_parameter_tensor_names_.Get(index);
+}
+inline const ::onnx::StringStringEntryProto& TensorAnnotation::quant_parameter_tensor_names(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorAnnotation.quant_parameter_tensor_names)
+  return _internal_quant_parameter_tensor_names(index);
+}
+inline ::onnx::StringStringEntryProto* TensorAnnotation::_internal_add_quant_parameter_tensor_names() {
+  return _impl_.quant_parameter_tensor_names_.Add();
+}
+inline ::onnx::StringStringEntryProto* TensorAnnotation::add_quant_parameter_tensor_names() {
+  ::onnx::StringStringEntryProto* _add = _internal_add_quant_parameter_tensor_names();
+  // @@protoc_insertion_point(field_add:onnx.TensorAnnotation.quant_parameter_tensor_names)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+TensorAnnotation::quant_parameter_tensor_names() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorAnnotation.quant_parameter_tensor_names)
+  return _impl_.quant_parameter_tensor_names_;
+}
+
+// -------------------------------------------------------------------
+
+// GraphProto
+
+// repeated .onnx.NodeProto node = 1;
+inline int GraphProto::_internal_node_size() const {
+  return _impl_.node_.size();
+}
+inline int GraphProto::node_size() const {
+  return _internal_node_size();
+}
+inline void GraphProto::clear_node() {
+  _impl_.node_.Clear();
+}
+inline ::onnx::NodeProto* GraphProto::mutable_node(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.GraphProto.node)
+  return _impl_.node_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeProto >*
+GraphProto::mutable_node() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.GraphProto.node)
+  return &_impl_.node_;
+}
+inline const ::onnx::NodeProto& GraphProto::_internal_node(int index) const {
+  return _impl_.node_.Get(index);
+}
+inline const ::onnx::NodeProto& GraphProto::node(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.GraphProto.node)
+  return _internal_node(index);
+}
+inline ::onnx::NodeProto* GraphProto::_internal_add_node() {
+  return _impl_.node_.Add();
+}
+inline ::onnx::NodeProto* GraphProto::add_node() {
+  ::onnx::NodeProto* _add = _internal_add_node();
+  // @@protoc_insertion_point(field_add:onnx.GraphProto.node)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeProto >&
+GraphProto::node() const {
+  // @@protoc_insertion_point(field_list:onnx.GraphProto.node)
+  return _impl_.node_;
+}
+
+// optional string name = 2;
+inline bool GraphProto::_internal_has_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool GraphProto::has_name() const {
+  return _internal_has_name();
+}
+inline void GraphProto::clear_name() {
+  _impl_.name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& GraphProto::name() const {
+  // @@protoc_insertion_point(field_get:onnx.GraphProto.name)
+  return _internal_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void GraphProto::set_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.GraphProto.name)
+}
+inline std::string* GraphProto::mutable_name() {
+  std::string* _s = _internal_mutable_name();
+  // @@protoc_insertion_point(field_mutable:onnx.GraphProto.name)
+  return _s;
+}
+inline const std::string& GraphProto::_internal_name() const {
+  return _impl_.name_.Get();
+}
+inline void GraphProto::_internal_set_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* GraphProto::_internal_mutable_name() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* GraphProto::release_name() {
+  // @@protoc_insertion_point(field_release:onnx.GraphProto.name)
+  if (!_internal_has_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void GraphProto::set_allocated_name(std::string* name) {
+  if (name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.name_.SetAllocated(name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.GraphProto.name)
+}
+
+// repeated .onnx.TensorProto initializer = 5;
+inline int GraphProto::_internal_initializer_size() const {
+  return _impl_.initializer_.size();
+}
+inline int GraphProto::initializer_size() const {
+  return _internal_initializer_size();
+}
+inline void GraphProto::clear_initializer() {
+  _impl_.initializer_.Clear();
+}
+inline ::onnx::TensorProto* GraphProto::mutable_initializer(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.GraphProto.initializer)
+  return _impl_.initializer_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorProto >*
+GraphProto::mutable_initializer() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.GraphProto.initializer)
+  return &_impl_.initializer_;
+}
+inline const ::onnx::TensorProto& GraphProto::_internal_initializer(int index) const {
+  return _impl_.initializer_.Get(index);
+}
+inline const ::onnx::TensorProto& GraphProto::initializer(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.GraphProto.initializer)
+  return _internal_initializer(index);
+}
+inline ::onnx::TensorProto* GraphProto::_internal_add_initializer() {
+  return _impl_.initializer_.Add();
+}
+inline ::onnx::TensorProto* GraphProto::add_initializer() {
+  ::onnx::TensorProto* _add = _internal_add_initializer();
+  // @@protoc_insertion_point(field_add:onnx.GraphProto.initializer)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorProto >&
+GraphProto::initializer() const {
+  // @@protoc_insertion_point(field_list:onnx.GraphProto.initializer)
+  return _impl_.initializer_;
+}
+
+// repeated .onnx.SparseTensorProto sparse_initializer = 15;
+inline int GraphProto::_internal_sparse_initializer_size() const {
+  return _impl_.sparse_initializer_.size();
+}
+inline int GraphProto::sparse_initializer_size() const {
+  return _internal_sparse_initializer_size();
+}
+inline void GraphProto::clear_sparse_initializer() {
+  _impl_.sparse_initializer_.Clear();
+}
+inline ::onnx::SparseTensorProto* GraphProto::mutable_sparse_initializer(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.GraphProto.sparse_initializer)
+  return _impl_.sparse_initializer_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SparseTensorProto >*
+GraphProto::mutable_sparse_initializer() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.GraphProto.sparse_initializer)
+  return &_impl_.sparse_initializer_;
+}
+inline const ::onnx::SparseTensorProto& GraphProto::_internal_sparse_initializer(int index) const {
+  return _impl_.sparse_initializer_.Get(index);
+}
+inline const ::onnx::SparseTensorProto& GraphProto::sparse_initializer(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.GraphProto.sparse_initializer)
+  return _internal_sparse_initializer(index);
+}
+inline ::onnx::SparseTensorProto* GraphProto::_internal_add_sparse_initializer() {
+  return _impl_.sparse_initializer_.Add();
+}
+inline ::onnx::SparseTensorProto* GraphProto::add_sparse_initializer() {
+  ::onnx::SparseTensorProto* _add = _internal_add_sparse_initializer();
+  // @@protoc_insertion_point(field_add:onnx.GraphProto.sparse_initializer)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::SparseTensorProto >&
+GraphProto::sparse_initializer() const {
+  // @@protoc_insertion_point(field_list:onnx.GraphProto.sparse_initializer)
+  return _impl_.sparse_initializer_;
+}
+
+// optional string doc_string = 10;
+inline bool GraphProto::_internal_has_doc_string() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool GraphProto::has_doc_string() const {
+  return _internal_has_doc_string();
+}
+inline void GraphProto::clear_doc_string() {
+  _impl_.doc_string_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const std::string& GraphProto::doc_string() const {
+  // @@protoc_insertion_point(field_get:onnx.GraphProto.doc_string)
+  return _internal_doc_string();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void GraphProto::set_doc_string(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000002u;
+ _impl_.doc_string_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.GraphProto.doc_string)
+}
+inline std::string* GraphProto::mutable_doc_string() {
+  std::string* _s = _internal_mutable_doc_string();
+  // @@protoc_insertion_point(field_mutable:onnx.GraphProto.doc_string)
+  return _s;
+}
+inline const std::string& GraphProto::_internal_doc_string() const {
+  return _impl_.doc_string_.Get();
+}
+inline void GraphProto::_internal_set_doc_string(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.doc_string_.Set(value, GetArenaForAllocation());
+}
+inline std::string* GraphProto::_internal_mutable_doc_string() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  return _impl_.doc_string_.Mutable(GetArenaForAllocation());
+}
+inline std::string* GraphProto::release_doc_string() {
+  // @@protoc_insertion_point(field_release:onnx.GraphProto.doc_string)
+  if (!_internal_has_doc_string()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  auto* p = _impl_.doc_string_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void GraphProto::set_allocated_doc_string(std::string* doc_string) {
+  if (doc_string != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.doc_string_.SetAllocated(doc_string, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.GraphProto.doc_string)
+}
+
+// repeated .onnx.ValueInfoProto input = 11;
+inline int GraphProto::_internal_input_size() const {
+  return _impl_.input_.size();
+}
+inline int GraphProto::input_size() const {
+  return _internal_input_size();
+}
+inline void GraphProto::clear_input() {
+  _impl_.input_.Clear();
+}
+inline ::onnx::ValueInfoProto* GraphProto::mutable_input(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.GraphProto.input)
+  return _impl_.input_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >*
+GraphProto::mutable_input() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.GraphProto.input)
+  return &_impl_.input_;
+}
+inline const ::onnx::ValueInfoProto& GraphProto::_internal_input(int index) const {
+  return _impl_.input_.Get(index);
+}
+inline const ::onnx::ValueInfoProto& GraphProto::input(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.GraphProto.input)
+  return _internal_input(index);
+}
+inline ::onnx::ValueInfoProto* GraphProto::_internal_add_input() {
+  return _impl_.input_.Add();
+}
+inline ::onnx::ValueInfoProto* GraphProto::add_input() {
+  ::onnx::ValueInfoProto* _add = _internal_add_input();
+  // @@protoc_insertion_point(field_add:onnx.GraphProto.input)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >&
+GraphProto::input() const {
+  // @@protoc_insertion_point(field_list:onnx.GraphProto.input)
+  return _impl_.input_;
+}
+
+// repeated .onnx.ValueInfoProto output = 12;
+inline int GraphProto::_internal_output_size() const {
+  return _impl_.output_.size();
+}
+inline int GraphProto::output_size() const {
+  return _internal_output_size();
+}
+inline void GraphProto::clear_output() {
+  _impl_.output_.Clear();
+}
+inline ::onnx::ValueInfoProto* GraphProto::mutable_output(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.GraphProto.output)
+  return _impl_.output_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >*
+GraphProto::mutable_output() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.GraphProto.output)
+  return &_impl_.output_;
+}
+inline const ::onnx::ValueInfoProto& GraphProto::_internal_output(int index) const {
+  return _impl_.output_.Get(index);
+}
+inline const ::onnx::ValueInfoProto& GraphProto::output(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.GraphProto.output)
+  return _internal_output(index);
+}
+inline ::onnx::ValueInfoProto* GraphProto::_internal_add_output() {
+  return _impl_.output_.Add();
+}
+inline ::onnx::ValueInfoProto* GraphProto::add_output() {
+  ::onnx::ValueInfoProto* _add = _internal_add_output();
+  // @@protoc_insertion_point(field_add:onnx.GraphProto.output)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >&
+GraphProto::output() const {
+  // @@protoc_insertion_point(field_list:onnx.GraphProto.output)
+  return _impl_.output_;
+}
+
+// repeated .onnx.ValueInfoProto value_info = 13;
+inline int GraphProto::_internal_value_info_size() const {
+  return _impl_.value_info_.size();
+}
+inline int GraphProto::value_info_size() const {
+  return _internal_value_info_size();
+}
+inline void GraphProto::clear_value_info() {
+  _impl_.value_info_.Clear();
+}
+inline ::onnx::ValueInfoProto* GraphProto::mutable_value_info(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.GraphProto.value_info)
+  return _impl_.value_info_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >*
+GraphProto::mutable_value_info() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.GraphProto.value_info)
+  return &_impl_.value_info_;
+}
+inline const ::onnx::ValueInfoProto& GraphProto::_internal_value_info(int index) const {
+  return _impl_.value_info_.Get(index);
+}
+inline const ::onnx::ValueInfoProto& GraphProto::value_info(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.GraphProto.value_info)
+  return _internal_value_info(index);
+}
+inline ::onnx::ValueInfoProto* GraphProto::_internal_add_value_info() {
+  return _impl_.value_info_.Add();
+}
+inline ::onnx::ValueInfoProto* GraphProto::add_value_info() {
+  ::onnx::ValueInfoProto* _add = _internal_add_value_info();
+  // @@protoc_insertion_point(field_add:onnx.GraphProto.value_info)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >&
+GraphProto::value_info() const {
+  // @@protoc_insertion_point(field_list:onnx.GraphProto.value_info)
+  return _impl_.value_info_;
+}
+
+// repeated .onnx.TensorAnnotation quantization_annotation = 14;
+inline int GraphProto::_internal_quantization_annotation_size() const {
+  return _impl_.quantization_annotation_.size();
+}
+inline int GraphProto::quantization_annotation_size() const {
+  return _internal_quantization_annotation_size();
+}
+inline void GraphProto::clear_quantization_annotation() {
+  _impl_.quantization_annotation_.Clear();
+}
+inline ::onnx::TensorAnnotation* GraphProto::mutable_quantization_annotation(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.GraphProto.quantization_annotation)
+  return _impl_.quantization_annotation_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorAnnotation >*
+GraphProto::mutable_quantization_annotation() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.GraphProto.quantization_annotation)
+  return &_impl_.quantization_annotation_;
+}
+inline const ::onnx::TensorAnnotation& GraphProto::_internal_quantization_annotation(int index) const {
+  return _impl_.quantization_annotation_.Get(index);
+}
+inline const ::onnx::TensorAnnotation& GraphProto::quantization_annotation(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.GraphProto.quantization_annotation)
+  return _internal_quantization_annotation(index);
+}
+inline ::onnx::TensorAnnotation* GraphProto::_internal_add_quantization_annotation() {
+  return _impl_.quantization_annotation_.Add();
+}
+inline ::onnx::TensorAnnotation* GraphProto::add_quantization_annotation() {
+  ::onnx::TensorAnnotation* _add = _internal_add_quantization_annotation();
+  // @@protoc_insertion_point(field_add:onnx.GraphProto.quantization_annotation)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorAnnotation >&
+GraphProto::quantization_annotation() const {
+  // @@protoc_insertion_point(field_list:onnx.GraphProto.quantization_annotation)
+  return _impl_.quantization_annotation_;
+}
+
+// repeated .onnx.StringStringEntryProto metadata_props = 16;
+inline int GraphProto::_internal_metadata_props_size() const {
+  return _impl_.metadata_props_.size();
+}
+inline int GraphProto::metadata_props_size() const {
+  return _internal_metadata_props_size();
+}
+inline void GraphProto::clear_metadata_props() {
+  _impl_.metadata_props_.Clear();
+}
+inline ::onnx::StringStringEntryProto* GraphProto::mutable_metadata_props(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.GraphProto.metadata_props)
+  return _impl_.metadata_props_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+GraphProto::mutable_metadata_props() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.GraphProto.metadata_props)
+  return &_impl_.metadata_props_;
+}
+inline const ::onnx::StringStringEntryProto& GraphProto::_internal_metadata_props(int index) const {
+  return _impl_.metadata_props_.Get(index);
+}
+inline const ::onnx::StringStringEntryProto& GraphProto::metadata_props(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.GraphProto.metadata_props)
+  return _internal_metadata_props(index);
+}
+inline ::onnx::StringStringEntryProto* GraphProto::_internal_add_metadata_props() {
+  return _impl_.metadata_props_.Add();
+}
+inline ::onnx::StringStringEntryProto* GraphProto::add_metadata_props() {
+  ::onnx::StringStringEntryProto* _add = _internal_add_metadata_props();
+  // @@protoc_insertion_point(field_add:onnx.GraphProto.metadata_props)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+GraphProto::metadata_props() const {
+  // @@protoc_insertion_point(field_list:onnx.GraphProto.metadata_props)
+  return _impl_.metadata_props_;
+}
+
+// -------------------------------------------------------------------
+
+// TensorProto_Segment
+
+// optional int64 begin = 1;
+inline bool TensorProto_Segment::_internal_has_begin() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool TensorProto_Segment::has_begin() const {
+  return _internal_has_begin();
+}
+inline void TensorProto_Segment::clear_begin() {
+  _impl_.begin_ = int64_t{0};
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline int64_t TensorProto_Segment::_internal_begin() const {
+  return _impl_.begin_;
+}
+inline int64_t TensorProto_Segment::begin() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.Segment.begin)
+  return _internal_begin();
+}
+inline void TensorProto_Segment::_internal_set_begin(int64_t value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.begin_ = value;
+}
+inline void TensorProto_Segment::set_begin(int64_t value) {
+  _internal_set_begin(value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.Segment.begin)
+}
+
+// optional int64 end = 2;
+inline bool TensorProto_Segment::_internal_has_end() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool TensorProto_Segment::has_end() const {
+  return _internal_has_end();
+}
+inline void TensorProto_Segment::clear_end() {
+  _impl_.end_ = int64_t{0};
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline int64_t TensorProto_Segment::_internal_end() const {
+  return _impl_.end_;
+}
+inline int64_t TensorProto_Segment::end() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.Segment.end)
+  return _internal_end();
+}
+inline void TensorProto_Segment::_internal_set_end(int64_t value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.end_ = value;
+}
+inline void TensorProto_Segment::set_end(int64_t value) {
+  _internal_set_end(value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.Segment.end)
+}
+
+// -------------------------------------------------------------------
+
+// TensorProto
+
+// repeated int64 dims = 1;
+inline int TensorProto::_internal_dims_size() const {
+  return _impl_.dims_.size();
+}
+inline int TensorProto::dims_size() const {
+  return _internal_dims_size();
+}
+inline void TensorProto::clear_dims() {
+  _impl_.dims_.Clear();
+}
+inline int64_t TensorProto::_internal_dims(int index) const {
+  return _impl_.dims_.Get(index);
+}
+inline int64_t TensorProto::dims(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.dims)
+  return _internal_dims(index);
+}
+inline void TensorProto::set_dims(int index, int64_t value) {
+  _impl_.dims_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.dims)
+}
+inline void TensorProto::_internal_add_dims(int64_t value) {
+  _impl_.dims_.Add(value);
+}
+inline void TensorProto::add_dims(int64_t value) {
+  _internal_add_dims(value);
+  // @@protoc_insertion_point(field_add:onnx.TensorProto.dims)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+TensorProto::_internal_dims() const {
+  return _impl_.dims_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+TensorProto::dims() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorProto.dims)
+  return _internal_dims();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+TensorProto::_internal_mutable_dims() {
+  return &_impl_.dims_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+TensorProto::mutable_dims() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorProto.dims)
+  return _internal_mutable_dims();
+}
+
+// optional int32 data_type = 2;
+inline bool TensorProto::_internal_has_data_type() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000010u) != 0;
+  return value;
+}
+inline bool TensorProto::has_data_type() const {
+  return _internal_has_data_type();
+}
+inline void TensorProto::clear_data_type() {
+  _impl_.data_type_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000010u;
+}
+inline int32_t TensorProto::_internal_data_type() const {
+  return _impl_.data_type_;
+}
+inline int32_t TensorProto::data_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.data_type)
+  return _internal_data_type();
+}
+inline void TensorProto::_internal_set_data_type(int32_t value) {
+  _impl_._has_bits_[0] |= 0x00000010u;
+  _impl_.data_type_ = value;
+}
+inline void TensorProto::set_data_type(int32_t value) {
+  _internal_set_data_type(value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.data_type)
+}
+
+// optional .onnx.TensorProto.Segment segment = 3;
+inline bool TensorProto::_internal_has_segment() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000008u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.segment_ != nullptr);
+  return value;
+}
+inline bool TensorProto::has_segment() const {
+  return _internal_has_segment();
+}
+inline void TensorProto::clear_segment() {
+  if (_impl_.segment_ != nullptr) _impl_.segment_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000008u;
+}
+inline const ::onnx::TensorProto_Segment& TensorProto::_internal_segment() const {
+  const ::onnx::TensorProto_Segment* p = _impl_.segment_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TensorProto_Segment&>(
+      ::onnx::_TensorProto_Segment_default_instance_);
+}
+inline const ::onnx::TensorProto_Segment& TensorProto::segment() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.segment)
+  return _internal_segment();
+}
+inline void TensorProto::unsafe_arena_set_allocated_segment(
+    ::onnx::TensorProto_Segment* segment) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.segment_);
+  }
+  _impl_.segment_ = segment;
+  if (segment) {
+    _impl_._has_bits_[0] |= 0x00000008u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000008u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TensorProto.segment)
+}
+inline ::onnx::TensorProto_Segment* TensorProto::release_segment() {
+  _impl_._has_bits_[0] &= ~0x00000008u;
+  ::onnx::TensorProto_Segment* temp = _impl_.segment_;
+  _impl_.segment_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TensorProto_Segment* TensorProto::unsafe_arena_release_segment() {
+  // @@protoc_insertion_point(field_release:onnx.TensorProto.segment)
+  _impl_._has_bits_[0] &= ~0x00000008u;
+  ::onnx::TensorProto_Segment* temp = _impl_.segment_;
+  _impl_.segment_ = nullptr;
+  return temp;
+}
+inline ::onnx::TensorProto_Segment* TensorProto::_internal_mutable_segment() {
+  _impl_._has_bits_[0] |= 0x00000008u;
+  if (_impl_.segment_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TensorProto_Segment>(GetArenaForAllocation());
+    _impl_.segment_ = p;
+  }
+  return _impl_.segment_;
+}
+inline ::onnx::TensorProto_Segment* TensorProto::mutable_segment() {
+  ::onnx::TensorProto_Segment* _msg = _internal_mutable_segment();
+  // @@protoc_insertion_point(field_mutable:onnx.TensorProto.segment)
+  return _msg;
+}
+inline void TensorProto::set_allocated_segment(::onnx::TensorProto_Segment* segment) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.segment_;
+  }
+  if (segment) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(segment);
+    if (message_arena != submessage_arena) {
+      segment = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, segment, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000008u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000008u;
+  }
+  _impl_.segment_ = segment;
+  // @@protoc_insertion_point(field_set_allocated:onnx.TensorProto.segment)
+}
+
+// repeated float float_data = 4 [packed = true];
+inline int TensorProto::_internal_float_data_size() const {
+  return _impl_.float_data_.size();
+}
+inline int TensorProto::float_data_size() const {
+  return _internal_float_data_size();
+}
+inline void TensorProto::clear_float_data() {
+  _impl_.float_data_.Clear();
+}
+inline float TensorProto::_internal_float_data(int index) const {
+  return _impl_.float_data_.Get(index);
+}
+inline float TensorProto::float_data(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.float_data)
+  return _internal_float_data(index);
+}
+inline void TensorProto::set_float_data(int index, float value) {
+  _impl_.float_data_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.float_data)
+}
+inline void TensorProto::_internal_add_float_data(float value) {
+  _impl_.float_data_.Add(value);
+}
+inline void TensorProto::add_float_data(float value) {
+  _internal_add_float_data(value);
+  // @@protoc_insertion_point(field_add:onnx.TensorProto.float_data)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+TensorProto::_internal_float_data() const {
+  return _impl_.float_data_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >&
+TensorProto::float_data() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorProto.float_data)
+  return _internal_float_data();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+TensorProto::_internal_mutable_float_data() {
+  return &_impl_.float_data_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< float >*
+TensorProto::mutable_float_data() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorProto.float_data)
+  return _internal_mutable_float_data();
+}
+
+// repeated int32 int32_data = 5 [packed = true];
+inline int TensorProto::_internal_int32_data_size() const {
+  return _impl_.int32_data_.size();
+}
+inline int TensorProto::int32_data_size() const {
+  return _internal_int32_data_size();
+}
+inline void TensorProto::clear_int32_data() {
+  _impl_.int32_data_.Clear();
+}
+inline int32_t TensorProto::_internal_int32_data(int index) const {
+  return _impl_.int32_data_.Get(index);
+}
+inline int32_t TensorProto::int32_data(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.int32_data)
+  return _internal_int32_data(index);
+}
+inline void TensorProto::set_int32_data(int index, int32_t value) {
+  _impl_.int32_data_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.int32_data)
+}
+inline void TensorProto::_internal_add_int32_data(int32_t value) {
+  _impl_.int32_data_.Add(value);
+}
+inline void TensorProto::add_int32_data(int32_t value) {
+  _internal_add_int32_data(value);
+  // @@protoc_insertion_point(field_add:onnx.TensorProto.int32_data)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int32_t >&
+TensorProto::_internal_int32_data() const {
+  return _impl_.int32_data_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int32_t >&
+TensorProto::int32_data() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorProto.int32_data)
+  return _internal_int32_data();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int32_t >*
+TensorProto::_internal_mutable_int32_data() {
+  return &_impl_.int32_data_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int32_t >*
+TensorProto::mutable_int32_data() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorProto.int32_data)
+  return _internal_mutable_int32_data();
+}
+
+// repeated bytes string_data = 6;
+inline int TensorProto::_internal_string_data_size() const {
+  return _impl_.string_data_.size();
+}
+inline int TensorProto::string_data_size() const {
+  return _internal_string_data_size();
+}
+inline void TensorProto::clear_string_data() {
+  _impl_.string_data_.Clear();
+}
+inline std::string* TensorProto::add_string_data() {
+  std::string* _s = _internal_add_string_data();
+  // @@protoc_insertion_point(field_add_mutable:onnx.TensorProto.string_data)
+  return _s;
+}
+inline const std::string& TensorProto::_internal_string_data(int index) const {
+  return _impl_.string_data_.Get(index);
+}
+inline const std::string& TensorProto::string_data(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.string_data)
+  return _internal_string_data(index);
+}
+inline std::string* TensorProto::mutable_string_data(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.TensorProto.string_data)
+  return _impl_.string_data_.Mutable(index);
+}
+inline void TensorProto::set_string_data(int index, const std::string& value) {
+  _impl_.string_data_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.string_data)
+}
+inline void TensorProto::set_string_data(int index, std::string&& value) {
+  _impl_.string_data_.Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.string_data)
+}
+inline void TensorProto::set_string_data(int index, const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.string_data_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:onnx.TensorProto.string_data)
+}
+inline void TensorProto::set_string_data(int index, const void* value, size_t size) {
+  _impl_.string_data_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:onnx.TensorProto.string_data)
+}
+inline std::string* TensorProto::_internal_add_string_data() {
+  return _impl_.string_data_.Add();
+}
+inline void TensorProto::add_string_data(const std::string& value) {
+  _impl_.string_data_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:onnx.TensorProto.string_data)
+}
+inline void TensorProto::add_string_data(std::string&& value) {
+  _impl_.string_data_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:onnx.TensorProto.string_data)
+}
+inline void TensorProto::add_string_data(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.string_data_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:onnx.TensorProto.string_data)
+}
+inline void TensorProto::add_string_data(const void* value, size_t size) {
+  _impl_.string_data_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:onnx.TensorProto.string_data)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+TensorProto::string_data() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorProto.string_data)
+  return _impl_.string_data_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+TensorProto::mutable_string_data() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorProto.string_data)
+  return &_impl_.string_data_;
+}
+
+// repeated int64 int64_data = 7 [packed = true];
+inline int TensorProto::_internal_int64_data_size() const {
+  return _impl_.int64_data_.size();
+}
+inline int TensorProto::int64_data_size() const {
+  return _internal_int64_data_size();
+}
+inline void TensorProto::clear_int64_data() {
+  _impl_.int64_data_.Clear();
+}
+inline int64_t TensorProto::_internal_int64_data(int index) const {
+  return _impl_.int64_data_.Get(index);
+}
+inline int64_t TensorProto::int64_data(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.int64_data)
+  return _internal_int64_data(index);
+}
+inline void TensorProto::set_int64_data(int index, int64_t value) {
+  _impl_.int64_data_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.int64_data)
+}
+inline void TensorProto::_internal_add_int64_data(int64_t value) {
+  _impl_.int64_data_.Add(value);
+}
+inline void TensorProto::add_int64_data(int64_t value) {
+  _internal_add_int64_data(value);
+  // @@protoc_insertion_point(field_add:onnx.TensorProto.int64_data)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+TensorProto::_internal_int64_data() const {
+  return _impl_.int64_data_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+TensorProto::int64_data() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorProto.int64_data)
+  return _internal_int64_data();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+TensorProto::_internal_mutable_int64_data() {
+  return &_impl_.int64_data_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+TensorProto::mutable_int64_data() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorProto.int64_data)
+  return _internal_mutable_int64_data();
+}
+
+// optional string name = 8;
+inline bool TensorProto::_internal_has_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool TensorProto::has_name() const {
+  return _internal_has_name();
+}
+inline void TensorProto::clear_name() {
+  _impl_.name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& TensorProto::name() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.name)
+  return _internal_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void TensorProto::set_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.name)
+}
+inline std::string* TensorProto::mutable_name() {
+  std::string* _s = _internal_mutable_name();
+  // @@protoc_insertion_point(field_mutable:onnx.TensorProto.name)
+  return _s;
+}
+inline const std::string& TensorProto::_internal_name() const {
+  return _impl_.name_.Get();
+}
+inline void TensorProto::_internal_set_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* TensorProto::_internal_mutable_name() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* TensorProto::release_name() {
+  // @@protoc_insertion_point(field_release:onnx.TensorProto.name)
+  if (!_internal_has_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void TensorProto::set_allocated_name(std::string* name) {
+  if (name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.name_.SetAllocated(name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.TensorProto.name)
+}
+
+// optional string doc_string = 12;
+inline bool TensorProto::_internal_has_doc_string() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000004u) != 0;
+  return value;
+}
+inline bool TensorProto::has_doc_string() const {
+  return _internal_has_doc_string();
+}
+inline void TensorProto::clear_doc_string() {
+  _impl_.doc_string_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000004u;
+}
+inline const std::string& TensorProto::doc_string() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.doc_string)
+  return _internal_doc_string();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void TensorProto::set_doc_string(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000004u;
+ _impl_.doc_string_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.doc_string)
+}
+inline std::string* TensorProto::mutable_doc_string() {
+  std::string* _s = _internal_mutable_doc_string();
+  // @@protoc_insertion_point(field_mutable:onnx.TensorProto.doc_string)
+  return _s;
+}
+inline const std::string& TensorProto::_internal_doc_string() const {
+  return _impl_.doc_string_.Get();
+}
+inline void TensorProto::_internal_set_doc_string(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  _impl_.doc_string_.Set(value, GetArenaForAllocation());
+}
+inline std::string* TensorProto::_internal_mutable_doc_string() {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  return _impl_.doc_string_.Mutable(GetArenaForAllocation());
+}
+inline std::string* TensorProto::release_doc_string() {
+  // @@protoc_insertion_point(field_release:onnx.TensorProto.doc_string)
+  if (!_internal_has_doc_string()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000004u;
+  auto* p = _impl_.doc_string_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void TensorProto::set_allocated_doc_string(std::string* doc_string) {
+  if (doc_string != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000004u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000004u;
+  }
+  _impl_.doc_string_.SetAllocated(doc_string, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.TensorProto.doc_string)
+}
+
+// optional bytes raw_data = 9;
+inline bool TensorProto::_internal_has_raw_data() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool TensorProto::has_raw_data() const {
+  return _internal_has_raw_data();
+}
+inline void TensorProto::clear_raw_data() {
+  _impl_.raw_data_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const std::string& TensorProto::raw_data() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.raw_data)
+  return _internal_raw_data();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void TensorProto::set_raw_data(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000002u;
+ _impl_.raw_data_.SetBytes(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.raw_data)
+}
+inline std::string* TensorProto::mutable_raw_data() {
+  std::string* _s = _internal_mutable_raw_data();
+  // @@protoc_insertion_point(field_mutable:onnx.TensorProto.raw_data)
+  return _s;
+}
+inline const std::string& TensorProto::_internal_raw_data() const {
+  return _impl_.raw_data_.Get();
+}
+inline void TensorProto::_internal_set_raw_data(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.raw_data_.Set(value, GetArenaForAllocation());
+}
+inline std::string* TensorProto::_internal_mutable_raw_data() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  return _impl_.raw_data_.Mutable(GetArenaForAllocation());
+}
+inline std::string* TensorProto::release_raw_data() {
+  // @@protoc_insertion_point(field_release:onnx.TensorProto.raw_data)
+  if (!_internal_has_raw_data()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  auto* p = _impl_.raw_data_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.raw_data_.IsDefault()) {
+    _impl_.raw_data_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void TensorProto::set_allocated_raw_data(std::string* raw_data) {
+  if (raw_data != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.raw_data_.SetAllocated(raw_data, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.raw_data_.IsDefault()) {
+    _impl_.raw_data_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.TensorProto.raw_data)
+}
+
+// repeated .onnx.StringStringEntryProto external_data = 13;
+inline int TensorProto::_internal_external_data_size() const {
+  return _impl_.external_data_.size();
+}
+inline int TensorProto::external_data_size() const {
+  return _internal_external_data_size();
+}
+inline void TensorProto::clear_external_data() {
+  _impl_.external_data_.Clear();
+}
+inline ::onnx::StringStringEntryProto* TensorProto::mutable_external_data(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.TensorProto.external_data)
+  return _impl_.external_data_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+TensorProto::mutable_external_data() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorProto.external_data)
+  return &_impl_.external_data_;
+}
+inline const ::onnx::StringStringEntryProto& TensorProto::_internal_external_data(int index) const {
+  return _impl_.external_data_.Get(index);
+}
+inline const ::onnx::StringStringEntryProto& TensorProto::external_data(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.external_data)
+  return _internal_external_data(index);
+}
+inline ::onnx::StringStringEntryProto* TensorProto::_internal_add_external_data() {
+  return _impl_.external_data_.Add();
+}
+inline ::onnx::StringStringEntryProto* TensorProto::add_external_data() {
+  ::onnx::StringStringEntryProto* _add = _internal_add_external_data();
+  // @@protoc_insertion_point(field_add:onnx.TensorProto.external_data)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+TensorProto::external_data() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorProto.external_data)
+  return _impl_.external_data_;
+}
+
+// optional .onnx.TensorProto.DataLocation data_location = 14;
+inline bool TensorProto::_internal_has_data_location() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000020u) != 0;
+  return value;
+}
+inline bool TensorProto::has_data_location() const {
+  return _internal_has_data_location();
+}
+inline void TensorProto::clear_data_location() {
+  _impl_.data_location_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000020u;
+}
+inline ::onnx::TensorProto_DataLocation TensorProto::_internal_data_location() const {
+  return static_cast< ::onnx::TensorProto_DataLocation >(_impl_.data_location_);
+}
+inline ::onnx::TensorProto_DataLocation TensorProto::data_location() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.data_location)
+  return _internal_data_location();
+}
+inline void TensorProto::_internal_set_data_location(::onnx::TensorProto_DataLocation value) {
+  assert(::onnx::TensorProto_DataLocation_IsValid(value));
+  _impl_._has_bits_[0] |= 0x00000020u;
+  _impl_.data_location_ = value;
+}
+inline void TensorProto::set_data_location(::onnx::TensorProto_DataLocation value) {
+  _internal_set_data_location(value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.data_location)
+}
+
+// repeated double double_data = 10 [packed = true];
+inline int TensorProto::_internal_double_data_size() const {
+  return _impl_.double_data_.size();
+}
+inline int TensorProto::double_data_size() const {
+  return _internal_double_data_size();
+}
+inline void TensorProto::clear_double_data() {
+  _impl_.double_data_.Clear();
+}
+inline double TensorProto::_internal_double_data(int index) const {
+  return _impl_.double_data_.Get(index);
+}
+inline double TensorProto::double_data(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.double_data)
+  return _internal_double_data(index);
+}
+inline void TensorProto::set_double_data(int index, double value) {
+  _impl_.double_data_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.double_data)
+}
+inline void TensorProto::_internal_add_double_data(double value) {
+  _impl_.double_data_.Add(value);
+}
+inline void TensorProto::add_double_data(double value) {
+  _internal_add_double_data(value);
+  // @@protoc_insertion_point(field_add:onnx.TensorProto.double_data)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< double >&
+TensorProto::_internal_double_data() const {
+  return _impl_.double_data_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< double >&
+TensorProto::double_data() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorProto.double_data)
+  return _internal_double_data();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< double >*
+TensorProto::_internal_mutable_double_data() {
+  return &_impl_.double_data_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< double >*
+TensorProto::mutable_double_data() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorProto.double_data)
+  return _internal_mutable_double_data();
+}
+
+// repeated uint64 uint64_data = 11 [packed = true];
+inline int TensorProto::_internal_uint64_data_size() const {
+  return _impl_.uint64_data_.size();
+}
+inline int TensorProto::uint64_data_size() const {
+  return _internal_uint64_data_size();
+}
+inline void TensorProto::clear_uint64_data() {
+  _impl_.uint64_data_.Clear();
+}
+inline uint64_t TensorProto::_internal_uint64_data(int index) const {
+  return _impl_.uint64_data_.Get(index);
+}
+inline uint64_t TensorProto::uint64_data(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.uint64_data)
+  return _internal_uint64_data(index);
+}
+inline void TensorProto::set_uint64_data(int index, uint64_t value) {
+  _impl_.uint64_data_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.TensorProto.uint64_data)
+}
+inline void TensorProto::_internal_add_uint64_data(uint64_t value) {
+  _impl_.uint64_data_.Add(value);
+}
+inline void TensorProto::add_uint64_data(uint64_t value) {
+  _internal_add_uint64_data(value);
+  // @@protoc_insertion_point(field_add:onnx.TensorProto.uint64_data)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< uint64_t >&
+TensorProto::_internal_uint64_data() const {
+  return _impl_.uint64_data_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< uint64_t >&
+TensorProto::uint64_data() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorProto.uint64_data)
+  return _internal_uint64_data();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< uint64_t >*
+TensorProto::_internal_mutable_uint64_data() {
+  return &_impl_.uint64_data_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< uint64_t >*
+TensorProto::mutable_uint64_data() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorProto.uint64_data)
+  return _internal_mutable_uint64_data();
+}
+
+// repeated .onnx.StringStringEntryProto metadata_props = 16;
+inline int TensorProto::_internal_metadata_props_size() const {
+  return _impl_.metadata_props_.size();
+}
+inline int TensorProto::metadata_props_size() const {
+  return _internal_metadata_props_size();
+}
+inline void TensorProto::clear_metadata_props() {
+  _impl_.metadata_props_.Clear();
+}
+inline ::onnx::StringStringEntryProto* TensorProto::mutable_metadata_props(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.TensorProto.metadata_props)
+  return _impl_.metadata_props_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+TensorProto::mutable_metadata_props() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorProto.metadata_props)
+  return &_impl_.metadata_props_;
+}
+inline const ::onnx::StringStringEntryProto& TensorProto::_internal_metadata_props(int index) const {
+  return _impl_.metadata_props_.Get(index);
+}
+inline const ::onnx::StringStringEntryProto& TensorProto::metadata_props(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorProto.metadata_props)
+  return _internal_metadata_props(index);
+}
+inline ::onnx::StringStringEntryProto* TensorProto::_internal_add_metadata_props() {
+  return _impl_.metadata_props_.Add();
+}
+inline ::onnx::StringStringEntryProto* TensorProto::add_metadata_props() {
+  ::onnx::StringStringEntryProto* _add = _internal_add_metadata_props();
+  // @@protoc_insertion_point(field_add:onnx.TensorProto.metadata_props)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+TensorProto::metadata_props() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorProto.metadata_props)
+  return _impl_.metadata_props_;
+}
+
+// -------------------------------------------------------------------
+
+// SparseTensorProto
+
+// optional .onnx.TensorProto values = 1;
+inline bool SparseTensorProto::_internal_has_values() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.values_ != nullptr);
+  return value;
+}
+inline bool SparseTensorProto::has_values() const {
+  return _internal_has_values();
+}
+inline void SparseTensorProto::clear_values() {
+  if (_impl_.values_ != nullptr) _impl_.values_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::onnx::TensorProto& SparseTensorProto::_internal_values() const {
+  const ::onnx::TensorProto* p = _impl_.values_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TensorProto&>(
+      ::onnx::_TensorProto_default_instance_);
+}
+inline const ::onnx::TensorProto& SparseTensorProto::values() const {
+  // @@protoc_insertion_point(field_get:onnx.SparseTensorProto.values)
+  return _internal_values();
+}
+inline void SparseTensorProto::unsafe_arena_set_allocated_values(
+    ::onnx::TensorProto* values) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.values_);
+  }
+  _impl_.values_ = values;
+  if (values) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.SparseTensorProto.values)
+}
+inline ::onnx::TensorProto* SparseTensorProto::release_values() {
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TensorProto* temp = _impl_.values_;
+  _impl_.values_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TensorProto* SparseTensorProto::unsafe_arena_release_values() {
+  // @@protoc_insertion_point(field_release:onnx.SparseTensorProto.values)
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TensorProto* temp = _impl_.values_;
+  _impl_.values_ = nullptr;
+  return temp;
+}
+inline ::onnx::TensorProto* SparseTensorProto::_internal_mutable_values() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  if (_impl_.values_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TensorProto>(GetArenaForAllocation());
+    _impl_.values_ = p;
+  }
+  return _impl_.values_;
+}
+inline ::onnx::TensorProto* SparseTensorProto::mutable_values() {
+  ::onnx::TensorProto* _msg = _internal_mutable_values();
+  // @@protoc_insertion_point(field_mutable:onnx.SparseTensorProto.values)
+  return _msg;
+}
+inline void SparseTensorProto::set_allocated_values(::onnx::TensorProto* values) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.values_;
+  }
+  if (values) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(values);
+    if (message_arena != submessage_arena) {
+      values = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, values, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.values_ = values;
+  // @@protoc_insertion_point(field_set_allocated:onnx.SparseTensorProto.values)
+}
+
+// optional .onnx.TensorProto indices = 2;
+inline bool SparseTensorProto::_internal_has_indices() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.indices_ != nullptr);
+  return value;
+}
+inline bool SparseTensorProto::has_indices() const {
+  return _internal_has_indices();
+}
+inline void SparseTensorProto::clear_indices() {
+  if (_impl_.indices_ != nullptr) _impl_.indices_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const ::onnx::TensorProto& SparseTensorProto::_internal_indices() const {
+  const ::onnx::TensorProto* p = _impl_.indices_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TensorProto&>(
+      ::onnx::_TensorProto_default_instance_);
+}
+inline const ::onnx::TensorProto& SparseTensorProto::indices() const {
+  // @@protoc_insertion_point(field_get:onnx.SparseTensorProto.indices)
+  return _internal_indices();
+}
+inline void SparseTensorProto::unsafe_arena_set_allocated_indices(
+    ::onnx::TensorProto* indices) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.indices_);
+  }
+  _impl_.indices_ = indices;
+  if (indices) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.SparseTensorProto.indices)
+}
+inline ::onnx::TensorProto* SparseTensorProto::release_indices() {
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  ::onnx::TensorProto* temp = _impl_.indices_;
+  _impl_.indices_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TensorProto* SparseTensorProto::unsafe_arena_release_indices() {
+  // @@protoc_insertion_point(field_release:onnx.SparseTensorProto.indices)
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  ::onnx::TensorProto* temp = _impl_.indices_;
+  _impl_.indices_ = nullptr;
+  return temp;
+}
+inline ::onnx::TensorProto* SparseTensorProto::_internal_mutable_indices() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  if (_impl_.indices_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TensorProto>(GetArenaForAllocation());
+    _impl_.indices_ = p;
+  }
+  return _impl_.indices_;
+}
+inline ::onnx::TensorProto* SparseTensorProto::mutable_indices() {
+  ::onnx::TensorProto* _msg = _internal_mutable_indices();
+  // @@protoc_insertion_point(field_mutable:onnx.SparseTensorProto.indices)
+  return _msg;
+}
+inline void SparseTensorProto::set_allocated_indices(::onnx::TensorProto* indices) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.indices_;
+  }
+  if (indices) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(indices);
+    if (message_arena != submessage_arena) {
+      indices = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, indices, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.indices_ = indices;
+  // @@protoc_insertion_point(field_set_allocated:onnx.SparseTensorProto.indices)
+}
+
+// repeated int64 dims = 3;
+inline int SparseTensorProto::_internal_dims_size() const {
+  return _impl_.dims_.size();
+}
+inline int SparseTensorProto::dims_size() const {
+  return _internal_dims_size();
+}
+inline void SparseTensorProto::clear_dims() {
+  _impl_.dims_.Clear();
+}
+inline int64_t SparseTensorProto::_internal_dims(int index) const {
+  return _impl_.dims_.Get(index);
+}
+inline int64_t SparseTensorProto::dims(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.SparseTensorProto.dims)
+  return _internal_dims(index);
+}
+inline void SparseTensorProto::set_dims(int index, int64_t value) {
+  _impl_.dims_.Set(index, value);
+  // @@protoc_insertion_point(field_set:onnx.SparseTensorProto.dims)
+}
+inline void SparseTensorProto::_internal_add_dims(int64_t value) {
+  _impl_.dims_.Add(value);
+}
+inline void SparseTensorProto::add_dims(int64_t value) {
+  _internal_add_dims(value);
+  // @@protoc_insertion_point(field_add:onnx.SparseTensorProto.dims)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+SparseTensorProto::_internal_dims() const {
+  return _impl_.dims_;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >&
+SparseTensorProto::dims() const {
+  // @@protoc_insertion_point(field_list:onnx.SparseTensorProto.dims)
+  return _internal_dims();
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+SparseTensorProto::_internal_mutable_dims() {
+  return &_impl_.dims_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedField< int64_t >*
+SparseTensorProto::mutable_dims() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.SparseTensorProto.dims)
+  return _internal_mutable_dims();
+}
+
+// -------------------------------------------------------------------
+
+// TensorShapeProto_Dimension
+
+// int64 dim_value = 1;
+inline bool TensorShapeProto_Dimension::_internal_has_dim_value() const {
+  return value_case() == kDimValue;
+}
+inline bool TensorShapeProto_Dimension::has_dim_value() const {
+  return _internal_has_dim_value();
+}
+inline void TensorShapeProto_Dimension::set_has_dim_value() {
+  _impl_._oneof_case_[0] = kDimValue;
+}
+inline void TensorShapeProto_Dimension::clear_dim_value() {
+  if (_internal_has_dim_value()) {
+    _impl_.value_.dim_value_ = int64_t{0};
+    clear_has_value();
+  }
+}
+inline int64_t TensorShapeProto_Dimension::_internal_dim_value() const {
+  if (_internal_has_dim_value()) {
+    return _impl_.value_.dim_value_;
+  }
+  return int64_t{0};
+}
+inline void TensorShapeProto_Dimension::_internal_set_dim_value(int64_t value) {
+  if (!_internal_has_dim_value()) {
+    clear_value();
+    set_has_dim_value();
+  }
+  _impl_.value_.dim_value_ = value;
+}
+inline int64_t TensorShapeProto_Dimension::dim_value() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorShapeProto.Dimension.dim_value)
+  return _internal_dim_value();
+}
+inline void TensorShapeProto_Dimension::set_dim_value(int64_t value) {
+  _internal_set_dim_value(value);
+  // @@protoc_insertion_point(field_set:onnx.TensorShapeProto.Dimension.dim_value)
+}
+
+// string dim_param = 2;
+inline bool TensorShapeProto_Dimension::_internal_has_dim_param() const {
+  return value_case() == kDimParam;
+}
+inline bool TensorShapeProto_Dimension::has_dim_param() const {
+  return _internal_has_dim_param();
+}
+inline void TensorShapeProto_Dimension::set_has_dim_param() {
+  _impl_._oneof_case_[0] = kDimParam;
+}
+inline void TensorShapeProto_Dimension::clear_dim_param() {
+  if (_internal_has_dim_param()) {
+    _impl_.value_.dim_param_.Destroy();
+    clear_has_value();
+  }
+}
+inline const std::string& TensorShapeProto_Dimension::dim_param() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorShapeProto.Dimension.dim_param)
+  return _internal_dim_param();
+}
+template <typename ArgT0, typename... ArgT>
+inline void TensorShapeProto_Dimension::set_dim_param(ArgT0&& arg0, ArgT... args) {
+  if (!_internal_has_dim_param()) {
+    clear_value();
+    set_has_dim_param();
+    _impl_.value_.dim_param_.InitDefault();
+  }
+  _impl_.value_.dim_param_.Set( static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.TensorShapeProto.Dimension.dim_param)
+}
+inline std::string* TensorShapeProto_Dimension::mutable_dim_param() {
+  std::string* _s = _internal_mutable_dim_param();
+  // @@protoc_insertion_point(field_mutable:onnx.TensorShapeProto.Dimension.dim_param)
+  return _s;
+}
+inline const std::string& TensorShapeProto_Dimension::_internal_dim_param() const {
+  if (_internal_has_dim_param()) {
+    return _impl_.value_.dim_param_.Get();
+  }
+  return ::PROTOBUF_NAMESPACE_ID::internal::GetEmptyStringAlreadyInited();
+}
+inline void TensorShapeProto_Dimension::_internal_set_dim_param(const std::string& value) {
+  if (!_internal_has_dim_param()) {
+    clear_value();
+    set_has_dim_param();
+    _impl_.value_.dim_param_.InitDefault();
+  }
+  _impl_.value_.dim_param_.Set(value, GetArenaForAllocation());
+}
+inline std::string* TensorShapeProto_Dimension::_internal_mutable_dim_param() {
+  if (!_internal_has_dim_param()) {
+    clear_value();
+    set_has_dim_param();
+    _impl_.value_.dim_param_.InitDefault();
+  }
+  return _impl_.value_.dim_param_.Mutable(      GetArenaForAllocation());
+}
+inline std::string* TensorShapeProto_Dimension::release_dim_param() {
+  // @@protoc_insertion_point(field_release:onnx.TensorShapeProto.Dimension.dim_param)
+  if (_internal_has_dim_param()) {
+    clear_has_value();
+    return _impl_.value_.dim_param_.Release();
+  } else {
+    return nullptr;
+  }
+}
+inline void TensorShapeProto_Dimension::set_allocated_dim_param(std::string* dim_param) {
+  if (has_value()) {
+    clear_value();
+  }
+  if (dim_param != nullptr) {
+    set_has_dim_param();
+    _impl_.value_.dim_param_.InitAllocated(dim_param, GetArenaForAllocation());
+  }
+  // @@protoc_insertion_point(field_set_allocated:onnx.TensorShapeProto.Dimension.dim_param)
+}
+
+// optional string denotation = 3;
+inline bool TensorShapeProto_Dimension::_internal_has_denotation() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool TensorShapeProto_Dimension::has_denotation() const {
+  return _internal_has_denotation();
+}
+inline void TensorShapeProto_Dimension::clear_denotation() {
+  _impl_.denotation_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& TensorShapeProto_Dimension::denotation() const {
+  // @@protoc_insertion_point(field_get:onnx.TensorShapeProto.Dimension.denotation)
+  return _internal_denotation();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void TensorShapeProto_Dimension::set_denotation(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.denotation_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.TensorShapeProto.Dimension.denotation)
+}
+inline std::string* TensorShapeProto_Dimension::mutable_denotation() {
+  std::string* _s = _internal_mutable_denotation();
+  // @@protoc_insertion_point(field_mutable:onnx.TensorShapeProto.Dimension.denotation)
+  return _s;
+}
+inline const std::string& TensorShapeProto_Dimension::_internal_denotation() const {
+  return _impl_.denotation_.Get();
+}
+inline void TensorShapeProto_Dimension::_internal_set_denotation(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.denotation_.Set(value, GetArenaForAllocation());
+}
+inline std::string* TensorShapeProto_Dimension::_internal_mutable_denotation() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.denotation_.Mutable(GetArenaForAllocation());
+}
+inline std::string* TensorShapeProto_Dimension::release_denotation() {
+  // @@protoc_insertion_point(field_release:onnx.TensorShapeProto.Dimension.denotation)
+  if (!_internal_has_denotation()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.denotation_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.denotation_.IsDefault()) {
+    _impl_.denotation_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void TensorShapeProto_Dimension::set_allocated_denotation(std::string* denotation) {
+  if (denotation != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.denotation_.SetAllocated(denotation, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.denotation_.IsDefault()) {
+    _impl_.denotation_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.TensorShapeProto.Dimension.denotation)
+}
+
+inline bool TensorShapeProto_Dimension::has_value() const {
+  return value_case() != VALUE_NOT_SET;
+}
+inline void TensorShapeProto_Dimension::clear_has_value() {
+  _impl_._oneof_case_[0] = VALUE_NOT_SET;
+}
+inline TensorShapeProto_Dimension::ValueCase TensorShapeProto_Dimension::value_case() const {
+  return TensorShapeProto_Dimension::ValueCase(_impl_._oneof_case_[0]);
+}
+// -------------------------------------------------------------------
+
+// TensorShapeProto
+
+// repeated .onnx.TensorShapeProto.Dimension dim = 1;
+inline int TensorShapeProto::_internal_dim_size() const {
+  return _impl_.dim_.size();
+}
+inline int TensorShapeProto::dim_size() const {
+  return _internal_dim_size();
+}
+inline void TensorShapeProto::clear_dim() {
+  _impl_.dim_.Clear();
+}
+inline ::onnx::TensorShapeProto_Dimension* TensorShapeProto::mutable_dim(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.TensorShapeProto.dim)
+  return _impl_.dim_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorShapeProto_Dimension >*
+TensorShapeProto::mutable_dim() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.TensorShapeProto.dim)
+  return &_impl_.dim_;
+}
+inline const ::onnx::TensorShapeProto_Dimension& TensorShapeProto::_internal_dim(int index) const {
+  return _impl_.dim_.Get(index);
+}
+inline const ::onnx::TensorShapeProto_Dimension& TensorShapeProto::dim(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.TensorShapeProto.dim)
+  return _internal_dim(index);
+}
+inline ::onnx::TensorShapeProto_Dimension* TensorShapeProto::_internal_add_dim() {
+  return _impl_.dim_.Add();
+}
+inline ::onnx::TensorShapeProto_Dimension* TensorShapeProto::add_dim() {
+  ::onnx::TensorShapeProto_Dimension* _add = _internal_add_dim();
+  // @@protoc_insertion_point(field_add:onnx.TensorShapeProto.dim)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::TensorShapeProto_Dimension >&
+TensorShapeProto::dim() const {
+  // @@protoc_insertion_point(field_list:onnx.TensorShapeProto.dim)
+  return _impl_.dim_;
+}
+
+// -------------------------------------------------------------------
+
+// TypeProto_Tensor
+
+// optional int32 elem_type = 1;
+inline bool TypeProto_Tensor::_internal_has_elem_type() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool TypeProto_Tensor::has_elem_type() const {
+  return _internal_has_elem_type();
+}
+inline void TypeProto_Tensor::clear_elem_type() {
+  _impl_.elem_type_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline int32_t TypeProto_Tensor::_internal_elem_type() const {
+  return _impl_.elem_type_;
+}
+inline int32_t TypeProto_Tensor::elem_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.Tensor.elem_type)
+  return _internal_elem_type();
+}
+inline void TypeProto_Tensor::_internal_set_elem_type(int32_t value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.elem_type_ = value;
+}
+inline void TypeProto_Tensor::set_elem_type(int32_t value) {
+  _internal_set_elem_type(value);
+  // @@protoc_insertion_point(field_set:onnx.TypeProto.Tensor.elem_type)
+}
+
+// optional .onnx.TensorShapeProto shape = 2;
+inline bool TypeProto_Tensor::_internal_has_shape() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.shape_ != nullptr);
+  return value;
+}
+inline bool TypeProto_Tensor::has_shape() const {
+  return _internal_has_shape();
+}
+inline void TypeProto_Tensor::clear_shape() {
+  if (_impl_.shape_ != nullptr) _impl_.shape_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::onnx::TensorShapeProto& TypeProto_Tensor::_internal_shape() const {
+  const ::onnx::TensorShapeProto* p = _impl_.shape_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TensorShapeProto&>(
+      ::onnx::_TensorShapeProto_default_instance_);
+}
+inline const ::onnx::TensorShapeProto& TypeProto_Tensor::shape() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.Tensor.shape)
+  return _internal_shape();
+}
+inline void TypeProto_Tensor::unsafe_arena_set_allocated_shape(
+    ::onnx::TensorShapeProto* shape) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.shape_);
+  }
+  _impl_.shape_ = shape;
+  if (shape) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.Tensor.shape)
+}
+inline ::onnx::TensorShapeProto* TypeProto_Tensor::release_shape() {
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TensorShapeProto* temp = _impl_.shape_;
+  _impl_.shape_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TensorShapeProto* TypeProto_Tensor::unsafe_arena_release_shape() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.Tensor.shape)
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TensorShapeProto* temp = _impl_.shape_;
+  _impl_.shape_ = nullptr;
+  return temp;
+}
+inline ::onnx::TensorShapeProto* TypeProto_Tensor::_internal_mutable_shape() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  if (_impl_.shape_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TensorShapeProto>(GetArenaForAllocation());
+    _impl_.shape_ = p;
+  }
+  return _impl_.shape_;
+}
+inline ::onnx::TensorShapeProto* TypeProto_Tensor::mutable_shape() {
+  ::onnx::TensorShapeProto* _msg = _internal_mutable_shape();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.Tensor.shape)
+  return _msg;
+}
+inline void TypeProto_Tensor::set_allocated_shape(::onnx::TensorShapeProto* shape) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.shape_;
+  }
+  if (shape) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(shape);
+    if (message_arena != submessage_arena) {
+      shape = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, shape, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.shape_ = shape;
+  // @@protoc_insertion_point(field_set_allocated:onnx.TypeProto.Tensor.shape)
+}
+
+// -------------------------------------------------------------------
+
+// TypeProto_Sequence
+
+// optional .onnx.TypeProto elem_type = 1;
+inline bool TypeProto_Sequence::_internal_has_elem_type() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.elem_type_ != nullptr);
+  return value;
+}
+inline bool TypeProto_Sequence::has_elem_type() const {
+  return _internal_has_elem_type();
+}
+inline void TypeProto_Sequence::clear_elem_type() {
+  if (_impl_.elem_type_ != nullptr) _impl_.elem_type_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::onnx::TypeProto& TypeProto_Sequence::_internal_elem_type() const {
+  const ::onnx::TypeProto* p = _impl_.elem_type_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TypeProto&>(
+      ::onnx::_TypeProto_default_instance_);
+}
+inline const ::onnx::TypeProto& TypeProto_Sequence::elem_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.Sequence.elem_type)
+  return _internal_elem_type();
+}
+inline void TypeProto_Sequence::unsafe_arena_set_allocated_elem_type(
+    ::onnx::TypeProto* elem_type) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.elem_type_);
+  }
+  _impl_.elem_type_ = elem_type;
+  if (elem_type) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.Sequence.elem_type)
+}
+inline ::onnx::TypeProto* TypeProto_Sequence::release_elem_type() {
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TypeProto* temp = _impl_.elem_type_;
+  _impl_.elem_type_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TypeProto* TypeProto_Sequence::unsafe_arena_release_elem_type() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.Sequence.elem_type)
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TypeProto* temp = _impl_.elem_type_;
+  _impl_.elem_type_ = nullptr;
+  return temp;
+}
+inline ::onnx::TypeProto* TypeProto_Sequence::_internal_mutable_elem_type() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  if (_impl_.elem_type_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TypeProto>(GetArenaForAllocation());
+    _impl_.elem_type_ = p;
+  }
+  return _impl_.elem_type_;
+}
+inline ::onnx::TypeProto* TypeProto_Sequence::mutable_elem_type() {
+  ::onnx::TypeProto* _msg = _internal_mutable_elem_type();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.Sequence.elem_type)
+  return _msg;
+}
+inline void TypeProto_Sequence::set_allocated_elem_type(::onnx::TypeProto* elem_type) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.elem_type_;
+  }
+  if (elem_type) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(elem_type);
+    if (message_arena != submessage_arena) {
+      elem_type = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, elem_type, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.elem_type_ = elem_type;
+  // @@protoc_insertion_point(field_set_allocated:onnx.TypeProto.Sequence.elem_type)
+}
+
+// -------------------------------------------------------------------
+
+// TypeProto_Map
+
+// optional int32 key_type = 1;
+inline bool TypeProto_Map::_internal_has_key_type() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool TypeProto_Map::has_key_type() const {
+  return _internal_has_key_type();
+}
+inline void TypeProto_Map::clear_key_type() {
+  _impl_.key_type_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline int32_t TypeProto_Map::_internal_key_type() const {
+  return _impl_.key_type_;
+}
+inline int32_t TypeProto_Map::key_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.Map.key_type)
+  return _internal_key_type();
+}
+inline void TypeProto_Map::_internal_set_key_type(int32_t value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.key_type_ = value;
+}
+inline void TypeProto_Map::set_key_type(int32_t value) {
+  _internal_set_key_type(value);
+  // @@protoc_insertion_point(field_set:onnx.TypeProto.Map.key_type)
+}
+
+// optional .onnx.TypeProto value_type = 2;
+inline bool TypeProto_Map::_internal_has_value_type() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.value_type_ != nullptr);
+  return value;
+}
+inline bool TypeProto_Map::has_value_type() const {
+  return _internal_has_value_type();
+}
+inline void TypeProto_Map::clear_value_type() {
+  if (_impl_.value_type_ != nullptr) _impl_.value_type_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::onnx::TypeProto& TypeProto_Map::_internal_value_type() const {
+  const ::onnx::TypeProto* p = _impl_.value_type_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TypeProto&>(
+      ::onnx::_TypeProto_default_instance_);
+}
+inline const ::onnx::TypeProto& TypeProto_Map::value_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.Map.value_type)
+  return _internal_value_type();
+}
+inline void TypeProto_Map::unsafe_arena_set_allocated_value_type(
+    ::onnx::TypeProto* value_type) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.value_type_);
+  }
+  _impl_.value_type_ = value_type;
+  if (value_type) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.Map.value_type)
+}
+inline ::onnx::TypeProto* TypeProto_Map::release_value_type() {
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TypeProto* temp = _impl_.value_type_;
+  _impl_.value_type_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TypeProto* TypeProto_Map::unsafe_arena_release_value_type() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.Map.value_type)
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TypeProto* temp = _impl_.value_type_;
+  _impl_.value_type_ = nullptr;
+  return temp;
+}
+inline ::onnx::TypeProto* TypeProto_Map::_internal_mutable_value_type() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  if (_impl_.value_type_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TypeProto>(GetArenaForAllocation());
+    _impl_.value_type_ = p;
+  }
+  return _impl_.value_type_;
+}
+inline ::onnx::TypeProto* TypeProto_Map::mutable_value_type() {
+  ::onnx::TypeProto* _msg = _internal_mutable_value_type();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.Map.value_type)
+  return _msg;
+}
+inline void TypeProto_Map::set_allocated_value_type(::onnx::TypeProto* value_type) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.value_type_;
+  }
+  if (value_type) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(value_type);
+    if (message_arena != submessage_arena) {
+      value_type = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, value_type, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.value_type_ = value_type;
+  // @@protoc_insertion_point(field_set_allocated:onnx.TypeProto.Map.value_type)
+}
+
+// -------------------------------------------------------------------
+
+// TypeProto_Optional
+
+// optional .onnx.TypeProto elem_type = 1;
+inline bool TypeProto_Optional::_internal_has_elem_type() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.elem_type_ != nullptr);
+  return value;
+}
+inline bool TypeProto_Optional::has_elem_type() const {
+  return _internal_has_elem_type();
+}
+inline void TypeProto_Optional::clear_elem_type() {
+  if (_impl_.elem_type_ != nullptr) _impl_.elem_type_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::onnx::TypeProto& TypeProto_Optional::_internal_elem_type() const {
+  const ::onnx::TypeProto* p = _impl_.elem_type_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TypeProto&>(
+      ::onnx::_TypeProto_default_instance_);
+}
+inline const ::onnx::TypeProto& TypeProto_Optional::elem_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.Optional.elem_type)
+  return _internal_elem_type();
+}
+inline void TypeProto_Optional::unsafe_arena_set_allocated_elem_type(
+    ::onnx::TypeProto* elem_type) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.elem_type_);
+  }
+  _impl_.elem_type_ = elem_type;
+  if (elem_type) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.Optional.elem_type)
+}
+inline ::onnx::TypeProto* TypeProto_Optional::release_elem_type() {
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TypeProto* temp = _impl_.elem_type_;
+  _impl_.elem_type_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TypeProto* TypeProto_Optional::unsafe_arena_release_elem_type() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.Optional.elem_type)
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TypeProto* temp = _impl_.elem_type_;
+  _impl_.elem_type_ = nullptr;
+  return temp;
+}
+inline ::onnx::TypeProto* TypeProto_Optional::_internal_mutable_elem_type() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  if (_impl_.elem_type_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TypeProto>(GetArenaForAllocation());
+    _impl_.elem_type_ = p;
+  }
+  return _impl_.elem_type_;
+}
+inline ::onnx::TypeProto* TypeProto_Optional::mutable_elem_type() {
+  ::onnx::TypeProto* _msg = _internal_mutable_elem_type();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.Optional.elem_type)
+  return _msg;
+}
+inline void TypeProto_Optional::set_allocated_elem_type(::onnx::TypeProto* elem_type) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.elem_type_;
+  }
+  if (elem_type) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(elem_type);
+    if (message_arena != submessage_arena) {
+      elem_type = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, elem_type, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.elem_type_ = elem_type;
+  // @@protoc_insertion_point(field_set_allocated:onnx.TypeProto.Optional.elem_type)
+}
+
+// -------------------------------------------------------------------
+
+// TypeProto_SparseTensor
+
+// optional int32 elem_type = 1;
+inline bool TypeProto_SparseTensor::_internal_has_elem_type() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool TypeProto_SparseTensor::has_elem_type() const {
+  return _internal_has_elem_type();
+}
+inline void TypeProto_SparseTensor::clear_elem_type() {
+  _impl_.elem_type_ = 0;
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline int32_t TypeProto_SparseTensor::_internal_elem_type() const {
+  return _impl_.elem_type_;
+}
+inline int32_t TypeProto_SparseTensor::elem_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.SparseTensor.elem_type)
+  return _internal_elem_type();
+}
+inline void TypeProto_SparseTensor::_internal_set_elem_type(int32_t value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.elem_type_ = value;
+}
+inline void TypeProto_SparseTensor::set_elem_type(int32_t value) {
+  _internal_set_elem_type(value);
+  // @@protoc_insertion_point(field_set:onnx.TypeProto.SparseTensor.elem_type)
+}
+
+// optional .onnx.TensorShapeProto shape = 2;
+inline bool TypeProto_SparseTensor::_internal_has_shape() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  PROTOBUF_ASSUME(!value || _impl_.shape_ != nullptr);
+  return value;
+}
+inline bool TypeProto_SparseTensor::has_shape() const {
+  return _internal_has_shape();
+}
+inline void TypeProto_SparseTensor::clear_shape() {
+  if (_impl_.shape_ != nullptr) _impl_.shape_->Clear();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const ::onnx::TensorShapeProto& TypeProto_SparseTensor::_internal_shape() const {
+  const ::onnx::TensorShapeProto* p = _impl_.shape_;
+  return p != nullptr ? *p : reinterpret_cast<const ::onnx::TensorShapeProto&>(
+      ::onnx::_TensorShapeProto_default_instance_);
+}
+inline const ::onnx::TensorShapeProto& TypeProto_SparseTensor::shape() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.SparseTensor.shape)
+  return _internal_shape();
+}
+inline void TypeProto_SparseTensor::unsafe_arena_set_allocated_shape(
+    ::onnx::TensorShapeProto* shape) {
+  if (GetArenaForAllocation() == nullptr) {
+    delete reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(_impl_.shape_);
+  }
+  _impl_.shape_ = shape;
+  if (shape) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.SparseTensor.shape)
+}
+inline ::onnx::TensorShapeProto* TypeProto_SparseTensor::release_shape() {
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TensorShapeProto* temp = _impl_.shape_;
+  _impl_.shape_ = nullptr;
+#ifdef PROTOBUF_FORCE_COPY_IN_RELEASE
+  auto* old =  reinterpret_cast<::PROTOBUF_NAMESPACE_ID::MessageLite*>(temp);
+  temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  if (GetArenaForAllocation() == nullptr) { delete old; }
+#else  // PROTOBUF_FORCE_COPY_IN_RELEASE
+  if (GetArenaForAllocation() != nullptr) {
+    temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+  }
+#endif  // !PROTOBUF_FORCE_COPY_IN_RELEASE
+  return temp;
+}
+inline ::onnx::TensorShapeProto* TypeProto_SparseTensor::unsafe_arena_release_shape() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.SparseTensor.shape)
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  ::onnx::TensorShapeProto* temp = _impl_.shape_;
+  _impl_.shape_ = nullptr;
+  return temp;
+}
+inline ::onnx::TensorShapeProto* TypeProto_SparseTensor::_internal_mutable_shape() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  if (_impl_.shape_ == nullptr) {
+    auto* p = CreateMaybeMessage<::onnx::TensorShapeProto>(GetArenaForAllocation());
+    _impl_.shape_ = p;
+  }
+  return _impl_.shape_;
+}
+inline ::onnx::TensorShapeProto* TypeProto_SparseTensor::mutable_shape() {
+  ::onnx::TensorShapeProto* _msg = _internal_mutable_shape();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.SparseTensor.shape)
+  return _msg;
+}
+inline void TypeProto_SparseTensor::set_allocated_shape(::onnx::TensorShapeProto* shape) {
+  ::PROTOBUF_NAMESPACE_ID::Arena* message_arena = GetArenaForAllocation();
+  if (message_arena == nullptr) {
+    delete _impl_.shape_;
+  }
+  if (shape) {
+    ::PROTOBUF_NAMESPACE_ID::Arena* submessage_arena =
+        ::PROTOBUF_NAMESPACE_ID::Arena::InternalGetOwningArena(shape);
+    if (message_arena != submessage_arena) {
+      shape = ::PROTOBUF_NAMESPACE_ID::internal::GetOwnedMessage(
+          message_arena, shape, submessage_arena);
+    }
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.shape_ = shape;
+  // @@protoc_insertion_point(field_set_allocated:onnx.TypeProto.SparseTensor.shape)
+}
+
+// -------------------------------------------------------------------
+
+// TypeProto_Opaque
+
+// optional string domain = 1;
+inline bool TypeProto_Opaque::_internal_has_domain() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool TypeProto_Opaque::has_domain() const {
+  return _internal_has_domain();
+}
+inline void TypeProto_Opaque::clear_domain() {
+  _impl_.domain_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& TypeProto_Opaque::domain() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.Opaque.domain)
+  return _internal_domain();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void TypeProto_Opaque::set_domain(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.domain_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.TypeProto.Opaque.domain)
+}
+inline std::string* TypeProto_Opaque::mutable_domain() {
+  std::string* _s = _internal_mutable_domain();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.Opaque.domain)
+  return _s;
+}
+inline const std::string& TypeProto_Opaque::_internal_domain() const {
+  return _impl_.domain_.Get();
+}
+inline void TypeProto_Opaque::_internal_set_domain(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.domain_.Set(value, GetArenaForAllocation());
+}
+inline std::string* TypeProto_Opaque::_internal_mutable_domain() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.domain_.Mutable(GetArenaForAllocation());
+}
+inline std::string* TypeProto_Opaque::release_domain() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.Opaque.domain)
+  if (!_internal_has_domain()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.domain_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.domain_.IsDefault()) {
+    _impl_.domain_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void TypeProto_Opaque::set_allocated_domain(std::string* domain) {
+  if (domain != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.domain_.SetAllocated(domain, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.domain_.IsDefault()) {
+    _impl_.domain_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.TypeProto.Opaque.domain)
+}
+
+// optional string name = 2;
+inline bool TypeProto_Opaque::_internal_has_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool TypeProto_Opaque::has_name() const {
+  return _internal_has_name();
+}
+inline void TypeProto_Opaque::clear_name() {
+  _impl_.name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const std::string& TypeProto_Opaque::name() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.Opaque.name)
+  return _internal_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void TypeProto_Opaque::set_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000002u;
+ _impl_.name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.TypeProto.Opaque.name)
+}
+inline std::string* TypeProto_Opaque::mutable_name() {
+  std::string* _s = _internal_mutable_name();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.Opaque.name)
+  return _s;
+}
+inline const std::string& TypeProto_Opaque::_internal_name() const {
+  return _impl_.name_.Get();
+}
+inline void TypeProto_Opaque::_internal_set_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* TypeProto_Opaque::_internal_mutable_name() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  return _impl_.name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* TypeProto_Opaque::release_name() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.Opaque.name)
+  if (!_internal_has_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  auto* p = _impl_.name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void TypeProto_Opaque::set_allocated_name(std::string* name) {
+  if (name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.name_.SetAllocated(name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.TypeProto.Opaque.name)
+}
+
+// -------------------------------------------------------------------
+
+// TypeProto
+
+// .onnx.TypeProto.Tensor tensor_type = 1;
+inline bool TypeProto::_internal_has_tensor_type() const {
+  return value_case() == kTensorType;
+}
+inline bool TypeProto::has_tensor_type() const {
+  return _internal_has_tensor_type();
+}
+inline void TypeProto::set_has_tensor_type() {
+  _impl_._oneof_case_[0] = kTensorType;
+}
+inline void TypeProto::clear_tensor_type() {
+  if (_internal_has_tensor_type()) {
+    if (GetArenaForAllocation() == nullptr) {
+      delete _impl_.value_.tensor_type_;
+    }
+    clear_has_value();
+  }
+}
+inline ::onnx::TypeProto_Tensor* TypeProto::release_tensor_type() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.tensor_type)
+  if (_internal_has_tensor_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_Tensor* temp = _impl_.value_.tensor_type_;
+    if (GetArenaForAllocation() != nullptr) {
+      temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+    }
+    _impl_.value_.tensor_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline const ::onnx::TypeProto_Tensor& TypeProto::_internal_tensor_type() const {
+  return _internal_has_tensor_type()
+      ? *_impl_.value_.tensor_type_
+      : reinterpret_cast< ::onnx::TypeProto_Tensor&>(::onnx::_TypeProto_Tensor_default_instance_);
+}
+inline const ::onnx::TypeProto_Tensor& TypeProto::tensor_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.tensor_type)
+  return _internal_tensor_type();
+}
+inline ::onnx::TypeProto_Tensor* TypeProto::unsafe_arena_release_tensor_type() {
+  // @@protoc_insertion_point(field_unsafe_arena_release:onnx.TypeProto.tensor_type)
+  if (_internal_has_tensor_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_Tensor* temp = _impl_.value_.tensor_type_;
+    _impl_.value_.tensor_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline void TypeProto::unsafe_arena_set_allocated_tensor_type(::onnx::TypeProto_Tensor* tensor_type) {
+  clear_value();
+  if (tensor_type) {
+    set_has_tensor_type();
+    _impl_.value_.tensor_type_ = tensor_type;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.tensor_type)
+}
+inline ::onnx::TypeProto_Tensor* TypeProto::_internal_mutable_tensor_type() {
+  if (!_internal_has_tensor_type()) {
+    clear_value();
+    set_has_tensor_type();
+    _impl_.value_.tensor_type_ = CreateMaybeMessage< ::onnx::TypeProto_Tensor >(GetArenaForAllocation());
+  }
+  return _impl_.value_.tensor_type_;
+}
+inline ::onnx::TypeProto_Tensor* TypeProto::mutable_tensor_type() {
+  ::onnx::TypeProto_Tensor* _msg = _internal_mutable_tensor_type();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.tensor_type)
+  return _msg;
+}
+
+// .onnx.TypeProto.Sequence sequence_type = 4;
+inline bool TypeProto::_internal_has_sequence_type() const {
+  return value_case() == kSequenceType;
+}
+inline bool TypeProto::has_sequence_type() const {
+  return _internal_has_sequence_type();
+}
+inline void TypeProto::set_has_sequence_type() {
+  _impl_._oneof_case_[0] = kSequenceType;
+}
+inline void TypeProto::clear_sequence_type() {
+  if (_internal_has_sequence_type()) {
+    if (GetArenaForAllocation() == nullptr) {
+      delete _impl_.value_.sequence_type_;
+    }
+    clear_has_value();
+  }
+}
+inline ::onnx::TypeProto_Sequence* TypeProto::release_sequence_type() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.sequence_type)
+  if (_internal_has_sequence_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_Sequence* temp = _impl_.value_.sequence_type_;
+    if (GetArenaForAllocation() != nullptr) {
+      temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+    }
+    _impl_.value_.sequence_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline const ::onnx::TypeProto_Sequence& TypeProto::_internal_sequence_type() const {
+  return _internal_has_sequence_type()
+      ? *_impl_.value_.sequence_type_
+      : reinterpret_cast< ::onnx::TypeProto_Sequence&>(::onnx::_TypeProto_Sequence_default_instance_);
+}
+inline const ::onnx::TypeProto_Sequence& TypeProto::sequence_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.sequence_type)
+  return _internal_sequence_type();
+}
+inline ::onnx::TypeProto_Sequence* TypeProto::unsafe_arena_release_sequence_type() {
+  // @@protoc_insertion_point(field_unsafe_arena_release:onnx.TypeProto.sequence_type)
+  if (_internal_has_sequence_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_Sequence* temp = _impl_.value_.sequence_type_;
+    _impl_.value_.sequence_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline void TypeProto::unsafe_arena_set_allocated_sequence_type(::onnx::TypeProto_Sequence* sequence_type) {
+  clear_value();
+  if (sequence_type) {
+    set_has_sequence_type();
+    _impl_.value_.sequence_type_ = sequence_type;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.sequence_type)
+}
+inline ::onnx::TypeProto_Sequence* TypeProto::_internal_mutable_sequence_type() {
+  if (!_internal_has_sequence_type()) {
+    clear_value();
+    set_has_sequence_type();
+    _impl_.value_.sequence_type_ = CreateMaybeMessage< ::onnx::TypeProto_Sequence >(GetArenaForAllocation());
+  }
+  return _impl_.value_.sequence_type_;
+}
+inline ::onnx::TypeProto_Sequence* TypeProto::mutable_sequence_type() {
+  ::onnx::TypeProto_Sequence* _msg = _internal_mutable_sequence_type();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.sequence_type)
+  return _msg;
+}
+
+// .onnx.TypeProto.Map map_type = 5;
+inline bool TypeProto::_internal_has_map_type() const {
+  return value_case() == kMapType;
+}
+inline bool TypeProto::has_map_type() const {
+  return _internal_has_map_type();
+}
+inline void TypeProto::set_has_map_type() {
+  _impl_._oneof_case_[0] = kMapType;
+}
+inline void TypeProto::clear_map_type() {
+  if (_internal_has_map_type()) {
+    if (GetArenaForAllocation() == nullptr) {
+      delete _impl_.value_.map_type_;
+    }
+    clear_has_value();
+  }
+}
+inline ::onnx::TypeProto_Map* TypeProto::release_map_type() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.map_type)
+  if (_internal_has_map_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_Map* temp = _impl_.value_.map_type_;
+    if (GetArenaForAllocation() != nullptr) {
+      temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+    }
+    _impl_.value_.map_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline const ::onnx::TypeProto_Map& TypeProto::_internal_map_type() const {
+  return _internal_has_map_type()
+      ? *_impl_.value_.map_type_
+      : reinterpret_cast< ::onnx::TypeProto_Map&>(::onnx::_TypeProto_Map_default_instance_);
+}
+inline const ::onnx::TypeProto_Map& TypeProto::map_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.map_type)
+  return _internal_map_type();
+}
+inline ::onnx::TypeProto_Map* TypeProto::unsafe_arena_release_map_type() {
+  // @@protoc_insertion_point(field_unsafe_arena_release:onnx.TypeProto.map_type)
+  if (_internal_has_map_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_Map* temp = _impl_.value_.map_type_;
+    _impl_.value_.map_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline void TypeProto::unsafe_arena_set_allocated_map_type(::onnx::TypeProto_Map* map_type) {
+  clear_value();
+  if (map_type) {
+    set_has_map_type();
+    _impl_.value_.map_type_ = map_type;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.map_type)
+}
+inline ::onnx::TypeProto_Map* TypeProto::_internal_mutable_map_type() {
+  if (!_internal_has_map_type()) {
+    clear_value();
+    set_has_map_type();
+    _impl_.value_.map_type_ = CreateMaybeMessage< ::onnx::TypeProto_Map >(GetArenaForAllocation());
+  }
+  return _impl_.value_.map_type_;
+}
+inline ::onnx::TypeProto_Map* TypeProto::mutable_map_type() {
+  ::onnx::TypeProto_Map* _msg = _internal_mutable_map_type();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.map_type)
+  return _msg;
+}
+
+// .onnx.TypeProto.Optional optional_type = 9;
+inline bool TypeProto::_internal_has_optional_type() const {
+  return value_case() == kOptionalType;
+}
+inline bool TypeProto::has_optional_type() const {
+  return _internal_has_optional_type();
+}
+inline void TypeProto::set_has_optional_type() {
+  _impl_._oneof_case_[0] = kOptionalType;
+}
+inline void TypeProto::clear_optional_type() {
+  if (_internal_has_optional_type()) {
+    if (GetArenaForAllocation() == nullptr) {
+      delete _impl_.value_.optional_type_;
+    }
+    clear_has_value();
+  }
+}
+inline ::onnx::TypeProto_Optional* TypeProto::release_optional_type() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.optional_type)
+  if (_internal_has_optional_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_Optional* temp = _impl_.value_.optional_type_;
+    if (GetArenaForAllocation() != nullptr) {
+      temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+    }
+    _impl_.value_.optional_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline const ::onnx::TypeProto_Optional& TypeProto::_internal_optional_type() const {
+  return _internal_has_optional_type()
+      ? *_impl_.value_.optional_type_
+      : reinterpret_cast< ::onnx::TypeProto_Optional&>(::onnx::_TypeProto_Optional_default_instance_);
+}
+inline const ::onnx::TypeProto_Optional& TypeProto::optional_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.optional_type)
+  return _internal_optional_type();
+}
+inline ::onnx::TypeProto_Optional* TypeProto::unsafe_arena_release_optional_type() {
+  // @@protoc_insertion_point(field_unsafe_arena_release:onnx.TypeProto.optional_type)
+  if (_internal_has_optional_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_Optional* temp = _impl_.value_.optional_type_;
+    _impl_.value_.optional_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline void TypeProto::unsafe_arena_set_allocated_optional_type(::onnx::TypeProto_Optional* optional_type) {
+  clear_value();
+  if (optional_type) {
+    set_has_optional_type();
+    _impl_.value_.optional_type_ = optional_type;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.optional_type)
+}
+inline ::onnx::TypeProto_Optional* TypeProto::_internal_mutable_optional_type() {
+  if (!_internal_has_optional_type()) {
+    clear_value();
+    set_has_optional_type();
+    _impl_.value_.optional_type_ = CreateMaybeMessage< ::onnx::TypeProto_Optional >(GetArenaForAllocation());
+  }
+  return _impl_.value_.optional_type_;
+}
+inline ::onnx::TypeProto_Optional* TypeProto::mutable_optional_type() {
+  ::onnx::TypeProto_Optional* _msg = _internal_mutable_optional_type();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.optional_type)
+  return _msg;
+}
+
+// .onnx.TypeProto.SparseTensor sparse_tensor_type = 8;
+inline bool TypeProto::_internal_has_sparse_tensor_type() const {
+  return value_case() == kSparseTensorType;
+}
+inline bool TypeProto::has_sparse_tensor_type() const {
+  return _internal_has_sparse_tensor_type();
+}
+inline void TypeProto::set_has_sparse_tensor_type() {
+  _impl_._oneof_case_[0] = kSparseTensorType;
+}
+inline void TypeProto::clear_sparse_tensor_type() {
+  if (_internal_has_sparse_tensor_type()) {
+    if (GetArenaForAllocation() == nullptr) {
+      delete _impl_.value_.sparse_tensor_type_;
+    }
+    clear_has_value();
+  }
+}
+inline ::onnx::TypeProto_SparseTensor* TypeProto::release_sparse_tensor_type() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.sparse_tensor_type)
+  if (_internal_has_sparse_tensor_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_SparseTensor* temp = _impl_.value_.sparse_tensor_type_;
+    if (GetArenaForAllocation() != nullptr) {
+      temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+    }
+    _impl_.value_.sparse_tensor_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline const ::onnx::TypeProto_SparseTensor& TypeProto::_internal_sparse_tensor_type() const {
+  return _internal_has_sparse_tensor_type()
+      ? *_impl_.value_.sparse_tensor_type_
+      : reinterpret_cast< ::onnx::TypeProto_SparseTensor&>(::onnx::_TypeProto_SparseTensor_default_instance_);
+}
+inline const ::onnx::TypeProto_SparseTensor& TypeProto::sparse_tensor_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.sparse_tensor_type)
+  return _internal_sparse_tensor_type();
+}
+inline ::onnx::TypeProto_SparseTensor* TypeProto::unsafe_arena_release_sparse_tensor_type() {
+  // @@protoc_insertion_point(field_unsafe_arena_release:onnx.TypeProto.sparse_tensor_type)
+  if (_internal_has_sparse_tensor_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_SparseTensor* temp = _impl_.value_.sparse_tensor_type_;
+    _impl_.value_.sparse_tensor_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline void TypeProto::unsafe_arena_set_allocated_sparse_tensor_type(::onnx::TypeProto_SparseTensor* sparse_tensor_type) {
+  clear_value();
+  if (sparse_tensor_type) {
+    set_has_sparse_tensor_type();
+    _impl_.value_.sparse_tensor_type_ = sparse_tensor_type;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.sparse_tensor_type)
+}
+inline ::onnx::TypeProto_SparseTensor* TypeProto::_internal_mutable_sparse_tensor_type() {
+  if (!_internal_has_sparse_tensor_type()) {
+    clear_value();
+    set_has_sparse_tensor_type();
+    _impl_.value_.sparse_tensor_type_ = CreateMaybeMessage< ::onnx::TypeProto_SparseTensor >(GetArenaForAllocation());
+  }
+  return _impl_.value_.sparse_tensor_type_;
+}
+inline ::onnx::TypeProto_SparseTensor* TypeProto::mutable_sparse_tensor_type() {
+  ::onnx::TypeProto_SparseTensor* _msg = _internal_mutable_sparse_tensor_type();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.sparse_tensor_type)
+  return _msg;
+}
+
+// .onnx.TypeProto.Opaque opaque_type = 7;
+inline bool TypeProto::_internal_has_opaque_type() const {
+  return value_case() == kOpaqueType;
+}
+inline bool TypeProto::has_opaque_type() const {
+  return _internal_has_opaque_type();
+}
+inline void TypeProto::set_has_opaque_type() {
+  _impl_._oneof_case_[0] = kOpaqueType;
+}
+inline void TypeProto::clear_opaque_type() {
+  if (_internal_has_opaque_type()) {
+    if (GetArenaForAllocation() == nullptr) {
+      delete _impl_.value_.opaque_type_;
+    }
+    clear_has_value();
+  }
+}
+inline ::onnx::TypeProto_Opaque* TypeProto::release_opaque_type() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.opaque_type)
+  if (_internal_has_opaque_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_Opaque* temp = _impl_.value_.opaque_type_;
+    if (GetArenaForAllocation() != nullptr) {
+      temp = ::PROTOBUF_NAMESPACE_ID::internal::DuplicateIfNonNull(temp);
+    }
+    _impl_.value_.opaque_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline const ::onnx::TypeProto_Opaque& TypeProto::_internal_opaque_type() const {
+  return _internal_has_opaque_type()
+      ? *_impl_.value_.opaque_type_
+      : reinterpret_cast< ::onnx::TypeProto_Opaque&>(::onnx::_TypeProto_Opaque_default_instance_);
+}
+inline const ::onnx::TypeProto_Opaque& TypeProto::opaque_type() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.opaque_type)
+  return _internal_opaque_type();
+}
+inline ::onnx::TypeProto_Opaque* TypeProto::unsafe_arena_release_opaque_type() {
+  // @@protoc_insertion_point(field_unsafe_arena_release:onnx.TypeProto.opaque_type)
+  if (_internal_has_opaque_type()) {
+    clear_has_value();
+    ::onnx::TypeProto_Opaque* temp = _impl_.value_.opaque_type_;
+    _impl_.value_.opaque_type_ = nullptr;
+    return temp;
+  } else {
+    return nullptr;
+  }
+}
+inline void TypeProto::unsafe_arena_set_allocated_opaque_type(::onnx::TypeProto_Opaque* opaque_type) {
+  clear_value();
+  if (opaque_type) {
+    set_has_opaque_type();
+    _impl_.value_.opaque_type_ = opaque_type;
+  }
+  // @@protoc_insertion_point(field_unsafe_arena_set_allocated:onnx.TypeProto.opaque_type)
+}
+inline ::onnx::TypeProto_Opaque* TypeProto::_internal_mutable_opaque_type() {
+  if (!_internal_has_opaque_type()) {
+    clear_value();
+    set_has_opaque_type();
+    _impl_.value_.opaque_type_ = CreateMaybeMessage< ::onnx::TypeProto_Opaque >(GetArenaForAllocation());
+  }
+  return _impl_.value_.opaque_type_;
+}
+inline ::onnx::TypeProto_Opaque* TypeProto::mutable_opaque_type() {
+  ::onnx::TypeProto_Opaque* _msg = _internal_mutable_opaque_type();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.opaque_type)
+  return _msg;
+}
+
+// optional string denotation = 6;
+inline bool TypeProto::_internal_has_denotation() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool TypeProto::has_denotation() const {
+  return _internal_has_denotation();
+}
+inline void TypeProto::clear_denotation() {
+  _impl_.denotation_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& TypeProto::denotation() const {
+  // @@protoc_insertion_point(field_get:onnx.TypeProto.denotation)
+  return _internal_denotation();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void TypeProto::set_denotation(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.denotation_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.TypeProto.denotation)
+}
+inline std::string* TypeProto::mutable_denotation() {
+  std::string* _s = _internal_mutable_denotation();
+  // @@protoc_insertion_point(field_mutable:onnx.TypeProto.denotation)
+  return _s;
+}
+inline const std::string& TypeProto::_internal_denotation() const {
+  return _impl_.denotation_.Get();
+}
+inline void TypeProto::_internal_set_denotation(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.denotation_.Set(value, GetArenaForAllocation());
+}
+inline std::string* TypeProto::_internal_mutable_denotation() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.denotation_.Mutable(GetArenaForAllocation());
+}
+inline std::string* TypeProto::release_denotation() {
+  // @@protoc_insertion_point(field_release:onnx.TypeProto.denotation)
+  if (!_internal_has_denotation()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.denotation_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.denotation_.IsDefault()) {
+    _impl_.denotation_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void TypeProto::set_allocated_denotation(std::string* denotation) {
+  if (denotation != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.denotation_.SetAllocated(denotation, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.denotation_.IsDefault()) {
+    _impl_.denotation_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.TypeProto.denotation)
+}
+
+inline bool TypeProto::has_value() const {
+  return value_case() != VALUE_NOT_SET;
+}
+inline void TypeProto::clear_has_value() {
+  _impl_._oneof_case_[0] = VALUE_NOT_SET;
+}
+inline TypeProto::ValueCase TypeProto::value_case() const {
+  return TypeProto::ValueCase(_impl_._oneof_case_[0]);
+}
+// -------------------------------------------------------------------
+
+// OperatorSetIdProto
+
+// optional string domain = 1;
+inline bool OperatorSetIdProto::_internal_has_domain() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool OperatorSetIdProto::has_domain() const {
+  return _internal_has_domain();
+}
+inline void OperatorSetIdProto::clear_domain() {
+  _impl_.domain_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& OperatorSetIdProto::domain() const {
+  // @@protoc_insertion_point(field_get:onnx.OperatorSetIdProto.domain)
+  return _internal_domain();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void OperatorSetIdProto::set_domain(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.domain_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.OperatorSetIdProto.domain)
+}
+inline std::string* OperatorSetIdProto::mutable_domain() {
+  std::string* _s = _internal_mutable_domain();
+  // @@protoc_insertion_point(field_mutable:onnx.OperatorSetIdProto.domain)
+  return _s;
+}
+inline const std::string& OperatorSetIdProto::_internal_domain() const {
+  return _impl_.domain_.Get();
+}
+inline void OperatorSetIdProto::_internal_set_domain(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.domain_.Set(value, GetArenaForAllocation());
+}
+inline std::string* OperatorSetIdProto::_internal_mutable_domain() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.domain_.Mutable(GetArenaForAllocation());
+}
+inline std::string* OperatorSetIdProto::release_domain() {
+  // @@protoc_insertion_point(field_release:onnx.OperatorSetIdProto.domain)
+  if (!_internal_has_domain()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.domain_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.domain_.IsDefault()) {
+    _impl_.domain_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void OperatorSetIdProto::set_allocated_domain(std::string* domain) {
+  if (domain != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.domain_.SetAllocated(domain, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.domain_.IsDefault()) {
+    _impl_.domain_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.OperatorSetIdProto.domain)
+}
+
+// optional int64 version = 2;
+inline bool OperatorSetIdProto::_internal_has_version() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool OperatorSetIdProto::has_version() const {
+  return _internal_has_version();
+}
+inline void OperatorSetIdProto::clear_version() {
+  _impl_.version_ = int64_t{0};
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline int64_t OperatorSetIdProto::_internal_version() const {
+  return _impl_.version_;
+}
+inline int64_t OperatorSetIdProto::version() const {
+  // @@protoc_insertion_point(field_get:onnx.OperatorSetIdProto.version)
+  return _internal_version();
+}
+inline void OperatorSetIdProto::_internal_set_version(int64_t value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.version_ = value;
+}
+inline void OperatorSetIdProto::set_version(int64_t value) {
+  _internal_set_version(value);
+  // @@protoc_insertion_point(field_set:onnx.OperatorSetIdProto.version)
+}
+
+// -------------------------------------------------------------------
+
+// FunctionProto
+
+// optional string name = 1;
+inline bool FunctionProto::_internal_has_name() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000001u) != 0;
+  return value;
+}
+inline bool FunctionProto::has_name() const {
+  return _internal_has_name();
+}
+inline void FunctionProto::clear_name() {
+  _impl_.name_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000001u;
+}
+inline const std::string& FunctionProto::name() const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.name)
+  return _internal_name();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void FunctionProto::set_name(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000001u;
+ _impl_.name_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.FunctionProto.name)
+}
+inline std::string* FunctionProto::mutable_name() {
+  std::string* _s = _internal_mutable_name();
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.name)
+  return _s;
+}
+inline const std::string& FunctionProto::_internal_name() const {
+  return _impl_.name_.Get();
+}
+inline void FunctionProto::_internal_set_name(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  _impl_.name_.Set(value, GetArenaForAllocation());
+}
+inline std::string* FunctionProto::_internal_mutable_name() {
+  _impl_._has_bits_[0] |= 0x00000001u;
+  return _impl_.name_.Mutable(GetArenaForAllocation());
+}
+inline std::string* FunctionProto::release_name() {
+  // @@protoc_insertion_point(field_release:onnx.FunctionProto.name)
+  if (!_internal_has_name()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000001u;
+  auto* p = _impl_.name_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void FunctionProto::set_allocated_name(std::string* name) {
+  if (name != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000001u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000001u;
+  }
+  _impl_.name_.SetAllocated(name, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.name_.IsDefault()) {
+    _impl_.name_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.FunctionProto.name)
+}
+
+// repeated string input = 4;
+inline int FunctionProto::_internal_input_size() const {
+  return _impl_.input_.size();
+}
+inline int FunctionProto::input_size() const {
+  return _internal_input_size();
+}
+inline void FunctionProto::clear_input() {
+  _impl_.input_.Clear();
+}
+inline std::string* FunctionProto::add_input() {
+  std::string* _s = _internal_add_input();
+  // @@protoc_insertion_point(field_add_mutable:onnx.FunctionProto.input)
+  return _s;
+}
+inline const std::string& FunctionProto::_internal_input(int index) const {
+  return _impl_.input_.Get(index);
+}
+inline const std::string& FunctionProto::input(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.input)
+  return _internal_input(index);
+}
+inline std::string* FunctionProto::mutable_input(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.input)
+  return _impl_.input_.Mutable(index);
+}
+inline void FunctionProto::set_input(int index, const std::string& value) {
+  _impl_.input_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:onnx.FunctionProto.input)
+}
+inline void FunctionProto::set_input(int index, std::string&& value) {
+  _impl_.input_.Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:onnx.FunctionProto.input)
+}
+inline void FunctionProto::set_input(int index, const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.input_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:onnx.FunctionProto.input)
+}
+inline void FunctionProto::set_input(int index, const char* value, size_t size) {
+  _impl_.input_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:onnx.FunctionProto.input)
+}
+inline std::string* FunctionProto::_internal_add_input() {
+  return _impl_.input_.Add();
+}
+inline void FunctionProto::add_input(const std::string& value) {
+  _impl_.input_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.input)
+}
+inline void FunctionProto::add_input(std::string&& value) {
+  _impl_.input_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.input)
+}
+inline void FunctionProto::add_input(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.input_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:onnx.FunctionProto.input)
+}
+inline void FunctionProto::add_input(const char* value, size_t size) {
+  _impl_.input_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:onnx.FunctionProto.input)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+FunctionProto::input() const {
+  // @@protoc_insertion_point(field_list:onnx.FunctionProto.input)
+  return _impl_.input_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+FunctionProto::mutable_input() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.FunctionProto.input)
+  return &_impl_.input_;
+}
+
+// repeated string output = 5;
+inline int FunctionProto::_internal_output_size() const {
+  return _impl_.output_.size();
+}
+inline int FunctionProto::output_size() const {
+  return _internal_output_size();
+}
+inline void FunctionProto::clear_output() {
+  _impl_.output_.Clear();
+}
+inline std::string* FunctionProto::add_output() {
+  std::string* _s = _internal_add_output();
+  // @@protoc_insertion_point(field_add_mutable:onnx.FunctionProto.output)
+  return _s;
+}
+inline const std::string& FunctionProto::_internal_output(int index) const {
+  return _impl_.output_.Get(index);
+}
+inline const std::string& FunctionProto::output(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.output)
+  return _internal_output(index);
+}
+inline std::string* FunctionProto::mutable_output(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.output)
+  return _impl_.output_.Mutable(index);
+}
+inline void FunctionProto::set_output(int index, const std::string& value) {
+  _impl_.output_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:onnx.FunctionProto.output)
+}
+inline void FunctionProto::set_output(int index, std::string&& value) {
+  _impl_.output_.Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:onnx.FunctionProto.output)
+}
+inline void FunctionProto::set_output(int index, const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.output_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:onnx.FunctionProto.output)
+}
+inline void FunctionProto::set_output(int index, const char* value, size_t size) {
+  _impl_.output_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:onnx.FunctionProto.output)
+}
+inline std::string* FunctionProto::_internal_add_output() {
+  return _impl_.output_.Add();
+}
+inline void FunctionProto::add_output(const std::string& value) {
+  _impl_.output_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.output)
+}
+inline void FunctionProto::add_output(std::string&& value) {
+  _impl_.output_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.output)
+}
+inline void FunctionProto::add_output(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.output_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:onnx.FunctionProto.output)
+}
+inline void FunctionProto::add_output(const char* value, size_t size) {
+  _impl_.output_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:onnx.FunctionProto.output)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+FunctionProto::output() const {
+  // @@protoc_insertion_point(field_list:onnx.FunctionProto.output)
+  return _impl_.output_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+FunctionProto::mutable_output() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.FunctionProto.output)
+  return &_impl_.output_;
+}
+
+// repeated string attribute = 6;
+inline int FunctionProto::_internal_attribute_size() const {
+  return _impl_.attribute_.size();
+}
+inline int FunctionProto::attribute_size() const {
+  return _internal_attribute_size();
+}
+inline void FunctionProto::clear_attribute() {
+  _impl_.attribute_.Clear();
+}
+inline std::string* FunctionProto::add_attribute() {
+  std::string* _s = _internal_add_attribute();
+  // @@protoc_insertion_point(field_add_mutable:onnx.FunctionProto.attribute)
+  return _s;
+}
+inline const std::string& FunctionProto::_internal_attribute(int index) const {
+  return _impl_.attribute_.Get(index);
+}
+inline const std::string& FunctionProto::attribute(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.attribute)
+  return _internal_attribute(index);
+}
+inline std::string* FunctionProto::mutable_attribute(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.attribute)
+  return _impl_.attribute_.Mutable(index);
+}
+inline void FunctionProto::set_attribute(int index, const std::string& value) {
+  _impl_.attribute_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set:onnx.FunctionProto.attribute)
+}
+inline void FunctionProto::set_attribute(int index, std::string&& value) {
+  _impl_.attribute_.Mutable(index)->assign(std::move(value));
+  // @@protoc_insertion_point(field_set:onnx.FunctionProto.attribute)
+}
+inline void FunctionProto::set_attribute(int index, const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.attribute_.Mutable(index)->assign(value);
+  // @@protoc_insertion_point(field_set_char:onnx.FunctionProto.attribute)
+}
+inline void FunctionProto::set_attribute(int index, const char* value, size_t size) {
+  _impl_.attribute_.Mutable(index)->assign(
+    reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_set_pointer:onnx.FunctionProto.attribute)
+}
+inline std::string* FunctionProto::_internal_add_attribute() {
+  return _impl_.attribute_.Add();
+}
+inline void FunctionProto::add_attribute(const std::string& value) {
+  _impl_.attribute_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.attribute)
+}
+inline void FunctionProto::add_attribute(std::string&& value) {
+  _impl_.attribute_.Add(std::move(value));
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.attribute)
+}
+inline void FunctionProto::add_attribute(const char* value) {
+  GOOGLE_DCHECK(value != nullptr);
+  _impl_.attribute_.Add()->assign(value);
+  // @@protoc_insertion_point(field_add_char:onnx.FunctionProto.attribute)
+}
+inline void FunctionProto::add_attribute(const char* value, size_t size) {
+  _impl_.attribute_.Add()->assign(reinterpret_cast<const char*>(value), size);
+  // @@protoc_insertion_point(field_add_pointer:onnx.FunctionProto.attribute)
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>&
+FunctionProto::attribute() const {
+  // @@protoc_insertion_point(field_list:onnx.FunctionProto.attribute)
+  return _impl_.attribute_;
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField<std::string>*
+FunctionProto::mutable_attribute() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.FunctionProto.attribute)
+  return &_impl_.attribute_;
+}
+
+// repeated .onnx.AttributeProto attribute_proto = 11;
+inline int FunctionProto::_internal_attribute_proto_size() const {
+  return _impl_.attribute_proto_.size();
+}
+inline int FunctionProto::attribute_proto_size() const {
+  return _internal_attribute_proto_size();
+}
+inline void FunctionProto::clear_attribute_proto() {
+  _impl_.attribute_proto_.Clear();
+}
+inline ::onnx::AttributeProto* FunctionProto::mutable_attribute_proto(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.attribute_proto)
+  return _impl_.attribute_proto_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::AttributeProto >*
+FunctionProto::mutable_attribute_proto() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.FunctionProto.attribute_proto)
+  return &_impl_.attribute_proto_;
+}
+inline const ::onnx::AttributeProto& FunctionProto::_internal_attribute_proto(int index) const {
+  return _impl_.attribute_proto_.Get(index);
+}
+inline const ::onnx::AttributeProto& FunctionProto::attribute_proto(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.attribute_proto)
+  return _internal_attribute_proto(index);
+}
+inline ::onnx::AttributeProto* FunctionProto::_internal_add_attribute_proto() {
+  return _impl_.attribute_proto_.Add();
+}
+inline ::onnx::AttributeProto* FunctionProto::add_attribute_proto() {
+  ::onnx::AttributeProto* _add = _internal_add_attribute_proto();
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.attribute_proto)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::AttributeProto >&
+FunctionProto::attribute_proto() const {
+  // @@protoc_insertion_point(field_list:onnx.FunctionProto.attribute_proto)
+  return _impl_.attribute_proto_;
+}
+
+// repeated .onnx.NodeProto node = 7;
+inline int FunctionProto::_internal_node_size() const {
+  return _impl_.node_.size();
+}
+inline int FunctionProto::node_size() const {
+  return _internal_node_size();
+}
+inline void FunctionProto::clear_node() {
+  _impl_.node_.Clear();
+}
+inline ::onnx::NodeProto* FunctionProto::mutable_node(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.node)
+  return _impl_.node_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeProto >*
+FunctionProto::mutable_node() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.FunctionProto.node)
+  return &_impl_.node_;
+}
+inline const ::onnx::NodeProto& FunctionProto::_internal_node(int index) const {
+  return _impl_.node_.Get(index);
+}
+inline const ::onnx::NodeProto& FunctionProto::node(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.node)
+  return _internal_node(index);
+}
+inline ::onnx::NodeProto* FunctionProto::_internal_add_node() {
+  return _impl_.node_.Add();
+}
+inline ::onnx::NodeProto* FunctionProto::add_node() {
+  ::onnx::NodeProto* _add = _internal_add_node();
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.node)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::NodeProto >&
+FunctionProto::node() const {
+  // @@protoc_insertion_point(field_list:onnx.FunctionProto.node)
+  return _impl_.node_;
+}
+
+// optional string doc_string = 8;
+inline bool FunctionProto::_internal_has_doc_string() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000002u) != 0;
+  return value;
+}
+inline bool FunctionProto::has_doc_string() const {
+  return _internal_has_doc_string();
+}
+inline void FunctionProto::clear_doc_string() {
+  _impl_.doc_string_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000002u;
+}
+inline const std::string& FunctionProto::doc_string() const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.doc_string)
+  return _internal_doc_string();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void FunctionProto::set_doc_string(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000002u;
+ _impl_.doc_string_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.FunctionProto.doc_string)
+}
+inline std::string* FunctionProto::mutable_doc_string() {
+  std::string* _s = _internal_mutable_doc_string();
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.doc_string)
+  return _s;
+}
+inline const std::string& FunctionProto::_internal_doc_string() const {
+  return _impl_.doc_string_.Get();
+}
+inline void FunctionProto::_internal_set_doc_string(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  _impl_.doc_string_.Set(value, GetArenaForAllocation());
+}
+inline std::string* FunctionProto::_internal_mutable_doc_string() {
+  _impl_._has_bits_[0] |= 0x00000002u;
+  return _impl_.doc_string_.Mutable(GetArenaForAllocation());
+}
+inline std::string* FunctionProto::release_doc_string() {
+  // @@protoc_insertion_point(field_release:onnx.FunctionProto.doc_string)
+  if (!_internal_has_doc_string()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000002u;
+  auto* p = _impl_.doc_string_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void FunctionProto::set_allocated_doc_string(std::string* doc_string) {
+  if (doc_string != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000002u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000002u;
+  }
+  _impl_.doc_string_.SetAllocated(doc_string, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.doc_string_.IsDefault()) {
+    _impl_.doc_string_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.FunctionProto.doc_string)
+}
+
+// repeated .onnx.OperatorSetIdProto opset_import = 9;
+inline int FunctionProto::_internal_opset_import_size() const {
+  return _impl_.opset_import_.size();
+}
+inline int FunctionProto::opset_import_size() const {
+  return _internal_opset_import_size();
+}
+inline void FunctionProto::clear_opset_import() {
+  _impl_.opset_import_.Clear();
+}
+inline ::onnx::OperatorSetIdProto* FunctionProto::mutable_opset_import(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.opset_import)
+  return _impl_.opset_import_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::OperatorSetIdProto >*
+FunctionProto::mutable_opset_import() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.FunctionProto.opset_import)
+  return &_impl_.opset_import_;
+}
+inline const ::onnx::OperatorSetIdProto& FunctionProto::_internal_opset_import(int index) const {
+  return _impl_.opset_import_.Get(index);
+}
+inline const ::onnx::OperatorSetIdProto& FunctionProto::opset_import(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.opset_import)
+  return _internal_opset_import(index);
+}
+inline ::onnx::OperatorSetIdProto* FunctionProto::_internal_add_opset_import() {
+  return _impl_.opset_import_.Add();
+}
+inline ::onnx::OperatorSetIdProto* FunctionProto::add_opset_import() {
+  ::onnx::OperatorSetIdProto* _add = _internal_add_opset_import();
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.opset_import)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::OperatorSetIdProto >&
+FunctionProto::opset_import() const {
+  // @@protoc_insertion_point(field_list:onnx.FunctionProto.opset_import)
+  return _impl_.opset_import_;
+}
+
+// optional string domain = 10;
+inline bool FunctionProto::_internal_has_domain() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000004u) != 0;
+  return value;
+}
+inline bool FunctionProto::has_domain() const {
+  return _internal_has_domain();
+}
+inline void FunctionProto::clear_domain() {
+  _impl_.domain_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000004u;
+}
+inline const std::string& FunctionProto::domain() const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.domain)
+  return _internal_domain();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void FunctionProto::set_domain(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000004u;
+ _impl_.domain_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.FunctionProto.domain)
+}
+inline std::string* FunctionProto::mutable_domain() {
+  std::string* _s = _internal_mutable_domain();
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.domain)
+  return _s;
+}
+inline const std::string& FunctionProto::_internal_domain() const {
+  return _impl_.domain_.Get();
+}
+inline void FunctionProto::_internal_set_domain(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  _impl_.domain_.Set(value, GetArenaForAllocation());
+}
+inline std::string* FunctionProto::_internal_mutable_domain() {
+  _impl_._has_bits_[0] |= 0x00000004u;
+  return _impl_.domain_.Mutable(GetArenaForAllocation());
+}
+inline std::string* FunctionProto::release_domain() {
+  // @@protoc_insertion_point(field_release:onnx.FunctionProto.domain)
+  if (!_internal_has_domain()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000004u;
+  auto* p = _impl_.domain_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.domain_.IsDefault()) {
+    _impl_.domain_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void FunctionProto::set_allocated_domain(std::string* domain) {
+  if (domain != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000004u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000004u;
+  }
+  _impl_.domain_.SetAllocated(domain, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.domain_.IsDefault()) {
+    _impl_.domain_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.FunctionProto.domain)
+}
+
+// optional string overload = 13;
+inline bool FunctionProto::_internal_has_overload() const {
+  bool value = (_impl_._has_bits_[0] & 0x00000008u) != 0;
+  return value;
+}
+inline bool FunctionProto::has_overload() const {
+  return _internal_has_overload();
+}
+inline void FunctionProto::clear_overload() {
+  _impl_.overload_.ClearToEmpty();
+  _impl_._has_bits_[0] &= ~0x00000008u;
+}
+inline const std::string& FunctionProto::overload() const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.overload)
+  return _internal_overload();
+}
+template <typename ArgT0, typename... ArgT>
+inline PROTOBUF_ALWAYS_INLINE
+void FunctionProto::set_overload(ArgT0&& arg0, ArgT... args) {
+ _impl_._has_bits_[0] |= 0x00000008u;
+ _impl_.overload_.Set(static_cast<ArgT0 &&>(arg0), args..., GetArenaForAllocation());
+  // @@protoc_insertion_point(field_set:onnx.FunctionProto.overload)
+}
+inline std::string* FunctionProto::mutable_overload() {
+  std::string* _s = _internal_mutable_overload();
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.overload)
+  return _s;
+}
+inline const std::string& FunctionProto::_internal_overload() const {
+  return _impl_.overload_.Get();
+}
+inline void FunctionProto::_internal_set_overload(const std::string& value) {
+  _impl_._has_bits_[0] |= 0x00000008u;
+  _impl_.overload_.Set(value, GetArenaForAllocation());
+}
+inline std::string* FunctionProto::_internal_mutable_overload() {
+  _impl_._has_bits_[0] |= 0x00000008u;
+  return _impl_.overload_.Mutable(GetArenaForAllocation());
+}
+inline std::string* FunctionProto::release_overload() {
+  // @@protoc_insertion_point(field_release:onnx.FunctionProto.overload)
+  if (!_internal_has_overload()) {
+    return nullptr;
+  }
+  _impl_._has_bits_[0] &= ~0x00000008u;
+  auto* p = _impl_.overload_.Release();
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.overload_.IsDefault()) {
+    _impl_.overload_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  return p;
+}
+inline void FunctionProto::set_allocated_overload(std::string* overload) {
+  if (overload != nullptr) {
+    _impl_._has_bits_[0] |= 0x00000008u;
+  } else {
+    _impl_._has_bits_[0] &= ~0x00000008u;
+  }
+  _impl_.overload_.SetAllocated(overload, GetArenaForAllocation());
+#ifdef PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  if (_impl_.overload_.IsDefault()) {
+    _impl_.overload_.Set("", GetArenaForAllocation());
+  }
+#endif // PROTOBUF_FORCE_COPY_DEFAULT_STRING
+  // @@protoc_insertion_point(field_set_allocated:onnx.FunctionProto.overload)
+}
+
+// repeated .onnx.ValueInfoProto value_info = 12;
+inline int FunctionProto::_internal_value_info_size() const {
+  return _impl_.value_info_.size();
+}
+inline int FunctionProto::value_info_size() const {
+  return _internal_value_info_size();
+}
+inline void FunctionProto::clear_value_info() {
+  _impl_.value_info_.Clear();
+}
+inline ::onnx::ValueInfoProto* FunctionProto::mutable_value_info(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.value_info)
+  return _impl_.value_info_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >*
+FunctionProto::mutable_value_info() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.FunctionProto.value_info)
+  return &_impl_.value_info_;
+}
+inline const ::onnx::ValueInfoProto& FunctionProto::_internal_value_info(int index) const {
+  return _impl_.value_info_.Get(index);
+}
+inline const ::onnx::ValueInfoProto& FunctionProto::value_info(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.value_info)
+  return _internal_value_info(index);
+}
+inline ::onnx::ValueInfoProto* FunctionProto::_internal_add_value_info() {
+  return _impl_.value_info_.Add();
+}
+inline ::onnx::ValueInfoProto* FunctionProto::add_value_info() {
+  ::onnx::ValueInfoProto* _add = _internal_add_value_info();
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.value_info)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::ValueInfoProto >&
+FunctionProto::value_info() const {
+  // @@protoc_insertion_point(field_list:onnx.FunctionProto.value_info)
+  return _impl_.value_info_;
+}
+
+// repeated .onnx.StringStringEntryProto metadata_props = 14;
+inline int FunctionProto::_internal_metadata_props_size() const {
+  return _impl_.metadata_props_.size();
+}
+inline int FunctionProto::metadata_props_size() const {
+  return _internal_metadata_props_size();
+}
+inline void FunctionProto::clear_metadata_props() {
+  _impl_.metadata_props_.Clear();
+}
+inline ::onnx::StringStringEntryProto* FunctionProto::mutable_metadata_props(int index) {
+  // @@protoc_insertion_point(field_mutable:onnx.FunctionProto.metadata_props)
+  return _impl_.metadata_props_.Mutable(index);
+}
+inline ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >*
+FunctionProto::mutable_metadata_props() {
+  // @@protoc_insertion_point(field_mutable_list:onnx.FunctionProto.metadata_props)
+  return &_impl_.metadata_props_;
+}
+inline const ::onnx::StringStringEntryProto& FunctionProto::_internal_metadata_props(int index) const {
+  return _impl_.metadata_props_.Get(index);
+}
+inline const ::onnx::StringStringEntryProto& FunctionProto::metadata_props(int index) const {
+  // @@protoc_insertion_point(field_get:onnx.FunctionProto.metadata_props)
+  return _internal_metadata_props(index);
+}
+inline ::onnx::StringStringEntryProto* FunctionProto::_internal_add_metadata_props() {
+  return _impl_.metadata_props_.Add();
+}
+inline ::onnx::StringStringEntryProto* FunctionProto::add_metadata_props() {
+  ::onnx::StringStringEntryProto* _add = _internal_add_metadata_props();
+  // @@protoc_insertion_point(field_add:onnx.FunctionProto.metadata_props)
+  return _add;
+}
+inline const ::PROTOBUF_NAMESPACE_ID::RepeatedPtrField< ::onnx::StringStringEntryProto >&
+FunctionProto::metadata_props() const {
+  // @@protoc_insertion_point(field_list:onnx.FunctionProto.metadata_props)
+  return _impl_.metadata_props_;
+}
+
+#ifdef __GNUC__
+  #pragma GCC diagnostic pop
+#endif  // __GNUC__
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+// -------------------------------------------------------------------
+
+
+// @@protoc_insertion_point(namespace_scope)
+
+}  // namespace onnx
+
+PROTOBUF_NAMESPACE_OPEN
+
+template <> struct is_proto_enum< ::onnx::AttributeProto_AttributeType> : ::std::true_type {};
+template <>
+inline const EnumDescriptor* GetEnumDescriptor< ::onnx::AttributeProto_AttributeType>() {
+  return ::onnx::AttributeProto_AttributeType_descriptor();
+}
+template <> struct is_proto_enum< ::onnx::TensorProto_DataType> : ::std::true_type {};
+template <>
+inline const EnumDescriptor* GetEnumDescriptor< ::onnx::TensorProto_DataType>() {
+  return ::onnx::TensorProto_DataType_descriptor();
+}
+template <> struct is_proto_enum< ::onnx::TensorProto_DataLocation> : ::std::true_type {};
+template <>
+inline const EnumDescriptor* GetEnumDescriptor< ::onnx::TensorProto_DataLocation>() {
+  return ::onnx::TensorProto_DataLocation_descriptor();
+}
+template <> struct is_proto_enum< ::onnx::Version> : ::std::true_type {};
+template <>
+inline const EnumDescriptor* GetEnumDescriptor< ::onnx::Version>() {
+  return ::onnx::Version_descriptor();
+}
+template <> struct is_proto_enum< ::onnx::OperatorStatus> : ::std::true_type {};
+template <>
+inline const EnumDescriptor* GetEnumDescriptor< ::onnx::OperatorStatus>() {
+  return ::onnx::OperatorStatus_descriptor();
+}
+
+PROTOBUF_NAMESPACE_CLOSE
+
+// @@protoc_insertion_point(global_scope)
+
+#include <google/protobuf/port_undef.inc>
+#endif  // GOOGLE_PROTOBUF_INCLUDED_GOOGLE_PROTOBUF_INCLUDED_onnx_2fonnx_2dml_2eproto
@@ -0,0 +1,4 @@
+# This file is generated by setup.py. DO NOT EDIT!
+
+
+from .onnx_operators_ml_pb2 import *  # noqa
@@ -3,6 +3,22 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-__all__ = ["ReferenceEvaluator"]
+__all__ = ["ProcessPoolEvaluator", "ReferenceEvaluator"]
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from onnx.reference.reference_evaluator import ReferenceEvaluator
+
+if TYPE_CHECKING:
+    from onnx.reference._process_pool import ProcessPoolEvaluator
+
+
+def __getattr__(name: str) -> Any:
+    # ProcessPoolEvaluator is imported the first time it is used,
+    # its module imports multiprocessing.
+    if name == "ProcessPoolEvaluator":
+        return importlib.import_module(
+            "onnx.reference._process_pool"
+        ).ProcessPoolEvaluator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
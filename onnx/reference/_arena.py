@@ -0,0 +1,219 @@
+# Copyright (c) ONNX Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Recycles the buffers the kernels write their outputs into,
+see parameter *reuse_buffers* of :class:`ReferenceEvaluator
+<onnx.reference.ReferenceEvaluator>`.
+
+The first run of a plan records the shape and the type of every output
+and which results share the same memory (a view returned by Reshape or
+Transpose keeps the buffer of its input alive). The arena then plans
+the buffers like a register allocator: a step receives a buffer of the
+same shape and type as the result it produced last time, a buffer becomes
+available again once every result sharing its memory was released.
+The next runs give these buffers to the kernels accepting argument `out`
+(see attribute :attr:`OpRun.supports_out
+<onnx.reference.op_run.OpRun.supports_out>`), a model with fixed shapes
+then almost does not allocate anything.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from onnx.reference._execution_plan import ExecutionPlan
+
+
+def _root(value: np.ndarray) -> np.ndarray:
+    """Returns the array owning the memory of *value*."""
+    while isinstance(value.base, np.ndarray):
+        value = value.base
+    return value
+
+
+class Arena:
+    """Buffers recycled across the runs of one execution plan.
+
+    Args:
+        plan: execution plan
+
+    An arena is used by one run at a time. Attribute `specs` holds,
+    for every step, the shape and the type of its first output observed
+    by the last recording run, `assignment` the buffer planned for every
+    step (None if the step does not receive any), `buffers` the buffers.
+    Every run tracks the slots holding a buffer or a view of it,
+    a slot stops holding it once the plan releases it (see
+    :meth:`release`). A buffer still held by a slot is not given
+    to a kernel, a new array is then allocated.
+    """
+
+    def __init__(self, plan: ExecutionPlan) -> None:
+        self.plan = plan
+        self.eligible = [
+            node.supports_out
+            and bool(node.output)
+            and bool(node.output[0])
+            and output_slots[0] in plan.releasable
+            for node, _, output_slots, *_ in plan.steps
+        ]
+        self.specs: list[tuple[tuple[int, ...], np.dtype] | None] = [None] * len(
+            plan.steps
+        )
+        self.assignment: list[int | None] = [None] * len(plan.steps)
+        self.buffers: list[np.ndarray] = []
+        self.recording = True
+        self._stale = False
+        # Filled by a recording run, slot -> group, group -> slots,
+        # id of an array -> (weak reference, group).
+        self._roots: dict[int, int] = {}
+        self._groups: dict[int, set[int]] = {}
+        self._keys: dict[int, tuple[weakref.ref, int]] = {}
+        self._n_keys = 0
+        # Filled by the other runs, id of a buffer -> index,
+        # slots holding every buffer, slot -> index of the buffer it holds.
+        self._indices: dict[int, int] = {}
+        self._holders: list[set[int]] = []
+        self._held: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.buffers)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the size of all buffers."""
+        return sum(buffer.nbytes for buffer in self.buffers)
+
+    def acquire(self, step: int) -> np.ndarray | None:
+        """Returns the buffer planned for *step*, None if there is none
+        or if it is still used by a result.
+        """
+        index = self.assignment[step]
+        if self.recording or index is None or self._holders[index]:
+            return None
+        return self.buffers[index]
+
+    def owner(self, value: Any) -> int | None:
+        """Returns the index of the buffer *value* shares its memory with,
+        None if it does not share any.
+        """
+        if not isinstance(value, np.ndarray):
+            return None
+        value = _root(value)
+        index = self._indices.get(id(value))
+        if index is None or self.buffers[index] is not value:
+            return None
+        return index
+
+    def release(self, slots: tuple[int, ...]) -> None:
+        """Tells the arena the plan released *slots*."""
+        for slot in slots:
+            index = self._held.pop(slot, None)
+            if index is not None:
+                self._holders[index].discard(slot)
+
+    def _key(self, value: np.ndarray) -> int:
+        """Returns the group of the array owning the memory of *value*,
+        the identifier of an array may be reused once it is deleted.
+        """
+        value = _root(value)
+        ref, key = self._keys.get(id(value), (None, -1))
+        if ref is None or ref() is not value:
+            key = self._n_keys
+            self._n_keys += 1
+            self._keys[id(value)] = (weakref.ref(value), key)
+        return key
+
+    def observe(self, step: int, output_slots: tuple[int, ...], outputs: Any) -> None:
+        """Checks the outputs of *step* match the plan, records them
+        while the arena is recording.
+        """
+        if self.recording:
+            for slot, value in zip(output_slots, outputs, strict=False):
+                if isinstance(value, np.ndarray):
+                    # Slots sharing the same memory belong to the same group.
+                    key = self._key(value)
+                    self._roots[slot] = key
+                    self._groups.setdefault(key, set()).add(slot)
+            if self.eligible[step] and outputs and isinstance(outputs[0], np.ndarray):
+                self.specs[step] = (outputs[0].shape, outputs[0].dtype)
+            return
+        for slot, value in zip(output_slots, outputs, strict=False):
+            index = self.owner(value)
+            if index is not None:
+                self._holders[index].add(slot)
+                self._held[slot] = index
+        spec = self.specs[step]
+        if spec is not None and (
+            not isinstance(outputs[0], np.ndarray)
+            or outputs[0].shape != spec[0]
+            or outputs[0].dtype != spec[1]
+        ):
+            # The shapes changed, the next run records them again.
+            self._stale = True
+
+    def start(self) -> None:
+        """Prepares a run, the buffers are planned after a recording run."""
+        if self.recording:
+            self.specs = [None] * len(self.plan.steps)
+        for holders in self._holders:
+            holders.clear()
+        self._held.clear()
+
+    def finish(self) -> None:
+        """Plans the buffers once a recording run is complete."""
+        if self.recording:
+            self._assign()
+            self.recording = False
+        elif self._stale:
+            self.recording = True
+            self._stale = False
+        self._roots.clear()
+        self._groups.clear()
+        self._keys.clear()
+
+    def _assign(self) -> None:
+        releasable = self.plan.releasable
+        free: dict[tuple[tuple[int, ...], np.dtype], list[int]] = {}
+        specs: list[tuple[tuple[int, ...], np.dtype]] = []
+        # Slots of a group still alive and the buffer the group holds.
+        alive: dict[int, set[int]] = {}
+        held: dict[int, int] = {}
+        assignment: list[int | None] = [None] * len(self.plan.steps)
+        for step, (_, _, output_slots, released, *_) in enumerate(self.plan.steps):
+            spec = self.specs[step]
+            key = self._roots.get(output_slots[0], -1)
+            group = self._groups.get(key, set())
+            if spec is not None and key not in held and group <= releasable:
+                pool = free.get(spec)
+                if pool:
+                    index = pool.pop()
+                else:
+                    index = len(specs)
+                    specs.append(spec)
+                assignment[step] = index
+                held[key] = index
+                alive[key] = set(group)
+            for slot in released:
+                key = self._roots.get(slot, -1)
+                if key not in alive:
+                    continue
+                alive[key].discard(slot)
+                if not alive[key]:
+                    del alive[key]
+                    index = held.pop(key)
+                    free.setdefault(specs[index], []).append(index)
+        self.assignment = assignment
+        # The buffers of the previous plan are kept when possible.
+        previous: dict[tuple[tuple[int, ...], np.dtype], list[np.ndarray]] = {}
+        for buffer in self.buffers:
+            previous.setdefault((buffer.shape, buffer.dtype), []).append(buffer)
+        self.buffers = [
+            previous[spec].pop() if previous.get(spec) else np.empty(*spec)
+            for spec in specs
+        ]
+        self._indices = {id(buffer): i for i, buffer in enumerate(self.buffers)}
+        self._holders = [set() for _ in self.buffers]
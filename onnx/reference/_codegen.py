@@ -0,0 +1,137 @@
+# Copyright (c) ONNX Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Converts an :class:`ExecutionPlan <onnx.reference._execution_plan.ExecutionPlan>`
+into a straight-line python function. Every result becomes a local variable,
+every kernel is called directly without going through method `OpRun.run`
+when it only checks the inputs and the outputs
+(see method :meth:`OpRun.direct_call <onnx.reference.op_run.OpRun.direct_call>`).
+"""
+
+from __future__ import annotations
+
+import itertools
+import linecache
+import math
+from typing import TYPE_CHECKING, Any
+
+from onnx.reference.op_run import _fix_outputs
+
+if TYPE_CHECKING:
+    from onnx.reference._execution_plan import ExecutionPlan
+
+_counter = itertools.count()
+
+
+def _literal(value: Any) -> str | None:
+    """Returns the python literal for a constant, None if there is none."""
+    if value is None or isinstance(value, (bool, int, str)):
+        return repr(value)
+    if isinstance(value, float) and math.isfinite(value):
+        return repr(value)
+    if isinstance(value, tuple) and all(_literal(v) is not None for v in value):
+        return repr(value)
+    return None
+
+
+class CompiledPlan:
+    """Python function generated for an execution plan.
+
+    Args:
+        plan: the plan to compile
+        name: name of the generated function
+
+    The function takes the list of slots filled with the inputs
+    and the initializers (see method `run`) and the attributes
+    of the function the graph belongs to. It stores the outputs
+    in their slots. Attribute `source` holds its source code,
+    the code is registered in :mod:`linecache` so that tracebacks
+    and profilers show the generated lines.
+    """
+
+    def __init__(self, plan: ExecutionPlan, name: str = "graph") -> None:
+        self.name = name
+        self.filename = f"<onnx-reference-{name}-{next(_counter)}>"
+        namespace: dict[str, Any] = {"_fix_outputs": _fix_outputs}
+        self.source = self._generate(plan, namespace)
+        code = compile(self.source, self.filename, "exec")
+        linecache.cache[self.filename] = (
+            len(self.source),
+            None,
+            self.source.splitlines(keepends=True),
+            self.filename,
+        )
+        exec(code, namespace)
+        self.function = namespace[name]
+
+    def __call__(
+        self, values: list[Any], attributes: dict[str, Any] | None = None
+    ) -> None:
+        self.function(values, attributes)
+
+    def _generate(self, plan: ExecutionPlan, namespace: dict[str, Any]) -> str:
+        names = {slot: name for name, slot in plan.slots.items()}
+        produced: set[int] = set()
+        loaded: set[int] = set()
+        lines = [f"def {self.name}(values, attributes):"]
+        body: list[str] = []
+
+        def _var(slot: int) -> str:
+            if slot == 0:
+                return "None"
+            if slot not in produced and slot not in loaded:
+                loaded.add(slot)
+                lines.append(f"    v{slot} = values[{slot}]  # {names[slot]!r}")
+            return f"v{slot}"
+
+        for index, step in enumerate(plan.steps):
+            node, input_slots, output_slots, released, context, linked = step
+            body.append(
+                f"    # {index}: {node.op_type}({list(node.input)!r}) "
+                f"-> {list(node.output)!r}"
+            )
+            args = [_var(slot) for slot in input_slots]
+            direct = node.direct_call()
+            if direct is None:
+                namespace[f"n{index}"] = node.run
+                if linked:
+                    args.append("linked_attributes=attributes")
+                if context is not None:
+                    items = ", ".join(
+                        f"{name!r}: {_var(slot)}"
+                        for name, slot in dict(context).items()
+                    )
+                    args.append(f"context={{{items}}}")
+                call = f"n{index}({', '.join(args)})"
+            else:
+                fct, kwargs = direct
+                namespace[f"n{index}"] = fct
+                for att, value in kwargs.items():
+                    literal = _literal(value)
+                    if literal is None:
+                        namespace[f"a{index}_{att}"] = value
+                        literal = f"a{index}_{att}"
+                    args.append(f"{att}={literal}")
+                call = f"_fix_outputs(n{index}({', '.join(args)}))"
+            outputs = [
+                (i, slot)
+                for i, (name, slot) in enumerate(
+                    zip(node.output, output_slots, strict=True)
+                )
+                if name
+            ]
+            if len(outputs) == 1 and outputs[0][0] == 0:
+                body.append(f"    v{outputs[0][1]} = {call}[0]")
+            else:
+                body.append(f"    res = {call}")
+                body.extend(f"    v{slot} = res[{i}]" for i, slot in outputs)
+            produced.update(slot for _, slot in outputs)
+            body.extend(f"    del v{slot}" for slot in released if slot in produced)
+
+        output_slots = plan.output_slots or ()
+        body.extend(
+            f"    values[{slot}] = v{slot}" for slot in output_slots if slot in produced
+        )
+        if len(lines) + len(body) == 1:
+            body.append("    pass")
+        return "\n".join([*lines, *body, ""])
@@ -0,0 +1,242 @@
+# Copyright (c) ONNX Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Compiled representation of the nodes :class:`ReferenceEvaluator
+<onnx.reference.ReferenceEvaluator>` executes to compute a set of outputs.
+Every result name is replaced by an integer (a slot) in a flat list of values
+so that running the plan does not need any dictionary.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import onnx
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from onnx.reference._arena import Arena
+    from onnx.reference._codegen import CompiledPlan
+    from onnx.reference.op_run import OpRun
+
+
+class _Missing:
+    """Marks a slot no value was assigned to."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+def graph_hidden_inputs(graph: onnx.GraphProto) -> set[str]:
+    """Returns the names a subgraph takes from the outer scope,
+    including the ones its own subgraphs access.
+    """
+    known = {i.name for i in graph.input}
+    known |= {i.name for i in graph.initializer}
+    known |= {i.name for i in graph.sparse_initializer}
+    hidden = set()
+    for node in graph.node:
+        for name in node_consumed_names(node):
+            if name not in known:
+                hidden.add(name)
+        known |= set(node.output)
+    return hidden
+
+
+def node_consumed_names(node: onnx.NodeProto) -> list[str]:
+    """Returns the names a node reads, explicit inputs first, then
+    the names its subgraphs access from the outer scope.
+    """
+    names = [i for i in node.input if i]
+    for att in node.attribute:
+        if att.type == onnx.AttributeProto.GRAPH:
+            names.extend(sorted(graph_hidden_inputs(att.g)))
+        elif att.type == onnx.AttributeProto.GRAPHS:
+            for g in att.graphs:
+                names.extend(sorted(graph_hidden_inputs(g)))
+    return names
+
+
+def compute_last_use(
+    nodes: Sequence[OpRun], consumed: Sequence[Sequence[str]], keep: set[str]
+) -> list[list[str]]:
+    """Returns, for every node, the intermediate results which are not
+    needed anymore once this node was executed. Results in *keep* are
+    never released. A node with a subgraph consumes every result
+    its subgraph implicitly accesses.
+    """
+    produced = set()
+    for node in nodes:
+        produced.update(node.output)
+    produced -= keep
+    produced.discard("")
+    last_use: dict[str, int] = {}
+    for i, node in enumerate(nodes):
+        for name in consumed[i]:
+            if name in produced:
+                last_use[name] = i
+        for name in node.output:
+            if name in produced and name not in last_use:
+                # Unused result, it can be released just after it is produced.
+                last_use[name] = i
+    release: list[list[str]] = [[] for _ in nodes]
+    for name, i in last_use.items():
+        release[i].append(name)
+    return release
+
+
+class ExecutionPlan:
+    """Nodes to execute to compute a given set of outputs,
+    every name is resolved into a slot.
+
+    Args:
+        nodes: nodes to execute, in the graph order
+        consumed: for every node, the names it reads
+            (see :func:`node_consumed_names`)
+        keep: results which must not be released
+        inits: initializers the nodes need
+        outputs: requested outputs, None if the caller
+            collects all results
+
+    Attribute `arenas` holds the buffers recycled by the runs of the plan
+    (see :class:`Arena <onnx.reference._arena.Arena>`), one per run
+    executed at the same time.
+
+    Attribute `compiled` holds the python function generated for the plan
+    once it was requested (see :class:`CompiledPlan
+    <onnx.reference._codegen.CompiledPlan>`).
+
+    Attribute `steps` holds one tuple per node
+    `(node, input slots, output slots, released slots, context, linked)`.
+    `context` is None if the node does not need any context, otherwise
+    it is a tuple of `(name, slot)` the node may access. `linked` tells
+    if the node has linked attributes.
+
+    The dependency graph between the steps is also stored to execute
+    them out of order: `n_predecessors[i]` is the number of steps
+    producing a result step *i* reads, `successors[i]` the steps reading
+    a result step *i* produces. Released slots cannot be used in that case
+    since the last reader depends on the execution order, `reads[i]` gives
+    the releasable slots step *i* reads and `n_readers[slot]` the number
+    of steps reading that slot, `releasable` is the set of all
+    releasable slots.
+    """
+
+    __slots__ = (
+        "arenas",
+        "compiled",
+        "consumed",
+        "free",
+        "initial",
+        "inits",
+        "n_predecessors",
+        "n_readers",
+        "nodes",
+        "output_slots",
+        "outputs",
+        "reads",
+        "releasable",
+        "release",
+        "slots",
+        "steps",
+        "successors",
+    )
+
+    def __init__(
+        self,
+        nodes: list[OpRun],
+        consumed: list[list[str]],
+        keep: set[str],
+        inits: dict[str, Any],
+        outputs: Sequence[str] | None,
+    ) -> None:
+        self.nodes = nodes
+        self.consumed = consumed
+        self.inits = list(inits)
+        # Python function generated for this plan, see module _codegen.
+        self.compiled: CompiledPlan | None = None
+        # Buffers recycled by the runs of this plan, see module _arena.
+        self.arenas: list[Arena] = []
+        self.outputs = None if outputs is None else list(outputs)
+        self.release = compute_last_use(nodes, consumed, keep)
+
+        # Slot 0 is the empty name used for a missing optional input.
+        slots: dict[str, int] = {"": 0}
+
+        def _slot(name: str) -> int:
+            if name not in slots:
+                slots[name] = len(slots)
+            return slots[name]
+
+        for name in inits:
+            _slot(name)
+        free = {}
+        produced = set(inits)
+        for node, names in zip(nodes, consumed, strict=True):
+            for name in names:
+                if name not in produced and name not in free:
+                    free[name] = _slot(name)
+            for name in node.output:
+                _slot(name)
+                produced.add(name)
+        for name in keep:
+            _slot(name)
+        self.slots = slots
+        self.free = list(free.items())
+
+        # One extra slot receives the outputs a node does not name.
+        discard = len(slots)
+        self.initial: list[Any] = [MISSING] * (len(slots) + 1)
+        self.initial[0] = None
+        for name, value in inits.items():
+            self.initial[slots[name]] = value
+        self.output_slots = (
+            None if outputs is None else tuple(slots[name] for name in outputs)
+        )
+
+        steps = []
+        for node, names, release in zip(nodes, consumed, self.release, strict=True):
+            context = (
+                tuple((name, slots[name]) for name in names)
+                if node.need_context()
+                else None
+            )
+            steps.append(
+                (
+                    node,
+                    tuple(slots[name] for name in node.input),
+                    tuple(slots[name] if name else discard for name in node.output),
+                    tuple(slots[name] for name in release),
+                    context,
+                    node.has_linked_attribute,
+                )
+            )
+        self.steps = steps
+
+        producer: dict[str, int] = {}
+        successors: list[set[int]] = [set() for _ in nodes]
+        self.n_predecessors = [0] * len(nodes)
+        releasable = {slots[name] for names in self.release for name in names}
+        self.releasable = frozenset(releasable)
+        self.n_readers = [0] * len(self.initial)
+        self.reads = []
+        for i, (node, names) in enumerate(zip(nodes, consumed, strict=True)):
+            predecessors = {producer[name] for name in names if name in producer}
+            for p in predecessors:
+                successors[p].add(i)
+            self.n_predecessors[i] = len(predecessors)
+            reads = tuple({slots[name] for name in names} & releasable)
+            for slot in reads:
+                self.n_readers[slot] += 1
+            self.reads.append(reads)
+            for name in node.output:
+                if name:
+                    producer[name] = i
+        self.successors = [tuple(sorted(s)) for s in successors]
+
+    def __len__(self) -> int:
+        return len(self.steps)
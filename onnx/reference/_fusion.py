@@ -0,0 +1,252 @@
+# Copyright (c) ONNX Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Fuses chains of elementwise operators, see parameter *fuse_elementwise*
+of :class:`ReferenceEvaluator <onnx.reference.ReferenceEvaluator>`.
+
+A chain is a sequence of unary or binary elementwise nodes where every
+node consumes the only output of the previous one and nobody else does.
+The first node allocates the result, the following ones write into it
+with the argument `out` of the numpy ufuncs. Every step computes exactly
+what the kernel it replaces computes, the results are bitwise identical.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from onnx import helper
+from onnx.reference._execution_plan import node_consumed_names
+from onnx.reference.op_run import OpRun
+from onnx.reference.ops.op_sigmoid import sigmoid
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Element types the fused chain handles, every other type runs
+# the original kernels (integer division, overflow, ml_dtypes...).
+_FLOAT_TYPES = {np.dtype(np.float16), np.dtype(np.float32), np.dtype(np.float64)}
+
+# Index standing for the result of the previous step in the arguments of a step.
+_PREVIOUS = -1
+
+
+def _sqrt(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        return np.sqrt(x, out=out)
+
+
+def _reciprocal(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    with np.errstate(divide="ignore"):
+        return np.reciprocal(x, out=out)
+
+
+def _relu(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    return np.maximum(x, 0, out=out)
+
+
+def _sigmoid(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    return sigmoid(x, out=np.empty_like(x) if out is None else out)
+
+
+def _softplus(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    if out is None:
+        out = np.empty_like(x)
+    np.exp(x, out=out)
+    np.add(out, 1, out=out)
+    return np.log(out, out=out)
+
+
+def _pow(x: np.ndarray, y: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    with np.errstate(all="ignore"):
+        return np.power(x, y, out=out)
+
+
+# Operators computed in place, the function has the signature of a ufunc.
+_UNARY: dict[str, Callable[..., np.ndarray]] = {
+    "Abs": np.absolute,
+    "Ceil": np.ceil,
+    "Cos": np.cos,
+    "Exp": np.exp,
+    "Floor": np.floor,
+    "Log": np.log,
+    "Neg": np.negative,
+    "Reciprocal": _reciprocal,
+    "Relu": _relu,
+    "Sigmoid": _sigmoid,
+    "Sin": np.sin,
+    "Softplus": _softplus,
+    "Sqrt": _sqrt,
+    "Tanh": np.tanh,
+}
+
+_BINARY: dict[str, Callable[..., np.ndarray]] = {
+    "Add": np.add,
+    "Div": np.divide,
+    "Mul": np.multiply,
+    "Pow": _pow,
+    "Sub": np.subtract,
+}
+
+# Operators without an in place implementation, the kernel is called
+# and its result, a new array, becomes the buffer of the next steps.
+_KERNELS = {"Erf"}
+
+
+def _is_fusable(node: OpRun) -> bool:
+    """Tells if a node can be part of a chain, the implementation must
+    be the one of this package, an operator given in *new_ops* may
+    compute something else.
+    """
+    if node.domain not in {"", "ai.onnx"} or node.has_linked_attribute:
+        return False
+    if node.op_type in _UNARY or node.op_type in _KERNELS:
+        n_inputs = 1
+    elif node.op_type in _BINARY:
+        n_inputs = 2
+    else:
+        return False
+    return (
+        type(node).__module__.startswith("onnx.reference.ops.")
+        and len(node.input) == n_inputs
+        and all(node.input)
+        and len(node.output) == 1
+        and bool(node.output[0])
+    )
+
+
+class FusedElementwise(OpRun):
+    """Executes a chain of elementwise nodes over a single buffer.
+
+    Args:
+        onnx_node: node with the inputs the chain reads from outside
+            and the output of the last node
+        run_params: see :class:`OpRun <onnx.reference.op_run.OpRun>`
+        nodes: the nodes of the chain, they are executed one after
+            another if the inputs are not floats of the same type
+    """
+
+    op_domain = "ai.onnx.reference"
+
+    def __init__(
+        self,
+        onnx_node: Any,
+        run_params: dict[str, Any],
+        nodes: list[OpRun],
+    ) -> None:
+        OpRun.__init__(self, onnx_node, run_params)
+        self.nodes = nodes
+        positions = {name: i for i, name in enumerate(onnx_node.input)}
+        previous = None
+        steps = []
+        for node in nodes:
+            args = tuple(
+                _PREVIOUS if name == previous else positions[name]
+                for name in node.input
+            )
+            if node.op_type in _KERNELS:
+                steps.append((None, args, node))
+            else:
+                fct = _UNARY.get(node.op_type) or _BINARY[node.op_type]
+                steps.append((fct, args, node))
+            previous = node.output[0]
+        self.steps = steps
+        if run_params.get("trusted", False):
+            self.make_trusted()
+
+    def _run(self, *inputs):
+        if not all(
+            isinstance(x, np.ndarray) and x.dtype in _FLOAT_TYPES for x in inputs
+        ) or any(x.dtype != inputs[0].dtype for x in inputs):
+            return self._run_unfused(*inputs)
+        buffer = None
+        for fct, args, node in self.steps:
+            operands = [buffer if i == _PREVIOUS else inputs[i] for i in args]
+            if fct is None:
+                buffer = np.asarray(node._run(*operands)[0])
+                continue
+            out = buffer
+            if out is not None and any(
+                x.shape != out.shape
+                and np.broadcast_shapes(out.shape, x.shape) != out.shape
+                for x in operands
+            ):
+                # The result is bigger than the buffer.
+                out = None
+            # A ufunc returns a scalar when every operand is a 0-d array.
+            buffer = np.asarray(fct(*operands, out=out))
+        return (buffer,)
+
+    def _run_unfused(self, *inputs):
+        values = dict(zip(self.input, inputs, strict=True))
+        for node in self.nodes:
+            values[node.output[0]] = node.run(*(values[i] for i in node.input))[0]
+        return (values[self.output[0]],)
+
+
+def fuse_elementwise(
+    nodes: list[OpRun], outputs: list[str], run_params: dict[str, Any]
+) -> list[OpRun]:
+    """Replaces every chain of at least two elementwise nodes
+    by a node :class:`FusedElementwise`.
+
+    Args:
+        nodes: nodes sorted in a topological order
+        outputs: names which must remain visible, usually the graph outputs
+        run_params: parameters given to the new nodes
+
+    Returns:
+        the new list of nodes, a fused node takes the place
+        of the last node of its chain
+    """
+    consumers: Counter[str] = Counter()
+    for node in nodes:
+        consumers.update(set(node_consumed_names(node.onnx_node)))
+    visible = set(outputs)
+    fusable = {i for i, node in enumerate(nodes) if _is_fusable(node)}
+    producer = {nodes[i].output[0]: i for i in fusable}
+
+    # next_node[i] is the node continuing the chain after node i.
+    next_node: dict[int, int] = {}
+    for j in sorted(fusable):
+        for name in dict.fromkeys(nodes[j].input):
+            i = producer.get(name)
+            if i is not None and consumers[name] == 1 and name not in visible:
+                next_node[i] = j
+                # A node continues one chain at most.
+                break
+
+    replaced: dict[int, OpRun | None] = {}
+    for head in sorted(set(next_node) - set(next_node.values())):
+        chain = [head]
+        while chain[-1] in next_node:
+            chain.append(next_node[chain[-1]])
+        chain_nodes = [nodes[i] for i in chain]
+        hidden = {node.output[0] for node in chain_nodes[:-1]}
+        inputs: list[str] = []
+        for node in chain_nodes:
+            inputs.extend(
+                name for name in node.input if name not in hidden and name not in inputs
+            )
+        onnx_node = helper.make_node(
+            "FusedElementwise",
+            inputs,
+            [chain_nodes[-1].output[0]],
+            name=chain_nodes[-1].onnx_node.name,
+            domain=FusedElementwise.op_domain,
+            doc_string="->".join(node.op_type for node in chain_nodes),
+        )
+        for i in chain[:-1]:
+            replaced[i] = None
+        replaced[chain[-1]] = FusedElementwise(onnx_node, run_params, chain_nodes)
+
+    new_nodes = []
+    for i, node in enumerate(nodes):
+        if i not in replaced:
+            new_nodes.append(node)
+        elif replaced[i] is not None:
+            new_nodes.append(replaced[i])
+    return new_nodes
@@ -0,0 +1,344 @@
+# Copyright (c) ONNX Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Runs a model over a pool of processes, see :class:`ProcessPoolEvaluator`.
+
+Every worker builds its own :class:`ReferenceEvaluator
+<onnx.reference.ReferenceEvaluator>` once when it starts and keeps it for
+all the following runs. A run splits the batch into one shard per worker.
+The inputs are copied once into shared memory blocks, a worker reads its
+shard directly from them. It writes its outputs into new blocks the parent
+process concatenates. Only the names of the blocks and the shapes
+go through the pipes, the arrays are never pickled, except the arrays
+of objects (strings). A run which cannot be split is executed by one
+worker. The parent process never builds any evaluator, it only reads
+the names and the types of the inputs and the outputs from the model.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import get_context, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+import onnx
+from onnx.onnx_pb import ModelProto
+from onnx.reference.reference_evaluator import ReferenceEvaluator, _batch_dimension
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from types import EllipsisType
+
+    from typing_extensions import Self
+
+
+class _SharedArray(NamedTuple):
+    """Array stored in a shared memory block."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: np.dtype
+
+
+def _share(value: np.ndarray) -> tuple[SharedMemory, _SharedArray]:
+    """Copies an array into a new shared memory block."""
+    # A block cannot be empty.
+    block = SharedMemory(create=True, size=max(value.nbytes, 1))
+    np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)[...] = value
+    return block, _SharedArray(block.name, value.shape, value.dtype)
+
+
+def _view(block: SharedMemory, shared: _SharedArray) -> np.ndarray:
+    return np.ndarray(shared.shape, dtype=shared.dtype, buffer=block.buf)
+
+
+# Evaluator of a worker, created once by _init_worker.
+_evaluator: ReferenceEvaluator | None = None
+
+
+def _init_worker(proto: str | bytes, kwargs: dict[str, Any]) -> None:
+    global _evaluator  # noqa: PLW0603
+    _evaluator = ReferenceEvaluator(proto, **kwargs)
+
+
+def _run_shard(
+    output_names: list[str],
+    inputs: dict[str, _SharedArray | Any],
+    rows: slice | EllipsisType,
+) -> list[_SharedArray | Any]:
+    """Executed by a worker, runs the model on rows *rows* of the inputs
+    stored in shared memory, the other inputs are given as they are.
+    """
+    assert _evaluator is not None, "The worker was not initialized."
+    blocks = []
+    try:
+        feeds = {}
+        for name, value in inputs.items():
+            if isinstance(value, _SharedArray):
+                block = SharedMemory(name=value.name)
+                blocks.append(block)
+                feeds[name] = _view(block, value)[rows]
+            else:
+                feeds[name] = value
+        outputs = _evaluator.run(output_names, feeds)
+        results = [_send(value) for value in outputs]
+        # An output may be a view of an input, every view must be deleted
+        # before the blocks are closed.
+        del feeds, outputs
+        return results
+    finally:
+        for block in blocks:
+            # The traceback of an exception may still hold a view,
+            # the block is then closed when it is garbage collected.
+            with contextlib.suppress(BufferError):
+                block.close()
+
+
+def _send(value: Any) -> _SharedArray | Any:
+    """Moves an output of a worker into a shared memory block."""
+    if isinstance(value, list):
+        # A sequence is pickled, its arrays may be views of the shared inputs.
+        return [np.array(v) if isinstance(v, np.ndarray) else v for v in value]
+    if not isinstance(value, np.ndarray) or value.dtype.hasobject:
+        return value
+    block, shared = _share(value)
+    # The parent process releases the block.
+    block.close()
+    return shared
+
+
+def _release(shared: Any) -> None:
+    if isinstance(shared, _SharedArray):
+        block = SharedMemory(name=shared.name)
+        block.close()
+        block.unlink()
+
+
+def _receive(shared: Any) -> Any:
+    """Copies an output of a worker out of its shared memory block."""
+    if not isinstance(shared, _SharedArray):
+        return shared
+    block = SharedMemory(name=shared.name)
+    try:
+        return _view(block, shared).copy()
+    finally:
+        block.close()
+
+
+class ProcessPoolEvaluator:
+    """Executes a model over a pool of processes, every process evaluates
+    a part of the batch.
+
+    Threads are limited by the kernels holding the GIL (python loops),
+    processes are not. This class is meant for offline scoring of large
+    batches. Every input and every requested output must share the same
+    dynamic first dimension (the same `dim_param`) and the model must
+    process every sample independently. Otherwise, a run is executed by
+    one worker.
+
+    Args:
+        proto: a ModelProto or the file it is stored in
+        n_processes: number of processes, `os.cpu_count()` if None
+        mp_context: multiprocessing start method (`'spawn'`,
+            `'forkserver'`, `'fork'`), the default one if None
+        kwargs: parameters given to every :class:`ReferenceEvaluator
+            <onnx.reference.ReferenceEvaluator>`, the classes in `new_ops`
+            must be importable by the workers, they are only checked
+            when the workers start
+
+    The instance can be used as a context manager to stop the workers.
+
+    ::
+
+        with ProcessPoolEvaluator("model.onnx", n_processes=8) as sess:
+            got = sess.run(None, {"X": X})
+    """
+
+    def __init__(
+        self,
+        proto: ModelProto | str,
+        n_processes: int | None = None,
+        mp_context: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if isinstance(proto, str):
+            # The weights are not needed, only the names and the types.
+            model = onnx.load(proto, load_external_data=False)
+        elif isinstance(proto, ModelProto):
+            model = proto
+        else:
+            raise TypeError(
+                f"proto must be a ModelProto or a filename not {type(proto)}."
+            )
+        self.n_processes = n_processes or os.cpu_count() or 1
+        self.input_names_ = [i.name for i in model.graph.input]
+        self.output_names_ = [o.name for o in model.graph.output]
+        self.input_types_ = [i.type for i in model.graph.input]
+        self.output_types_ = {o.name: o.type for o in model.graph.output}
+        # The workers must use the same resource tracker as this process,
+        # it would release the blocks of the parent otherwise.
+        resource_tracker.ensure_running()
+        self.executor_ = ProcessPoolExecutor(
+            max_workers=self.n_processes,
+            mp_context=get_context(mp_context),
+            initializer=_init_worker,
+            initargs=(
+                # The workers load the model from the file if there is one,
+                # the external data may then be memory mapped by all of them.
+                proto if isinstance(proto, str) else proto.SerializeToString(),
+                kwargs,
+            ),
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops the workers."""
+        self.executor_.shutdown()
+
+    @property
+    def input_names(self) -> list[str]:
+        """Returns the input names of the model."""
+        return self.input_names_
+
+    @property
+    def output_names(self) -> list[str]:
+        """Returns the output names of the model."""
+        return self.output_names_
+
+    def _batch_size(
+        self, output_names: Sequence[str], feed_inputs: dict[str, Any]
+    ) -> int | None:
+        """Returns the batch size if the feeds can be split, None otherwise."""
+        if self.n_processes <= 1 or not _batch_dimension(
+            self.input_types_, self.output_types_, output_names
+        ):
+            return None
+        sizes = set()
+        for name in self.input_names:
+            value = feed_inputs.get(name)
+            if not isinstance(value, np.ndarray) or value.ndim == 0:
+                return None
+            sizes.add(value.shape[0])
+        if len(sizes) != 1:
+            return None
+        size = sizes.pop()
+        return size if size > 1 else None
+
+    def run(
+        self, output_names: Sequence[str] | None, feed_inputs: dict[str, Any]
+    ) -> list[Any]:
+        """Executes the model.
+
+        Args:
+            output_names: requested outputs by names, None for all
+            feed_inputs: dictionary `{ input name: input value }`
+
+        Returns:
+            list of requested outputs
+        """
+        if output_names is None:
+            output_names = self.output_names
+        output_names = list(output_names)
+        batch_size = self._batch_size(output_names, feed_inputs)
+        if batch_size is None:
+            # One worker receives all the feeds.
+            names = list(feed_inputs)
+            bounds = []
+            rows: list[slice | EllipsisType] = [...]
+        else:
+            names = self.input_names
+            n_shards = min(self.n_processes, batch_size)
+            bounds = [batch_size * i // n_shards for i in range(n_shards + 1)]
+            rows = [slice(start, stop) for start, stop in itertools.pairwise(bounds)]
+        blocks = []
+        try:
+            inputs: dict[str, _SharedArray | Any] = {}
+            for name in names:
+                value = feed_inputs[name]
+                if not isinstance(value, np.ndarray) or value.dtype.hasobject:
+                    inputs[name] = value
+                    continue
+                block, inputs[name] = _share(value)
+                blocks.append(block)
+            futures = [
+                self.executor_.submit(
+                    _run_shard,
+                    output_names,
+                    {
+                        name: value[r]
+                        if isinstance(value, np.ndarray) and isinstance(r, slice)
+                        else value
+                        for name, value in inputs.items()
+                    },
+                    r,
+                )
+                for r in rows
+            ]
+            wait(futures)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        shards = [f.result() for f in futures if f.exception() is None]
+        try:
+            for f in futures:
+                # Raises the exception of the first failing shard.
+                f.result()
+            if batch_size is None:
+                return [_receive(shared) for shared in shards[0]]
+            return [
+                self._gather(name, [shard[i] for shard in shards], bounds, feed_inputs)
+                for i, name in enumerate(output_names)
+            ]
+        finally:
+            for shard in shards:
+                for shared in shard:
+                    _release(shared)
+
+    def _gather(
+        self,
+        name: str,
+        parts: list[_SharedArray | np.ndarray],
+        bounds: list[int],
+        feed_inputs: dict[str, Any],
+    ) -> np.ndarray:
+        """Concatenates the outputs of every shard."""
+        first = parts[0]
+        for part, (start, stop) in zip(parts, itertools.pairwise(bounds), strict=True):
+            if (
+                not isinstance(part, (_SharedArray, np.ndarray))
+                or len(part.shape) == 0
+                or part.shape[0] != stop - start
+                or part.shape[1:] != first.shape[1:]
+                or part.dtype != first.dtype
+            ):
+                raise RuntimeError(
+                    f"Output {name!r} cannot be split along the first dimension, "
+                    f"shard [{start}:{stop}] has shape {getattr(part, 'shape', None)} "
+                    f"and type {getattr(part, 'dtype', type(part))}, feeds have shapes "
+                    f"{ {k: getattr(v, 'shape', None) for k, v in feed_inputs.items()} }."
+                )
+        shape = (bounds[-1], *first.shape[1:])
+        result = np.empty(shape, dtype=first.dtype)
+        for part, (start, stop) in zip(parts, itertools.pairwise(bounds), strict=True):
+            if isinstance(part, _SharedArray):
+                block = SharedMemory(name=part.name)
+                try:
+                    result[start:stop] = _view(block, part)
+                finally:
+                    block.close()
+            else:
+                result[start:stop] = part
+        return result
@@ -0,0 +1,179 @@
+# Copyright (c) ONNX Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Profiling information collected by :class:`ReferenceEvaluator
+<onnx.reference.ReferenceEvaluator>` when it is created with `profiling=True`.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import time
+from typing import Any
+
+import numpy as np
+
+
+def nbytes(value: Any) -> int:
+    """Returns the number of bytes a result holds, 0 if unknown."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sum(nbytes(v) for v in value.values())
+    return 0
+
+
+@dataclasses.dataclass
+class NodeEvent:
+    """Execution of one node.
+
+    Args:
+        name: node name, `<op_type>_<index>` if the node has no name
+        op_type: operator type
+        domain: operator domain
+        begin: time in seconds the node started at, relative to the
+            creation of the profile
+        duration: execution time in seconds
+        input_bytes: size of the inputs
+        output_bytes: size of the outputs
+        live_bytes: size of all the results alive once the node
+            was executed, before the unused ones are released
+        thread_id: thread which executed the node
+    """
+
+    name: str
+    op_type: str
+    domain: str
+    begin: float
+    duration: float
+    input_bytes: int
+    output_bytes: int
+    live_bytes: int
+    thread_id: int
+
+
+class Profile:
+    """Collects one :class:`NodeEvent` every time a node is executed.
+    The events accumulate over every call to method `run`.
+    """
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.events: list[NodeEvent] = []
+        self.n_runs = 0
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def clear(self) -> None:
+        """Removes all events."""
+        self.events.clear()
+        self.n_runs = 0
+
+    @property
+    def peak_live_bytes(self) -> int:
+        """Returns the maximum size of all results alive at the same time."""
+        return max((e.live_bytes for e in self.events), default=0)
+
+    def aggregate(self, by: str = "op_type") -> list[dict[str, Any]]:
+        """Aggregates the events.
+
+        Args:
+            by: `"op_type"` to aggregate per operator type,
+                `"name"` to aggregate per node
+
+        Returns:
+            one dictionary per key with keys `key`, `count`, `total`,
+            `mean`, `max` (times in seconds), `ratio` (share of the total
+            time), `input_bytes`, `output_bytes`, `peak_live_bytes`,
+            sorted by decreasing total time
+        """
+        if by not in {"op_type", "name"}:
+            raise ValueError(f"Unexpected value {by!r} for by.")
+        rows: dict[str, dict[str, Any]] = {}
+        for e in self.events:
+            key = getattr(e, by)
+            if key not in rows:
+                rows[key] = {
+                    "key": key,
+                    "count": 0,
+                    "total": 0.0,
+                    "max": 0.0,
+                    "input_bytes": 0,
+                    "output_bytes": 0,
+                    "peak_live_bytes": 0,
+                }
+            row = rows[key]
+            row["count"] += 1
+            row["total"] += e.duration
+            row["max"] = max(row["max"], e.duration)
+            row["input_bytes"] += e.input_bytes
+            row["output_bytes"] += e.output_bytes
+            row["peak_live_bytes"] = max(row["peak_live_bytes"], e.live_bytes)
+        total = sum(row["total"] for row in rows.values()) or 1.0
+        for row in rows.values():
+            row["mean"] = row["total"] / row["count"]
+            row["ratio"] = row["total"] / total
+        return sorted(rows.values(), key=lambda row: -row["total"])
+
+    def to_table(self, by: str = "op_type") -> str:
+        """Returns the aggregated events as a text table,
+        see method :meth:`aggregate`.
+        """
+        columns = [
+            ("key", "{}"),
+            ("count", "{}"),
+            ("total", "{:.6f}"),
+            ("mean", "{:.6f}"),
+            ("max", "{:.6f}"),
+            ("ratio", "{:.3f}"),
+            ("input_bytes", "{}"),
+            ("output_bytes", "{}"),
+            ("peak_live_bytes", "{}"),
+        ]
+        table = [[name for name, _ in columns]]
+        table.extend(
+            [fmt.format(row[name]) for name, fmt in columns]
+            for row in self.aggregate(by)
+        )
+        widths = [max(len(line[i]) for line in table) for i in range(len(columns))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(w) if i == 0 else cell.rjust(w)
+                for i, (cell, w) in enumerate(zip(line, widths, strict=True))
+            )
+            for line in table
+        )
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Returns the events in the Trace Event Format understood by
+        `chrome://tracing` or `https://ui.perfetto.dev`,
+        times are converted into microseconds.
+        """
+        events = [
+            {
+                "name": e.name,
+                "cat": e.op_type,
+                "ph": "X",
+                "ts": e.begin * 1e6,
+                "dur": e.duration * 1e6,
+                "pid": 0,
+                "tid": e.thread_id,
+                "args": {
+                    "domain": e.domain,
+                    "input_bytes": e.input_bytes,
+                    "output_bytes": e.output_bytes,
+                    "live_bytes": e.live_bytes,
+                },
+            }
+            for e in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, filename: str) -> None:
+        """Saves the events in a json file, see method :meth:`to_chrome_trace`."""
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+# Copyright (c) ONNX Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Generates file `onnx/reference/ops/_op_table.py`.
+
+The reference evaluator imports the implementation of an operator
+the first time a model uses it. The table tells which module defines
+every implementation listed in `__all__` of a file `_op_list.py`.
+It must be generated again every time an implementation is added::
+
+    python onnx/reference/gen_op_table.py
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import os
+import pkgutil
+
+from onnx.reference.op_run import OpRun
+
+# Package implementing the operators of every domain.
+PACKAGES = {
+    "": "onnx.reference.ops",
+    "ai.onnx.ml": "onnx.reference.ops.aionnxml",
+    "ai.onnx.preview.training": "onnx.reference.ops.aionnx_preview_training",
+    "experimental": "onnx.reference.ops.experimental",
+}
+
+_HEADER = '''# Copyright (c) ONNX Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Module defining every registered implementation, domain -> class name -> module.
+
+This file is generated by onnx/reference/gen_op_table.py, do not edit.
+"""
+
+from __future__ import annotations
+
+OP_TABLE: dict[str, dict[str, str]] = {
+'''
+
+
+def find_modules(package_name: str) -> dict[str, str]:
+    """Returns the module defining every implementation registered
+    in file `_op_list.py` of a package.
+
+    Args:
+        package_name: package name
+
+    Returns:
+        class name -> module name
+    """
+    package = importlib.import_module(package_name)
+    op_list = importlib.import_module(f"{package_name}._op_list")
+    defined: dict[str, str] = {}
+    for info in pkgutil.iter_modules(package.__path__):
+        if not info.name.startswith("op_"):
+            continue
+        module = importlib.import_module(f"{package_name}.{info.name}")
+        for name, cls in vars(module).items():
+            if (
+                inspect.isclass(cls)
+                and issubclass(cls, OpRun)
+                and cls.__module__ == module.__name__
+            ):
+                defined[name] = module.__name__
+    table = {}
+    for name in op_list.__all__:
+        if name in vars(op_list):
+            # load_op or a class always imported
+            continue
+        if name not in defined:
+            raise RuntimeError(
+                f"Unable to find class {name!r} listed in {op_list.__name__!r} "
+                f"in any module {package_name}.op_*."
+            )
+        table[name] = defined[name]
+    return table
+
+
+def generate() -> str:
+    """Returns the content of file `_op_table.py`."""
+    rows = [_HEADER]
+    for domain, package_name in PACKAGES.items():
+        rows.append(f"    {domain!r}: {{\n".replace("'", '"'))
+        rows.extend(
+            f'        "{name}": "{module}",\n'
+            for name, module in find_modules(package_name).items()
+        )
+        rows.append("    },\n")
+    rows.append("}\n")
+    return "".join(rows)
+
+
+def main() -> None:
+    filename = os.path.join(
+        os.path.dirname(os.path.realpath(__file__)), "ops", "_op_table.py"
+    )
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        f.write(generate())
+
+
+if __name__ == "__main__":
+    main()
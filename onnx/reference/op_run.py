@@ -4,6 +4,10 @@
 from __future__ import annotations
 
 import abc
+import functools
+import hashlib
+import threading
+import weakref
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -11,7 +15,7 @@ import numpy as np
 import onnx
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
 
 class RuntimeTypeError(RuntimeError):
@@ -44,6 +48,26 @@ class RefAttrName:
         return f"{self.__class__.__name__}({self.name!r})"
 
 
+def _fix_outputs(res: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Converts the scalars a kernel may return into arrays like
+    method `OpRun._check_and_fix_outputs` does, without any other check.
+    """
+    fixed = None
+    for i, value in enumerate(res):
+        if not isinstance(value, np.ndarray) and np.isscalar(value):
+            if fixed is None:
+                fixed = list(res)
+            fixed[i] = np.array(value)
+    return res if fixed is None else tuple(fixed)
+
+
+def can_write(out: np.ndarray | None, shape: tuple[int, ...], dtype: Any) -> bool:
+    """Tells if the buffer *out* given to method `_run` of a kernel
+    can receive a result of shape *shape* and type *dtype*.
+    """
+    return out is not None and out.shape == tuple(shape) and out.dtype == dtype
+
+
 def _build_schemas() -> dict[str, onnx.defs.OpSchema]:
     res: dict[str, onnx.defs.OpSchema] = {}
     for schema in onnx.defs.onnx.defs.get_all_schemas_with_history():
@@ -66,6 +90,73 @@ def _build_schemas() -> dict[str, onnx.defs.OpSchema]:
 _schemas = _build_schemas()
 
 
+# Evaluators built for a function body or a subgraph, shared by every
+# node with an identical body, see function build_evaluator. The cache
+# only holds weak references, an evaluator disappears with the last
+# kernel using it.
+_evaluator_cache: weakref.WeakValueDictionary[tuple[Any, ...], Any] = (
+    weakref.WeakValueDictionary()
+)
+_evaluator_cache_lock = threading.Lock()
+
+
+def _fingerprint(proto: Any) -> str:
+    return hashlib.sha256(proto.SerializeToString(deterministic=True)).hexdigest()
+
+
+def _freeze(value: Any) -> Any:
+    """Converts *value* into a hashable key depending only on its content,
+    protos and evaluators are replaced by the fingerprint of their proto.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if hasattr(value, "SerializeToString"):
+        return (type(value).__name__, _fingerprint(value))
+    if hasattr(value, "proto_"):
+        return (type(value), _freeze(value.proto_))
+    return value
+
+
+def build_evaluator(
+    evaluator_cls: type, proto: onnx.FunctionProto | onnx.GraphProto, **kwargs: Any
+) -> Any:
+    """Returns `evaluator_cls(proto, **kwargs)`. Evaluators are cached
+    and shared across the process, a second call with an identical proto
+    (same serialized bytes) and equivalent arguments returns the first
+    instance as long as it is still alive. The key only depends on the
+    content of the arguments: the opsets, the operator classes in
+    *new_ops* and the proto of every function in *functions*.
+    A shared evaluator is never given any option keeping a state between
+    two runs and method `run` can be called from several threads.
+
+    Args:
+        evaluator_cls: evaluator class, usually :class:`ReferenceEvaluator
+            <onnx.reference.ReferenceEvaluator>`
+        proto: function body or subgraph
+        **kwargs: additional arguments given to the constructor,
+            opsets, functions, new_ops, verbose
+
+    Returns:
+        an instance of *evaluator_cls*
+    """
+    key = (evaluator_cls, type(proto).__name__, _fingerprint(proto), _freeze(kwargs))
+    with _evaluator_cache_lock:
+        evaluator = _evaluator_cache.get(key)
+    if evaluator is not None:
+        return evaluator
+    evaluator = evaluator_cls(proto, **kwargs)
+    with _evaluator_cache_lock:
+        return _evaluator_cache.setdefault(key, evaluator)
+
+
+def clear_evaluator_cache() -> None:
+    """Removes every evaluator cached by :func:`build_evaluator`."""
+    with _evaluator_cache_lock:
+        _evaluator_cache.clear()
+
+
 class OnnxType:
     def __init__(self, type_proto: onnx.TypeProto):
         if not isinstance(type_proto, onnx.TypeProto):
@@ -150,9 +241,20 @@ class OpRun(abc.ABC):
             (it can be more than one if the operator has a subgraph),
             `log` for a logging function
         schema: operator schema
+
+    Method `_run` must not modify the instance, the same node
+    may be executed by several threads at the same time.
+
+    A class setting `supports_out` to True accepts a keyword argument
+    `out` in method `_run`: a preallocated array the first output may be
+    written into (see :class:`Arena <onnx.reference._arena.Arena>`).
+    The kernel must ignore it if its shape or its type is not the one
+    of the result (see function :func:`can_write`) and return
+    the array it wrote into.
     """
 
     op_domain = ""
+    supports_out = False
 
     def __init__(
         self, onnx_node: onnx.NodeProto, run_params: dict[str, Any], schema: Any = None
@@ -200,12 +302,16 @@ class OpRun(abc.ABC):
             assert evaluator_cls is not None, (
                 f"evaluator_cls must be specified to evaluate att={att}"
             )
-            return evaluator_cls(
+            return build_evaluator(
+                evaluator_cls,
                 att.g,
                 opsets=self.run_params["opsets"],
                 verbose=max(0, self.run_params.get("verbose", 0) - 2),
                 new_ops=None if new_ops is None else list(new_ops.values()),
                 functions=functions,
+                fuse_elementwise=self.run_params.get("fuse_elementwise", False),
+                trusted=self.run_params.get("trusted", False),
+                external_data_dir=self.run_params.get("external_data_dir", None),
             )
 
         conversion_function = _attribute_conversion_function(att.type)
@@ -388,7 +494,41 @@ class OpRun(abc.ABC):
             )
         return res
 
-    def run(self, *args, linked_attributes=None, context=None):
+    def direct_call(self) -> tuple[Callable[..., Any], dict[str, Any]] | None:
+        """Returns method `_run` and the keyword arguments method `run`
+        gives it, None if method `run` does more than checking the inputs
+        and the outputs: the node needs a context, has a subgraph or linked
+        attributes, or the class overwrites method `run`.
+        """
+        if (
+            type(self).run is not OpRun.run
+            or self.need_context()
+            or self.has_linked_attribute
+            or self.has_subgraph
+        ):
+            return None
+        return self._run, {att: getattr(self, att) for att in self.attributes_names_}
+
+    def make_trusted(self) -> bool:
+        """Replaces method `run` by a direct call to method `_run`
+        with the attributes bound once, see method :meth:`direct_call`.
+        The inputs and the outputs are not checked anymore, scalars
+        are still converted into arrays. The attributes must not
+        be modified after this call.
+
+        Returns:
+            False if method `run` cannot be replaced
+        """
+        direct = self.direct_call()
+        if direct is None:
+            return False
+        fct, kwargs = direct
+        if kwargs:
+            fct = functools.partial(fct, **kwargs)
+        self.run = lambda *args, **kwargs: _fix_outputs(fct(*args, **kwargs))  # type: ignore[method-assign]
+        return True
+
+    def run(self, *args, linked_attributes=None, context=None, out=None):
         """Calls method ``_run``, catches exceptions,
         displays a longer error message.
 
@@ -398,6 +538,8 @@ class OpRun(abc.ABC):
                 the attribute of the function it belongs to
             context: if this node is part of the subgraph, `context` is
                 a dictionary with the values this node may use
+            out: buffer the first output may be written into,
+                only given to a kernel whose attribute `supports_out` is True
 
         Returns:
             tuple of results
@@ -455,6 +597,8 @@ class OpRun(abc.ABC):
             kwargs["attributes"] = linked_attributes
         if context is not None:
             kwargs["context"] = context
+        if out is not None and self.supports_out:
+            kwargs["out"] = out
         try:
             if overridden_attributes:
                 res = self._run(*args, **overridden_attributes, **kwargs)
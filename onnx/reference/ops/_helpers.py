@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import importlib
+from collections.abc import Iterator, Mapping
 from typing import Any
 
 from onnx.reference.op_run import OpRun
@@ -19,49 +21,57 @@ def _split_class_name(name):
     return name, None
 
 
-def build_registered_operators_any_domain(
-    module_context: dict[str, Any],
-) -> dict[str, dict[int | None, type[OpRun]]]:
-    reg_ops: dict[str, dict[int | None, type[OpRun]]] = {}
-    for class_name, class_type in module_context.items():
-        if class_name.startswith("_") or class_name in {
-            "Any",
-            "Dict",
-            "List",
-            "TOptional",
-            "Union",
-            "annotations",
-            "cl",
-            "class_name",
-            "get_schema",
-            "module_context",
-            "textwrap",
-        }:
-            continue
-        if isinstance(class_type, type(build_registered_operators_any_domain)):
-            continue
-        issub: bool = False
-        try:
-            issub = issubclass(class_type, OpRun)
-        except TypeError as e:
-            raise TypeError(
-                f"Unexpected variable type {class_type!r} and class_name={class_name!r}."
-            ) from e
-        if issub:
+def import_operator(table: dict[str, str], module_name: str, class_name: str) -> Any:
+    """Imports an implementation registered in *table* (class name -> module),
+    used as function `__getattr__` of the modules `_op_list.py`.
+    """
+    if class_name not in table:
+        raise AttributeError(f"module {module_name!r} has no attribute {class_name!r}")
+    return getattr(importlib.import_module(table[class_name]), class_name)
+
+
+class LazyRegisteredOperators(Mapping[str, dict[int | None, type[OpRun]]]):
+    """Registered operators of a domain, op_type -> version -> class,
+    the module defining an operator is imported the first time
+    it is requested.
+
+    Args:
+        table: class name -> module defining it,
+            see file `onnx/reference/ops/_op_table.py`
+    """
+
+    def __init__(self, table: dict[str, str]) -> None:
+        if not table:
+            raise RuntimeError(
+                "No registered operator. This error happens when no implementation "
+                "of type 'OpRun' was detected. It may be due to an error during installation. Please try reinstalling onnx."
+            )
+        self._table = table
+        self._names: dict[str, dict[int | None, str]] = {}
+        for class_name in table:
             op_type, op_version = _split_class_name(class_name)
-            if op_type not in reg_ops:
-                reg_ops[op_type] = {}
-            reg_ops[op_type][op_version] = class_type
-    if not reg_ops:
-        raise RuntimeError(
-            "No registered operator. This error happens when no implementation "
-            "of type 'OpRun' was detected. It may be due to an error during installation. Please try reinstalling onnx."
-        )
-    # Set default implementation to the latest one.
-    for impl in reg_ops.values():
-        if None in impl:
-            # default already exists
-            continue
-        max_version = max(impl)  # type: ignore[type-var]
-        impl[None] = impl[max_version]
-    return reg_ops
+            self._names.setdefault(op_type, {})[op_version] = class_name
+        # Set default implementation to the latest one.
+        for names in self._names.values():
+            if None not in names:
+                names[None] = names[max(names)]  # type: ignore[type-var]
+        self._loaded: dict[str, dict[int | None, type[OpRun]]] = {}
+
+    def __getitem__(self, op_type: str) -> dict[int | None, type[OpRun]]:
+        impl = self._loaded.get(op_type)
+        if impl is None:
+            impl = {
+                version: import_operator(self._table, __name__, class_name)
+                for version, class_name in self._names[op_type].items()
+            }
+            self._loaded[op_type] = impl
+        return impl
+
+    def __contains__(self, op_type: object) -> bool:
+        return op_type in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
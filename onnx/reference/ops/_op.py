@@ -7,9 +7,11 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
-from onnx.reference.op_run import OpRun, RuntimeTypeError
+from onnx.reference.op_run import OpRun, RuntimeTypeError, can_write
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from onnx.onnx_pb import NodeProto
 
 
@@ -19,14 +21,26 @@ class OpRunUnary(OpRun):
     Checks that input and output types are the same.
     """
 
-    def run(self, x):
+    def direct_call(self) -> tuple[Callable[..., Any], dict[str, Any]] | None:
+        """Method `run` calls `_run` without any attribute."""
+        if (
+            type(self).run not in {OpRunUnary.run, OpRunUnaryNum.run}
+            or self.has_linked_attribute
+        ):
+            return None
+        return self._run, {}
+
+    def run(self, x, out=None):
         """Calls method ``_run``, catches exceptions, displays a longer error message.
 
         Supports only unary operators.
         """
         self._log("-- begin %s.run(1 input)", self.__class__.__name__)
         try:
-            res = self._run(x)
+            if out is not None and self.supports_out:
+                res = self._run(x, out=out)
+            else:
+                res = self._run(x)
         except TypeError as e:
             raise TypeError(
                 f"Issues with types {', '.join(str(type(_)) for _ in [x])} "
@@ -42,13 +56,13 @@ class OpRunUnaryNum(OpRunUnary):
     Checks that input and output types are the same.
     """
 
-    def run(self, x):
+    def run(self, x, out=None):
         """Calls method ``OpRunUnary.run``.
 
         Catches exceptions, displays a longer error message.
         Checks that the result is not empty.
         """
-        res = OpRunUnary.run(self, x)
+        res = OpRunUnary.run(self, x, out=out)
         if len(res) == 0 or res[0] is None:
             return res
         if not isinstance(res[0], list) and res[0].dtype != x.dtype:
@@ -65,7 +79,16 @@ class OpRunBinary(OpRun):
     Checks that input and output types are the same.
     """
 
-    def run(self, x, y):
+    def direct_call(self) -> tuple[Callable[..., Any], dict[str, Any]] | None:
+        """Method `run` calls `_run` without any attribute."""
+        if (
+            type(self).run not in {OpRunBinary.run, OpRunBinaryNum.run}
+            or self.has_linked_attribute
+        ):
+            return None
+        return self._run, {}
+
+    def run(self, x, y, out=None):
         """Calls method ``_run``, catches exceptions, displays a longer error message.
 
         Supports only binary operators.
@@ -82,7 +105,10 @@ class OpRunBinary(OpRun):
                 f"shapes {x.shape}, {y.shape})."
             )
         try:
-            res = self._run(x, y)
+            if out is not None and self.supports_out:
+                res = self._run(x, y, out=out)
+            else:
+                res = self._run(x, y)
         except (TypeError, ValueError) as e:
             raise TypeError(
                 f"Issues with types {', '.join(str(type(_)) for _ in [x, y])} "
@@ -102,9 +128,9 @@ class OpRunBinaryNum(OpRunBinary):
     Checks that input oud output types are the same.
     """
 
-    def run(self, x, y):
+    def run(self, x, y, out=None):
         """Calls method ``OpRunBinary.run``, catches exceptions, displays a longer error message."""
-        res = OpRunBinary.run(self, x, y)
+        res = OpRunBinary.run(self, x, y, out=out)
         if res[0].dtype != x.dtype:
             raise RuntimeTypeError(
                 f"Output type mismatch: {x.dtype} != {res[0].dtype} or {y.dtype} "
@@ -125,7 +151,14 @@ class OpRunBinaryNumpy(OpRunBinaryNum):
         OpRunBinaryNum.__init__(self, onnx_node, run_params)
         self.numpy_fct = numpy_fct
 
-    def _run(self, a, b):
+    def _run(self, a, b, out=None):
+        if (
+            self.supports_out
+            and out is not None
+            and a.dtype == b.dtype
+            and can_write(out, np.broadcast_shapes(a.shape, b.shape), a.dtype)
+        ):
+            return (self.numpy_fct(a, b, out=out),)
         res = (self.numpy_fct(a, b),)
         return self._check_and_fix_outputs(res)
 
@@ -3,299 +3,125 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-import itertools
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-from onnx.reference.op_run import OpRun
-from onnx.reference.ops._op_common_indices import _get_index, _get_indices
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 
-def _get_pad_shape(
-    auto_pad: str,
-    input_spatial_shape: tuple[int],
-    kernel_spatial_shape: tuple[int],
-    strides_spatial: tuple[int],
-    output_spatial_shape: tuple[int],
-) -> tuple[int]:
-    pad_shape = [0] * len(input_spatial_shape)
-    if auto_pad in ("SAME_UPPER", "SAME_LOWER"):
-        for i in range(len(input_spatial_shape)):
-            pad_shape[i] = (
-                (output_spatial_shape[i] - 1) * strides_spatial[i]
-                + kernel_spatial_shape[i]
-                - input_spatial_shape[i]
-            )
-    elif auto_pad == "VALID":
-        pass
-    if len(pad_shape) == 0:
-        raise RuntimeError(
-            f"Unable to compute pad shape, auto_pad={auto_pad!r}, "
-            f"input_spatial_shape={input_spatial_shape!r}, "
-            f"kernel_spatial_shape={kernel_spatial_shape!r}, "
-            f"strides_spatial={strides_spatial!r}."
-        )
-    return tuple(pad_shape)
-
-
-def _get_output_shape_no_ceil(
-    auto_pad: str,
-    input_spatial_shape: tuple[int],
-    kernel_spatial_shape: tuple[int],
-    strides_spatial: tuple[int],
-) -> tuple[int]:
-    out_shape = [0] * len(input_spatial_shape)
-    if auto_pad in ("SAME_UPPER", "SAME_LOWER"):
-        for i in range(len(input_spatial_shape)):
-            out_shape[i] = int(
-                np.ceil(float(input_spatial_shape[i]) / float(strides_spatial[i]))
-            )
-    elif auto_pad == "VALID":
-        for i in range(len(input_spatial_shape)):
-            out_shape[i] = int(
-                np.ceil(
-                    float(input_spatial_shape[i] - (kernel_spatial_shape[i] - 1))
-                    / float(strides_spatial[i])
-                )
-            )
-    return tuple(out_shape)
-
-
-def _get_output_shape(
-    auto_pad: str,
-    input_spatial_shape: tuple[int],
-    kernel_spatial_shape: tuple[int],
-    strides_spatial: tuple[int],
-    pad_shape: tuple[int] | None = None,
-    ceil_mode: int | None = 0,
-) -> tuple[int]:
-    if not ceil_mode:
-        out_shape = _get_output_shape_no_ceil(
-            auto_pad, input_spatial_shape, kernel_spatial_shape, strides_spatial
-        )
-    else:
-        round_fct = np.ceil if ceil_mode else np.floor
-        out_shape = [0] * len(input_spatial_shape)
-        if auto_pad in ("SAME_UPPER", "SAME_LOWER"):
-            for i in range(len(input_spatial_shape)):
-                out_shape[i] = int(
-                    round_fct(float(input_spatial_shape[i]) / float(strides_spatial[i]))
-                )
-        elif auto_pad == "VALID":
-            if pad_shape is None:
-                raise ValueError(  # pragma: no cogitver
-                    "pad_shape cannot be None if auto_pad is "
-                    "'VALID' and ceil_mode is 1."
-                )
-            for i in range(len(input_spatial_shape)):
-                out_shape[i] = int(
-                    round_fct(
-                        float(
-                            input_spatial_shape[i]
-                            + pad_shape[i]
-                            - kernel_spatial_shape[i]
-                        )
-                        / float(strides_spatial[i])
-                        + 1
-                    )
-                )
-    if len(out_shape) == 0:
-        raise RuntimeError(
-            f"Unable to compute output shape, auto_pad={auto_pad!r}, "
-            f"input_spatial_shape={input_spatial_shape!r}, "
-            f"kernel_spatial_shape={kernel_spatial_shape!r}, "
-            f"strides_spatial={strides_spatial!r}, ceil_mode={ceil_mode!r}."
-        )
-    if min(out_shape) <= 0:
-        raise RuntimeError(
-            f"output shape cannot be null or negative, out_shape={out_shape!r}, "
-            f"auto_pad={auto_pad!r}, input_spatial_shape={input_spatial_shape!r}, "
-            f"kernel_spatial_shape={kernel_spatial_shape!r}, "
-            f"strides_spatial={strides_spatial!r}, ceil_mode={ceil_mode!r}."
+def _windows(
+    x: np.ndarray,
+    kernel_shape: Sequence[int],
+    strides: Sequence[int],
+    dilations: Sequence[int],
+    begin_pads: Sequence[int],
+    out_shape: Sequence[int],
+    fill_value: Any,
+) -> np.ndarray:
+    """Returns a view of shape `(N, C, *out_shape, *kernel_shape)`
+    on every window of *x* once padded with *fill_value*.
+    The input is padded at the end as much as the last window needs,
+    it is cropped if no window reaches its end.
+    """
+    n_dims = len(kernel_shape)
+    extents = [(k - 1) * d + 1 for k, d in zip(kernel_shape, dilations, strict=True)]
+    pad_width = [(0, 0), (0, 0)]
+    for size, out, stride, extent, begin in zip(
+        x.shape[2:], out_shape, strides, extents, begin_pads, strict=True
+    ):
+        pad_width.append((begin, max(0, (out - 1) * stride + extent - size - begin)))
+    padded = (
+        np.pad(x, pad_width, mode="constant", constant_values=fill_value)
+        if any(begin or end for begin, end in pad_width)
+        else x
+    )
+    windows = sliding_window_view(padded, extents, axis=tuple(range(2, 2 + n_dims)))
+    return windows[
+        (
+            slice(None),
+            slice(None),
+            *(
+                slice(0, out * stride, stride)
+                for out, stride in zip(out_shape, strides, strict=True)
+            ),
+            *(slice(None, None, d) for d in dilations),
         )
-    return tuple(out_shape)
+    ]
 
 
 def _pool(
     padded: np.ndarray,
-    x_shape: tuple[int],
-    kernel_shape: tuple[int],
-    strides_shape: tuple[int],
-    out_shape: tuple[int],
-    pad_shape: tuple[int],
+    kernel_shape: Sequence[int],
+    strides: Sequence[int],
+    dilations: Sequence[int],
+    out_shape: Sequence[int],
+    limits: Sequence[int],
     pooling_type: str,
-    count_include_pad: int | None = 0,
-    ceil_mode: int | None = 0,
-    indices: bool = False,
-    pads: np.ndarray | None = None,
+    count_include_pad: int = 0,
+    p: int = 2,
 ) -> np.ndarray:
-    if pooling_type == "AVG":
-        fpool = np.average
-    elif pooling_type == "MAX":
-        fpool = np.max
-    else:
+    """Pools every window of an input already padded.
+
+    Args:
+        padded: padded input, NaN marks the padding not to be counted
+        kernel_shape: kernel shape
+        strides: strides
+        dilations: dilations
+        out_shape: number of windows along every spatial axis,
+            the first window starts at the beginning of *padded*
+        limits: positions beyond these limits are not part of any window
+        pooling_type: `"AVG"`, `"MAX"` or `"LPPOOL"`
+        count_include_pad: if 1, NaN values are not ignored when the
+            pooling type is AVG or LPPOOL
+        p: exponent for LPPOOL
+
+    Returns:
+        array of shape `(N, C, *out_shape)`
+    """
+    if pooling_type not in {"AVG", "MAX", "LPPOOL"}:
         raise NotImplementedError(
-            f"Pooling type {pooling_type!r} does not support. Should be AVG, MAX."
+            f"Pooling type {pooling_type!r} does not support. Should be AVG, MAX, LPPOOL."
         )
-    spatial_size = len(x_shape) - 2
-    y = np.zeros([x_shape[0], x_shape[1], *list(out_shape)])
-    if indices:
-        z = np.full(y.shape, fill_value=-1, dtype=np.int64)
-    round_fct = np.ceil if ceil_mode else np.floor
-
-    def loop_range():
-        return [
-            range(
-                int(
-                    round_fct(
-                        float(x_shape[i + 2] + pad_shape[i] - kernel_shape[i])
-                        / float(strides_shape[i])
-                        + 1
-                    )
-                )
-            )
-            for i in range(spatial_size)
-        ]
-
-    for shape in itertools.product(range(x_shape[0]), range(x_shape[1]), *loop_range()):
-        window = padded[shape[0], shape[1]]
-        listi = [
-            range(
-                strides_shape[i] * shape[i + 2],
-                strides_shape[i] * shape[i + 2] + kernel_shape[i],
-            )
-            for i in range(spatial_size)
-        ]
-        listi2 = list(itertools.product(*listi))
-        values = []
-        for i in listi2:
-            try:
-                values.append(window[i])
-            except IndexError:  # noqa: PERF203
-                continue
-        window_vals = np.array(values)
-
-        if count_include_pad == 1 and pooling_type == "AVG":
-            y[shape] = fpool(window_vals)
-        else:
-            no_nan = window_vals[np.where(~np.isnan(window_vals))]
-            y[shape] = fpool(no_nan)
-            if indices:
-                try:
-                    window_vals_min = np.nan_to_num(window_vals, nan=no_nan.min())
-                except TypeError:
-                    # argument nan was introduced in numpy 1.17
-                    window_vals_min = window_vals.copy()
-                    window_vals_min[np.isnan(window_vals_min)] = no_nan.min()
-                arg = np.argmax(window_vals_min)
-                coordinates = _get_indices(arg, out_shape)
-                delta = shape[2:] - pads[:, 0]
-                coordinates += delta
-                new_arg = _get_index(coordinates, x_shape[2:])
-                z[shape] = new_arg
-    if indices:
-        return y.astype(padded.dtype), z
-    return y.astype(padded.dtype)
-
-
-class CommonPool(OpRun):
-    def _run(
-        self,
-        pooling_type,
-        count_include_pad,
-        x,
-        auto_pad=None,
-        ceil_mode=None,
-        dilations=None,
-        kernel_shape=None,
-        pads=None,
-        storage_order=None,  # noqa: ARG002
-        strides=None,
-    ):
-        if pooling_type == "MAX" and dilations is None:
-            dilations = [1 for s in kernel_shape]
-        if pads is None:
-            pads = [0 for s in kernel_shape] * 2
-
-        if strides is None or len(strides) == 0:
-            strides = [1] * (len(x.shape) - 2)
-        kernel_shape = list(kernel_shape)
-        auto_pad = "VALID" if auto_pad == "NOTSET" else auto_pad
-
-        if pads is None or len(pads) == 0:
-            pad_shape = [0] * (len(x.shape) - 2)
-            x_shape = x.shape[2:]
-            padded = x
-        elif len(pads) == 4:
-            pad_top, pad_bottom, pad_left, pad_right = pads
-            pad_shape = [pad_top + pad_bottom, pad_left + pad_right]
-            x_shape = np.array(x.shape[2:]) + np.array(pad_shape)
-            const = np.nan if count_include_pad == 0 else 0
-            padded = np.pad(
-                x,
-                ((0, 0), (0, 0), (pad_top, pad_bottom), (pad_left, pad_right)),
-                mode="constant",
-                constant_values=const,
-            )
-        else:
-            pad_shape = pads
-            x_shape = x.shape[2:]
-            padded = x
-
-        if auto_pad in ("SAME_LOWER", "SAME_UPPER"):
-            const = np.nan if count_include_pad == 0 else 0
-            out_shape = _get_output_shape(
-                auto_pad,
-                x_shape,
-                kernel_shape,
-                strides,
-                pad_shape,
-                ceil_mode,
-            )
-            pad_shape = _get_pad_shape(
-                auto_pad, x_shape, kernel_shape, strides, out_shape
-            )
-            if auto_pad == "SAME_LOWER":
-                pad_bottom = pad_shape[0] // 2
-                pad_top = pad_shape[0] - pad_bottom
-                pad_right = pad_shape[1] // 2
-                pad_left = pad_shape[1] - pad_right
-            else:
-                pad_top = pad_shape[0] // 2
-                pad_bottom = pad_shape[0] - pad_top
-                pad_left = pad_shape[1] // 2
-                pad_right = pad_shape[1] - pad_left
-            padded = np.pad(
-                padded,
-                ((0, 0), (0, 0), (pad_top, pad_bottom), (pad_left, pad_right)),
-                mode="constant",
-                constant_values=const,
-            )
-        else:
-            out_shape = _get_output_shape(
-                auto_pad,
-                x_shape,
-                kernel_shape,
-                strides,
-                pad_shape,
-                ceil_mode,
-            )
-
-        n_dims = len(pads) // 2
-        new_pads = np.array([(pads[i], pads[i + n_dims]) for i in range(n_dims)])
-        res = _pool(
-            padded,
-            x.shape,
+    n_dims = len(kernel_shape)
+    axes = tuple(range(-n_dims, 0))
+    # Positions beyond the limits are removed, the windows going beyond
+    # them are filled again by function _windows.
+    padded = padded[(slice(None), slice(None), *(slice(0, lim) for lim in limits))]
+    ignored = np.isnan(padded)
+
+    def _reduce(values: np.ndarray, fill_value: Any, reduce: Any) -> np.ndarray:
+        # The reduction runs on a view of the windows, it does not
+        # allocate any array of shape (N, C, *out_shape, *kernel_shape),
+        # only arrays of the size of the padded input.
+        windows = _windows(
+            values,
             kernel_shape,
             strides,
+            dilations,
+            [0] * n_dims,
             out_shape,
-            pad_shape,
-            pooling_type,
-            count_include_pad=count_include_pad,
-            ceil_mode=ceil_mode,
-            indices=len(self.output) > 1,
-            pads=new_pads,
+            fill_value,
+        )
+        return reduce(windows, axis=axes)
+
+    if pooling_type == "MAX":
+        lowest = -np.inf if padded.dtype.kind == "f" else np.iinfo(padded.dtype).min
+        values = np.where(ignored, lowest, padded) if ignored.any() else padded
+        return _reduce(values, lowest, np.max).astype(padded.dtype)
+    if count_include_pad == 1:
+        # NaN values are not ignored, they propagate to the result.
+        ignored = np.zeros(padded.shape, dtype=bool)
+    values = np.where(ignored, 0, padded) if ignored.any() else padded
+    if pooling_type == "LPPOOL":
+        return (_reduce(np.abs(values) ** p, 0, np.sum) ** (1.0 / p)).astype(
+            padded.dtype
+        )
+    counts = (~ignored).astype(np.int64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # An empty window produces NaN.
+        return (_reduce(values, 0, np.sum) / _reduce(counts, 0, np.sum)).astype(
+            padded.dtype
         )
-        if isinstance(res, tuple):
-            return res
-        return (res,)
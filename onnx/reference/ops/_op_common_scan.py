@@ -0,0 +1,75 @@
+# Copyright (c) ONNX Project Contributors
+
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+# Upper bound on the size of a buffer allocated before the number
+# of iterations is known for sure, the buffer grows beyond that if needed.
+_MAX_PREALLOCATED_BYTES = 1 << 24
+
+
+class ScanOutputBuffer:
+    """Accumulates the values of a scan output iteration after iteration
+    into a single array, the final result is equal to `np.vstack(values)`.
+    The buffer is allocated for *capacity* iterations when the first value
+    is appended if it does not exceed `_MAX_PREALLOCATED_BYTES`, it grows
+    geometrically if the loop runs longer. If one value does not have
+    the dtype or the trailing dimensions of the first one, the buffer falls
+    back to a list of values concatenated with `np.vstack` at the end.
+
+    Args:
+        capacity: expected number of iterations, only an upper bound
+            (a Loop may stop earlier), None if unknown
+    """
+
+    def __init__(self, capacity: int | None = None) -> None:
+        self.capacity = 1 if capacity is None or capacity < 1 else capacity
+        self.buffer: np.ndarray | None = None
+        self.rows = 0
+        self.values: list[Any] | None = None
+
+    def append(self, value: Any) -> None:
+        """Appends the value produced by one iteration."""
+        if self.values is not None:
+            self.values.append(value)
+            return
+        block = np.atleast_2d(value)
+        if self.buffer is None:
+            capacity = min(
+                self.capacity, max(1, _MAX_PREALLOCATED_BYTES // max(block.nbytes, 1))
+            )
+            self.buffer = np.empty(
+                (block.shape[0] * capacity, *block.shape[1:]), dtype=block.dtype
+            )
+        elif (
+            block.dtype != self.buffer.dtype or block.shape[1:] != self.buffer.shape[1:]
+        ):
+            self.values = [self.buffer[: self.rows], value]
+            self.buffer = None
+            return
+        end = self.rows + block.shape[0]
+        if end > self.buffer.shape[0]:
+            grown = np.empty(
+                (max(end, self.buffer.shape[0] * 2), *self.buffer.shape[1:]),
+                dtype=self.buffer.dtype,
+            )
+            grown[: self.rows] = self.buffer[: self.rows]
+            self.buffer = grown
+        self.buffer[self.rows : end] = block
+        self.rows = end
+
+    def result(self) -> np.ndarray:
+        """Returns the concatenated values."""
+        if self.buffer is None:
+            # np.vstack raises an exception if no value was appended.
+            return np.vstack(self.values or [])
+        if self.rows == self.buffer.shape[0]:
+            return self.buffer
+        if self.rows * 2 < self.buffer.shape[0]:
+            # The loop stopped early, a view would keep the whole buffer alive.
+            return self.buffer[: self.rows].copy()
+        return self.buffer[: self.rows]
@@ -0,0 +1,277 @@
+# Copyright (c) ONNX Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""Module defining every registered implementation, domain -> class name -> module.
+
+This file is generated by onnx/reference/gen_op_table.py, do not edit.
+"""
+
+from __future__ import annotations
+
+OP_TABLE: dict[str, dict[str, str]] = {
+    "": {
+        "Abs": "onnx.reference.ops.op_abs",
+        "Acos": "onnx.reference.ops.op_acos",
+        "Acosh": "onnx.reference.ops.op_acosh",
+        "Add": "onnx.reference.ops.op_add",
+        "AffineGrid": "onnx.reference.ops.op_affine_grid",
+        "And": "onnx.reference.ops.op_and",
+        "ArgMax_1": "onnx.reference.ops.op_argmax",
+        "ArgMax_12": "onnx.reference.ops.op_argmax",
+        "ArgMin_1": "onnx.reference.ops.op_argmin",
+        "ArgMin_12": "onnx.reference.ops.op_argmin",
+        "Asin": "onnx.reference.ops.op_asin",
+        "Asinh": "onnx.reference.ops.op_asinh",
+        "Atan": "onnx.reference.ops.op_atan",
+        "Atanh": "onnx.reference.ops.op_atanh",
+        "Attention": "onnx.reference.ops.op_attention",
+        "AttributeHasValue": "onnx.reference.ops.op_attribute_has_value",
+        "AveragePool_1": "onnx.reference.ops.op_average_pool",
+        "AveragePool_7": "onnx.reference.ops.op_average_pool",
+        "AveragePool_11": "onnx.reference.ops.op_average_pool",
+        "AveragePool_19": "onnx.reference.ops.op_average_pool",
+        "BatchNormalization_6": "onnx.reference.ops.op_batch_normalization",
+        "BatchNormalization_9": "onnx.reference.ops.op_batch_normalization",
+        "BatchNormalization_14": "onnx.reference.ops.op_batch_normalization",
+        "Bernoulli": "onnx.reference.ops.op_bernoulli",
+        "BitShift": "onnx.reference.ops.op_bitshift",
+        "BitwiseAnd": "onnx.reference.ops.op_bitwise_and",
+        "BitwiseNot": "onnx.reference.ops.op_bitwise_not",
+        "BitwiseOr": "onnx.reference.ops.op_bitwise_or",
+        "BitwiseXor": "onnx.reference.ops.op_bitwise_xor",
+        "BlackmanWindow": "onnx.reference.ops.op_blackman_window",
+        "Cast_1": "onnx.reference.ops.op_cast",
+        "Cast_19": "onnx.reference.ops.op_cast",
+        "Cast_24": "onnx.reference.ops.op_cast",
+        "CastLike_15": "onnx.reference.ops.op_cast_like",
+        "CastLike_19": "onnx.reference.ops.op_cast_like",
+        "Ceil": "onnx.reference.ops.op_ceil",
+        "Celu": "onnx.reference.ops.op_celu",
+        "CenterCropPad": "onnx.reference.ops.op_center_crop_pad",
+        "Clip_6": "onnx.reference.ops.op_clip",
+        "Clip_11": "onnx.reference.ops.op_clip",
+        "Col2Im": "onnx.reference.ops.op_col2im",
+        "Compress": "onnx.reference.ops.op_compress",
+        "Concat": "onnx.reference.ops.op_concat",
+        "ConcatFromSequence": "onnx.reference.ops.op_concat_from_sequence",
+        "Constant_1": "onnx.reference.ops.op_constant",
+        "Constant_9": "onnx.reference.ops.op_constant",
+        "Constant_11": "onnx.reference.ops.op_constant",
+        "Constant_12": "onnx.reference.ops.op_constant",
+        "ConstantOfShape": "onnx.reference.ops.op_constant_of_shape",
+        "Conv": "onnx.reference.ops.op_conv",
+        "ConvInteger": "onnx.reference.ops.op_conv_integer",
+        "ConvTranspose": "onnx.reference.ops.op_conv_transpose",
+        "Cos": "onnx.reference.ops.op_cos",
+        "Cosh": "onnx.reference.ops.op_cosh",
+        "CumProd": "onnx.reference.ops.op_cum_prod",
+        "CumSum": "onnx.reference.ops.op_cum_sum",
+        "DeformConv": "onnx.reference.ops.op_deform_conv",
+        "DepthToSpace": "onnx.reference.ops.op_depth_to_space",
+        "DequantizeLinear_19": "onnx.reference.ops.op_dequantize_linear",
+        "DequantizeLinear_21": "onnx.reference.ops.op_dequantize_linear",
+        "Det": "onnx.reference.ops.op_det",
+        "DFT_17": "onnx.reference.ops.op_dft",
+        "DFT_20": "onnx.reference.ops.op_dft",
+        "Div": "onnx.reference.ops.op_div",
+        "Dropout_7": "onnx.reference.ops.op_dropout",
+        "Dropout_12": "onnx.reference.ops.op_dropout",
+        "DynamicQuantizeLinear": "onnx.reference.ops.op_dynamic_quantize_linear",
+        "Einsum": "onnx.reference.ops.op_einsum",
+        "Elu": "onnx.reference.ops.op_elu",
+        "Equal": "onnx.reference.ops.op_equal",
+        "Erf": "onnx.reference.ops.op_erf",
+        "Exp": "onnx.reference.ops.op_exp",
+        "Expand": "onnx.reference.ops.op_expand",
+        "EyeLike": "onnx.reference.ops.op_eyelike",
+        "Flatten": "onnx.reference.ops.op_flatten",
+        "Floor": "onnx.reference.ops.op_floor",
+        "Gather": "onnx.reference.ops.op_gather",
+        "GatherElements": "onnx.reference.ops.op_gather_elements",
+        "GatherND": "onnx.reference.ops.op_gathernd",
+        "Gemm_6": "onnx.reference.ops.op_gemm",
+        "Gemm_7": "onnx.reference.ops.op_gemm",
+        "GlobalAveragePool": "onnx.reference.ops.op_global_average_pool",
+        "GlobalMaxPool": "onnx.reference.ops.op_global_max_pool",
+        "Greater": "onnx.reference.ops.op_greater",
+        "GreaterOrEqual": "onnx.reference.ops.op_greater_or_equal",
+        "GridSample": "onnx.reference.ops.op_grid_sample",
+        "GRU": "onnx.reference.ops.op_gru",
+        "HammingWindow": "onnx.reference.ops.op_hamming_window",
+        "HannWindow": "onnx.reference.ops.op_hann_window",
+        "HardSigmoid": "onnx.reference.ops.op_hard_sigmoid",
+        "Hardmax": "onnx.reference.ops.op_hardmax",
+        "Identity": "onnx.reference.ops.op_identity",
+        "If": "onnx.reference.ops.op_if",
+        "ImageDecoder": "onnx.reference.ops.op_image_decoder",
+        "InstanceNormalization": "onnx.reference.ops.op_instance_normalization",
+        "IsInf": "onnx.reference.ops.op_isinf",
+        "IsNaN": "onnx.reference.ops.op_isnan",
+        "LayerNormalization": "onnx.reference.ops.op_layer_normalization",
+        "LeakyRelu": "onnx.reference.ops.op_leaky_relu",
+        "Less": "onnx.reference.ops.op_less",
+        "LessOrEqual": "onnx.reference.ops.op_less_or_equal",
+        "Log": "onnx.reference.ops.op_log",
+        "LogSoftmax": "onnx.reference.ops.op_log_softmax",
+        "Loop": "onnx.reference.ops.op_loop",
+        "LpNormalization": "onnx.reference.ops.op_lp_normalization",
+        "LpPool": "onnx.reference.ops.op_lp_pool",
+        "LRN": "onnx.reference.ops.op_lrn",
+        "LSTM": "onnx.reference.ops.op_lstm",
+        "MatMul": "onnx.reference.ops.op_matmul",
+        "MatMulInteger": "onnx.reference.ops.op_matmul_integer",
+        "Max": "onnx.reference.ops.op_max",
+        "MaxPool": "onnx.reference.ops.op_max_pool",
+        "MaxUnpool": "onnx.reference.ops.op_max_unpool",
+        "Mean": "onnx.reference.ops.op_mean",
+        "MelWeightMatrix": "onnx.reference.ops.op_mel_weight_matrix",
+        "Min": "onnx.reference.ops.op_min",
+        "Mod": "onnx.reference.ops.op_mod",
+        "Mul": "onnx.reference.ops.op_mul",
+        "Neg": "onnx.reference.ops.op_neg",
+        "NegativeLogLikelihoodLoss": "onnx.reference.ops.op_negative_log_likelihood_loss",
+        "NonMaxSuppression": "onnx.reference.ops.op_non_max_suppression",
+        "NonZero": "onnx.reference.ops.op_non_zero",
+        "Not": "onnx.reference.ops.op_not",
+        "OneHot": "onnx.reference.ops.op_one_hot",
+        "Optional": "onnx.reference.ops.op_optional",
+        "OptionalGetElement": "onnx.reference.ops.op_optional_get_element",
+        "OptionalHasElement": "onnx.reference.ops.op_optional_has_element",
+        "Or": "onnx.reference.ops.op_or",
+        "Pad_1": "onnx.reference.ops.op_pad",
+        "Pad_2": "onnx.reference.ops.op_pad",
+        "Pad_11": "onnx.reference.ops.op_pad",
+        "Pad_18": "onnx.reference.ops.op_pad",
+        "Pow": "onnx.reference.ops.op_pow",
+        "PRelu": "onnx.reference.ops.op_prelu",
+        "QLinearConv": "onnx.reference.ops.op_qlinear_conv",
+        "QLinearMatMul": "onnx.reference.ops.op_qlinear_matmul",
+        "QuantizeLinear_10": "onnx.reference.ops.op_quantize_linear",
+        "QuantizeLinear_19": "onnx.reference.ops.op_quantize_linear",
+        "QuantizeLinear_21": "onnx.reference.ops.op_quantize_linear",
+        "RandomNormal": "onnx.reference.ops.op_random_normal",
+        "RandomNormalLike": "onnx.reference.ops.op_random_normal_like",
+        "RandomUniform": "onnx.reference.ops.op_random_uniform",
+        "RandomUniformLike": "onnx.reference.ops.op_random_uniform_like",
+        "Range": "onnx.reference.ops.op_range",
+        "Reciprocal": "onnx.reference.ops.op_reciprocal",
+        "ReduceL1_1": "onnx.reference.ops.op_reduce_l1",
+        "ReduceL1_18": "onnx.reference.ops.op_reduce_l1",
+        "ReduceL2_1": "onnx.reference.ops.op_reduce_l2",
+        "ReduceL2_18": "onnx.reference.ops.op_reduce_l2",
+        "ReduceLogSum_1": "onnx.reference.ops.op_reduce_log_sum",
+        "ReduceLogSum_18": "onnx.reference.ops.op_reduce_log_sum",
+        "ReduceLogSumExp_1": "onnx.reference.ops.op_reduce_log_sum_exp",
+        "ReduceLogSumExp_18": "onnx.reference.ops.op_reduce_log_sum_exp",
+        "ReduceMax_1": "onnx.reference.ops.op_reduce_max",
+        "ReduceMax_18": "onnx.reference.ops.op_reduce_max",
+        "ReduceMean_1": "onnx.reference.ops.op_reduce_mean",
+        "ReduceMean_18": "onnx.reference.ops.op_reduce_mean",
+        "ReduceMin_1": "onnx.reference.ops.op_reduce_min",
+        "ReduceMin_18": "onnx.reference.ops.op_reduce_min",
+        "ReduceProd_1": "onnx.reference.ops.op_reduce_prod",
+        "ReduceProd_18": "onnx.reference.ops.op_reduce_prod",
+        "ReduceSum_1": "onnx.reference.ops.op_reduce_sum",
+        "ReduceSum_13": "onnx.reference.ops.op_reduce_sum",
+        "ReduceSumSquare_1": "onnx.reference.ops.op_reduce_sum_square",
+        "ReduceSumSquare_18": "onnx.reference.ops.op_reduce_sum_square",
+        "RegexFullMatch": "onnx.reference.ops.op_regex_full_match",
+        "Relu": "onnx.reference.ops.op_relu",
+        "Reshape_5": "onnx.reference.ops.op_reshape",
+        "Reshape_14": "onnx.reference.ops.op_reshape",
+        "Resize": "onnx.reference.ops.op_resize",
+        "ReverseSequence": "onnx.reference.ops.op_reverse_sequence",
+        "RMSNormalization": "onnx.reference.ops.op_rms_normalization",
+        "RNN_7": "onnx.reference.ops.op_rnn",
+        "RNN_14": "onnx.reference.ops.op_rnn",
+        "RoiAlign": "onnx.reference.ops.op_roi_align",
+        "RotaryEmbedding": "onnx.reference.ops.op_rotary_embedding",
+        "Round": "onnx.reference.ops.op_round",
+        "Scan": "onnx.reference.ops.op_scan",
+        "ScatterElements": "onnx.reference.ops.op_scatter_elements",
+        "ScatterND": "onnx.reference.ops.op_scatternd",
+        "Selu": "onnx.reference.ops.op_selu",
+        "SequenceAt": "onnx.reference.ops.op_sequence_at",
+        "SequenceConstruct": "onnx.reference.ops.op_sequence_construct",
+        "SequenceEmpty": "onnx.reference.ops.op_sequence_empty",
+        "SequenceErase": "onnx.reference.ops.op_sequence_erase",
+        "SequenceInsert": "onnx.reference.ops.op_sequence_insert",
+        "SequenceLength": "onnx.reference.ops.op_sequence_length",
+        "SequenceMap": "onnx.reference.ops.op_sequence_map",
+        "Shape_1": "onnx.reference.ops.op_shape",
+        "Shape_15": "onnx.reference.ops.op_shape",
+        "Shrink": "onnx.reference.ops.op_shrink",
+        "Sigmoid": "onnx.reference.ops.op_sigmoid",
+        "Sign": "onnx.reference.ops.op_sign",
+        "Sin": "onnx.reference.ops.op_sin",
+        "Sinh": "onnx.reference.ops.op_sinh",
+        "Size": "onnx.reference.ops.op_size",
+        "Slice_1": "onnx.reference.ops.op_slice",
+        "Slice_10": "onnx.reference.ops.op_slice",
+        "Softmax": "onnx.reference.ops.op_softmax",
+        "SoftmaxCrossEntropyLoss": "onnx.reference.ops.op_softmax_cross_entropy_loss",
+        "Softplus": "onnx.reference.ops.op_softplus",
+        "Softsign": "onnx.reference.ops.op_softsign",
+        "Swish": "onnx.reference.ops.op_swish",
+        "SpaceToDepth": "onnx.reference.ops.op_space_to_depth",
+        "Split_2": "onnx.reference.ops.op_split",
+        "Split_11": "onnx.reference.ops.op_split",
+        "Split_13": "onnx.reference.ops.op_split",
+        "Split_18": "onnx.reference.ops.op_split",
+        "SplitToSequence": "onnx.reference.ops.op_split_to_sequence",
+        "Sqrt": "onnx.reference.ops.op_sqrt",
+        "Squeeze_1": "onnx.reference.ops.op_squeeze",
+        "Squeeze_11": "onnx.reference.ops.op_squeeze",
+        "Squeeze_13": "onnx.reference.ops.op_squeeze",
+        "STFT": "onnx.reference.ops.op_stft",
+        "StringConcat": "onnx.reference.ops.op_string_concat",
+        "StringNormalizer": "onnx.reference.ops.op_string_normalizer",
+        "StringSplit": "onnx.reference.ops.op_string_split",
+        "Sub": "onnx.reference.ops.op_sub",
+        "Sum": "onnx.reference.ops.op_sum",
+        "Tan": "onnx.reference.ops.op_tan",
+        "Tanh": "onnx.reference.ops.op_tanh",
+        "TensorScatter": "onnx.reference.ops.op_tensor_scatter",
+        "TfIdfVectorizer": "onnx.reference.ops.op_tfidf_vectorizer",
+        "ThresholdedRelu": "onnx.reference.ops.op_thresholded_relu",
+        "Tile": "onnx.reference.ops.op_tile",
+        "TopK_1": "onnx.reference.ops.op_topk",
+        "TopK_10": "onnx.reference.ops.op_topk",
+        "TopK_11": "onnx.reference.ops.op_topk",
+        "Transpose": "onnx.reference.ops.op_transpose",
+        "Trilu": "onnx.reference.ops.op_trilu",
+        "Unique": "onnx.reference.ops.op_unique",
+        "Unsqueeze_1": "onnx.reference.ops.op_unsqueeze",
+        "Unsqueeze_11": "onnx.reference.ops.op_unsqueeze",
+        "Unsqueeze_13": "onnx.reference.ops.op_unsqueeze",
+        "Upsample": "onnx.reference.ops.op_upsample",
+        "Where": "onnx.reference.ops.op_where",
+        "Xor": "onnx.reference.ops.op_xor",
+    },
+    "ai.onnx.ml": {
+        "ArrayFeatureExtractor": "onnx.reference.ops.aionnxml.op_array_feature_extractor",
+        "Binarizer": "onnx.reference.ops.aionnxml.op_binarizer",
+        "DictVectorizer": "onnx.reference.ops.aionnxml.op_dict_vectorizer",
+        "FeatureVectorizer": "onnx.reference.ops.aionnxml.op_feature_vectorizer",
+        "Imputer": "onnx.reference.ops.aionnxml.op_imputer",
+        "LabelEncoder": "onnx.reference.ops.aionnxml.op_label_encoder",
+        "LinearClassifier": "onnx.reference.ops.aionnxml.op_linear_classifier",
+        "LinearRegressor": "onnx.reference.ops.aionnxml.op_linear_regressor",
+        "Normalizer": "onnx.reference.ops.aionnxml.op_normalizer",
+        "OneHotEncoder": "onnx.reference.ops.aionnxml.op_one_hot_encoder",
+        "Scaler": "onnx.reference.ops.aionnxml.op_scaler",
+        "SVMClassifier": "onnx.reference.ops.aionnxml.op_svm_classifier",
+        "SVMRegressor": "onnx.reference.ops.aionnxml.op_svm_regressor",
+        "TreeEnsemble": "onnx.reference.ops.aionnxml.op_tree_ensemble",
+        "TreeEnsembleClassifier": "onnx.reference.ops.aionnxml.op_tree_ensemble_classifier",
+        "TreeEnsembleRegressor": "onnx.reference.ops.aionnxml.op_tree_ensemble_regressor",
+    },
+    "ai.onnx.preview.training": {
+        "Adagrad": "onnx.reference.ops.aionnx_preview_training.op_adagrad",
+        "Adam": "onnx.reference.ops.aionnx_preview_training.op_adam",
+        "Momentum": "onnx.reference.ops.aionnx_preview_training.op_momentum",
+    },
+    "experimental": {
+        "Im2Col": "onnx.reference.ops.experimental.op_im2col",
+    },
+}
@@ -1,6 +1,8 @@
 # Copyright (c) ONNX Project Contributors
 
 # SPDX-License-Identifier: Apache-2.0
+# The implementations listed in __all__ are imported by __getattr__.
+# ruff: noqa: F822
 from __future__ import annotations
 
 __all__ = [
@@ -13,15 +15,22 @@ __all__ = [
 import textwrap
 from typing import Any
 
-from onnx.reference.op_run import OpFunction, OpRun
-from onnx.reference.ops._helpers import build_registered_operators_any_domain
-from onnx.reference.ops.aionnx_preview_training.op_adagrad import Adagrad
-from onnx.reference.ops.aionnx_preview_training.op_adam import Adam
-from onnx.reference.ops.aionnx_preview_training.op_momentum import Momentum
+from onnx.reference.op_run import OpFunction
+from onnx.reference.ops._helpers import (
+    LazyRegisteredOperators,
+    import_operator,
+)
+from onnx.reference.ops._op_table import OP_TABLE
 
 
-def _build_registered_operators() -> dict[str, dict[int | None, type[OpRun]]]:
-    return build_registered_operators_any_domain(globals().copy())
+def __getattr__(name: str) -> Any:
+    # The implementations are imported the first time they are used,
+    # the generated table tells which module defines every one of them.
+    return import_operator(OP_TABLE["ai.onnx.preview.training"], __name__, name)
+
+
+def _build_registered_operators() -> LazyRegisteredOperators:
+    return LazyRegisteredOperators(OP_TABLE["ai.onnx.preview.training"])
 
 
 def load_op(
@@ -86,4 +95,4 @@ def load_op(
     return cl
 
 
-_registered_operators: dict[str, dict[int | None, type[OpRun]]] | None = None
+_registered_operators: LazyRegisteredOperators | None = None
@@ -3,6 +3,9 @@
 # Operator ZipMap is not implemented. Its use should
 # be discouraged. It is just a different way to output
 # probabilities not consumed by any operator.
+
+# The implementations listed in __all__ are imported by __getattr__.
+# ruff: noqa: F822
 from __future__ import annotations
 
 __all__ = [
@@ -29,31 +32,23 @@ __all__ = [
 import textwrap
 from typing import Any
 
-from onnx.reference.op_run import OpFunction, OpRun
-from onnx.reference.ops._helpers import build_registered_operators_any_domain
-from onnx.reference.ops.aionnxml._op_run_aionnxml import OpRunAiOnnxMl
-from onnx.reference.ops.aionnxml.op_array_feature_extractor import ArrayFeatureExtractor
-from onnx.reference.ops.aionnxml.op_binarizer import Binarizer
-from onnx.reference.ops.aionnxml.op_dict_vectorizer import DictVectorizer
-from onnx.reference.ops.aionnxml.op_feature_vectorizer import FeatureVectorizer
-from onnx.reference.ops.aionnxml.op_imputer import Imputer
-from onnx.reference.ops.aionnxml.op_label_encoder import LabelEncoder
-from onnx.reference.ops.aionnxml.op_linear_classifier import LinearClassifier
-from onnx.reference.ops.aionnxml.op_linear_regressor import LinearRegressor
-from onnx.reference.ops.aionnxml.op_normalizer import Normalizer
-from onnx.reference.ops.aionnxml.op_one_hot_encoder import OneHotEncoder
-from onnx.reference.ops.aionnxml.op_scaler import Scaler
-from onnx.reference.ops.aionnxml.op_svm_classifier import SVMClassifier
-from onnx.reference.ops.aionnxml.op_svm_regressor import SVMRegressor
-from onnx.reference.ops.aionnxml.op_tree_ensemble import TreeEnsemble
-from onnx.reference.ops.aionnxml.op_tree_ensemble_classifier import (
-    TreeEnsembleClassifier,
+from onnx.reference.op_run import OpFunction
+from onnx.reference.ops._helpers import (
+    LazyRegisteredOperators,
+    import_operator,
 )
-from onnx.reference.ops.aionnxml.op_tree_ensemble_regressor import TreeEnsembleRegressor
+from onnx.reference.ops._op_table import OP_TABLE
+from onnx.reference.ops.aionnxml._op_run_aionnxml import OpRunAiOnnxMl
+
+
+def __getattr__(name: str) -> Any:
+    # The implementations are imported the first time they are used,
+    # the generated table tells which module defines every one of them.
+    return import_operator(OP_TABLE["ai.onnx.ml"], __name__, name)
 
 
-def _build_registered_operators() -> dict[str, dict[int | None, type[OpRun]]]:
-    return build_registered_operators_any_domain(globals().copy())
+def _build_registered_operators() -> LazyRegisteredOperators:
+    return LazyRegisteredOperators(OP_TABLE["ai.onnx.ml"])
 
 
 def load_op(
@@ -118,4 +113,4 @@ def load_op(
     return cl
 
 
-_registered_operators: dict[str, dict[int | None, type[OpRun]]] | None = None
+_registered_operators: LazyRegisteredOperators | None = None
@@ -121,21 +121,29 @@ def set_score_svm(
 
 
 class SVMClassifier(OpRunAiOnnxMl):
-    def _run_linear(self, X, coefs, class_count_, kernel_type_):
+    def _run_linear(self, svm, X, coefs, class_count_, kernel_type_):
         scores = []
         for j in range(class_count_):
-            d = self._svm.kernel_dot(X, coefs[j], kernel_type_)
-            score = self._svm.atts.rho[0] + d
+            d = svm.kernel_dot(X, coefs[j], kernel_type_)
+            score = svm.atts.rho[0] + d
             scores.append(score)
         return np.array(scores, dtype=X.dtype)
 
     def _run_svm(
-        self, X, sv, vector_count_, kernel_type_, class_count_, starting_vector_, coefs
+        self,
+        svm,
+        X,
+        sv,
+        vector_count_,
+        kernel_type_,
+        class_count_,
+        starting_vector_,
+        coefs,
     ):
         evals = 0
 
         kernels_list = [
-            self._svm.kernel_dot(X, sv[j], kernel_type_) for j in range(vector_count_)
+            svm.kernel_dot(X, sv[j], kernel_type_) for j in range(vector_count_)
         ]
         kernels = np.array(kernels_list)
 
@@ -143,11 +151,11 @@ class SVMClassifier(OpRunAiOnnxMl):
         scores = []
         for i in range(class_count_):
             si_i = starting_vector_[i]
-            class_i_sc = self._svm.atts.vectors_per_class[i]
+            class_i_sc = svm.atts.vectors_per_class[i]
 
             for j in range(i + 1, class_count_):
                 si_j = starting_vector_[j]
-                class_j_sc = self._svm.atts.vectors_per_class[j]
+                class_j_sc = svm.atts.vectors_per_class[j]
 
                 s1 = np.dot(
                     coefs[j - 1, si_i : si_i + class_i_sc],
@@ -158,7 +166,7 @@ class SVMClassifier(OpRunAiOnnxMl):
                     kernels[si_j : si_j + class_j_sc],
                 )
 
-                s = self._svm.atts.rho[evals] + s1 + s2
+                s = svm.atts.rho[evals] + s1 + s2
                 scores.append(s)
                 if s > 0:
                     votes[i] += 1
@@ -167,7 +175,7 @@ class SVMClassifier(OpRunAiOnnxMl):
                 evals += 1
         return votes, np.array(scores, dtype=X.dtype)
 
-    def _probabilities(self, scores, class_count_):
+    def _probabilities(self, svm, scores, class_count_):
         probsp2 = np.zeros((class_count_, class_count_), dtype=scores.dtype)
 
         index = 0
@@ -175,8 +183,8 @@ class SVMClassifier(OpRunAiOnnxMl):
             for j in range(i + 1, class_count_):
                 val1 = sigmoid_probability(
                     scores[index],
-                    self._svm.atts.prob_a[index],
-                    self._svm.atts.prob_b[index],
+                    svm.atts.prob_a[index],
+                    svm.atts.prob_b[index],
                 )
                 val2 = max(val1, 1.0e-7)
                 val2 = min(val2, (1 - 1.0e-7))
@@ -186,7 +194,7 @@ class SVMClassifier(OpRunAiOnnxMl):
         return multiclass_probability(class_count_, probsp2)
 
     def _compute_final_scores(
-        self, votes, scores, weights_are_all_positive_, has_proba, classlabels_ints
+        self, svm, votes, scores, weights_are_all_positive_, has_proba, classlabels_ints
     ):
         max_weight = 0
         if votes is not None and len(votes) > 0:
@@ -197,7 +205,7 @@ class SVMClassifier(OpRunAiOnnxMl):
             max_weight = scores[max_class]
 
         write_additional_scores = -1
-        if self._svm.atts.rho.size == 1:
+        if svm.atts.rho.size == 1:
             label, write_additional_scores = set_score_svm(
                 max_weight,
                 max_class,
@@ -215,7 +223,7 @@ class SVMClassifier(OpRunAiOnnxMl):
         new_scores = write_scores(
             scores.size,
             scores,
-            self._svm.atts.post_transform,
+            svm.atts.post_transform,
             write_additional_scores,
         )
         return label, new_scores
@@ -246,8 +254,6 @@ class SVMClassifier(OpRunAiOnnxMl):
             support_vectors=support_vectors,
             vectors_per_class=vectors_per_class,
         )
-        # unused unless for debugging purposes
-        self._svm = svm
 
         vector_count_ = 0
         class_count_ = max(len(classlabels_ints or classlabels_strings or []), 1)
@@ -275,7 +281,7 @@ class SVMClassifier(OpRunAiOnnxMl):
         if vector_count_ == 0 and mode == "SVM_LINEAR":
             res = np.empty((X.shape[0], class_count_), dtype=X.dtype)
             for n in range(X.shape[0]):
-                scores = self._run_linear(X[n], coefs, class_count_, kernel_type_)
+                scores = self._run_linear(svm, X[n], coefs, class_count_, kernel_type_)
                 res[n, :] = scores
             votes = None
         else:
@@ -285,6 +291,7 @@ class SVMClassifier(OpRunAiOnnxMl):
             votes = np.empty((X.shape[0], class_count_), dtype=X.dtype)
             for n in range(X.shape[0]):
                 vote, scores = self._run_svm(
+                    svm,
                     X[n],
                     sv,
                     vector_count_,
@@ -304,7 +311,7 @@ class SVMClassifier(OpRunAiOnnxMl):
         ):
             scores = np.empty((res.shape[0], class_count_), dtype=X.dtype)
             for n in range(scores.shape[0]):
-                s = self._probabilities(res[n], class_count_)
+                s = self._probabilities(svm, res[n], class_count_)
                 scores[n, :] = s
             has_proba = True
         else:
@@ -316,6 +323,7 @@ class SVMClassifier(OpRunAiOnnxMl):
         labels = []
         for n in range(scores.shape[0]):
             label, new_scores = self._compute_final_scores(
+                svm,
                 None if votes is None else votes[n],
                 scores[n],
                 weights_are_all_positive_,
@@ -34,8 +34,6 @@ class SVMRegressor(OpRunAiOnnxMl):
             rho=rho,
             support_vectors=support_vectors,
         )
-        # adding an attribute for debugging purpose
-        self._svm = svm
         res = svm.run_reg(X)
 
         if post_transform in (None, "NONE"):
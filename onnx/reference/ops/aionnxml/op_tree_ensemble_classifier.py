@@ -59,8 +59,6 @@ class TreeEnsembleClassifier(OpRunAiOnnxMl):
             class_weights=class_weights,
             class_weights_as_tensor=class_weights_as_tensor,
         )
-        # unused unless for debugging purposes
-        self._tree = tr
         if X.dtype not in (np.float32, np.float64):
             X = X.astype(np.float32)
         leaves_index = tr.leave_index_tree(X)
@@ -55,8 +55,6 @@ class TreeEnsembleRegressor(OpRunAiOnnxMl):
             target_weights=target_weights,
             target_weights_as_tensor=target_weights_as_tensor,
         )
-        # unused unless for debugging purposes
-        self._tree = tr
         leaves_index = tr.leave_index_tree(X)
         res = np.zeros((leaves_index.shape[0], n_targets), dtype=X.dtype)
         n_trees = len(set(tr.atts.nodes_treeids))
@@ -1,18 +1,34 @@
 # Copyright (c) ONNX Project Contributors
 
 # SPDX-License-Identifier: Apache-2.0
+# The implementations listed in __all__ are imported by __getattr__.
+# ruff: noqa: F822
 from __future__ import annotations
 
+__all__ = [
+    "load_op",
+    "Im2Col",
+]
+
 import textwrap
 from typing import Any
 
-from onnx.reference.op_run import OpFunction, OpRun
-from onnx.reference.ops._helpers import build_registered_operators_any_domain
-from onnx.reference.ops.experimental.op_im2col import Im2Col  # noqa: F401
+from onnx.reference.op_run import OpFunction
+from onnx.reference.ops._helpers import (
+    LazyRegisteredOperators,
+    import_operator,
+)
+from onnx.reference.ops._op_table import OP_TABLE
+
+
+def __getattr__(name: str) -> Any:
+    # The implementations are imported the first time they are used,
+    # the generated table tells which module defines every one of them.
+    return import_operator(OP_TABLE["experimental"], __name__, name)
 
 
-def _build_registered_operators() -> dict[str, dict[int | None, type[OpRun]]]:
-    return build_registered_operators_any_domain(globals().copy())
+def _build_registered_operators() -> LazyRegisteredOperators:
+    return LazyRegisteredOperators(OP_TABLE["experimental"])
 
 
 def load_op(
@@ -69,4 +85,4 @@ def load_op(
     return impl[best]
 
 
-_registered_operators: dict[str, dict[int | None, type[OpRun]]] | None = None
+_registered_operators: LazyRegisteredOperators | None = None
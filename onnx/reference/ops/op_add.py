@@ -9,5 +9,7 @@ from onnx.reference.ops._op import OpRunBinaryNumpy
 
 
 class Add(OpRunBinaryNumpy):
+    supports_out = True
+
     def __init__(self, onnx_node, run_params):
         OpRunBinaryNumpy.__init__(self, np.add, onnx_node, run_params)
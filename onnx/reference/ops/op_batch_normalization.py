@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from onnx.reference.op_run import OpRun
+from onnx.reference.op_run import OpRun, can_write
 
 
 def _batchnorm_test_mode(
@@ -15,6 +15,7 @@ def _batchnorm_test_mode(
     mean: np.ndarray,
     var: np.ndarray,
     epsilon: float = 1e-5,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     dims_x = len(x.shape)
     dim_ones = (1,) * (dims_x - 2)
@@ -22,6 +23,15 @@ def _batchnorm_test_mode(
     bias = bias.reshape(-1, *dim_ones)
     mean = mean.reshape(-1, *dim_ones)
     var = var.reshape(-1, *dim_ones)
+    shape = np.broadcast_shapes(x.shape, s.shape, bias.shape, mean.shape, var.shape)
+    if can_write(out, shape, x.dtype) and np.result_type(
+        x, s, bias, mean, var, epsilon
+    ) == np.dtype(x.dtype):
+        # Same operations in the same order, without any temporary array.
+        np.subtract(x, mean, out=out)
+        np.multiply(s, out, out=out)
+        np.divide(out, np.sqrt(var + epsilon), out=out)
+        return np.add(out, bias, out=out)
     y = s * (x - mean) / np.sqrt(var + epsilon) + bias
     return y.astype(x.dtype)
 
@@ -73,9 +83,13 @@ class BatchNormalization_6(OpRun):
 
 
 class BatchNormalization_9(OpRun):
-    def _run(self, x, scale, bias, mean, var, epsilon=None, momentum=None):
+    supports_out = True
+
+    def _run(self, x, scale, bias, mean, var, epsilon=None, momentum=None, out=None):
         if momentum is None:
-            res = _batchnorm_test_mode(x, scale, bias, mean, var, epsilon=epsilon)
+            res = _batchnorm_test_mode(
+                x, scale, bias, mean, var, epsilon=epsilon, out=out
+            )
             return (res,)
         axis = tuple(np.delete(np.arange(len(x.shape)), 1))
         saved_mean = x.mean(axis=axis)
@@ -89,11 +103,24 @@ class BatchNormalization_9(OpRun):
 
 
 class BatchNormalization_14(OpRun):
+    supports_out = True
+
     def _run(
-        self, x, scale, bias, mean, var, epsilon=None, momentum=None, training_mode=None
+        self,
+        x,
+        scale,
+        bias,
+        mean,
+        var,
+        epsilon=None,
+        momentum=None,
+        training_mode=None,
+        out=None,
     ):
         if training_mode == 0:
-            res = _batchnorm_test_mode(x, scale, bias, mean, var, epsilon=epsilon)
+            res = _batchnorm_test_mode(
+                x, scale, bias, mean, var, epsilon=epsilon, out=out
+            )
             return (res,)
         res, __, _, output_mean, output_var = _batchnorm_training_mode(
             x, scale, bias, mean, var, momentum, epsilon
@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 
 from onnx.reference.op_run import OpRun
@@ -184,6 +186,90 @@ def col2im_naive_implementation(
     return data_im
 
 
+@functools.lru_cache(maxsize=128)
+def _col2im_indices(
+    image_shape: tuple[int, ...],
+    kernel_shape: tuple[int, ...],
+    dilations: tuple[int, ...],
+    pads: tuple[int, ...],
+    strides: tuple[int, ...],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the flat indices of the elements of a column matrix
+    `(kernel_size, n_blocks)` falling into the image and the flat
+    position in the image every one of them is added to.
+    The arrays are cached and must not be modified.
+    """
+    n_dims = len(image_shape)
+    n_blocks = [
+        (size + pads[i] + pads[i + n_dims] - (d * (k - 1) + 1)) // s + 1
+        for i, (size, k, d, s) in enumerate(
+            zip(image_shape, kernel_shape, dilations, strides, strict=True)
+        )
+    ]
+    # Coordinate along every dimension of the image, shape (*kernel, *blocks).
+    grid = np.ix_(
+        *(np.arange(k) for k in kernel_shape), *(np.arange(b) for b in n_blocks)
+    )
+    coords = [
+        grid[i] * dilations[i] + grid[i + n_dims] * strides[i] - pads[i]
+        for i in range(n_dims)
+    ]
+    inside = np.ones([*kernel_shape, *n_blocks], dtype=bool)
+    for c, size in zip(coords, image_shape, strict=True):
+        inside &= (c >= 0) & (c < size)
+    columns = np.flatnonzero(inside)
+    positions = np.ravel_multi_index(
+        [np.broadcast_to(c, inside.shape).ravel()[columns] for c in coords],
+        image_shape,
+    )
+    columns.setflags(write=False)
+    positions.setflags(write=False)
+    return columns, positions
+
+
+def _col2im(data, image_shape, kernel_shape, dilations, pads, strides):
+    """Vectorized `col2im`, *data* has shape `(..., kernel_size, n_blocks)`,
+    the result has shape `(..., *image_shape)`.
+
+    Every element is added to its position in the image with a single
+    scatter-add over precomputed flat indices.
+    """
+    image_shape = tuple(int(i) for i in image_shape)
+    kernel_shape = tuple(int(i) for i in kernel_shape)
+    n_dims = len(image_shape)
+    new_pads = np.array([(pads[i], pads[i + n_dims]) for i in range(n_dims)])
+    _col2im_shape_check(
+        data.reshape((int(np.prod(data.shape[:-1])), data.shape[-1])),
+        image_shape,
+        kernel_shape,
+        dilations,
+        new_pads,
+        strides,
+    )
+    columns, positions = _col2im_indices(
+        image_shape,
+        kernel_shape,
+        tuple(int(i) for i in dilations),
+        tuple(int(i) for i in pads),
+        tuple(int(i) for i in strides),
+    )
+    leading = data.shape[:-2]
+    n_images = int(np.prod(leading))
+    image_size = int(np.prod(image_shape))
+    values = data.reshape((n_images, -1))[:, columns]
+    indices = (
+        positions + np.arange(n_images, dtype=np.int64)[:, np.newaxis] * image_size
+    ).ravel()
+    if data.dtype.kind == "f":
+        res = np.bincount(
+            indices, weights=values.ravel(), minlength=n_images * image_size
+        ).astype(data.dtype)
+    else:
+        res = np.zeros(n_images * image_size, dtype=data.dtype)
+        np.add.at(res, indices, values.ravel())
+    return res.reshape((*leading, *image_shape))
+
+
 class Col2Im(OpRun):
     def _run(
         self, data, image_shape, block_shape, dilations=None, pads=None, strides=None
@@ -195,19 +281,7 @@ class Col2Im(OpRun):
         if strides is None:
             strides = [1 for s in image_shape]
 
-        bl = np.prod(block_shape)
+        bl = int(np.prod(block_shape))
         C = data.shape[1] // bl
         data = data.reshape((*data.shape[:1], C, bl, *data.shape[2:]))
-
-        ks = tuple(block_shape)
-        res = None
-        for n in range(data.shape[0]):
-            for c in range(data.shape[1]):
-                out = col2im_naive_implementation(
-                    data[n, c, ...], image_shape, ks, dilations, pads, strides
-                )
-                if res is None:
-                    new_shape = data.shape[:2] + out.shape
-                    res = np.empty(new_shape, dtype=data.dtype)
-                res[n, c, ...] = out
-        return (res,)
+        return (_col2im(data, image_shape, block_shape, dilations, pads, strides),)
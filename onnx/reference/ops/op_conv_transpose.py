@@ -6,7 +6,7 @@ from __future__ import annotations
 import numpy as np
 
 from onnx.reference.op_run import OpRun
-from onnx.reference.ops.op_col2im import col2im_naive_implementation
+from onnx.reference.ops.op_col2im import _col2im
 
 
 class ConvTranspose(OpRun):
@@ -56,7 +56,6 @@ class ConvTranspose(OpRun):
                     pads_1.append(total_padding[i] - (total_padding[i] // 2))
                     pads_2.append(total_padding[i] // 2)
             pads = pads_1 + pads_2
-            n_dims = len(pads) // 2
         else:
             n_dims = len(X.shape) - 2
             new_pads = np.array([(pads[i], pads[i + n_dims]) for i in range(n_dims)])
@@ -69,71 +68,30 @@ class ConvTranspose(OpRun):
                     for i in range(n_dims)
                 ]
 
-        kernel_shape = W.shape[2:]
-        kernel_size = np.prod(kernel_shape)
-        num_output_channels = W.shape[1] * group
-        kernel_dim = num_output_channels // group * kernel_size
-
-        C = X.shape[1]  # num_inputs_channels
-        m = kernel_dim  # kernel_dim
-        n = np.prod(X.shape[2:])  # input_image_size
-        k = C // group
-        w_reshaped = W.reshape((group, k, m))
-        final = None
-
         # N x C x H x W = X.shape
         # C x M/group x k1 x k2 = W.shape
-        if group == 1:
-            for image_id in range(X.shape[0]):
-                w_t = w_reshaped[0].T
-                gemm = np.matmul(w_t, X[image_id].reshape((k, n)))
-                gemmc = gemm.reshape((num_output_channels, -1, gemm.shape[-1]))
-                for c in range(num_output_channels):
-                    res = col2im_naive_implementation(
-                        gemmc[c], output_shape, kernel_shape, dilations, pads, strides
-                    )
-                    if final is None:
-                        final = np.empty(
-                            (*X.shape[:1], num_output_channels, *res.shape),
-                            dtype=X.dtype,
-                        )
-                    if B is not None:
-                        res += B[c]
-                    final[image_id, c, ...] = res[...]
-        else:
-            final = np.zeros((X.shape[0], num_output_channels, *output_shape))
-            output_array = []
-
-            for group_id in range(group):
-                group_X = X[:, group_id * C // group : (group_id + 1) * C // group, ...]
-                group_W = W[
-                    group_id * num_output_channels // group : (group_id + 1)
-                    * num_output_channels
-                    // group,
-                    ...,
-                ]
-
-                group_output = self._run(
-                    group_X,
-                    group_W,
-                    B=B,
-                    auto_pad=auto_pad,
-                    dilations=dilations,
-                    group=1,
-                    kernel_shape=kernel_shape,
-                    output_padding=output_padding,
-                    output_shape=output_shape,
-                    pads=pads,
-                    strides=strides,
-                )
-                group_output = np.array(group_output[0])
-                output_array.append(group_output)
-
-            for image_id in range(X.shape[0]):
-                for group_id in range(group):
-                    group_output = output_array[group_id]
-                    final[image_id, group_id : (group_id + 1), ...] = group_output[
-                        image_id, ...
-                    ]
+        group = group or 1
+        kernel_shape = W.shape[2:]
+        kernel_size = int(np.prod(kernel_shape))
+        n, c = X.shape[:2]
+        num_output_channels = W.shape[1] * group
+        n_blocks = int(np.prod(X.shape[2:]))
+        if B is not None and B.shape != (num_output_channels,):
+            raise ValueError(
+                f"B must have shape ({num_output_channels},) "
+                f"but its shape is {B.shape}."
+            )
 
-        return (final.astype(X.dtype),)  # type: ignore[union-attr]
+        # float16 and bfloat16 are accumulated in float32.
+        dtype = np.float32 if X.dtype.kind == "f" and X.dtype.itemsize < 4 else None
+        x = X.reshape((n, group, c // group, n_blocks))
+        w = W.reshape((group, c // group, -1)).transpose((0, 2, 1))
+        if dtype is not None:
+            x, w = x.astype(dtype), w.astype(dtype)
+        # Every group multiplies its columns by its weights at once,
+        # col2im then adds every column to the blocks of the output.
+        cols = np.matmul(w, x).reshape((n, num_output_channels, kernel_size, n_blocks))
+        final = _col2im(cols, output_shape, kernel_shape, dilations, pads, strides)
+        if B is not None:
+            final += B.reshape((1, -1) + (1,) * (X.ndim - 2))
+        return (final.astype(X.dtype),)
@@ -5,10 +5,13 @@ from __future__ import annotations
 
 import numpy as np
 
+from onnx.reference.op_run import can_write
 from onnx.reference.ops._op import OpRunBinaryNumpy
 
 
 class Div(OpRunBinaryNumpy):
+    supports_out = True
+
     def __init__(self, onnx_node, run_params):
         def func(x, y):
             if issubclass(x.dtype.type, np.integer):
@@ -18,7 +21,14 @@ class Div(OpRunBinaryNumpy):
 
         OpRunBinaryNumpy.__init__(self, func, onnx_node, run_params)
 
-    def _run(self, a, b):
+    def _run(self, a, b, out=None):
+        if (
+            out is not None
+            and a.dtype == b.dtype
+            and np.issubdtype(a.dtype, np.floating)
+            and can_write(out, np.broadcast_shapes(a.shape, b.shape), a.dtype)
+        ):
+            return (np.divide(a, b, out=out),)
         res = OpRunBinaryNumpy._run(self, a, b)
         if res[0].dtype != a.dtype:
             return (res[0].astype(a.dtype),)
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from onnx.reference.op_run import OpRun
+from onnx.reference.op_run import OpRun, can_write
 
 
 def _layer_normalization(
@@ -14,6 +14,7 @@ def _layer_normalization(
     B: np.ndarray,
     axis: int = -1,
     epsilon: float = 1e-5,
+    out: np.ndarray | None = None,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     X_shape = X.shape
     X_rank = len(X_shape)
@@ -53,21 +54,38 @@ def _layer_normalization(
     y_mat = x_diff * inv_std_dev
     # Apply affine transform on normalization outcome.
     # W is linear coefficient while B is bias.
-    Y = np.reshape(y_mat, X_shape) * W
-    if B is not None:
-        Y = Y + B
+    y_mat = np.reshape(y_mat, X_shape)
+    shape = np.broadcast_shapes(X_shape, W.shape, *([] if B is None else [B.shape]))
+    if can_write(out, shape, X.dtype) and np.result_type(
+        y_mat, W, *([] if B is None else [B])
+    ) == np.dtype(X.dtype):
+        Y = np.multiply(y_mat, W, out=out)
+        if B is not None:
+            np.add(Y, B, out=Y)
+    else:
+        Y = y_mat * W
+        if B is not None:
+            Y = Y + B
     # Matrix-level operations' outputs should be reshaped
     # to compensate the initial tensor-to-matrix reshape.
     X_mean = np.reshape(x_mean, reduction_shape)
     X_inv_std_dev = np.reshape(inv_std_dev, reduction_shape)
 
-    return (Y.astype(X.dtype), X_mean.astype(X.dtype), X_inv_std_dev.astype(X.dtype))
+    return (
+        Y.astype(X.dtype, copy=False),
+        X_mean.astype(X.dtype),
+        X_inv_std_dev.astype(X.dtype),
+    )
 
 
 class LayerNormalization(OpRun):
-    def _run(self, X, Scale, B=None, axis=None, epsilon=None, stash_type=None):
+    supports_out = True
+
+    def _run(
+        self, X, Scale, B=None, axis=None, epsilon=None, stash_type=None, out=None
+    ):
         if stash_type != 1:
             raise NotImplementedError(
                 f"LayerNormalization not implemented for stash_type={stash_type} != 1."
             )
-        return _layer_normalization(X, Scale, B, axis=axis, epsilon=epsilon)
+        return _layer_normalization(X, Scale, B, axis=axis, epsilon=epsilon, out=out)
@@ -5,9 +5,14 @@ from __future__ import annotations
 
 import numpy as np
 
+from onnx.reference.op_run import can_write
 from onnx.reference.ops._op import OpRunUnaryNum
 
 
 class Log(OpRunUnaryNum):
-    def _run(self, x):
+    supports_out = True
+
+    def _run(self, x, out=None):
+        if can_write(out, x.shape, x.dtype) and np.issubdtype(x.dtype, np.floating):
+            return (np.log(x, out=out),)
         return (np.log(x).astype(x.dtype),)
@@ -9,7 +9,7 @@ from onnx.reference.ops.op_softmax import Softmax
 
 
 class LogSoftmax(Softmax):
-    def _run(self, X):
-        Y = Softmax._run(self, X)[0]
+    def _run(self, X, out=None):
+        Y = Softmax._run(self, X, out=out)[0]
         np.log(Y, out=Y)
         return (Y,)
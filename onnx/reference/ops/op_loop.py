@@ -6,6 +6,7 @@ from __future__ import annotations
 import numpy as np
 
 from onnx.reference.op_run import OpRun
+from onnx.reference.ops._op_common_scan import ScanOutputBuffer
 
 
 class Loop(OpRun):
@@ -50,7 +51,10 @@ class Loop(OpRun):
             for a in context:
                 inputs[a] = context[a]
 
-        k_carried_away = [[] for i in range(self.K)]
+        # Scan outputs are written into buffers sized after the trip count,
+        # it is only an upper bound as the loop may stop on cond.
+        capacity = None if M is None or M.size != 1 else int(M.item())
+        k_carried_away = [ScanOutputBuffer(capacity) for i in range(self.K)]
         it = 0
         while cond and (M is None or it < M):
             self._log("  -- loop> {%r}", context)
@@ -79,7 +83,7 @@ class Loop(OpRun):
             outputs = [inputs[i] for i in body.input_names[2:]]
         else:
             outputs = outputs[1 : 1 + self.N]
-        outputs.extend([np.vstack(x) for x in k_carried_away])
+        outputs.extend([x.result() for x in k_carried_away])
         while len(outputs) < len(self.onnx_node.output):
             outputs.append(np.empty(shape=()))
         res = tuple(outputs)
@@ -5,21 +5,46 @@ from __future__ import annotations
 
 import numpy as np
 
+from onnx.reference.op_run import can_write
 from onnx.reference.ops._op import OpRunBinaryNum
 
 
-def numpy_matmul(a, b):
+def numpy_matmul(a, b, out=None):
     """Implements a matmul product. See :func:`np.matmul`.
-    Handles sparse matrices.
+    Handles sparse matrices. The result is written into *out*
+    if it is specified, it must have the shape and the type of the result.
     """
     try:
         if len(a.shape) <= 2 and len(b.shape) <= 2:
-            return np.dot(a, b)
-        return np.matmul(a, b)
+            return np.dot(a, b, out=out)
+        return np.matmul(a, b, out=out)
     except ValueError as e:
         raise ValueError(f"Unable to multiply shapes {a.shape!r}, {b.shape!r}.") from e
 
 
+def _matmul_shape(a: np.ndarray, b: np.ndarray) -> tuple[int, ...] | None:
+    """Returns the shape of the matrix product if both inputs have
+    at least two dimensions and are compatible, None otherwise.
+    """
+    if len(a.shape) < 2 or len(b.shape) < 2 or a.shape[-1] != b.shape[-2]:
+        return None
+    try:
+        batch = np.broadcast_shapes(a.shape[:-2], b.shape[:-2])
+    except ValueError:
+        return None
+    return (*batch, a.shape[-2], b.shape[-1])
+
+
 class MatMul(OpRunBinaryNum):
-    def _run(self, a, b):
+    supports_out = True
+
+    def _run(self, a, b, out=None):
+        if out is not None and a.dtype == b.dtype:
+            shape = _matmul_shape(a, b)
+            if (
+                shape is not None
+                and can_write(out, shape, a.dtype)
+                and out.flags.c_contiguous
+            ):
+                return (numpy_matmul(a, b, out=out),)
         return (numpy_matmul(a, b),)
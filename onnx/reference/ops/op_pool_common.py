@@ -3,13 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
-import itertools
 import math
 from typing import TYPE_CHECKING
 
 import numpy as np
 
 from onnx.reference.op_run import OpRun
+from onnx.reference.ops._op_common_pool import _pool
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -200,12 +200,13 @@ def pool(
         pads = pads * spatial_size * 2
     strides = strides or [1] * spatial_size
 
-    # Iterate all the possible sliding windows
-    for shape in itertools.product(
-        range(x_shape[0]),  # e.g. dim=0: [0]
-        range(x_shape[1]),  # e.g. dim=1: [0, 1]
-        *[
-            range(
+    # Number of windows along every axis, the first one starts
+    # at the beginning of the padded tensor.
+    n_windows = [
+        max(
+            0,
+            min(
+                out_shape[i],
                 int(
                     (
                         x_shape[i + 2]
@@ -215,55 +216,25 @@ def pool(
                     )
                     / strides[i]
                     + 1
-                )
-            )
-            for i in range(spatial_size)
-        ],
-    ):
-        window = padded[shape[0], shape[1]]
-        window_vals = np.array(
-            [
-                window[i]
-                for i in list(
-                    itertools.product(
-                        *[
-                            [
-                                pixel
-                                for pixel in range(
-                                    strides[i] * shape[i + 2],
-                                    strides[i] * shape[i + 2]
-                                    + (1 + (kernel[i] - 1) * dilations[i]),
-                                    dilations[i],
-                                )
-                                if pixel
-                                < x_shape[i + 2] + pads[i] + pads[spatial_size + i]
-                            ]
-                            for i in range(spatial_size)
-                        ]
-                    )
-                )
-            ]
+                ),
+            ),
         )
-
-        if pooling_type == "AVG":
-            f = np.average
-        elif pooling_type == "MAX":
-            f = np.max
-        elif pooling_type == "LPPOOL":
-
-            def lp_pool(x: np.array, p: int = p) -> float:
-                return np.sum(np.abs(x) ** p) ** (1.0 / p)
-
-            f = lp_pool
-        else:
-            raise NotImplementedError(
-                f"Pooling type {pooling_type} does not support. Should be AVG, MAX"
-            )
-
-        if count_include_pad == 1 and (pooling_type in {"AVG", "LPPOOL"}):
-            y[shape] = f(window_vals)
-        else:
-            y[shape] = f(window_vals[np.where(~np.isnan(window_vals))])
+        for i in range(spatial_size)
+    ]
+    limits = [
+        x_shape[i + 2] + pads[i] + pads[spatial_size + i] for i in range(spatial_size)
+    ]
+    y[(slice(None), slice(None), *(slice(0, n) for n in n_windows))] = _pool(
+        padded,
+        kernel,
+        strides,
+        dilations,
+        n_windows,
+        limits,
+        pooling_type,
+        count_include_pad=count_include_pad,
+        p=p,
+    )
     return y.astype(padded.dtype)
 
 
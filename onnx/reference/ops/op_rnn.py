@@ -108,9 +108,9 @@ class CommonRNN(OpRun):
         layout=None,
     ):
         # TODO: support overridden attributes.
-        self.num_directions = W.shape[0]
+        num_directions = W.shape[0]
 
-        if self.num_directions == 1:
+        if num_directions == 1:
             R = np.squeeze(R, axis=0)
             W = np.squeeze(W, axis=0)
             if B is not None:
@@ -135,7 +135,7 @@ class CommonRNN(OpRun):
             H_0 = h_0
         else:
             raise NotImplementedError(
-                f"Unsupported value {self.num_directions} for num_directions and operator {self.__class__.__name__!r}."
+                f"Unsupported value {num_directions} for num_directions and operator {self.__class__.__name__!r}."
             )
 
         Y, Y_h = self._step(X, R, B, W, H_0)
@@ -6,6 +6,7 @@ from __future__ import annotations
 import numpy as np
 
 from onnx.reference.op_run import OpRun
+from onnx.reference.ops._op_common_scan import ScanOutputBuffer
 
 
 class Scan(OpRun):
@@ -124,7 +125,7 @@ class Scan(OpRun):
         ) = self._common_run_shape(*args)
 
         max_iter = args[num_loop_state_vars].shape[self.input_axes_[0]]
-        results = [[] for _ in scan_names_out]
+        results = [ScanOutputBuffer(max_iter) for _ in scan_names_out]
 
         for it in range(max_iter):
             inputs = dict(zip(state_names_in, states, strict=False))
@@ -148,6 +149,5 @@ class Scan(OpRun):
                 results[i].append(np.expand_dims(outputs[name], axis=0))
 
         for res in results:
-            conc = np.vstack(res)
-            states.append(conc)
+            states.append(res.result())
         return self._check_and_fix_outputs(tuple(states))
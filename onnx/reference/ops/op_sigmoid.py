@@ -5,12 +5,24 @@ from __future__ import annotations
 
 import numpy as np
 
+from onnx.reference.op_run import can_write
 from onnx.reference.ops._op import OpRunUnaryNum
 
 
-def sigmoid(x: np.ndarray) -> np.ndarray:
-    """Numerically stable sigmoid implementation that supports scalars and nd-arrays."""
+def sigmoid(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Numerically stable sigmoid implementation that supports scalars and nd-arrays.
+    If *out* is specified, the result is computed in place in it with
+    the same formulas, *x* and *out* must be floats of the same type and shape.
+    """
     pos_mask = x > 0
+    if out is not None:
+        # exp(-|x|) is exp(-x) if x > 0, exp(x) otherwise.
+        np.absolute(x, out=out)
+        np.negative(out, out=out)
+        np.exp(out, out=out)
+        denominator = np.add(out, 1)
+        np.copyto(out, 1, where=pos_mask)
+        return np.divide(out, denominator, out=out)
     exp_x = np.exp(x)
     return np.where(
         pos_mask,
@@ -20,8 +32,12 @@ def sigmoid(x: np.ndarray) -> np.ndarray:
 
 
 class Sigmoid(OpRunUnaryNum):
+    supports_out = True
+
     def __init__(self, onnx_node, run_params):
         OpRunUnaryNum.__init__(self, onnx_node, run_params)
 
-    def _run(self, X):
+    def _run(self, X, out=None):
+        if can_write(out, X.shape, X.dtype) and np.issubdtype(X.dtype, np.floating):
+            return (sigmoid(X, out=out),)
         return (sigmoid(X).astype(X.dtype),)
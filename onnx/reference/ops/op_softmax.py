@@ -5,14 +5,22 @@ from __future__ import annotations
 
 import numpy as np
 
+from onnx.reference.op_run import can_write
 from onnx.reference.ops._op import OpRunUnaryNum
 
 
 class Softmax(OpRunUnaryNum):
-    def _run(self, X, axis=None):
+    supports_out = True
+
+    def _run(self, X, axis=None, out=None):
         if X.size == 0:
             return (X,)
         axis = axis or self.axis
+        if can_write(out, X.shape, X.dtype) and np.issubdtype(X.dtype, np.floating):
+            np.subtract(X, X.max(axis=axis, keepdims=1), out=out)
+            np.exp(out, out=out)
+            out /= out.sum(axis=axis, keepdims=1)
+            return (out,)
         tmp = X - X.max(axis=axis, keepdims=1)
         Y = np.exp(tmp)
         Y /= Y.sum(axis=axis, keepdims=1)
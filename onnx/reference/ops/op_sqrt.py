@@ -7,11 +7,16 @@ from warnings import catch_warnings, simplefilter
 
 import numpy as np
 
+from onnx.reference.op_run import can_write
 from onnx.reference.ops._op import OpRunUnaryNum
 
 
 class Sqrt(OpRunUnaryNum):
-    def _run(self, x):
+    supports_out = True
+
+    def _run(self, x, out=None):
         with catch_warnings():
             simplefilter("ignore")
+            if can_write(out, x.shape, x.dtype) and np.issubdtype(x.dtype, np.floating):
+                return (np.sqrt(x, out=out),)
             return (np.sqrt(x).astype(x.dtype),)
@@ -9,5 +9,7 @@ from onnx.reference.ops._op import OpRunBinaryNumpy
 
 
 class Sub(OpRunBinaryNumpy):
+    supports_out = True
+
     def __init__(self, onnx_node, run_params):
         OpRunBinaryNumpy.__init__(self, np.subtract, onnx_node, run_params)
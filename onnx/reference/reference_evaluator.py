@@ -3,13 +3,29 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from io import BytesIO
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
 import onnx
 import onnx.model_container
+import onnx.onnx_cpp2py_export.checker as c_checker
 from onnx.onnx_pb import (
     FunctionProto,
     GraphProto,
@@ -19,8 +35,159 @@ from onnx.onnx_pb import (
     TypeProto,
 )
 from onnx.reference import op_run
+from onnx.reference._arena import Arena
+from onnx.reference._codegen import CompiledPlan
+from onnx.reference._execution_plan import (
+    MISSING,
+    ExecutionPlan,
+    node_consumed_names,
+)
+from onnx.reference._fusion import fuse_elementwise
+from onnx.reference._profiling import NodeEvent, Profile, nbytes
 from onnx.reference.ops_optimized import optimized_operators
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from typing_extensions import Self
+
+
+# Operators producing a different result every time they are executed,
+# they cannot be replaced by a constant.
+_NON_DETERMINISTIC_OPS = {
+    "Bernoulli",
+    "Dropout",
+    "Multinomial",
+    "RandomNormal",
+    "RandomNormalLike",
+    "RandomUniform",
+    "RandomUniformLike",
+}
+
+
+def _is_deterministic(node: op_run.OpRun) -> bool:
+    """Tells if a node always produces the same outputs for the same inputs,
+    the nodes of its subgraphs and of the function it calls are checked
+    as well.
+    """
+    if node.op_type in _NON_DETERMINISTIC_OPS:
+        return False
+    evaluators = [getattr(node, "impl_", None)]
+    evaluators.extend(
+        getattr(node, att.name, None)
+        for att in node.onnx_node.attribute
+        if att.type == onnx.AttributeProto.GRAPH
+    )
+    return all(
+        all(_is_deterministic(n) for n in evaluator.rt_nodes_)
+        for evaluator in evaluators
+        if isinstance(evaluator, ReferenceEvaluator)
+    )
+
+
+def _is_foldable(node: op_run.OpRun) -> bool:
+    """Tells if a node with constant inputs can be replaced by its outputs."""
+    return not (
+        node.has_linked_attribute or node.need_context() or not _is_deterministic(node)
+    )
+
+
+# Element types whose elements do not use a whole number of bytes,
+# they cannot be mapped to a numpy array without unpacking.
+_PACKED_TYPES = {
+    TensorProto.INT2,
+    TensorProto.UINT2,
+    TensorProto.INT4,
+    TensorProto.UINT4,
+    TensorProto.FLOAT4E2M1,
+}
+
+
+def _memmap_external_data(tensor: TensorProto, base_dir: str) -> np.ndarray:
+    """Returns a read-only memory-mapped array on the external data
+    of a tensor. Strings, packed types, empty tensors or big endian
+    machines fall back to loading the data into memory.
+    """
+    info = onnx.external_data_helper.ExternalDataInfo(tensor)
+    dtype = np.dtype(onnx.helper.tensor_dtype_to_np_dtype(tensor.data_type))
+    shape = tuple(tensor.dims)
+    size = int(np.prod(shape)) * dtype.itemsize
+    if (
+        tensor.data_type == TensorProto.STRING
+        or tensor.data_type in _PACKED_TYPES
+        or size == 0
+        or sys.byteorder == "big"
+        or (info.length and info.length != size)
+    ):
+        copy = TensorProto()
+        copy.CopyFrom(tensor)
+        return onnx.numpy_helper.to_array(copy, base_dir)
+    path = c_checker._resolve_external_data_location(  # type: ignore[attr-defined]
+        base_dir, info.location, tensor.name
+    )
+    return np.memmap(path, dtype=dtype, mode="r", offset=info.offset or 0, shape=shape)
+
+
+def _fingerprint(value: Any, mode: str) -> Any:
+    """Returns a key telling if an input changed between two calls,
+    None if it cannot be computed and the input is then assumed to change.
+    """
+    if mode == "identity":
+        return id(value)
+    if value is None:
+        return ()
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return None
+        data = np.ascontiguousarray(value).reshape(-1).view(np.uint8)
+        return value.dtype, value.shape, hashlib.blake2b(data).digest()
+    if isinstance(value, list):
+        keys = tuple(_fingerprint(v, mode) for v in value)
+        return None if any(k is None for k in keys) else keys
+    return None
+
+
+def _signature(
+    plan: ExecutionPlan, feed_inputs: dict[str, Any]
+) -> tuple[Any, ...] | None:
+    """Returns the dtype and shape of every input the plan reads,
+    None if one of them is not a tensor, the plan is not specialized then.
+    """
+    signature = []
+    for k, v in feed_inputs.items():
+        if k not in plan.slots:
+            continue
+        if not isinstance(v, np.ndarray):
+            return None
+        signature.append((k, v.dtype.str, v.shape))
+    return tuple(signature)
+
+
+def _batch_dimension(
+    input_types: Sequence[TypeProto],
+    output_types: dict[str, TypeProto],
+    output_names: Sequence[str],
+) -> str | None:
+    """Returns the name of the first dimension if every input and
+    every output in *output_names* share the same dynamic first dimension,
+    None otherwise.
+    """
+    if any(name not in output_types for name in output_names):
+        return None
+    dims = set()
+    for tp in [*input_types, *(output_types[n] for n in output_names)]:
+        if (
+            not tp.HasField("tensor_type")
+            or not tp.tensor_type.HasField("shape")
+            or len(tp.tensor_type.shape.dim) == 0
+        ):
+            return None
+        dim = tp.tensor_type.shape.dim[0]
+        if not dim.dim_param:
+            return None
+        dims.add(dim.dim_param)
+    return dims.pop() if len(dims) == 1 else None
+
 
 class ReferenceEvaluator:
     r"""Computes the outputs of an ONNX proto (`ModelProto`, `FunctionProto`, `GraphProto`, `NodeProto`).
@@ -53,6 +220,105 @@ class ReferenceEvaluator:
             added in `new_ops` and are used instead of the inner
             implementation if list *new_ops* does not already contain
             one.
+        fold_constants: if True, every node whose inputs only depend on
+            initializers is executed once when the evaluator is created,
+            its outputs become initializers and the node is removed
+            from the nodes method `run` executes
+        fuse_elementwise: if True, every chain of unary or binary
+            elementwise operators (Add, Mul, Sigmoid, Exp, Erf...)
+            where every intermediate result is only consumed by the next
+            operator is replaced by a single node writing all the steps
+            in the same buffer with the argument `out` of the numpy ufuncs
+            (see :func:`fuse_elementwise
+            <onnx.reference._fusion.fuse_elementwise>`), the chain falls
+            back to the original kernels when the inputs are not floats
+            of the same type, the intermediate results of a chain
+            are not available anymore (parameter *intermediate* of
+            method `run`)
+        reuse_buffers: if True, method `run` gives the kernels able to
+            write into a preallocated array (attribute `supports_out`
+            of :class:`OpRun <onnx.reference.op_run.OpRun>`: elementwise
+            operators, MatMul, Softmax, BatchNormalization,
+            LayerNormalization) a buffer recycled from a result
+            released earlier, the buffers are planned from the shapes
+            observed in the previous call (see :class:`Arena
+            <onnx.reference._arena.Arena>`), the outputs never share
+            any buffer, this only applies to the nodes executed
+            sequentially by method `run`
+        shape_cache_size: if greater than 0, method `run` specializes
+            the execution plan for every signature (dtype and shape)
+            of the inputs it receives and keeps the last
+            *shape_cache_size* ones, nodes only depending on initializers
+            and input shapes are folded, context dependent functions
+            are resolved once
+        mmap_external_data: if True, *proto* must be a filename, the external
+            data is not loaded in memory, every initializer stored as external
+            data (including the initializers of the subgraphs) becomes
+            a read-only :class:`numpy.memmap` on the file holding it,
+            the operating system only reads the pages a kernel touches
+            and shares them across processes, the tensors held by
+            attributes (Constant) are loaded in memory
+        incremental: if not None, method `run` keeps the results of
+            the previous call for every set of requested outputs
+            and only executes again the nodes depending on an input
+            which changed, the other results are reused,
+            `"content"` compares a hash of the inputs,
+            `"identity"` only checks the inputs are the same objects
+            (the caller must then not modify an input in place),
+            the intermediate results are never released
+            and the caller must not modify the outputs in place
+        codegen: if True, method `run` converts every execution plan into
+            a python function calling the kernels one after another,
+            every result is a local variable, every kernel is called
+            without the checks method `OpRun.run` does on the inputs
+            and the outputs (see method :meth:`compile`)
+        trusted: if True, the inputs and the outputs of every node
+            (and of the nodes of its subgraphs) are assumed to be valid,
+            the attributes are bound once when the evaluator is created
+            and method `run` of a node calls method `_run` directly
+            (see method :meth:`OpRun.make_trusted
+            <onnx.reference.op_run.OpRun.make_trusted>`), this removes
+            a significant overhead on graphs with many small nodes
+        profiling: if True, method `run` measures the execution time,
+            the input and output sizes of every node and the memory
+            held by all the results alive, the information accumulates
+            in attribute `profile_` (see :class:`Profile
+            <onnx.reference._profiling.Profile>`), the nodes are then
+            always executed sequentially
+        parallel: if greater than 1, method `run` executes the nodes
+            on a thread pool with *parallel* threads, a node starts as
+            soon as the nodes it depends on are done, numpy releases
+            the GIL in many kernels so independent branches can run
+            at the same time
+        external_data_dir: directory holding the external data
+            of the initializers of *proto*, they are memory mapped,
+            this is how the evaluators of the subgraphs and the functions
+            of a model loaded with *mmap_external_data* find them
+
+    One instance can be shared by many threads calling method `run`
+    (or `run_batch`, `run_async`) at the same time. Everything built
+    when the instance is created (the kernels, the initializers,
+    the execution plans) is only read by method `run`, every call
+    holds its results in its own list of slots, and the caches filled
+    on demand (plans, specialized plans, thread pool) are protected
+    by a lock. The initializers are therefore stored once whatever
+    the number of threads. This assumes the kernels do not modify
+    the instance of :class:`OpRun <onnx.reference.op_run.OpRun>`
+    in method `_run`, every kernel in this package follows that rule,
+    a kernel given in *new_ops* must follow it as well. The profile
+    may interleave the events of concurrent runs.
+
+    Parameters *incremental*, *profiling*, *codegen*, *parallel*
+    and *reuse_buffers* select how method `run` executes the nodes,
+    only one of them can be enabled, the constructor raises a ValueError
+    otherwise. Parameters *shape_cache_size*, *fold_constants*,
+    *fuse_elementwise* and *trusted* change the plan or the kernels
+    and can be combined with any of them.
+
+    The thread pool used when *parallel* is greater than 1 is created
+    by the first call to method `run`, method :meth:`close` shuts it down.
+    The instance can also be used as a context manager calling
+    method :meth:`close` on exit.
 
     The class maps every node to its associated implementation.
     When a subgraph of a function is met,
@@ -88,7 +354,10 @@ class ReferenceEvaluator:
     the implementation itself. Any existing node can be used as a template.
     The second is one line in file `_op_list.py
     <https://github.com/onnx/onnx/tree/main/onnx/reference/ops/_op_list.py>`_
-    to import the file and let the reference evaluator know it exists.
+    to let the reference evaluator know it exists. The evaluator only imports
+    the implementations a model uses, script `gen_op_table.py
+    <https://github.com/onnx/onnx/tree/main/onnx/reference/gen_op_table.py>`_
+    updates the table telling which module defines every one of them.
 
     This class can also be used to test an implementation of
     a custom operator. Let's assume this new operator
@@ -170,8 +439,8 @@ class ReferenceEvaluator:
         a new implementation needs to be registered. `Pad_11`, `Pad_18`.
         `Pad_11` is the implementation chose for opset in [11, 17].
         `Pad_18` is selected for any greater opset. Both classes must be
-        imported into file `_op_list.py` to register their existence to the
-        runtime.
+        listed in file `_op_list.py` to register their existence to the
+        runtime, script `onnx/reference/gen_op_table.py` must then be run again.
 
         An operator may have a reference implementation such as `CastLike`
         and still be defined as a function. By default, the reference implementation
@@ -200,7 +469,34 @@ class ReferenceEvaluator:
         verbose: int = 0,
         new_ops: list[type[op_run.OpRun]] | None = None,
         optimized: bool = True,
+        fold_constants: bool = False,
+        fuse_elementwise: bool = False,
+        reuse_buffers: bool = False,
+        shape_cache_size: int = 0,
+        mmap_external_data: bool = False,
+        incremental: str | None = None,
+        codegen: bool = False,
+        trusted: bool = False,
+        profiling: bool = False,
+        parallel: int = 0,
+        external_data_dir: str | None = None,
     ) -> None:
+        modes = [
+            name
+            for name, enabled in [
+                ("incremental", incremental is not None),
+                ("profiling", profiling),
+                ("codegen", codegen),
+                ("parallel", parallel > 1),
+                ("reuse_buffers", reuse_buffers),
+            ]
+            if enabled
+        ]
+        if len(modes) > 1:
+            raise ValueError(
+                f"Parameters {', '.join(modes)} select how method run executes "
+                f"the nodes, only one of them can be enabled."
+            )
         if optimized:
             if new_ops is None:
                 new_ops = optimized_operators.copy()
@@ -218,9 +514,28 @@ class ReferenceEvaluator:
         else:
             self.container_ = None
 
+        self.base_dir_: str | None = external_data_dir
+        if mmap_external_data and not isinstance(proto, str):
+            raise ValueError(
+                f"mmap_external_data requires proto to be a filename not {type(proto)}."
+            )
         if isinstance(proto, str):
-            with open(proto, "rb") as f:
-                proto = onnx.load(f)
+            if mmap_external_data:
+                self.base_dir_ = os.path.dirname(os.path.abspath(proto))
+                proto = onnx.load(proto, load_external_data=False)
+                # The initializers of the subgraphs are memory mapped by
+                # their own evaluators, the tensors held by attributes
+                # are loaded in memory.
+                for tensor in onnx.external_data_helper._get_attribute_tensors(proto):
+                    if onnx.external_data_helper.uses_external_data(tensor):
+                        onnx.external_data_helper.load_external_data_for_tensor(
+                            tensor, self.base_dir_
+                        )
+                        tensor.data_location = TensorProto.DEFAULT
+                        del tensor.external_data[:]
+            else:
+                with open(proto, "rb") as f:
+                    proto = onnx.load(f)
         elif isinstance(proto, bytes):
             proto = onnx.load(BytesIO(proto))
         self.proto_ = proto
@@ -280,7 +595,12 @@ class ReferenceEvaluator:
             for f in functions:
                 if isinstance(f, FunctionProto):
                     self.functions_[f.domain, f.name] = self.__class__(
-                        f, verbose=verbose, functions=list(self.functions_.values())
+                        f,
+                        verbose=verbose,
+                        functions=list(self.functions_.values()),
+                        fuse_elementwise=fuse_elementwise,
+                        trusted=trusted,
+                        external_data_dir=self.base_dir_,
                     )
                 elif isinstance(f, ReferenceEvaluator):
                     onx = f.proto_
@@ -288,6 +608,24 @@ class ReferenceEvaluator:
                 else:
                     raise TypeError(f"Unexpected type {type(f)!r} for a function.")
         self.verbose = verbose
+        self.fold_constants = fold_constants
+        self.fuse_elementwise = fuse_elementwise
+        self.reuse_buffers = reuse_buffers
+        self.shape_cache_size = shape_cache_size
+        self.specialized_plans_: OrderedDict[tuple[Any, ...], ExecutionPlan] = (
+            OrderedDict()
+        )
+        if incremental not in {None, "content", "identity"}:
+            raise ValueError(f"Unexpected value {incremental!r} for incremental.")
+        self.incremental = incremental
+        self.memo_: dict[tuple[str, ...], tuple[Any, ...]] = {}
+        self.codegen = codegen
+        self.trusted = trusted
+        self.profile_ = Profile() if profiling else None
+        self.parallel = parallel
+        self.executor_: ThreadPoolExecutor | None = None
+        # Protects the caches shared by concurrent calls to method run.
+        self._lock = threading.Lock()
         self.new_ops_: dict[tuple[str, str], type[op_run.OpRun]] = {}
         if new_ops is not None:
             for cl in new_ops:
@@ -304,6 +642,21 @@ class ReferenceEvaluator:
                 self.new_ops_[key] = cl
         self._init()
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts down the thread pool used when *parallel* is greater than 1,
+        a later call to method `run` creates a new one.
+        """
+        with self._lock:
+            executor, self.executor_ = self.executor_, None
+        if executor is not None:
+            executor.shutdown()
+
     def retrieve_external_data(self, initializer: TensorProto) -> np.ndarray:
         """Returns a tensor saved as external."""
         info = onnx.external_data_helper.ExternalDataInfo(initializer)
@@ -313,6 +666,9 @@ class ReferenceEvaluator:
         ):
             # It comes from a large container.
             return self.container_[location]
+        if self.base_dir_ is not None:
+            # The data stays on disk and is mapped into memory.
+            return _memmap_external_data(initializer, self.base_dir_)
         # Otherwise, the data is on disk.
         if self.container_ is not None:
             raise RuntimeError(
@@ -407,6 +763,9 @@ class ReferenceEvaluator:
             "new_ops": self.new_ops_,
             "existing_functions": self.functions_.copy(),
             "evaluator_cls": self.__class__,
+            "fuse_elementwise": self.fuse_elementwise,
+            "trusted": self.trusted,
+            "external_data_dir": self.base_dir_,
         }
         if self.input_types_:
             all_types = {i.name: i.type for i in self.onnx_graph_.input}
@@ -446,7 +805,90 @@ class ReferenceEvaluator:
                     f"Unable to instantiate class {cl!r} with "
                     f"run_params={run_params} and node={node}."
                 ) from e
+            if self.trusted:
+                inst.make_trusted()
             self.rt_nodes_.append(inst)
+        if self.fold_constants:
+            self._fold_constants()
+        if self.fuse_elementwise:
+            self.rt_nodes_ = fuse_elementwise(
+                self.rt_nodes_, self.output_names, run_params
+            )
+        self.rt_consumed_ = [
+            node_consumed_names(node.onnx_node) for node in self.rt_nodes_
+        ]
+        self.plans_: dict[tuple[str, ...] | None, ExecutionPlan] = {}
+        self.last_use_ = self._get_plan(None).release
+
+    def _fold_constants(self) -> None:
+        """Executes every node whose inputs are all constant and stores
+        its outputs in `rt_inits_`. Initializers which are also graph
+        inputs may be overwritten by the user and are not constant.
+        Nodes with a random output, a linked attribute or needing a context
+        are never folded. A node failing is kept and fails again when
+        the graph is executed.
+        """
+        constants = set(self.rt_inits_) - set(self.input_names_)
+        kept = []
+        for node in self.rt_nodes_:
+            if not _is_foldable(node) or any(
+                name not in constants for name in node_consumed_names(node.onnx_node)
+            ):
+                kept.append(node)
+                continue
+            inputs = [self.rt_inits_[i] if i else None for i in node.input]
+            try:
+                outputs = node.run(*inputs)
+            except Exception as e:  # noqa: BLE001
+                self._log(0, "unable to fold %s(%s): %s", node.op_type, node.input, e)
+                kept.append(node)
+                continue
+            self._log(1, "fold %s(%s) -> %s", node.op_type, node.input, node.output)
+            for name, value in zip(node.output, outputs, strict=False):
+                if name:
+                    self.rt_inits_[name] = value
+                    constants.add(name)
+        self.rt_nodes_ = kept
+
+    def _get_plan(self, output_names: Sequence[str] | None) -> ExecutionPlan:
+        """Returns the plan computing *output_names*, it is built
+        the first time these outputs are requested. None means all nodes
+        are executed.
+        """
+        key = None if output_names is None else tuple(output_names)
+        plan = self.plans_.get(key)
+        if plan is None:
+            # Two threads may build the same plan, only one is kept.
+            plan = self.plans_.setdefault(key, self._build_plan(key))
+        return plan
+
+    def _build_plan(self, output_names: tuple[str, ...] | None) -> ExecutionPlan:
+        """Walks the graph backward from *output_names*, keeps only
+        the nodes and the initializers they depend on and compiles them
+        into an :class:`ExecutionPlan`.
+        """
+        if output_names is None:
+            indices = list(range(len(self.rt_nodes_)))
+            keep = set(self.output_names)
+            needed = set(self.output_names) | set(self.rt_inits_)
+            for consumed in self.rt_consumed_:
+                needed.update(consumed)
+        else:
+            keep = set(output_names)
+            needed = set(output_names)
+            indices = []
+            for i in range(len(self.rt_nodes_) - 1, -1, -1):
+                if any(o in needed for o in self.rt_nodes_[i].output):
+                    indices.append(i)
+                    needed.update(self.rt_consumed_[i])
+            indices.reverse()
+        return ExecutionPlan(
+            [self.rt_nodes_[i] for i in indices],
+            [self.rt_consumed_[i] for i in indices],
+            keep,
+            {k: v for k, v in self.rt_inits_.items() if k in needed},
+            output_names,
+        )
 
     def _load_impl(  # noqa: PLR0911
         self, node: NodeProto, input_types: TypeProto | None = None
@@ -555,6 +997,8 @@ class ReferenceEvaluator:
             intermediate: if True, the function returns all the results,
                 final ones and intermediates one in a same dictionary,
                 if False, only the final results are returned in a list
+                and every intermediate result is released once the last
+                node consuming it was executed
 
         Returns:
             list of requested outputs if intermediate is False,
@@ -564,45 +1008,648 @@ class ReferenceEvaluator:
             output_names = self.output_names
         if isinstance(self.proto_, FunctionProto) and attributes is None:
             raise TypeError()
+        # Only the nodes contributing to the requested outputs are executed
+        # unless all intermediate results are requested.
+        plan = self._get_plan(None if intermediate else output_names)
+        signature = None
+        if self.shape_cache_size > 0 and not intermediate:
+            key = _signature(plan, feed_inputs)
+            if key is not None:
+                signature = (tuple(output_names), key)
+        if signature is not None:
+            with self._lock:
+                specialized = self.specialized_plans_.get(signature)
+                if specialized is not None:
+                    self.specialized_plans_.move_to_end(signature)
+            if specialized is not None:
+                plan = specialized
+                signature = None
 
         # step 1: inputs and initializers
-        results = {"": None}  # optional input
-        results.update(self.rt_inits_)  # type: ignore[arg-type]
-        results.update(feed_inputs)
-        for k, v in self.rt_inits_.items():
-            self._log(2, " +C %s: %s", k, v)  # type: ignore[arg-type]
-        for k, v in feed_inputs.items():
-            self._log(2, " +I %s: %s", k, v)  # type: ignore[arg-type]
-
-        # step 2: execute nodes
-        for node in self.rt_nodes_:
-            self._log(1, "%s(%s) -> %s", node.op_type, node.input, node.output)
-            for i in node.input:
-                if i not in results:
-                    raise RuntimeError(
-                        f"Unable to find input {i!r} in known results {sorted(results)}, "
-                        f"self.rt_inits_ has {sorted(self.rt_inits_)}, "
-                        f"feed_inputs has {sorted(feed_inputs)}."
-                    )
-            inputs = [results[i] for i in node.input]
-            linked_attributes = {}
-            if node.has_linked_attribute and attributes:
-                linked_attributes["linked_attributes"] = attributes
-            if node.need_context():
-                outputs = node.run(*inputs, context=results, **linked_attributes)
-            else:
-                outputs = node.run(*inputs, **linked_attributes)
-            for name, value in zip(node.output, outputs, strict=False):
-                self._log(2, " + %s: %s", name, value)  # type: ignore[arg-type]
-                results[name] = value
+        values = self._bind_inputs(plan, feed_inputs)
+
+        # step 2: execute nodes, intermediate results are released
+        # as soon as they are not needed anymore
+        if self.incremental and not intermediate and signature is None:
+            self._run_incremental(plan, values, attributes, feed_inputs)
+        elif signature is not None:
+            self._specialize(plan, signature, values, attributes, feed_inputs)
+        elif self.profile_ is not None:
+            self._run_profiled(plan, values, attributes, not intermediate)
+        elif self.codegen and not intermediate:
+            self._compile_plan(plan)(values, attributes)
+        elif self.parallel > 1 and len(plan) > 1:
+            self._run_parallel(plan, values, attributes, not intermediate)
+        elif self.reuse_buffers and not intermediate:
+            self._run_with_arena(plan, values, attributes)
+        else:
+            self._run_sequential(plan, values, attributes, not intermediate)
 
         # return the results
+        return self._collect_results(
+            plan, values, output_names, feed_inputs, intermediate
+        )
+
+    def compile(self, output_names: Sequence[str] | None = None) -> CompiledPlan:
+        """Converts the nodes computing *output_names* into a python
+        function. Attribute `source` of the returned object holds
+        the generated code.
+
+        Args:
+            output_names: requested outputs by names, None for all
+
+        Returns:
+            an instance of :class:`CompiledPlan
+            <onnx.reference._codegen.CompiledPlan>`
+        """
+        if output_names is None:
+            output_names = self.output_names
+        return self._compile_plan(self._get_plan(output_names))
+
+    def _compile_plan(self, plan: ExecutionPlan) -> CompiledPlan:
+        """Returns the function generated for *plan*, it is built once."""
+        compiled = plan.compiled
+        if compiled is None:
+            compiled = CompiledPlan(plan)
+            plan.compiled = compiled
+        return compiled
+
+    def _bind_inputs(
+        self, plan: ExecutionPlan, feed_inputs: dict[str, Any]
+    ) -> list[Any]:
+        """Returns the slots of *plan* filled with the initializers
+        and the inputs, checks every input the plan reads is known.
+        """
+        values = plan.initial.copy()
+        slots = plan.slots
+        if self.verbose > 2:  # noqa: PLR2004
+            for k in plan.inits:
+                self._log(2, " +C %s: %s", k, values[slots[k]])  # type: ignore[arg-type]
+        for k, v in feed_inputs.items():
+            slot = slots.get(k)
+            if slot is not None:
+                self._log(2, " +I %s: %s", k, v)  # type: ignore[arg-type]
+                values[slot] = v
+        for name, slot in plan.free:
+            if values[slot] is MISSING:
+                raise RuntimeError(
+                    f"Unable to find input {name!r} in known results "
+                    f"{sorted(n for n, s in slots.items() if values[s] is not MISSING)}, "
+                    f"self.rt_inits_ has {sorted(self.rt_inits_)}, "
+                    f"feed_inputs has {sorted(feed_inputs)}."
+                )
+        return values
+
+    def _collect_results(
+        self,
+        plan: ExecutionPlan,
+        values: list[Any],
+        output_names: Sequence[str],
+        feed_inputs: dict[str, Any],
+        intermediate: bool,
+    ) -> dict[str, Any] | list[Any]:
+        """Returns the results method `run` returns once *plan* was executed."""
+        slots = plan.slots
         if intermediate:
+            results = dict(feed_inputs)
+            results.update(
+                (name, values[i])
+                for name, i in slots.items()
+                if values[i] is not MISSING
+            )
             return results
 
-        for name in output_names:
-            if name not in results:
+        outputs = [values[i] for i in plan.output_slots]  # type: ignore[union-attr]
+        for name, value in zip(output_names, outputs, strict=True):
+            if value is MISSING:
                 raise RuntimeError(
-                    f"Unable to find output name {name!r} in {sorted(results)}, proto is\n{self.proto_}"
+                    f"Unable to find output name {name!r} in "
+                    f"{sorted(n for n, s in slots.items() if values[s] is not MISSING)}, "
+                    f"proto is\n{self.proto_}"
+                )
+        return outputs
+
+    def _batch_dimension(self, output_names: Sequence[str]) -> str | None:
+        """Returns the name of the first dimension if every input and
+        every requested output share the same dynamic first dimension,
+        None otherwise.
+        """
+        if not self.input_types_ or self.output_types_ is None:
+            return None
+        return _batch_dimension(
+            self.input_types_,
+            dict(zip(self.output_names, self.output_types_, strict=True)),
+            output_names,
+        )
+
+    def _stack_feeds(
+        self, list_of_feeds: Sequence[dict[str, Any]]
+    ) -> tuple[dict[str, np.ndarray], list[int]] | None:
+        """Concatenates the feeds along the first axis, returns the stacked
+        feeds and the batch size of every feed, None if they cannot be stacked.
+        """
+        names = set(self.input_names)
+        sizes = []
+        for feeds in list_of_feeds:
+            if set(feeds) != names:
+                return None
+            size = None
+            for name in self.input_names:
+                first, value = list_of_feeds[0][name], feeds[name]
+                if (
+                    not isinstance(value, np.ndarray)
+                    or value.ndim == 0
+                    or value.dtype != first.dtype
+                    or value.shape[1:] != first.shape[1:]
+                    or (size is not None and value.shape[0] != size)
+                ):
+                    return None
+                size = value.shape[0]
+            sizes.append(size)
+        stacked = {
+            name: np.concatenate([feeds[name] for feeds in list_of_feeds], axis=0)
+            for name in self.input_names
+        }
+        return stacked, sizes
+
+    def run_batch(
+        self,
+        output_names,
+        list_of_feeds: Sequence[dict[str, Any]],
+        attributes: dict[str, Any] | None = None,
+        n_threads: int = 0,
+    ) -> list[list[Any]]:
+        """Executes the onnx model on many feeds.
+
+        If every input and every requested output share the same dynamic
+        first dimension (the same `dim_param`), the feeds are concatenated
+        along this axis, the model is executed once and the outputs
+        are split back. The model is then assumed to process every sample
+        independently. Otherwise, or if the feeds do not have compatible
+        shapes and types, the model is executed once per feed.
+
+        Args:
+            output_names: requested outputs by names, None for all
+            list_of_feeds: list of dictionaries `{ input name: input value }`
+            attributes: attributes value if the instance runs a
+                FunctionProto
+            n_threads: if greater than 1 and the feeds cannot be stacked,
+                the runs are distributed over a thread pool
+
+        Returns:
+            one list of requested outputs per feed
+        """
+        if output_names is None:
+            output_names = self.output_names
+        if not list_of_feeds:
+            return []
+        if len(list_of_feeds) > 1 and self._batch_dimension(output_names):
+            stacked = self._stack_feeds(list_of_feeds)
+            if stacked is not None:
+                feeds, sizes = stacked
+                outputs = self.run(output_names, feeds, attributes=attributes)
+                total = sum(sizes)
+                if all(
+                    isinstance(o, np.ndarray) and o.ndim > 0 and o.shape[0] == total
+                    for o in outputs
+                ):
+                    splits = np.cumsum(sizes)[:-1]
+                    parts = [np.split(o, splits, axis=0) for o in outputs]
+                    return [list(p) for p in zip(*parts, strict=True)]
+
+        if n_threads > 1 and len(list_of_feeds) > 1:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                return list(
+                    executor.map(
+                        lambda feeds: self.run(
+                            output_names, feeds, attributes=attributes
+                        ),
+                        list_of_feeds,
+                    )
+                )
+        return [
+            self.run(output_names, feeds, attributes=attributes)
+            for feeds in list_of_feeds
+        ]
+
+    async def run_async(
+        self,
+        output_names,
+        feed_inputs: dict[str, Any],
+        attributes: dict[str, Any] | None = None,
+        intermediate: bool = False,
+        executor: Executor | None = None,
+        offload_bytes: int = 0,
+        yield_every: int = 1,
+    ) -> dict[str, Any] | list[Any]:
+        """Executes the onnx model like method `run` from a coroutine.
+
+        The nodes are executed one after another in the event loop thread,
+        control goes back to the event loop every *yield_every* nodes so that
+        one large graph does not stall other tasks. Cancelling the task
+        stops the execution before the next node starts. A node offloaded
+        to *executor* keeps running until it completes but its results
+        are dropped. Profiling, parallel execution and plan specialization
+        do not apply, a plan already specialized for the input signature
+        is used if there is one.
+
+        Args:
+            output_names: requested outputs by names, None for all
+            feed_inputs: dictionary `{ input name: input value }`
+            attributes: attributes value if the instance runs a
+                FunctionProto
+            intermediate: see method `run`
+            executor: if specified, a node whose inputs hold at least
+                *offload_bytes* bytes is executed by this executor
+                (a :class:`concurrent.futures.ThreadPoolExecutor` for example),
+                the event loop keeps serving other tasks meanwhile
+            offload_bytes: minimum size of the inputs of a node
+                to offload it to *executor*
+            yield_every: number of nodes executed between two
+                consecutive yields to the event loop
+
+        Returns:
+            list of requested outputs if intermediate is False,
+            named results in a dictionary otherwise
+        """
+        if output_names is None:
+            output_names = self.output_names
+        if isinstance(self.proto_, FunctionProto) and attributes is None:
+            raise TypeError()
+        if yield_every < 1:
+            raise ValueError(f"yield_every must be >= 1 not {yield_every}.")
+        plan = self._get_plan(None if intermediate else output_names)
+        if self.shape_cache_size > 0 and not intermediate:
+            key = _signature(plan, feed_inputs)
+            if key is not None:
+                with self._lock:
+                    plan = self.specialized_plans_.get((tuple(output_names), key), plan)
+        values = self._bind_inputs(plan, feed_inputs)
+
+        loop = asyncio.get_running_loop()
+        release = not intermediate
+        verbose = self.verbose
+        for index, step in enumerate(plan.steps):
+            node, input_slots, output_slots, released, context, linked = step
+            if verbose > 1:
+                self._log(1, "%s(%s) -> %s", node.op_type, node.input, node.output)
+            inputs = [values[i] for i in input_slots]
+            kwargs: dict[str, Any] = {}
+            if linked and attributes:
+                kwargs["linked_attributes"] = attributes
+            if context is not None:
+                kwargs["context"] = {name: values[i] for name, i in context}
+            if executor is not None and sum(nbytes(v) for v in inputs) >= offload_bytes:
+                outputs = await loop.run_in_executor(
+                    executor, functools.partial(node.run, *inputs, **kwargs)
+                )
+            else:
+                outputs = node.run(*inputs, **kwargs)
+                if (index + 1) % yield_every == 0:
+                    await asyncio.sleep(0)
+            for i, value in zip(output_slots, outputs, strict=False):
+                values[i] = value
+            if verbose > 2:  # noqa: PLR2004
+                for name, value in zip(node.output, outputs, strict=False):
+                    self._log(2, " + %s: %s", name, value)  # type: ignore[arg-type]
+            if release:
+                for i in released:
+                    values[i] = None
+        return self._collect_results(
+            plan, values, output_names, feed_inputs, intermediate
+        )
+
+    def _run_sequential(
+        self,
+        plan: ExecutionPlan,
+        values: list[Any],
+        attributes: dict[str, Any] | None,
+        release: bool,
+        arena: Arena | None = None,
+    ) -> None:
+        """Executes the steps of *plan* one after another in the graph order.
+        The kernels write their output into the buffers of *arena*
+        if it is specified.
+        """
+        verbose = self.verbose
+        for index, step in enumerate(plan.steps):
+            node, input_slots, output_slots, released, context, linked = step
+            if verbose > 1:
+                self._log(1, "%s(%s) -> %s", node.op_type, node.input, node.output)
+            inputs = [values[i] for i in input_slots]
+            buffer = None if arena is None else arena.acquire(index)
+            if context is None and not linked:
+                if buffer is None:
+                    outputs = node.run(*inputs)
+                else:
+                    outputs = node.run(*inputs, out=buffer)
+            else:
+                kwargs = {}
+                if linked and attributes:
+                    kwargs["linked_attributes"] = attributes
+                if context is not None:
+                    kwargs["context"] = {name: values[i] for name, i in context}
+                if buffer is not None:
+                    kwargs["out"] = buffer
+                outputs = node.run(*inputs, **kwargs)
+            buffer = None
+            if arena is not None:
+                arena.observe(index, output_slots, outputs)
+            for i, value in zip(output_slots, outputs, strict=False):
+                values[i] = value
+            if verbose > 2:  # noqa: PLR2004
+                for name, value in zip(node.output, outputs, strict=False):
+                    self._log(2, " + %s: %s", name, value)  # type: ignore[arg-type]
+            if release:
+                for i in released:
+                    values[i] = None
+                if arena is not None:
+                    arena.release(released)
+
+    def _run_with_arena(
+        self,
+        plan: ExecutionPlan,
+        values: list[Any],
+        attributes: dict[str, Any] | None,
+    ) -> None:
+        """Executes *plan* sequentially with one of its arenas,
+        a run uses an arena no other run is using. An output sharing
+        its memory with a buffer of the arena is copied.
+        """
+        with self._lock:
+            arena = plan.arenas.pop() if plan.arenas else Arena(plan)
+        try:
+            arena.start()
+            self._run_sequential(plan, values, attributes, True, arena)
+            for i in plan.output_slots:  # type: ignore[union-attr]
+                if arena.owner(values[i]) is not None:
+                    values[i] = values[i].copy()
+            arena.finish()
+        finally:
+            with self._lock:
+                plan.arenas.append(arena)
+
+    def _run_incremental(
+        self,
+        plan: ExecutionPlan,
+        values: list[Any],
+        attributes: dict[str, Any] | None,
+        feed_inputs: dict[str, Any],
+    ) -> None:
+        """Executes the steps of *plan* whose inputs changed since the
+        previous call for the same outputs, the other steps reuse the
+        results of that call. Nodes producing random numbers, directly or
+        in a subgraph or a function, are always executed.
+        """
+        key = tuple(plan.outputs)  # type: ignore[arg-type]
+        fingerprints = {
+            name: _fingerprint(value, self.incremental)  # type: ignore[arg-type]
+            for name, value in feed_inputs.items()
+            if name in plan.slots
+        }
+        with self._lock:
+            memo = self.memo_.get(key)
+        if memo is None or memo[0] is not plan or attributes is not None:
+            previous = None
+            dirty: set[int] = set()
+        else:
+            _, previous_fingerprints, previous = memo
+            dirty = {
+                plan.slots[name]
+                for name in set(fingerprints) | set(previous_fingerprints)
+                if fingerprints.get(name) is None
+                or fingerprints.get(name) != previous_fingerprints.get(name)
+            }
+
+        slots = plan.slots
+        for step, names in zip(plan.steps, plan.consumed, strict=True):
+            node, input_slots, output_slots, _, context, linked = step
+            if (
+                previous is not None
+                and _is_deterministic(node)
+                and not any(slots[name] in dirty for name in names)
+            ):
+                for i in output_slots:
+                    values[i] = previous[i]
+                continue
+            inputs = [values[i] for i in input_slots]
+            kwargs: dict[str, Any] = {}
+            if linked and attributes:
+                kwargs["linked_attributes"] = attributes
+            if context is not None:
+                kwargs["context"] = {name: values[i] for name, i in context}
+            if self.verbose > 1:
+                self._log(1, "%s(%s) -> %s", node.op_type, node.input, node.output)
+            outputs = node.run(*inputs, **kwargs)
+            for i, value in zip(output_slots, outputs, strict=False):
+                values[i] = value
+            dirty.update(output_slots)
+
+        if attributes is None:
+            with self._lock:
+                self.memo_[key] = (plan, fingerprints, values)
+
+    def _specialize(
+        self,
+        plan: ExecutionPlan,
+        signature: tuple[Any, ...],
+        values: list[Any],
+        attributes: dict[str, Any] | None,
+        feed_inputs: dict[str, Any],
+    ) -> None:
+        """Executes the steps of *plan* one after another and builds
+        a plan specialized for the input signature. A node is folded if
+        its inputs only depend on initializers and on the shapes of
+        the inputs, an initializer overridden by *feed_inputs* is not
+        a constant. A context dependent function is replaced by the
+        function built for the input types it receives if they are
+        all tensors.
+        """
+        input_names = set(self.input_names_)
+        constants = {
+            name: values[plan.slots[name]]
+            for name in plan.inits
+            if name not in input_names and name not in feed_inputs
+        }
+        nodes, consumed = [], []
+        for step, names in zip(plan.steps, plan.consumed, strict=True):
+            node, input_slots, output_slots, released, context, linked = step
+            inputs = [values[i] for i in input_slots]
+            if (
+                node.op_type in {"Shape", "Size"}
+                and _is_foldable(node)
+                and node.input[0] in input_names
+            ):
+                # The shape of an input is part of the signature.
+                outputs = node.run(*inputs)
+                folded = True
+            elif _is_foldable(node) and all(name in constants for name in names):
+                outputs = node.run(*inputs)
+                folded = True
+            else:
+                folded = False
+                if isinstance(node, op_run.OpFunctionContextDependant) and all(
+                    isinstance(t, np.ndarray) for t in inputs
+                ):
+                    types = [
+                        onnx.helper.make_tensor_type_proto(
+                            onnx.helper.np_dtype_to_tensor_dtype(t.dtype), t.shape
+                        )
+                        for t in inputs
+                    ]
+                    cl = self._load_impl(node.onnx_node, types)
+                    node = cl(node.onnx_node, node.run_params)
+                kwargs = {}
+                if linked and attributes:
+                    kwargs["linked_attributes"] = attributes
+                if context is not None:
+                    kwargs["context"] = {name: values[i] for name, i in context}
+                outputs = node.run(*inputs, **kwargs)
+                nodes.append(node)
+                consumed.append(names)
+            for name, i, value in zip(node.output, output_slots, outputs, strict=False):
+                values[i] = value
+                if not name:
+                    continue
+                if folded:
+                    constants[name] = value
+            for i in released:
+                values[i] = None
+
+        needed = set(plan.outputs)
+        for names in consumed:
+            needed.update(names)
+        inits = {name: self.rt_inits_[name] for name in plan.inits}
+        inits.update(constants)
+        inits = {k: v for k, v in inits.items() if k in needed}
+        specialized = ExecutionPlan(
+            nodes, consumed, set(plan.outputs), inits, plan.outputs
+        )
+        self._log(
+            0,
+            "specialized plan for %s: %d nodes -> %d nodes",
+            str(signature),
+            len(plan),
+            len(specialized),
+        )
+        with self._lock:
+            self.specialized_plans_[signature] = specialized
+            while len(self.specialized_plans_) > self.shape_cache_size:
+                self.specialized_plans_.popitem(last=False)
+
+    def _run_profiled(
+        self,
+        plan: ExecutionPlan,
+        values: list[Any],
+        attributes: dict[str, Any] | None,
+        release: bool,
+    ) -> None:
+        """Executes the steps of *plan* like method `_run_sequential`
+        and adds one event per node to the profile.
+        """
+        profile = self.profile_
+        assert profile is not None
+        thread_id = threading.get_ident()
+        live = sum(nbytes(v) for v in values if v is not MISSING)
+        for index, step in enumerate(plan.steps):
+            node, input_slots, output_slots, released, context, linked = step
+            inputs = [values[i] for i in input_slots]
+            kwargs = {}
+            if linked and attributes:
+                kwargs["linked_attributes"] = attributes
+            if context is not None:
+                kwargs["context"] = {name: values[i] for name, i in context}
+            begin = time.perf_counter()
+            outputs = node.run(*inputs, **kwargs)
+            duration = time.perf_counter() - begin
+            output_bytes = 0
+            for i, value in zip(output_slots, outputs, strict=False):
+                size = nbytes(value)
+                output_bytes += size
+                live += size - nbytes(values[i])
+                values[i] = value
+            profile.events.append(
+                NodeEvent(
+                    name=node.onnx_node.name or f"{node.op_type}_{index}",
+                    op_type=node.op_type,
+                    domain=node.domain,
+                    begin=begin - profile.start,
+                    duration=duration,
+                    input_bytes=sum(nbytes(v) for v in inputs),
+                    output_bytes=output_bytes,
+                    live_bytes=live,
+                    thread_id=thread_id,
+                )
+            )
+            if release:
+                for i in released:
+                    live -= nbytes(values[i])
+                    values[i] = None
+        with self._lock:
+            profile.n_runs += 1
+
+    def _run_parallel(
+        self,
+        plan: ExecutionPlan,
+        values: list[Any],
+        attributes: dict[str, Any] | None,
+        release: bool,
+    ) -> None:
+        """Executes the steps of *plan* on a thread pool. A step is submitted
+        as soon as all the steps it depends on are done. Slots are only read
+        and written by the calling thread, the workers only run the kernels.
+        """
+        with self._lock:
+            if self.executor_ is None:
+                self.executor_ = ThreadPoolExecutor(
+                    max_workers=self.parallel,
+                    thread_name_prefix="ReferenceEvaluator",
                 )
-        return [results[name] for name in output_names]
+        executor = self.executor_
+        remaining = plan.n_predecessors.copy()
+        n_readers = plan.n_readers.copy()
+        running: dict[Future, int] = {}
+
+        def _submit(i: int) -> None:
+            node, input_slots, _, _, context, linked = plan.steps[i]
+            if self.verbose > 1:
+                self._log(1, "%s(%s) -> %s", node.op_type, node.input, node.output)
+            inputs = [values[k] for k in input_slots]
+            kwargs: dict[str, Any] = {}
+            if linked and attributes:
+                kwargs["linked_attributes"] = attributes
+            if context is not None:
+                kwargs["context"] = {name: values[k] for name, k in context}
+            running[executor.submit(node.run, *inputs, **kwargs)] = i
+
+        for i, n in enumerate(remaining):
+            if n == 0:
+                _submit(i)
+        try:
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    outputs = future.result()
+                    node, _, output_slots, _, _, _ = plan.steps[i]
+                    for k, value in zip(output_slots, outputs, strict=False):
+                        values[k] = value
+                    if self.verbose > 2:  # noqa: PLR2004
+                        for name, value in zip(node.output, outputs, strict=False):
+                            self._log(2, " + %s: %s", name, value)  # type: ignore[arg-type]
+                    if release:
+                        for k in plan.reads[i]:
+                            n_readers[k] -= 1
+                            if n_readers[k] == 0:
+                                values[k] = None
+                        for k in output_slots:
+                            if k in plan.releasable and n_readers[k] == 0:
+                                values[k] = None
+                    for j in plan.successors[i]:
+                        remaining[j] -= 1
+                        if remaining[j] == 0:
+                            _submit(j)
+        except BaseException:
+            for future in running:
+                future.cancel()
+            raise
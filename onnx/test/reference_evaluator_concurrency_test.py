@@ -0,0 +1,132 @@
+# Copyright (c) ONNX Project Contributors
+
+# SPDX-License-Identifier: Apache-2.0
+"""Runs the backend node tests with one instance of ReferenceEvaluator
+shared by several threads. By default, only the tests involving operators
+holding a subgraph, a function or a complex state are executed, set
+environment variable `ONNX_REFERENCE_STRESS=1` to execute all of them.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import re
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+
+import onnx
+from onnx import numpy_helper
+from onnx.backend.test.loader import load_model_tests
+from onnx.reference import ReferenceEvaluator
+
+N_THREADS = 4
+N_RUNS = 3
+
+# Operators producing random numbers cannot be compared.
+EXCLUDED = re.compile("bernoulli|random|training_dropout|test_gradient")
+
+# Operators holding a subgraph, a function or a complex state.
+STATEFUL = re.compile(
+    "loop|scan|test_if|sequence_map|_expanded|tfidf|rnn|gru|lstm|"
+    "affine_grid|attention|layer_normalization|softmax_cross_entropy"
+)
+
+STRESS = os.environ.get("ONNX_REFERENCE_STRESS", "0") not in {"", "0"}
+
+
+def _load_value(filename: str, type_proto: onnx.TypeProto) -> Any:
+    with open(filename, "rb") as f:
+        content = f.read()
+    if type_proto.HasField("sequence_type"):
+        seq = onnx.SequenceProto()
+        seq.ParseFromString(content)
+        return numpy_helper.to_list(seq)
+    if type_proto.HasField("optional_type"):
+        opt = onnx.OptionalProto()
+        opt.ParseFromString(content)
+        return numpy_helper.to_optional(opt)
+    tensor = onnx.TensorProto()
+    tensor.ParseFromString(content)
+    return numpy_helper.to_array(tensor)
+
+
+def _load_feeds(model_dir: str, model: onnx.ModelProto) -> dict[str, Any] | None:
+    data_dir = os.path.join(model_dir, "test_data_set_0")
+    if not os.path.exists(data_dir):
+        return None
+    n_inputs = len(glob.glob(os.path.join(data_dir, "input_*.pb")))
+    return {
+        model.graph.input[i].name: _load_value(
+            os.path.join(data_dir, f"input_{i}.pb"), model.graph.input[i].type
+        )
+        for i in range(n_inputs)
+    }
+
+
+def _assert_same(expected: Any, got: Any) -> None:
+    if isinstance(expected, (list, tuple)):
+        assert isinstance(got, (list, tuple)), f"type mismatch {type(got)}"
+        assert len(expected) == len(got), f"length mismatch {len(got)}"
+        for e, g in zip(expected, got, strict=True):
+            _assert_same(e, g)
+    elif isinstance(expected, np.ndarray) and expected.dtype != object:
+        # Bitwise comparison, nan is equal to nan.
+        assert expected.dtype == got.dtype, f"dtype mismatch {got.dtype}"
+        assert expected.shape == got.shape, f"shape mismatch {got.shape}"
+        assert expected.tobytes() == got.tobytes(), f"{expected} != {got}"
+    elif isinstance(expected, np.ndarray):
+        np.testing.assert_array_equal(expected, got)
+    else:
+        assert expected == got, f"{expected!r} != {got!r}"
+
+
+def run_concurrently(
+    ref: ReferenceEvaluator,
+    feeds: dict[str, Any],
+    n_threads: int = N_THREADS,
+    n_runs: int = N_RUNS,
+) -> list[Any]:
+    """Calls method `run` *n_runs* times from *n_threads* threads
+    starting at the same time, returns all the results.
+    """
+    barrier = threading.Barrier(n_threads)
+
+    def _worker(_):
+        barrier.wait()
+        return [ref.run(None, feeds) for _ in range(n_runs)]
+
+    with ThreadPoolExecutor(n_threads) as executor:
+        results = list(executor.map(_worker, range(n_threads)))
+    return [r for rs in results for r in rs]
+
+
+class TestReferenceEvaluatorConcurrency(unittest.TestCase):
+    def test_backend_node_tests_concurrently(self):
+        n_tested = 0
+        for case in sorted(load_model_tests(kind="node"), key=lambda c: c.name):
+            if EXCLUDED.search(case.name) or case.model_dir is None:
+                continue
+            if not STRESS and not STATEFUL.search(case.name):
+                continue
+            model = onnx.load(os.path.join(case.model_dir, "model.onnx"))
+            try:
+                feeds = _load_feeds(case.model_dir, model)
+                ref = ReferenceEvaluator(model)
+                expected = ref.run(None, feeds)
+            except Exception:  # noqa: BLE001
+                # test_backend_reference.py covers the failing models.
+                continue
+            with self.subTest(name=case.name):
+                for got in run_concurrently(ref, feeds):
+                    _assert_same(expected, got)
+            n_tested += 1
+        self.assertGreater(n_tested, 50)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
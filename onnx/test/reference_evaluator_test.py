@@ -12,10 +12,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import gc
 import importlib
 import itertools
 import math
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stdout
 from functools import wraps
 from io import StringIO
@@ -56,15 +64,17 @@ from onnx.helper import (
     make_value_info,
 )
 from onnx.numpy_helper import from_array
-from onnx.reference import ReferenceEvaluator
+from onnx.reference import ProcessPoolEvaluator, ReferenceEvaluator, gen_op_table
 from onnx.reference.op_run import OpRun, OpRunExpand
-from onnx.reference.ops import load_op
+from onnx.reference.ops import _op_list, load_op
 from onnx.reference.ops._op_common_indices import _get_indices, _is_out
+from onnx.reference.ops._op_common_scan import ScanOutputBuffer
 from onnx.reference.ops._op_list import Cast_19, Celu
 from onnx.reference.ops.aionnx_preview_training._op_list import Adam
 from onnx.reference.ops.op_attention import _apply_causal
 from onnx.reference.ops.op_celu import _vcelu1
 from onnx.reference.ops.op_col2im import (
+    _col2im,
     _col2im_naive_implementation_2d,
     col2im_naive_implementation,
 )
@@ -2050,6 +2060,33 @@ class TestReferenceEvaluator(unittest.TestCase):
         )
         assert_allclose(r1, r2)
 
+    @parameterized.parameterized.expand(
+        [
+            ((7,), (3,), (1,), (1, 1), (2,)),
+            ((6, 4), (2, 3), (1, 1), (1, 1, 1, 1), (1, 1)),
+            ((7, 8), (3, 2), (2, 1), (0, 1, 2, 0), (2, 3)),
+            ((4, 5, 6), (2, 2, 3), (1, 2, 1), (1, 0, 1, 0, 1, 1), (2, 1, 2)),
+        ]
+    )
+    def test_col2im_vectorized(
+        self, image_shape, kernel_shape, dilations, pads, strides
+    ):
+        n_dims = len(image_shape)
+        n_blocks = [
+            (image_shape[i] + pads[i] + pads[i + n_dims] - dilations[i] * (k - 1) - 1)
+            // strides[i]
+            + 1
+            for i, k in enumerate(kernel_shape)
+        ]
+        data = np.random.randn(2, 3, np.prod(kernel_shape), np.prod(n_blocks))
+        got = _col2im(data, image_shape, kernel_shape, dilations, pads, strides)
+        self.assertEqual((2, 3, *image_shape), got.shape)
+        for n, c in itertools.product(range(2), range(3)):
+            expected = col2im_naive_implementation(
+                data[n, c], image_shape, kernel_shape, dilations, pads, strides
+            )
+            assert_allclose(expected, got[n, c])
+
     def test_conv_im2col_group4(self):
         # model 1
         X = make_tensor_value_info("X", TensorProto.FLOAT, [2, 4, 6, 6])
@@ -2307,6 +2344,119 @@ class TestReferenceEvaluator(unittest.TestCase):
         got1 = ref1.run(None, feeds)
         assert_allclose(got1[0], expected)
 
+    @parameterized.parameterized.expand(
+        [
+            ((7,), [3], [2], [1], [1, 1], 0, 0),
+            ((7,), [2], [2], [2], [0, 0], 1, 0),
+            ((6, 7), [2, 3], [2, 1], [1, 2], [1, 0, 0, 1], 1, 0),
+            ((6, 7), [3, 3], [2, 2], [1, 1], [1, 1, 1, 1], 0, 1),
+            ((4, 5, 6), [2, 2, 3], [2, 1, 2], [2, 1, 1], [1, 0, 1, 0, 1, 1], 1, 1),
+        ]
+    )
+    def test_max_pool_indices(
+        self, shape, kernel_shape, strides, dilations, pads, ceil_mode, storage_order
+    ):
+        node = make_node(
+            "MaxPool",
+            ["X"],
+            ["Y", "I"],
+            kernel_shape=kernel_shape,
+            strides=strides,
+            dilations=dilations,
+            pads=pads,
+            ceil_mode=ceil_mode,
+            storage_order=storage_order,
+        )
+        # Integers make ties, the first position in the window is expected.
+        x = np.random.randint(0, 4, size=(2, 3, *shape)).astype(np.float32)
+        y, indices = ReferenceEvaluator(node).run(None, {"X": x})
+
+        n_dims = len(shape)
+        for position in itertools.product(*(range(d) for d in y.shape)):
+            n, c, *out = position
+            best, best_index = None, -1
+            for k in itertools.product(*(range(d) for d in kernel_shape)):
+                coords = [
+                    o * s + i * d - p
+                    for o, s, i, d, p in zip(
+                        out, strides, k, dilations, pads[:n_dims], strict=True
+                    )
+                ]
+                if any(v < 0 or v >= d for v, d in zip(coords, shape, strict=True)):
+                    continue
+                if best is None or x[(n, c, *coords)] > best:
+                    best = x[(n, c, *coords)]
+                    best_index = (n * x.shape[1] + c) * np.prod(shape) + int(
+                        np.ravel_multi_index(
+                            coords, shape, order="C" if storage_order == 0 else "F"
+                        )
+                    )
+            self.assertEqual(best, y[position])
+            self.assertEqual(best_index, indices[position])
+
+    @parameterized.parameterized.expand(
+        [
+            ("AveragePool", (7,), [3], [2], [1], [1, 1], 0, 0),
+            ("AveragePool", (7,), [3], [2], [1], [1, 1], 0, 1),
+            ("AveragePool", (6, 7), [2, 3], [2, 1], [1, 2], [1, 0, 0, 1], 1, 0),
+            ("AveragePool", (6, 7), [3, 2], [2, 2], [1, 1], [1, 1, 1, 0], 1, 1),
+            ("LpPool", (6, 7), [2, 3], [2, 1], [1, 2], [1, 0, 0, 1], 0, 0),
+            ("LpPool", (4, 5, 6), [2, 2, 3], [2, 1, 2], [2, 1, 1], [1] * 6, 1, 1),
+        ]
+    )
+    def test_average_lp_pool(
+        self,
+        op_type,
+        shape,
+        kernel_shape,
+        strides,
+        dilations,
+        pads,
+        ceil_mode,
+        count_include_pad,
+    ):
+        node = make_node(
+            op_type,
+            ["X"],
+            ["Y"],
+            kernel_shape=kernel_shape,
+            strides=strides,
+            dilations=dilations,
+            pads=pads,
+            ceil_mode=ceil_mode,
+            count_include_pad=count_include_pad,
+        )
+        x = np.random.randn(2, 3, *shape).astype(np.float32)
+        y = ReferenceEvaluator(node).run(None, {"X": x})[0]
+
+        n_dims = len(shape)
+        for position in itertools.product(*(range(d) for d in y.shape)):
+            n, c, *out = position
+            values, count = [], 0
+            for k in itertools.product(*(range(d) for d in kernel_shape)):
+                coords = [
+                    o * s + i * d - p
+                    for o, s, i, d, p in zip(
+                        out, strides, k, dilations, pads[:n_dims], strict=True
+                    )
+                ]
+                if all(0 <= v < d for v, d in zip(coords, shape, strict=True)):
+                    values.append(x[(n, c, *coords)])
+                    count += 1
+                elif count_include_pad and all(
+                    -pads[i] <= v < d + pads[i + n_dims]
+                    for i, (v, d) in enumerate(zip(coords, shape, strict=True))
+                ):
+                    count += 1
+            if op_type == "AveragePool":
+                expected = np.sum(values) / count
+            else:
+                # LpPool multiplies the average by the kernel size.
+                expected = np.sqrt(
+                    np.sum(np.square(values)) / count * np.prod(kernel_shape)
+                )
+            self.assertAlmostEqual(float(expected), float(y[position]), places=5)
+
     def test_scatter_elements(self):
         X = make_tensor_value_info("X", TensorProto.FLOAT, [None, None])
         Ind = make_tensor_value_info("I", TensorProto.INT64, [None, None])
@@ -2378,7 +2528,7 @@ class TestReferenceEvaluator(unittest.TestCase):
         feeds = {
             "X": np.arange(1 * 3 * 5 * 4).reshape((1, 3, 5, 4)).astype(np.float32),
             "W": np.arange(3 * 1 * 3 * 3).reshape((3, 1, 3, 3)).astype(np.float32),
-            "B": np.array([0, 0, 0, 0], dtype=np.float32),
+            "B": np.array([0], dtype=np.float32),
         }
 
         ref1 = ReferenceEvaluator(onnx_model)
@@ -2439,7 +2589,7 @@ class TestReferenceEvaluator(unittest.TestCase):
         feeds = {
             "X": np.arange(1 * 1 * 3 * 3).reshape((1, 1, 3, 3)).astype(np.float32),
             "W": np.arange(1 * 2 * 3 * 3).reshape((1, 2, 3, 3)).astype(np.float32),
-            "B": np.array([0, 0, 0, 0], dtype=np.float32),
+            "B": np.array([0, 0], dtype=np.float32),
         }
 
         expected = np.array(
@@ -2469,6 +2619,70 @@ class TestReferenceEvaluator(unittest.TestCase):
         ref1 = ReferenceEvaluator(onnx_model)
         got1 = ref1.run(None, feeds)
         assert_allclose(got1[0], expected)
+        feeds["B"] = np.array([0, 0, 0, 0], dtype=np.float32)
+        with self.assertRaisesRegex(ValueError, "B must have shape"):
+            ref1.run(None, feeds)
+
+    @parameterized.parameterized.expand(
+        [
+            ((5,), 1, [3], [2], [1], [1, 0], [1]),
+            ((4, 3), 2, [2, 3], [2, 1], [1, 2], [1, 0, 0, 1], [1, 0]),
+            ((3, 4), 3, [3, 3], [3, 2], [2, 1], [0, 1, 1, 0], [2, 1]),
+            ((2, 3, 3), 2, [2, 2, 3], [2, 1, 2], [2, 1, 1], [1] * 6, [0, 0, 1]),
+        ]
+    )
+    def test_conv_transpose_groups(
+        self, shape, group, kernel_shape, strides, dilations, pads, output_padding
+    ):
+        node = make_node(
+            "ConvTranspose",
+            ["X", "W", "B"],
+            ["Y"],
+            group=group,
+            strides=strides,
+            dilations=dilations,
+            pads=pads,
+            output_padding=output_padding,
+        )
+        x = np.random.randn(2, group * 2, *shape).astype(np.float32)
+        w = np.random.randn(group * 2, 3, *kernel_shape).astype(np.float32)
+        b = np.random.randn(group * 3).astype(np.float32)
+        y = ReferenceEvaluator(node).run(None, {"X": x, "W": w, "B": b})[0]
+
+        n_dims = len(shape)
+        expected = np.zeros(y.shape, dtype=np.float64)
+        expected += b.reshape((1, -1) + (1,) * n_dims)
+        for position in itertools.product(*(range(d) for d in x.shape)):
+            n, c, *i = position
+            g = c // 2
+            for k in itertools.product(*(range(d) for d in kernel_shape)):
+                coords = [
+                    v * s + j * d - p
+                    for v, s, j, d, p in zip(
+                        i, strides, k, dilations, pads[:n_dims], strict=True
+                    )
+                ]
+                if all(0 <= v < d for v, d in zip(coords, y.shape[2:], strict=True)):
+                    expected[(n, slice(g * 3, (g + 1) * 3), *coords)] += (
+                        x[position] * w[(c, slice(None), *k)]
+                    )
+        self.assertEqual(
+            tuple(
+                s * (d - 1) + o + (k - 1) * dl + 1 - p - q
+                for d, s, o, k, dl, p, q in zip(
+                    shape,
+                    strides,
+                    output_padding,
+                    kernel_shape,
+                    dilations,
+                    pads[:n_dims],
+                    pads[n_dims:],
+                    strict=True,
+                )
+            ),
+            y.shape[2:],
+        )
+        assert_allclose(expected, y, atol=1e-4)
 
     def test_stft(self):
         signal = make_tensor_value_info("signal", TensorProto.FLOAT, [None, None, None])
@@ -2633,6 +2847,87 @@ class TestReferenceEvaluator(unittest.TestCase):
         # with self.subTest(mode="max"):
         #     self.common_test_roi_align_torch("max")
 
+    @parameterized.parameterized.expand(
+        [
+            ("avg", "half_pixel", 0, 1.0),
+            ("avg", "output_half_pixel", 2, 0.5),
+            ("max", "half_pixel", 2, 1.0),
+            ("max", "output_half_pixel", 0, 0.5),
+        ]
+    )
+    def test_roi_align_modes(
+        self, mode, coordinate_transformation_mode, sampling_ratio, spatial_scale
+    ):
+        node = make_node(
+            "RoiAlign",
+            ["X", "rois", "I"],
+            ["Y"],
+            output_height=3,
+            output_width=4,
+            sampling_ratio=sampling_ratio,
+            spatial_scale=spatial_scale,
+            coordinate_transformation_mode=coordinate_transformation_mode,
+            mode=mode,
+        )
+        x = np.random.randn(2, 3, 7, 9).astype(np.float32)
+        rois = np.array(
+            [
+                [0, 0, 8, 6],
+                [1.5, 2.5, 7.5, 14.0],
+                [-3, -2, 4, 3],
+                [10, 5, 30, 20],
+                [4, 4, 4, 4],
+            ],
+            dtype=np.float32,
+        )
+        batch_indices = np.array([0, 1, 1, 0, 1], dtype=np.int64)
+        y = ReferenceEvaluator(node).run(
+            None, {"X": x, "rois": rois, "I": batch_indices}
+        )[0]
+        self.assertEqual((5, 3, 3, 4), y.shape)
+
+        def bilinear(image, yy, xx):
+            height, width = image.shape
+            if yy < -1 or yy > height or xx < -1 or xx > width:
+                return [0.0]
+            yy, xx = max(yy, 0), max(xx, 0)
+            y0, x0 = min(int(yy), height - 1), min(int(xx), width - 1)
+            y1, x1 = min(y0 + 1, height - 1), min(x0 + 1, width - 1)
+            ly = yy - y0 if y0 < height - 1 else 0
+            lx = xx - x0 if x0 < width - 1 else 0
+            return [
+                (1 - ly) * (1 - lx) * image[y0, x0],
+                (1 - ly) * lx * image[y0, x1],
+                ly * (1 - lx) * image[y1, x0],
+                ly * lx * image[y1, x1],
+            ]
+
+        offset = 0.5 if coordinate_transformation_mode == "half_pixel" else 0
+        for r, (roi, b) in enumerate(zip(rois, batch_indices, strict=True)):
+            x0, y0, x1, y1 = roi * spatial_scale - offset
+            height, width = y1 - y0, x1 - x0
+            if offset == 0:
+                height, width = max(height, 1), max(width, 1)
+            grid_h = sampling_ratio or int(np.ceil(height / 3))
+            grid_w = sampling_ratio or int(np.ceil(width / 4))
+            for c, ph, pw in itertools.product(range(3), range(3), range(4)):
+                values = [
+                    bilinear(
+                        x[b, c],
+                        y0 + (ph + (iy + 0.5) / grid_h) * height / 3,
+                        x0 + (pw + (ix + 0.5) / grid_w) * width / 4,
+                    )
+                    for iy in range(grid_h)
+                    for ix in range(grid_w)
+                ]
+                if not values:
+                    expected = 0.0
+                elif mode == "avg":
+                    expected = sum(sum(v) for v in values) / (grid_h * grid_w)
+                else:
+                    expected = max(max(v) for v in values)
+                self.assertAlmostEqual(expected, float(y[r, c, ph, pw]), places=4)
+
     def test_split(self):
         X = make_tensor_value_info("X", TensorProto.FLOAT, [None])
         Y1 = make_tensor_value_info("Y1", TensorProto.FLOAT, [None])
@@ -4214,6 +4509,75 @@ class TestReferenceEvaluator(unittest.TestCase):
         got = _conv_implementation_im2col(**feeds, **kwargs)
         assert_allclose(got, expected)
 
+    @parameterized.parameterized.expand(
+        [
+            ((7,), 1, 4, [3], [2], [1], "NOTSET", [1, 2]),
+            ((6, 7), 2, 4, [2, 3], [2, 1], [1, 2], "NOTSET", [1, 0, 0, 1]),
+            ((6, 7), 4, 4, [3, 3], [1, 1], [2, 2], "SAME_UPPER", None),
+            ((6, 7), 3, 6, [3, 2], [2, 2], [1, 1], "SAME_LOWER", None),
+            ((5, 6), 2, 2, [2, 2], [1, 2], [2, 1], "VALID", None),
+            ((4, 5, 6), 2, 4, [2, 2, 3], [2, 1, 2], [2, 1, 1], "NOTSET", [1] * 6),
+        ]
+    )
+    def test_conv_groups_dilations(
+        self, shape, group, channels, kernel_shape, strides, dilations, auto_pad, pads
+    ):
+        node = make_node(
+            "Conv",
+            ["X", "W", "B"],
+            ["Y"],
+            group=group,
+            kernel_shape=kernel_shape,
+            strides=strides,
+            dilations=dilations,
+            auto_pad=auto_pad,
+            **({} if pads is None else {"pads": pads}),
+        )
+        x = np.random.randn(2, channels, *shape).astype(np.float32)
+        w = np.random.randn(group * 2, channels // group, *kernel_shape).astype(
+            np.float32
+        )
+        b = np.random.randn(group * 2).astype(np.float32)
+        y = ReferenceEvaluator(node).run(None, {"X": x, "W": w, "B": b})[0]
+
+        n_dims = len(shape)
+        extents = [
+            (k - 1) * d + 1 for k, d in zip(kernel_shape, dilations, strict=True)
+        ]
+        if auto_pad == "VALID":
+            pads = [0] * n_dims * 2
+        elif auto_pad != "NOTSET":
+            needed = [
+                max(0, (-(-n // s) - 1) * s + e - n)
+                for n, s, e in zip(shape, strides, extents, strict=True)
+            ]
+            lower = [
+                (p + 1) // 2 if auto_pad == "SAME_LOWER" else p // 2 for p in needed
+            ]
+            pads = lower + [p - q for p, q in zip(needed, lower, strict=True)]
+        expected_shape = [
+            (n + pads[i] + pads[i + n_dims] - e) // s + 1
+            for i, (n, s, e) in enumerate(zip(shape, strides, extents, strict=True))
+        ]
+        self.assertEqual((2, group * 2, *expected_shape), y.shape)
+        for position in itertools.product(*(range(d) for d in y.shape)):
+            n, m, *out = position
+            g = m // 2
+            expected = float(b[m])
+            for c in range(channels // group):
+                for k in itertools.product(*(range(d) for d in kernel_shape)):
+                    coords = [
+                        o * s + i * d - p
+                        for o, s, i, d, p in zip(
+                            out, strides, k, dilations, pads[:n_dims], strict=True
+                        )
+                    ]
+                    if all(0 <= v < d for v, d in zip(coords, shape, strict=True)):
+                        expected += float(
+                            x[(n, g * (channels // group) + c, *coords)] * w[(m, c, *k)]
+                        )
+            self.assertAlmostEqual(expected, float(y[position]), places=4)
+
     @parameterized.parameterized.expand(
         [
             ("ReduceSum",),
@@ -6261,6 +6625,1002 @@ class TestReferenceEvaluator(unittest.TestCase):
         assert_allclose(got, expected)
         self.assertEqual(got.shape, (1, 1, 1))
 
+    def test_release_intermediate_results(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18]>
+            agraph (float[N] X) => (float[N] Z)
+            {
+                A = Neg(X)
+                B = Exp(A)
+                C = Abs(X)
+                Z = Add(B, C)
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model)
+        self.assertEqual(ref.last_use_, [[], ["A"], [], ["B", "C"]])
+        x = np.array([-1, 0, 2], dtype=np.float32)
+        expected = np.exp(-x) + np.abs(x)
+        assert_allclose(expected, ref.run(None, {"X": x})[0])
+        got = ref.run(["A", "Z"], {"X": x})
+        assert_allclose(-x, got[0])
+        assert_allclose(expected, got[1])
+        got = ref.run(None, {"X": x}, intermediate=True)
+        self.assertEqual({"", "X", "A", "B", "C", "Z"}, set(got))
+
+    def test_release_intermediate_results_subgraph(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18]>
+            agraph (float[N] X, bool C) => (float[N] Z)
+            {
+                T = Neg(X)
+                U = Abs(X)
+                Z = If(C) <
+                    then_branch = g1 () => (float[N] Y1) { Y1 = Add(T, U) },
+                    else_branch = g2 () => (float[N] Y2) { Y2 = Identity(T) }
+                >
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model)
+        self.assertEqual(ref.last_use_, [[], [], ["T", "U"]])
+        x = np.array([-1, 0, 2], dtype=np.float32)
+        assert_allclose(np.abs(x) - x, ref.run(None, {"X": x, "C": np.array(True)})[0])
+        assert_allclose(-x, ref.run(None, {"X": x, "C": np.array(False)})[0])
+
+    def test_run_output_subset_only_executes_needed_nodes(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18]>
+            agraph (float[N] X, float[N] Y) => (float[N] Z, float[N] W)
+            {
+                A = Neg(X)
+                Z = Exp(A)
+                W = Abs(Y)
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model)
+        x = np.array([-1, 0, 2], dtype=np.float32)
+        y = np.array([-3, 4], dtype=np.float32)
+        # X is not needed to compute W.
+        assert_allclose(np.abs(y), ref.run(["W"], {"Y": y})[0])
+        plan = ref.plans_["W",]
+        self.assertEqual(["Abs"], [node.op_type for node in plan.nodes])
+        self.assertIs(plan, ref._get_plan(["W"]))
+        assert_allclose(-x, ref.run(["A"], {"X": x, "Y": y})[0])
+        self.assertEqual(["Neg"], [node.op_type for node in ref.plans_["A",].nodes])
+        got = ref.run(None, {"X": x, "Y": y})
+        assert_allclose(np.exp(-x), got[0])
+        assert_allclose(np.abs(y), got[1])
+
+    def test_execution_plan_slots(self):
+        ref = ReferenceEvaluator(self._load_model(self.m2_def))
+        plan = ref._get_plan(ref.output_names)
+        self.assertEqual(3, len(plan))
+        node, input_slots, output_slots, release, context, linked = plan.steps[2]
+        self.assertEqual("Mul", node.op_type)
+        self.assertEqual((plan.slots["C0"], plan.slots["C1"]), input_slots)
+        self.assertEqual((plan.slots["D0"],), output_slots)
+        self.assertEqual({plan.slots["C0"], plan.slots["C1"]}, set(release))
+        self.assertIsNone(context)
+        self.assertFalse(linked)
+        self.assertEqual(["B01", "B11", "B21"], [name for name, _ in plan.free])
+
+        x = np.random.rand(2, 3).astype(np.float32)
+        y = np.random.rand(2, 3).astype(np.float32)
+        z = np.random.rand(2, 3).astype(np.float32)
+        got = ref.run(None, {"B01": x, "B11": y, "B21": z})[0]
+        assert_allclose((x + y) * (y - z), got, rtol=1e-6)
+        with self.assertRaisesRegex(RuntimeError, "Unable to find input 'B21'"):
+            ref.run(None, {"B01": x, "B11": y})
+
+    def test_parallel_run(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18]>
+            agraph (float[N, N] X) => (float[N, N] Z, float[N, N] A)
+            {
+                A = MatMul(X, X)
+                B = Exp(X)
+                C = Neg(B)
+                D = Add(A, C)
+                E = Abs(X)
+                Z = Mul(D, E)
+            }
+            """
+        )
+        x = np.random.rand(8, 8).astype(np.float32)
+        expected = ReferenceEvaluator(model).run(None, {"X": x})
+        ref = ReferenceEvaluator(model, parallel=3)
+        plan = ref._get_plan(ref.output_names)
+        self.assertEqual([0, 0, 1, 2, 0, 2], plan.n_predecessors)
+        for _ in range(3):
+            got = ref.run(None, {"X": x})
+            self.assertEqual(len(expected), len(got))
+            for e, g in zip(expected, got, strict=False):
+                assert_allclose(e, g)
+        self.assertIsNotNone(ref.executor_)
+        got = ref.run(None, {"X": x}, intermediate=True)
+        assert_allclose(np.exp(x), got["B"])
+        with self.assertRaisesRegex(RuntimeError, "Unable to find input 'X'"):
+            ref.run(None, {})
+        executor = ref.executor_
+        ref.close()
+        self.assertIsNone(ref.executor_)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+        with self.assertRaisesRegex(ValueError, "parallel, reuse_buffers"):
+            ReferenceEvaluator(model, parallel=2, reuse_buffers=True)
+        with self.assertRaisesRegex(ValueError, "incremental, profiling"):
+            ReferenceEvaluator(model, incremental="content", profiling=True)
+        with ReferenceEvaluator(model, parallel=2) as ref:
+            assert_allclose(expected[0], ref.run(None, {"X": x})[0])
+            executor = ref.executor_
+        self.assertIsNone(ref.executor_)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+
+    def test_fold_constants(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18]>
+            agraph (float[N] X) => (float[M, K] Z)
+            <float[6] W = {1, 2, 3, 4, 5, 6}, int64[1] zero = {0}, int64[1] m = {-1}>
+            {
+                sh = Shape(W)
+                n = Gather(sh, zero)
+                two = Constant<value = int64[1] {2}>()
+                half = Div(n, two)
+                new_shape = Concat<axis = 0>(m, half)
+                WT = Reshape(W, new_shape)
+                XW = Reshape(X, new_shape)
+                Z = Add(XW, WT)
+            }
+            """
+        )
+        x = np.arange(6).astype(np.float32)
+        expected = ReferenceEvaluator(model).run(None, {"X": x})[0]
+        ref = ReferenceEvaluator(model, fold_constants=True)
+        self.assertEqual(["Reshape", "Add"], [n.op_type for n in ref.rt_nodes_])
+        assert_allclose(np.array([3], dtype=np.int64), ref.rt_inits_["half"])
+        got = ref.run(None, {"X": x})[0]
+        assert_allclose(expected, got)
+        self.assertEqual((2, 3), got.shape)
+
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18]>
+            agraph (float[N] X) => (float[N] Z)
+            {
+                R = RandomUniform<shape = [1]>()
+                Z = Add(X, R)
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model, fold_constants=True)
+        self.assertEqual(["RandomUniform", "Add"], [n.op_type for n in ref.rt_nodes_])
+
+    def test_run_batch(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18]>
+            agraph (float[N, 3] X, float[N, 3] Y) => (float[N, 3] Z, float[N] S)
+            <int64[1] axes = {1}>
+            {
+                A = Add(X, Y)
+                Z = Sigmoid(A)
+                S = ReduceSum<keepdims = 0>(Z, axes)
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model)
+        self.assertEqual("N", ref._batch_dimension(ref.output_names))
+        feeds = [
+            {
+                "X": np.random.rand(n, 3).astype(np.float32),
+                "Y": np.random.rand(n, 3).astype(np.float32),
+            }
+            for n in [1, 3, 2]
+        ]
+        expected = [ref.run(None, f) for f in feeds]
+        for n_threads in [0, 2]:
+            got = ref.run_batch(None, feeds, n_threads=n_threads)
+            self.assertEqual(len(expected), len(got))
+            for e, g in zip(expected, got, strict=False):
+                assert_allclose(e[0], g[0], rtol=1e-6)
+                assert_allclose(e[1], g[1], rtol=1e-6)
+
+        # Different dtypes, the feeds cannot be stacked.
+        feeds[1] = {k: v.astype(np.float64) for k, v in feeds[1].items()}
+        self.assertIsNone(ref._stack_feeds(feeds))
+        got = ref.run_batch(["S"], feeds, n_threads=2)
+        self.assertEqual(np.float64, got[1][0].dtype)
+        assert_allclose(expected[2][1], got[2][0], rtol=1e-6)
+
+    def test_shape_specialized_plans(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18]>
+            agraph (float[N, M] X) => (float[K] Z)
+            <int64[1] zero = {0}, int64[1] one = {1}>
+            {
+                sh = Shape(X)
+                n = Gather(sh, zero)
+                m = Gather(sh, one)
+                nm = Mul(n, m)
+                Z = Reshape(X, nm)
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model, shape_cache_size=2)
+        for shape in [(2, 3), (2, 3), (4, 5), (1, 2), (2, 3)]:
+            x = np.random.rand(*shape).astype(np.float32)
+            got = ref.run(None, {"X": x})[0]
+            assert_allclose(x.ravel(), got)
+        self.assertEqual(2, len(ref.specialized_plans_))
+        signatures = [sig[1][0][2] for sig in ref.specialized_plans_]
+        self.assertEqual([(1, 2), (2, 3)], signatures)
+        plan = next(reversed(ref.specialized_plans_.values()))
+        self.assertEqual(["Reshape"], [n.op_type for n in plan.nodes])
+        assert_allclose(np.array([6], dtype=np.int64), plan.initial[plan.slots["nm"]])
+
+    @parameterized.parameterized.expand(
+        [
+            ({"fold_constants": True},),
+            ({"shape_cache_size": 4},),
+            ({"incremental": "content"},),
+        ]
+    )
+    def test_random_in_subgraph_and_function(self, kwargs):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18, "custom": 1]>
+            agraph (float[2] X) => (float[2] R, float[M, 2] L)
+            <int64 n = {2}, bool c = {1}>
+            {
+                F = custom.Rand()
+                R = Add(X, F)
+                L = Loop(n, c) <
+                    body = loop_body (int64 i, bool cond_in) => (bool cond_out, float[2] r) {
+                        cond_out = Identity(cond_in)
+                        r = RandomUniform<shape = [2]>()
+                    }
+                >
+            }
+            <domain: "custom", opset_import: [ "": 18]>
+            Rand () => (Y) { Y = RandomUniform<shape = [2]>() }
+            """
+        )
+        ref = ReferenceEvaluator(model, **kwargs)
+        x = np.zeros(2, dtype=np.float32)
+        first = ref.run(None, {"X": x})
+        second = ref.run(None, {"X": x})
+        self.assertEqual((2, 2), second[1].shape)
+        # Random numbers are drawn again at every run.
+        for a, b in zip(first, second, strict=True):
+            self.assertFalse(np.array_equal(a, b))
+        if ref.specialized_plans_:
+            # The specialized plan keeps the nodes drawing random numbers.
+            plan = next(iter(ref.specialized_plans_.values()))
+            self.assertEqual(["Rand", "Add", "Loop"], [n.op_type for n in plan.nodes])
+
+    def test_shape_specialized_plans_inputs(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18]>
+            agraph (float[N] X, seq(float[N]) S) => (float[N] Z, float[N] T)
+            <float[1] bias = {1.0}>
+            {
+                B = Mul(bias, bias)
+                Z = Add(X, B)
+                C = ConcatFromSequence<axis=0>(S)
+                T = Add(C, bias)
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model, shape_cache_size=4)
+        x = np.array([1, 2], dtype=np.float32)
+        seq = [x, x]
+        # A sequence input is not specialized.
+        got = ref.run(None, {"X": x, "S": seq})
+        assert_allclose(x + 1, got[0])
+        assert_allclose(np.hstack(seq) + 1, got[1])
+        self.assertEqual(0, len(ref.specialized_plans_))
+        # An initializer overridden by the feeds is not folded.
+        for value in [1, 5, 7]:
+            feeds = {"X": x, "bias": np.array([value], dtype=np.float32)}
+            assert_allclose(x + value**2, ref.run(["Z"], feeds)[0])
+        assert_allclose(x + 1, ref.run(["Z"], {"X": x})[0])
+        self.assertEqual(2, len(ref.specialized_plans_))
+
+    def test_evaluator_cache_shared_bodies(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18]>
+            agraph (float[N] X, bool C) => (float[N] Z)
+            {
+                A = If(C) <
+                    then_branch = g1 () => (float[N] Y1) { Y1 = Neg(X) },
+                    else_branch = g2 () => (float[N] Y2) { Y2 = Abs(X) }
+                >
+                Z = If(C) <
+                    then_branch = g1 () => (float[N] Y1) { Y1 = Neg(X) },
+                    else_branch = g2 () => (float[N] Y2) { Y2 = Abs(A) }
+                >
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model)
+        first, second = ref.rt_nodes_
+        self.assertIs(first.then_branch, second.then_branch)
+        self.assertIsNot(first.else_branch, second.else_branch)
+        x = np.array([-1, 2], dtype=np.float32)
+        assert_allclose(-x, ref.run(None, {"X": x, "C": np.array(True)})[0])
+        assert_allclose(np.abs(x), ref.run(None, {"X": x, "C": np.array(False)})[0])
+
+        f1 = load_op("", "Softsign", 18, expand=True, evaluator_cls=ReferenceEvaluator)
+        f2 = load_op("", "Softsign", 18, expand=True, evaluator_cls=ReferenceEvaluator)
+        node = make_node("Softsign", ["X"], ["Y"])
+        run_params = {"opsets": {"": 18}, "new_ops": None, "log": None}
+        self.assertIs(f1(node, run_params).impl_, f2(node, run_params).impl_)
+
+    def test_evaluator_cache_content_key(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "": 18, "custom": 1]>
+            agraph (float[N] X, bool C) => (float[N] Z)
+            {
+                Z = If(C) <
+                    then_branch = g1 () => (float[N] Y1) { Y1 = custom.Twice(X) },
+                    else_branch = g2 () => (float[N] Y2) { Y2 = Neg(X) }
+                >
+            }
+            <domain: "custom", opset_import: [ "": 18]>
+            Twice (A) => (B) { B = Add(A, A) }
+            """
+        )
+        first = ReferenceEvaluator(model)
+        second = ReferenceEvaluator(model)
+        # Function evaluators differ but share the same proto.
+        self.assertIsNot(first.functions_, second.functions_)
+        branch = weakref.ref(first.rt_nodes_[0].then_branch)
+        self.assertIs(branch(), second.rt_nodes_[0].then_branch)
+        x = np.array([-1, 2], dtype=np.float32)
+        assert_allclose(x * 2, second.run(None, {"X": x, "C": np.array(True)})[0])
+        # The cache does not keep an evaluator alive.
+        del first, second
+        gc.collect()
+        self.assertIsNone(branch())
+
+    @parameterized.parameterized.expand(
+        [
+            (None, [(3,), (3,), (3,), (3,), (3,)]),
+            (2, [(2, 3), (2, 3), (2, 3)]),
+            (3, [(), (), ()]),
+            (4, [(2,), (2,)]),
+            (None, [(2, 3), (1, 3), (4, 3)]),
+        ]
+    )
+    def test_scan_output_buffer(self, capacity, shapes):
+        values = [
+            np.asarray(np.random.rand(*shape), dtype=np.float32) for shape in shapes
+        ]
+        buffer = ScanOutputBuffer(capacity)
+        for value in values:
+            buffer.append(value)
+        expected = np.vstack(values)
+        got = buffer.result()
+        self.assertEqual(expected.dtype, got.dtype)
+        assert_allclose(expected, got)
+
+        # A different dtype falls back to np.vstack.
+        buffer.append(values[-1].astype(np.float64))
+        expected = np.vstack([*values, values[-1].astype(np.float64)])
+        got = buffer.result()
+        self.assertEqual(expected.dtype, got.dtype)
+        assert_allclose(expected, got)
+
+    def test_loop_large_trip_count_stops_on_cond(self):
+        # A "while" loop, the trip count is only an upper bound.
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: [ "" : 18 ]>
+            agraph (int64 M, float[1000, 1000] X) => (float[N, 1000] Y) {
+                C = Constant<value = bool {1}>()
+                XF, Y = Loop(M, C, X) <
+                    body = loop_body (int64 i, bool c_in, float[1000, 1000] x_in)
+                        => (bool c_out, float[1000, 1000] x_out,
+                            float[1000, 1000] y_out) {
+                        two = Constant<value = int64 {2}>()
+                        c_out = Less(i, two)
+                        x_out = Identity(x_in)
+                        y_out = Identity(x_in)
+                    }
+                >
+            }
+            """
+        )
+        x = np.random.rand(1000, 1000).astype(np.float32)
+        got = ReferenceEvaluator(model).run(
+            None, {"M": np.array(2**63 - 1, dtype=np.int64), "X": x}
+        )[0]
+        self.assertEqual((3000, 1000), got.shape)
+        assert_allclose(np.vstack([x, x, x]), got)
+
+    def test_profiling(self):
+        ref = ReferenceEvaluator(self._load_model(self.m2_def), profiling=True)
+        x = np.ones((4, 5), dtype=np.float32)
+        for _ in range(2):
+            got = ref.run(None, {"B01": x, "B11": x, "B21": x})[0]
+            assert_allclose(np.zeros((4, 5), dtype=np.float32), got)
+        profile = ref.profile_
+        self.assertEqual(2, profile.n_runs)
+        self.assertEqual(["Add", "Sub", "Mul"] * 2, [e.op_type for e in profile.events])
+        add = profile.events[0]
+        self.assertEqual(160, add.input_bytes)
+        self.assertEqual(80, add.output_bytes)
+        # 3 inputs, 2 intermediate results and the output
+        self.assertEqual(480, profile.peak_live_bytes)
+
+        rows = profile.aggregate()
+        self.assertEqual({"Add", "Sub", "Mul"}, {row["key"] for row in rows})
+        self.assertEqual([2, 2, 2], [row["count"] for row in rows])
+        self.assertAlmostEqual(1.0, sum(row["ratio"] for row in rows))
+        self.assertEqual(3, len(profile.aggregate(by="name")))
+        table = profile.to_table()
+        self.assertIn("peak_live_bytes", table)
+        self.assertEqual(4, len(table.split("\n")))
+        trace = profile.to_chrome_trace()
+        self.assertEqual(6, len(trace["traceEvents"]))
+        self.assertEqual("X", trace["traceEvents"][0]["ph"])
+        self.assertEqual("Add", trace["traceEvents"][0]["cat"])
+
+    def test_mmap_external_data(self):
+        model = make_model(
+            make_graph(
+                [
+                    make_node("MatMul", ["X", "A"], ["XA"]),
+                    make_node("Add", ["XA", "B"], ["Y"]),
+                ],
+                "g",
+                [make_tensor_value_info("X", TensorProto.FLOAT, [None, 3])],
+                [make_tensor_value_info("Y", TensorProto.FLOAT, [None, 3])],
+                [
+                    from_array(
+                        np.arange(9).reshape((3, 3)).astype(np.float32), name="A"
+                    ),
+                    from_array(np.arange(3).astype(np.int64), name="C"),
+                    from_array(np.array([0.5, -1, 2], dtype=np.float32), name="B"),
+                ],
+            )
+        )
+        x = np.arange(6).reshape((2, 3)).astype(np.float32)
+        expected = ReferenceEvaluator(model).run(None, {"X": x})[0]
+        with tempfile.TemporaryDirectory() as temp:
+            filename = os.path.join(temp, "model.onnx")
+            onnx.save_model(
+                model,
+                filename,
+                save_as_external_data=True,
+                all_tensors_to_one_file=True,
+                location="weights.bin",
+                size_threshold=0,
+            )
+            ref = ReferenceEvaluator(filename, mmap_external_data=True)
+            for name in ["A", "B", "C"]:
+                self.assertIsInstance(ref.rt_inits_[name], np.memmap)
+            self.assertFalse(ref.rt_inits_["A"].flags.writeable)
+            assert_allclose(expected, ref.run(None, {"X": x})[0])
+            del ref
+        with self.assertRaisesRegex(ValueError, "mmap_external_data"):
+            ReferenceEvaluator(model, mmap_external_data=True)
+
+        # Initializers and constants of a subgraph.
+        branch = make_graph(
+            [
+                make_node("Constant", [], ["K"], value=from_array(x, name="K")),
+                make_node("Add", ["X", "W"], ["XW"]),
+                make_node("Add", ["XW", "K"], ["Y1"]),
+            ],
+            "then",
+            [],
+            [make_tensor_value_info("Y1", TensorProto.FLOAT, [None, 3])],
+            [from_array(np.full((2, 3), 3, dtype=np.float32), name="W")],
+        )
+        model = make_model(
+            make_graph(
+                [
+                    make_node(
+                        "If",
+                        ["C"],
+                        ["Y"],
+                        then_branch=branch,
+                        else_branch=make_graph(
+                            [make_node("Neg", ["X"], ["Y2"])],
+                            "else",
+                            [],
+                            [
+                                make_tensor_value_info(
+                                    "Y2", TensorProto.FLOAT, [None, 3]
+                                )
+                            ],
+                        ),
+                    )
+                ],
+                "g",
+                [
+                    make_tensor_value_info("X", TensorProto.FLOAT, [None, 3]),
+                    make_tensor_value_info("C", TensorProto.BOOL, []),
+                ],
+                [make_tensor_value_info("Y", TensorProto.FLOAT, [None, 3])],
+            ),
+            opset_imports=[make_opsetid("", 18)],
+        )
+        feeds = {"X": x, "C": np.array(True)}
+        expected = ReferenceEvaluator(model).run(None, feeds)[0]
+        with tempfile.TemporaryDirectory() as temp:
+            filename = os.path.join(temp, "model.onnx")
+            onnx.save_model(
+                model,
+                filename,
+                save_as_external_data=True,
+                location="weights.bin",
+                size_threshold=0,
+            )
+            ref = ReferenceEvaluator(filename, mmap_external_data=True)
+            assert_allclose(expected, ref.run(None, feeds)[0])
+            then_branch = ref.rt_nodes_[0].then_branch
+            self.assertIsInstance(then_branch.rt_inits_["W"], np.memmap)
+            del ref, then_branch
+
+    def test_run_async(self):
+        ref = ReferenceEvaluator(self._load_model(self.m2_def))
+        x = np.arange(20).reshape((4, 5)).astype(np.float32)
+        feeds = {"B01": x, "B11": x + 1, "B21": x * 2}
+        expected = ref.run(None, feeds)
+
+        async def _main(**kwargs):
+            return await asyncio.gather(
+                ref.run_async(None, feeds, **kwargs),
+                ref.run_async(["C0"], feeds, intermediate=True, **kwargs),
+            )
+
+        got, inter = asyncio.run(_main())
+        assert_allclose(expected[0], got[0])
+        assert_allclose(expected[0], inter["D0"])
+        self.assertIn("C0", inter)
+        with ThreadPoolExecutor(2) as executor:
+            got, _ = asyncio.run(_main(executor=executor, offload_bytes=100))
+        assert_allclose(expected[0], got[0])
+
+        async def _cancel():
+            task = asyncio.create_task(ref.run_async(None, feeds))
+            await asyncio.sleep(0)
+            task.cancel()
+            await task
+
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(_cancel())
+
+    @parameterized.parameterized.expand([("content",), ("identity",)])
+    def test_incremental(self, mode):
+        calls = []
+
+        class Tracked(OpRun):
+            op_domain = "custom"
+
+            def _run(self, x, y):
+                calls.append(self.onnx_node.output[0])
+                return (x + y,)
+
+        model = make_model(
+            make_graph(
+                [
+                    make_node("Tracked", ["X", "Y"], ["A"], domain="custom"),
+                    make_node("Tracked", ["A", "Z"], ["B"], domain="custom"),
+                    make_node("Tracked", ["B", "Y"], ["C"], domain="custom"),
+                ],
+                "g",
+                [
+                    make_tensor_value_info("X", TensorProto.FLOAT, [None]),
+                    make_tensor_value_info("Y", TensorProto.FLOAT, [None]),
+                    make_tensor_value_info("Z", TensorProto.FLOAT, [None]),
+                ],
+                [make_tensor_value_info("C", TensorProto.FLOAT, [None])],
+            ),
+            opset_imports=[make_opsetid("", 18), make_opsetid("custom", 1)],
+        )
+        ref = ReferenceEvaluator(model, new_ops=[Tracked], incremental=mode)
+        x, y, z = (np.array([i], dtype=np.float32) for i in range(3))
+        assert_allclose(
+            np.array([4], dtype=np.float32), ref.run(None, {"X": x, "Y": y, "Z": z})[0]
+        )
+        self.assertEqual(["A", "B", "C"], calls)
+
+        del calls[:]
+        assert_allclose(
+            np.array([4], dtype=np.float32), ref.run(None, {"X": x, "Y": y, "Z": z})[0]
+        )
+        self.assertEqual([], calls)
+
+        z2 = np.array([10], dtype=np.float32)
+        assert_allclose(
+            np.array([12], dtype=np.float32),
+            ref.run(None, {"X": x, "Y": y, "Z": z2})[0],
+        )
+        self.assertEqual(["B", "C"], calls)
+
+        del calls[:]
+        ref.run(["A"], {"X": x, "Y": y, "Z": z2})
+        self.assertEqual(["A"], calls)
+
+        # An input modified in place is only detected by comparing contents.
+        del calls[:]
+        z2[0] = 20
+        got = ref.run(None, {"X": x, "Y": y, "Z": z2})[0]
+        if mode == "content":
+            self.assertEqual(["B", "C"], calls)
+            assert_allclose(np.array([22], dtype=np.float32), got)
+        else:
+            self.assertEqual([], calls)
+
+        del calls[:]
+        ref.run(None, {"X": x, "Y": y.copy(), "Z": z2})
+        self.assertEqual([] if mode == "content" else ["A", "B", "C"], calls)
+
+    def test_codegen(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: ["": 18]>
+            agraph (float[N] X, float[N] Y, bool C) => (float[N] Z, float[N] W)
+            {
+                A = Add(X, Y)
+                B = Concat<axis=0>(A)
+                M = Min(A, B, Y)
+                Z = If(C) <
+                    then_branch = g1 () => (float[N] z1) { z1 = Neg(M) },
+                    else_branch = g2 () => (float[N] z2) { z2 = Identity(M) }
+                >
+                W = Clip(Z, , Y)
+            }
+            """
+        )
+        x = np.array([-1, 2, 3], dtype=np.float32)
+        y = np.array([1, -2, 1], dtype=np.float32)
+        ref = ReferenceEvaluator(model)
+        cg = ReferenceEvaluator(model, codegen=True)
+        for c in [np.array(True), np.array(False)]:
+            feeds = {"X": x, "Y": y, "C": c}
+            expected = ref.run(None, feeds)
+            got = cg.run(None, feeds)
+            for e, g in zip(expected, got, strict=True):
+                assert_allclose(e, g)
+            assert_allclose(expected[0], cg.run(["Z"], feeds)[0])
+
+        source = cg.compile().source
+        self.assertTrue(source.startswith("def graph(values, attributes):"))
+        self.assertIn("axis=0", source)
+        self.assertIn("context={'C': v6, 'M': v5}", source)
+        self.assertIn("None", source)
+        self.assertIs(cg.compile(), cg.compile())
+        self.assertIs(cg.compile(["Z"]), cg.compile(["Z"]))
+        self.assertNotIn("Clip", cg.compile(["Z"]).source)
+
+    def test_trusted(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: ["": 18]>
+            agraph (float[N] X, float[N] Y, bool C) => (float[N] Z, float S)
+            {
+                A = Add(X, Y)
+                B = Concat<axis=0>(A)
+                M = Min(A, B, Y)
+                Z = If(C) <
+                    then_branch = g1 () => (float[N] z1) { z1 = Neg(M) },
+                    else_branch = g2 () => (float[N] z2) { z2 = Identity(M) }
+                >
+                S = ReduceSum<keepdims=0>(Z)
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model)
+        trusted = ReferenceEvaluator(model, trusted=True)
+        # run is replaced by an instance attribute when it can be.
+        self.assertEqual(
+            [True, True, False, False, True],
+            ["run" in node.__dict__ for node in trusted.rt_nodes_],
+        )
+        self.assertFalse(any("run" in node.__dict__ for node in ref.rt_nodes_))
+        then_branch = trusted.rt_nodes_[3].then_branch
+        self.assertTrue(then_branch.trusted)
+        self.assertIn("run", then_branch.rt_nodes_[0].__dict__)
+
+        x = np.array([-1, 2, 3], dtype=np.float32)
+        y = np.array([1, -2, 1], dtype=np.float32)
+        for c in [np.array(True), np.array(False)]:
+            feeds = {"X": x, "Y": y, "C": c}
+            expected = ref.run(None, feeds)
+            got = trusted.run(None, feeds)
+            for e, g in zip(expected, got, strict=True):
+                self.assertIsInstance(g, np.ndarray)
+                assert_allclose(e, g)
+
+    @parameterized.parameterized.expand(
+        [
+            ((3, 4), (4,)),
+            ((4,), (3, 4)),
+            ((), ()),
+        ]
+    )
+    def test_fuse_elementwise(self, x_shape, b_shape):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: ["": 18]>
+            agraph (float[N] X, float[N] B, float H) => (float Y, float A)
+            {
+                E = Div(X, H)
+                F = Erf(E)
+                G = Add(F, H)
+                A = Mul(G, X)
+                C = Add(X, B)
+                D = Mul(C, X)
+                S = Sigmoid(D)
+                T = Mul(S, A)
+                Y = Relu(T)
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model)
+        fused = ReferenceEvaluator(model, fuse_elementwise=True)
+        # A is an output and ends the first chain.
+        self.assertEqual(
+            ["Div->Erf->Add->Mul", "Add->Mul->Sigmoid->Mul->Relu"],
+            [node.onnx_node.doc_string for node in fused.rt_nodes_],
+        )
+        self.assertEqual(["X", "B", "A"], fused.rt_nodes_[1].input)
+
+        for dtype in [np.float16, np.float32, np.float64, np.int64]:
+            feeds = {
+                "X": np.arange(np.prod(x_shape) or 1).reshape(x_shape).astype(dtype),
+                "B": (np.arange(np.prod(b_shape) or 1) - 2)
+                .reshape(b_shape)
+                .astype(dtype),
+                "H": np.array(2, dtype=dtype),
+            }
+            expected = ref.run(None, feeds)
+            got = fused.run(None, feeds)
+            for e, g in zip(expected, got, strict=True):
+                self.assertEqual(e.dtype, g.dtype)
+                self.assertEqual(e.shape, g.shape)
+                # The fused chain computes exactly the same values.
+                self.assertEqual(e.tobytes(), g.tobytes())
+            for x in feeds.values():
+                # The inputs are never modified.
+                self.assertEqual(dtype, x.dtype)
+            assert_allclose(
+                np.arange(np.prod(x_shape) or 1).reshape(x_shape), feeds["X"]
+            )
+
+    def test_reuse_buffers(self):
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: ["": 18]>
+            agraph (float[N, 4] X, float[4, 4] W, float[4] B, int64[2] S)
+                => (float[M, 8] Y, float[N, 4] Z)
+            {
+                M1 = MatMul(X, W)
+                A1 = Add(M1, B)
+                R1 = Relu(A1)
+                M2 = MatMul(R1, W)
+                A2 = Add(M2, B)
+                Z = Tanh(A2)
+                T = Reshape(A2, S)
+                E = Sigmoid(T)
+                Y = Softmax<axis=-1>(E)
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model)
+        arena_ref = ReferenceEvaluator(model, reuse_buffers=True)
+        rng = np.random.default_rng(0)
+        feeds = {
+            "W": rng.standard_normal((4, 4)).astype(np.float32),
+            "B": rng.standard_normal((4,)).astype(np.float32),
+            "S": np.array([-1, 8], dtype=np.int64),
+        }
+        plan = arena_ref._get_plan(tuple(arena_ref.output_names))
+        buffers, previous = None, None
+        for n in [4, 4, 4, 6, 6, 6]:
+            feeds["X"] = rng.standard_normal((n, 4)).astype(np.float32)
+            expected = ref.run(None, feeds)
+            got = arena_ref.run(None, feeds)
+            for e, g in zip(expected, got, strict=True):
+                self.assertEqual(e.tobytes(), g.tobytes())
+            self.assertEqual(1, len(plan.arenas))
+            arena = plan.arenas[0]
+            # M1, A1, R1, M2, A2 (kept alive by its view T), E
+            self.assertEqual([0, 1, 0, 1, 0, None, None, 2, None], arena.assignment)
+            for b in arena.buffers:
+                self.assertFalse(any(np.shares_memory(b, g) for g in got))
+            if n == previous:
+                # The buffers are planned again once the shapes changed,
+                # the same buffers are used by every run after that.
+                self.assertEqual(
+                    [(n, 4), (n, 4), (n // 2, 8)], [b.shape for b in arena.buffers]
+                )
+                if buffers is not None:
+                    self.assertEqual(buffers, [id(b) for b in arena.buffers])
+                buffers = [id(b) for b in arena.buffers]
+            else:
+                buffers = None
+            previous = n
+
+        # A kernel writes into the buffer it receives if the shape
+        # and the type match the result, it ignores it otherwise.
+        add = arena_ref.rt_nodes_[1]
+        x, y = feeds["W"], feeds["B"]
+        buffer = np.empty((4, 4), dtype=np.float32)
+        self.assertIs(buffer, add.run(x, y, out=buffer)[0])
+        assert_allclose(x + y, buffer)
+        for wrong in [np.empty((4, 1), np.float32), np.empty((4, 4), np.float64)]:
+            res = add.run(x, y, out=wrong)[0]
+            self.assertIsNot(wrong, res)
+            assert_allclose(x + y, res)
+
+    def test_reuse_buffers_output_view(self):
+        class Pass(OpRun):
+            op_domain = "custom"
+            calls = 0
+
+            def _run(self, x):
+                # A copy while the arena records the run, a view after.
+                Pass.calls += 1
+                return (x.copy() if Pass.calls == 1 else x[...],)
+
+        model = self._load_model(
+            """
+            <ir_version: 8, opset_import: ["": 18, "custom": 1]>
+            agraph (float[N, 4] X, float[4] B) => (float[N, 4] Y, float[N, 4] Z)
+            {
+                A = Add(X, B)
+                Y = custom.Pass(A)
+                N = Neg(A)
+                M = Neg(N)
+                Z = Add(M, B)
+            }
+            """
+        )
+        ref = ReferenceEvaluator(model, new_ops=[Pass], reuse_buffers=True)
+        plan = ref._get_plan(tuple(ref.output_names))
+        b = np.arange(4, dtype=np.float32)
+        results = []
+        for i in range(4):
+            x = np.full((4, 4), i, dtype=np.float32)
+            got = ref.run(None, {"X": x, "B": b})
+            results.append((x, got))
+            # The buffer of A is still held by Y when M is computed.
+            for buffer in plan.arenas[0].buffers:
+                self.assertFalse(any(np.shares_memory(buffer, g) for g in got))
+        self.assertEqual([0, None, 1, 0, None], plan.arenas[0].assignment)
+        # A later run does not overwrite the results already returned.
+        for x, (y, z) in results:
+            assert_allclose(x + b, y)
+            assert_allclose(x + b + b, z)
+
+    def test_op_table_up_to_date(self):
+        filename = os.path.join(
+            os.path.dirname(gen_op_table.__file__), "ops", "_op_table.py"
+        )
+        with open(filename, encoding="utf-8") as f:
+            content = f.read()
+        self.assertEqual(
+            content,
+            gen_op_table.generate(),
+            msg="Run python onnx/reference/gen_op_table.py to update the table.",
+        )
+
+    def test_lazy_op_registry(self):
+        # The test modules already imported many implementations.
+        script = dedent(
+            """
+            import sys
+            from onnx.reference.ops import load_op
+            from onnx.reference.ops.aionnxml import load_op as load_op_ml
+
+            module = "onnx.reference.ops.op_celu"
+            assert module not in sys.modules
+            assert "onnx.reference.ops.aionnxml.op_scaler" not in sys.modules
+            cl = load_op("", "Celu")
+            assert cl.__module__ == module, cl.__module__
+            assert module in sys.modules
+            assert "onnx.reference.ops.op_cast" not in sys.modules
+            from onnx.reference.ops._op_list import Cast_19
+            assert Cast_19.__module__ == "onnx.reference.ops.op_cast"
+            assert load_op_ml("ai.onnx.ml", "Scaler", None).__name__ == "Scaler"
+            """
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+        self.assertIs(Celu, load_op("", "Celu"))
+        self.assertIs(Cast_19, load_op("", "Cast", 19))
+        self.assertIn("Celu", _op_list._registered_operators)
+        self.assertNotIn("Cast_19", _op_list._registered_operators)
+        with self.assertRaises(AttributeError):
+            _op_list.Celu_0  # noqa: B018
+
+    def test_process_pool_evaluator(self):
+        X = make_tensor_value_info("X", TensorProto.FLOAT, ["N", 2, 8, 8])
+        Y = make_tensor_value_info("Y", TensorProto.FLOAT, ["N", 2, 4, 4])
+        Z = make_tensor_value_info("Z", TensorProto.FLOAT, ["N", 2, 8, 8])
+        A = make_tensor_value_info("A", TensorProto.INT64, ["N", 8, 8])
+        model = make_model(
+            make_graph(
+                [
+                    make_node(
+                        "MaxPool", ["X"], ["Y"], kernel_shape=[2, 2], strides=[2, 2]
+                    ),
+                    make_node("Identity", ["X"], ["Z"]),
+                    make_node("ArgMax", ["X"], ["A"], axis=1, keepdims=0),
+                ],
+                "g",
+                [X],
+                [Y, Z, A],
+            ),
+            opset_imports=[make_opsetid("", 18)],
+        )
+        ref = ReferenceEvaluator(model)
+        x = np.random.randn(7, 2, 8, 8).astype(np.float32)
+        with ProcessPoolEvaluator(model, n_processes=3, mp_context="spawn") as sess:
+            self.assertEqual(["X"], sess.input_names)
+            self.assertEqual(["Y", "Z", "A"], sess.output_names)
+            for n in [7, 2, 1]:
+                expected = ref.run(None, {"X": x[:n]})
+                got = sess.run(None, {"X": x[:n]})
+                self.assertEqual(len(expected), len(got))
+                for e, g in zip(expected, got, strict=True):
+                    self.assertEqual(e.dtype, g.dtype)
+                    assert_allclose(e, g)
+            got = sess.run(["A"], {"X": x})
+            assert_allclose(ref.run(["A"], {"X": x})[0], got[0])
+            # The exception raised by a worker is raised again.
+            with self.assertRaises(ValueError):
+                sess.run(None, {"X": x[:, :, 0, 0]})
+
+        # An output declared as a tensor but producing a sequence.
+        model = make_model(
+            make_graph(
+                [make_node("SplitToSequence", ["X"], ["S"], axis=0)],
+                "g",
+                [make_tensor_value_info("X", TensorProto.FLOAT, ["N", 2])],
+                [make_tensor_value_info("S", TensorProto.FLOAT, ["N", 2])],
+            ),
+            opset_imports=[make_opsetid("", 18)],
+        )
+        x = np.arange(8, dtype=np.float32).reshape((4, 2))
+        with ProcessPoolEvaluator(model, n_processes=2, mp_context="spawn") as sess:
+            with self.assertRaisesRegex(RuntimeError, "cannot be split"):
+                sess.run(None, {"X": x})
+            # A run executed by one worker returns the sequence.
+            got = sess.run(None, {"X": x[:1]})[0]
+            self.assertIsInstance(got, list)
+            assert_allclose(x[:1], got[0])
+
+        script = dedent(
+            """
+            import sys
+            import onnx.reference
+
+            assert "multiprocessing" not in sys.modules
+            assert "onnx.reference._process_pool" not in sys.modules
+            from onnx.reference import ProcessPoolEvaluator
+            assert "onnx.reference._process_pool" in sys.modules
+            """
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
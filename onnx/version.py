@@ -0,0 +1,5 @@
+# This file is generated by setup.py. DO NOT EDIT!
+
+
+version = "1.21.0"
+git_version = "b9a432b119d654281d1012701ee04a1ae15a64bd"